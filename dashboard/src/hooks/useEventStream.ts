@@ -38,6 +38,10 @@ export function useEventStream() {
             queryClient.invalidateQueries({ queryKey: queryKeys.risk });
             queryClient.invalidateQueries({ queryKey: queryKeys.activity });
             break;
+          case 'resync':
+            // Server dropped events for this client; refetch everything
+            queryClient.invalidateQueries();
+            break;
           case 'bot_state':
             queryClient.invalidateQueries({ queryKey: queryKeys.status });
             queryClient.invalidateQueries({ queryKey: queryKeys.activity });
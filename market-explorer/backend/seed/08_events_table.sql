@@ -28,6 +28,9 @@ CREATE TABLE IF NOT EXISTS explorer_events (
     closed BOOLEAN DEFAULT false,
     featured BOOLEAN DEFAULT false,
 
+    -- Gamma updatedAt (the --incremental watermark lives in explorer_sync_cursors)
+    source_updated_at TIMESTAMP WITH TIME ZONE,
+
     -- Timestamps
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
@@ -38,6 +41,7 @@ CREATE INDEX IF NOT EXISTS idx_explorer_events_volume ON explorer_events(volume
 CREATE INDEX IF NOT EXISTS idx_explorer_events_volume_24h ON explorer_events(volume_24h DESC NULLS LAST);
 CREATE INDEX IF NOT EXISTS idx_explorer_events_category ON explorer_events(category);
 CREATE INDEX IF NOT EXISTS idx_explorer_events_active ON explorer_events(active);
+CREATE INDEX IF NOT EXISTS idx_explorer_events_source_updated_at ON explorer_events(source_updated_at DESC NULLS LAST);
 
 -- Add comment
 COMMENT ON TABLE explorer_events IS 'Stores event-level aggregated data from Polymarket. Events group multiple related markets.';
@@ -6,17 +6,21 @@ Provides REST API endpoints for querying Polymarket data.
 
 from __future__ import annotations
 
+import logging
 from contextlib import asynccontextmanager
 from decimal import Decimal
-from typing import Annotated, Any, AsyncIterator, Optional
+from typing import Annotated, Any, AsyncIterator, Awaitable, Callable, Optional, TypeVar
 
-from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, field_validator
 
 from explorer import __version__
+from explorer.api.response_cache import ResponseCache
 from explorer.config import settings
 from explorer.db.database import db
+from explorer.db.notifications import NotificationListener
+from explorer.db.pagination import InvalidCursorError
 from explorer.db.repositories import (
     MarketFilter,
     MarketRepository,
@@ -25,6 +29,10 @@ from explorer.db.repositories import (
 )
 from explorer.models.market import Market, MarketStatus
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 # =============================================================================
 # Pydantic Response Schemas
@@ -88,6 +96,10 @@ class PaginatedMarketsResponse(BaseModel):
     total_pages: int
     has_next: bool
     has_prev: bool
+    # Pass back as ?cursor= for the next page (keyset pagination)
+    next_cursor: Optional[str] = None
+    # True when total is a planner estimate (unfiltered listings)
+    total_is_estimate: bool = False
 
 
 class HealthResponse(BaseModel):
@@ -152,9 +164,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan: startup and shutdown."""
     # Startup
     await db.connect()
-    set_market_repo(MarketRepository(db))
+    repo = MarketRepository(db)
+    set_market_repo(repo)
+    cache = ResponseCache()
+    set_response_cache(cache)
+
+    def on_sync_complete(payload: dict[str, Any]) -> None:
+        cache.invalidate()
+        repo.count_cache.invalidate()
+        logger.debug(f"Sync notification {payload}: response cache cleared")
+
+    listener = NotificationListener(db.dsn, on_sync_complete)
+    listener.start()
     yield
     # Shutdown
+    await listener.stop()
+    set_response_cache(None)
     await db.disconnect()
 
 
@@ -200,6 +225,39 @@ def set_market_repo(repo: MarketRepository) -> None:
     _market_repo = repo
 
 
+# Response cache for aggregate endpoints (None = uncached, e.g. in tests)
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the response cache, if one is installed."""
+    return _response_cache
+
+
+def set_response_cache(cache: Optional[ResponseCache]) -> None:
+    """Install (or remove) the response cache."""
+    global _response_cache
+    _response_cache = cache
+
+
+async def cached_response(
+    request: Request,
+    route: str,
+    params: dict[str, Any],
+    compute: Callable[[], Awaitable[T]],
+) -> T | Response:
+    """
+    Serve `compute()` through the response cache when one is installed.
+
+    With a cache the result is returned pre-serialized as a Response, so
+    routes using this declare their response_model on the decorator.
+    """
+    cache = get_response_cache()
+    if cache is None:
+        return await compute()
+    return await cache.respond(request, route, params, compute)
+
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -227,8 +285,13 @@ async def list_markets(
     sort_desc: Annotated[bool, Query(description="Sort descending")] = True,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=500, description="Items per page")] = 100,
+    cursor: Annotated[Optional[str], Query(max_length=1024, description="next_cursor from the previous page; overrides page")] = None,
 ) -> PaginatedMarketsResponse:
-    """List markets with filtering, sorting, and pagination."""
+    """List markets with filtering, sorting, and pagination.
+
+    Supports both offset (?page=) and keyset (?cursor=) pagination. Keyset
+    pages cost the same at any depth; offset pages stay for existing clients.
+    """
     # Build filter
     # Parse status values with error handling
     status_list = None
@@ -257,12 +320,16 @@ async def list_markets(
         raise HTTPException(status_code=400, detail=str(e))
 
     # Query repository
-    result = await repo.list_markets(
-        market_filter=market_filter,
-        sort=sort,
-        page=page,
-        page_size=page_size,
-    )
+    try:
+        result = await repo.list_markets(
+            market_filter=market_filter,
+            sort=sort,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     # Convert to response
     return PaginatedMarketsResponse(
@@ -273,6 +340,8 @@ async def list_markets(
         total_pages=result.total_pages,
         has_next=result.has_next,
         has_prev=result.has_prev,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -287,15 +356,42 @@ async def search_markets(
     return [market_to_response(m) for m in markets]
 
 
-@app.get("/api/markets/leaders/volume")
+class AutocompleteSuggestion(BaseModel):
+    """Search-box suggestion."""
+
+    condition_id: str
+    question: str
+    category: Optional[str] = None
+
+
+@app.get("/api/markets/autocomplete", response_model=list[AutocompleteSuggestion])
+async def autocomplete_markets(
+    repo: Annotated[MarketRepository, Depends(get_market_repo)],
+    q: Annotated[str, Query(min_length=1, max_length=100, description="Text typed so far")],
+    limit: Annotated[int, Query(ge=1, le=25)] = 10,
+    include_closed: Annotated[bool, Query(description="Include closed/resolved markets")] = False,
+) -> list[AutocompleteSuggestion]:
+    """Prefix suggestions for the market search box."""
+    suggestions = await repo.autocomplete(q, limit=limit, active_only=not include_closed)
+    return [AutocompleteSuggestion(**s) for s in suggestions]
+
+
+@app.get("/api/markets/leaders/volume", response_model=list[MarketResponse])
 async def get_volume_leaders(
+    request: Request,
     repo: Annotated[MarketRepository, Depends(get_market_repo)],
     category: Annotated[Optional[str], Query()] = None,
     limit: Annotated[int, Query(ge=1, le=50)] = 10,
-) -> list[MarketResponse]:
+) -> list[MarketResponse] | Response:
     """Get markets with highest 24h volume."""
-    markets = await repo.get_volume_leaders(limit=limit, category=category)
-    return [market_to_response(m) for m in markets]
+
+    async def compute() -> list[MarketResponse]:
+        markets = await repo.get_volume_leaders(limit=limit, category=category)
+        return [market_to_response(m) for m in markets]
+
+    return await cached_response(
+        request, "volume_leaders", {"category": category, "limit": limit}, compute
+    )
 
 
 @app.get("/api/markets/{condition_id}", response_model=MarketResponse)
@@ -310,14 +406,20 @@ async def get_market_by_id(
     return market_to_response(market)
 
 
-@app.get("/api/categories")
+@app.get("/api/categories", response_model=dict[str, int])
 async def get_categories(
+    request: Request,
     repo: Annotated[MarketRepository, Depends(get_market_repo)],
     resolved: Annotated[Optional[bool], Query(description="Filter by resolved status")] = None,
     include_closed: Annotated[bool, Query(description="Include closed/resolved markets")] = False,
-) -> dict[str, int]:
+) -> dict[str, int] | Response:
     """Get all categories with their market counts."""
-    return await repo.get_categories(resolved=resolved, active_only=not include_closed)
+    return await cached_response(
+        request,
+        "categories",
+        {"resolved": resolved, "include_closed": include_closed},
+        lambda: repo.get_categories(resolved=resolved, active_only=not include_closed),
+    )
 
 
 class CategoryDetailResponse(BaseModel):
@@ -343,52 +445,69 @@ class PaginatedCategoriesResponse(BaseModel):
 
 @app.get("/api/categories/detailed", response_model=PaginatedCategoriesResponse)
 async def get_categories_detailed(
+    request: Request,
     repo: Annotated[MarketRepository, Depends(get_market_repo)],
     include_closed: Annotated[bool, Query(description="Include closed/resolved markets")] = False,
     min_markets: Annotated[int, Query(ge=1, description="Minimum markets per category")] = 1,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=500, description="Items per page")] = 50,
     search: Annotated[Optional[str], Query(description="Search category names")] = None,
-) -> PaginatedCategoriesResponse:
+) -> PaginatedCategoriesResponse | Response:
     """Get detailed category stats with volume and liquidity totals.
 
     Returns categories sorted by total 24h volume descending.
     Supports pagination and search.
     """
-    cats = await repo.get_categories_detailed(
-        active_only=not include_closed,
-        min_markets=min_markets,
-    )
 
-    # Filter by search if provided
-    if search:
-        search_lower = search.lower()
-        cats = [c for c in cats if search_lower in c["category"].lower()]
-
-    # Paginate
-    total = len(cats)
-    total_pages = max(1, (total + page_size - 1) // page_size)
-    start = (page - 1) * page_size
-    end = start + page_size
-    page_items = cats[start:end]
-
-    return PaginatedCategoriesResponse(
-        items=[CategoryDetailResponse(**c) for c in page_items],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-    )
+    async def compute() -> PaginatedCategoriesResponse:
+        cats = await repo.get_categories_detailed(
+            active_only=not include_closed,
+            min_markets=min_markets,
+        )
+
+        # Filter by search if provided
+        if search:
+            search_lower = search.lower()
+            cats = [c for c in cats if search_lower in c["category"].lower()]
+
+        # Paginate
+        total = len(cats)
+        total_pages = max(1, (total + page_size - 1) // page_size)
+        start = (page - 1) * page_size
+        end = start + page_size
+        page_items = cats[start:end]
+
+        return PaginatedCategoriesResponse(
+            items=[CategoryDetailResponse(**c) for c in page_items],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+        )
 
+    params = {
+        "include_closed": include_closed,
+        "min_markets": min_markets,
+        "page": page,
+        "page_size": page_size,
+        "search": search,
+    }
+    return await cached_response(request, "categories_detailed", params, compute)
 
-@app.get("/api/events/{event_id}/markets")
+
+@app.get("/api/events/{event_id}/markets", response_model=list[MarketResponse])
 async def get_event_markets(
+    request: Request,
     event_id: str,
     repo: Annotated[MarketRepository, Depends(get_market_repo)],
-) -> list[MarketResponse]:
+) -> list[MarketResponse] | Response:
     """Get all markets for an event."""
-    markets = await repo.get_by_event_id(event_id)
-    return [market_to_response(m) for m in markets]
+
+    async def compute() -> list[MarketResponse]:
+        markets = await repo.get_by_event_id(event_id)
+        return [market_to_response(m) for m in markets]
+
+    return await cached_response(request, "event_markets", {"event_id": event_id}, compute)
 
 
 # =============================================================================
@@ -431,6 +550,7 @@ class PaginatedEventsResponse(BaseModel):
 
 @app.get("/api/events", response_model=PaginatedEventsResponse)
 async def list_events(
+    request: Request,
     category: Annotated[Optional[str], Query(description="Filter by category")] = None,
     search: Annotated[Optional[str], Query(min_length=2, description="Search event titles")] = None,
     active_only: Annotated[bool, Query(description="Only show active events")] = True,
@@ -439,15 +559,39 @@ async def list_events(
     sort_desc: Annotated[bool, Query(description="Sort descending")] = True,
     page: Annotated[int, Query(ge=1, description="Page number")] = 1,
     page_size: Annotated[int, Query(ge=1, le=200, description="Items per page")] = 50,
-) -> PaginatedEventsResponse:
+) -> PaginatedEventsResponse | Response:
     """List events with aggregated volume metrics.
 
     Events group multiple related markets. For example, "2028 Democratic Presidential Nominee"
     contains 128 individual candidate markets with a combined $412M volume.
     """
+    params: dict[str, Any] = {
+        "category": category,
+        "search": search,
+        "active_only": active_only,
+        "min_volume": min_volume,
+        "sort_by": sort_by,
+        "sort_desc": sort_desc,
+        "page": page,
+        "page_size": page_size,
+    }
+    return await cached_response(request, "events", params, lambda: _query_events(**params))
+
+
+async def _query_events(
+    category: Optional[str],
+    search: Optional[str],
+    active_only: bool,
+    min_volume: Optional[float],
+    sort_by: str,
+    sort_desc: bool,
+    page: int,
+    page_size: int,
+) -> PaginatedEventsResponse:
+    """Run the /api/events queries."""
     # Build query
     conditions = []
-    params = []
+    params: list[Any] = []
     param_idx = 1
 
     if active_only:
@@ -583,12 +727,25 @@ class SyncStatusResponse(BaseModel):
     error_message: Optional[str] = None
 
 
+class ResponseCacheStatsResponse(BaseModel):
+    """Response cache counters."""
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    hit_ratio: Optional[float] = None
+    not_modified: int
+    invalidations: int
+
+
 class SyncHealthResponse(BaseModel):
     """Overall sync health response."""
 
     overall_status: str
     jobs: list[SyncStatusResponse]
     is_healthy: bool
+    response_cache: Optional[ResponseCacheStatsResponse] = None
 
 
 @app.get("/api/sync/status", response_model=SyncHealthResponse)
@@ -603,6 +760,8 @@ async def get_sync_status() -> SyncHealthResponse:
     - error: Last sync failed
     - syncing: Sync currently running
     """
+    cache = get_response_cache()
+    cache_stats = ResponseCacheStatsResponse(**cache.get_stats()) if cache else None
     try:
         # Query sync status from database
         query = """
@@ -664,6 +823,7 @@ async def get_sync_status() -> SyncHealthResponse:
             overall_status=overall_status,
             jobs=jobs,
             is_healthy=overall_status == "healthy",
+            response_cache=cache_stats,
         )
 
     except Exception as e:
@@ -672,4 +832,5 @@ async def get_sync_status() -> SyncHealthResponse:
             overall_status="unknown",
             jobs=[],
             is_healthy=False,
+            response_cache=cache_stats,
         )
@@ -0,0 +1,197 @@
+"""
+In-process response cache for aggregate explorer endpoints.
+
+Category counts, volume leaders and the events views are GROUP BY or
+aggregate queries over explorer_markets/explorer_events, and that data
+only changes when a sync run completes. ResponseCache keeps their
+responses between runs:
+
+- Keys are the route name plus its resolved parameters (defaults filled
+  in, unknown query params ignored), so equivalent requests share an
+  entry.
+- Payloads are serialized to JSON once; hits return the stored bytes with
+  an ETag, and If-None-Match gets a bodyless 304.
+- invalidate() is called from the sync LISTEN/NOTIFY handler. A
+  computation that was in flight when invalidate() ran is returned to its
+  caller but not stored.
+- Concurrent misses for one key share a single computation.
+- Entries also expire after `max_age_seconds`, covering writers that do
+  not record sync runs (the standalone sync_*.py scripts).
+
+Usage:
+    cache = ResponseCache()
+    return await cache.respond(request, "categories", {"resolved": None}, compute)
+    cache.invalidate()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A pre-serialized JSON response body."""
+
+    body: bytes
+    etag: str  # Quoted, as sent in the ETag header
+    created_at: float
+
+
+def serialize(payload: Any) -> CachedResponse:
+    """Encode `payload` to JSON bytes and compute its ETag."""
+    body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode("utf-8")
+    return CachedResponse(
+        body=body,
+        etag=f'"{hashlib.sha1(body).hexdigest()}"',
+        created_at=time.monotonic(),
+    )
+
+
+def cache_key(route: str, params: dict[str, Any]) -> str:
+    """Normalized key for a route and its resolved parameters."""
+    return route + "?" + "&".join(f"{k}={params[k]!r}" for k in sorted(params))
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """True if an If-None-Match header value matches `etag` (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class ResponseCache:
+    """LRU of serialized responses, cleared when a sync run completes."""
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_age_seconds: float = 600.0,
+    ) -> None:
+        """
+        Args:
+            max_entries: Max cached responses
+            max_bytes: Max total body bytes held
+            max_age_seconds: Upper bound on an entry's age without a sync
+                notification
+        """
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._max_age_seconds = max_age_seconds
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._inflight: dict[str, asyncio.Future[CachedResponse]] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return a fresh entry for `key`, counting the hit."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.created_at >= self._max_age_seconds:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += len(key) + len(entry.body)
+        while self._entries and (
+            len(self._entries) > self._max_entries or self._bytes > self._max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(key) + len(entry.body)
+
+    def invalidate(self, *_: Any) -> None:
+        """Drop every entry (accepts and ignores a notification payload)."""
+        self._generation += 1
+        self._entries.clear()
+        self._bytes = 0
+        self.invalidations += 1
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+    ) -> CachedResponse:
+        """Return the cached response for `key`, computing and storing it on a miss."""
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        generation = self._generation
+        future: asyncio.Future[CachedResponse] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            entry = serialize(await compute())
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved when nobody else was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        future.set_result(entry)
+        if generation == self._generation:
+            self.put(key, entry)
+        return entry
+
+    async def respond(
+        self,
+        request: Request,
+        route: str,
+        params: dict[str, Any],
+        compute: Callable[[], Awaitable[Any]],
+    ) -> Response:
+        """Serve `route` from the cache with ETag / If-None-Match handling."""
+        entry = await self.get_or_compute(cache_key(route, params), compute)
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), entry.etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=entry.body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit ratio and memory use for status endpoints."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
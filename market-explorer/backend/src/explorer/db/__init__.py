@@ -4,6 +4,8 @@ Database layer for Market Explorer.
 Provides repository pattern for data access.
 """
 
+from explorer.db.notifications import SYNC_COMPLETE_CHANNEL, NotificationListener
+from explorer.db.pagination import CountCache, Cursor, InvalidCursorError
 from explorer.db.repositories import (
     MarketRepository,
     MarketFilter,
@@ -12,6 +14,11 @@ from explorer.db.repositories import (
 )
 
 __all__ = [
+    "CountCache",
+    "Cursor",
+    "InvalidCursorError",
+    "NotificationListener",
+    "SYNC_COMPLETE_CHANNEL",
     "MarketRepository",
     "MarketFilter",
     "SortOrder",
@@ -0,0 +1,114 @@
+"""
+Postgres LISTEN/NOTIFY plumbing for sync-driven cache invalidation.
+
+SyncService sends a notification on SYNC_COMPLETE_CHANNEL in the same
+statement that records a finished sync run, so listeners hear about it
+exactly when the run's writes are committed. NotificationListener holds a
+dedicated connection (LISTEN does not work through a pool, because pooled
+connections are reset and shared) and reconnects if it drops.
+
+While disconnected, notifications are lost, so the listener fires its
+callback once after every (re)connect to let caches drop anything that
+may have gone stale in the gap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Channel notified by SyncService._record_sync_end
+SYNC_COMPLETE_CHANNEL = "explorer_sync_complete"
+
+
+def parse_payload(payload: str) -> dict[str, Any]:
+    """Decode a sync notification payload; tolerates non-JSON senders."""
+    try:
+        data = json.loads(payload) if payload else {}
+    except ValueError:
+        return {"raw": payload}
+    return data if isinstance(data, dict) else {"raw": data}
+
+
+class NotificationListener:
+    """Listens on one channel and calls `on_notify(payload_dict)` for each message."""
+
+    def __init__(
+        self,
+        dsn: str,
+        on_notify: Callable[[dict[str, Any]], None],
+        channel: str = SYNC_COMPLETE_CHANNEL,
+        reconnect_seconds: float = 5.0,
+    ) -> None:
+        """
+        Args:
+            dsn: PostgreSQL connection string
+            on_notify: Called on the event loop for every notification, and
+                with {"reconnected": True} after each (re)connect
+            channel: Channel to LISTEN on
+            reconnect_seconds: Delay between reconnect attempts
+        """
+        self._dsn = dsn
+        self._on_notify = on_notify
+        self._channel = channel
+        self._reconnect_seconds = reconnect_seconds
+        self._task: Optional[asyncio.Task[None]] = None
+        self._conn: Optional[asyncpg.Connection] = None
+        self.notifications = 0
+        self.reconnects = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self._conn is not None and not self._conn.is_closed()
+
+    def start(self) -> None:
+        """Start listening in a background task on the running loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"listen_{self._channel}")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _dispatch(self, payload: dict[str, Any]) -> None:
+        try:
+            self._on_notify(payload)
+        except Exception as e:
+            logger.warning(f"Notification handler for {self._channel} failed: {e}")
+
+    def _handle(self, connection: Any, pid: int, channel: str, payload: str) -> None:
+        self.notifications += 1
+        self._dispatch(parse_payload(payload))
+
+    async def _run(self) -> None:
+        while True:
+            lost = asyncio.Event()
+            try:
+                self._conn = await asyncpg.connect(self._dsn)
+                self._conn.add_termination_listener(lambda _conn: lost.set())
+                await self._conn.add_listener(self._channel, self._handle)
+                logger.info(f"Listening for {self._channel} notifications")
+                self._dispatch({"reconnected": True})
+                await lost.wait()
+                logger.warning(f"Lost {self._channel} listener connection, reconnecting")
+            except asyncio.CancelledError:
+                if self._conn is not None and not self._conn.is_closed():
+                    await self._conn.close()
+                self._conn = None
+                raise
+            except Exception as e:
+                logger.warning(f"Cannot listen on {self._channel}: {e}")
+            self._conn = None
+            self.reconnects += 1
+            await asyncio.sleep(self._reconnect_seconds)
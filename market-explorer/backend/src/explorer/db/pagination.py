@@ -0,0 +1,187 @@
+"""
+Keyset pagination cursors and cached totals for market listings.
+
+Offset pagination makes Postgres walk and discard every row before the
+requested page, and each page request also ran a full COUNT(*) with the
+same filters. This module provides the two pieces MarketRepository uses to
+avoid both:
+
+- Cursors: an opaque, URL-safe token holding the sort field, direction and
+  the (sort value, condition_id) of the last row served. The next page is a
+  row-comparison predicate on that pair, which an index on
+  (sort_field, condition_id) answers as an index seek instead of walking
+  and discarding the skipped rows.
+- CountCache: totals keyed by the filter's WHERE clause and parameters,
+  valid until the next successful sync run (explorer_sync_runs.finished_at
+  moves). The sync generation is re-read at most every
+  `generation_check_seconds`, so a burst of page requests costs one
+  lookup.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional
+
+# Sort fields holding timestamps; all other sortable fields are numeric
+TIMESTAMP_SORT_FIELDS = frozenset(["end_time", "created_at", "updated_at"])
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor cannot be decoded or does not match the request."""
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """Position after the last row of a page."""
+
+    field: str
+    descending: bool
+    value: Any  # Decimal, datetime, or None (row sorted into NULLS LAST)
+    condition_id: str
+
+    def encode(self) -> str:
+        """Serialize to an opaque URL-safe token."""
+        value = self.value
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif value is not None:
+            value = str(value)
+        payload = json.dumps(
+            [self.field, int(self.descending), value, self.condition_id],
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "Cursor":
+        """Parse a token produced by encode().
+
+        Raises:
+            InvalidCursorError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            field, descending, value, condition_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode("ascii"))
+            )
+        except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+            raise InvalidCursorError(f"Malformed cursor: {e}") from e
+
+        if not isinstance(field, str) or not isinstance(condition_id, str):
+            raise InvalidCursorError("Malformed cursor")
+        if value is not None:
+            try:
+                if field in TIMESTAMP_SORT_FIELDS:
+                    value = datetime.fromisoformat(value)
+                else:
+                    value = Decimal(value)
+            except (ValueError, TypeError, InvalidOperation) as e:
+                raise InvalidCursorError(f"Malformed cursor value: {e}") from e
+        return cls(field=field, descending=bool(descending), value=value, condition_id=condition_id)
+
+
+def keyset_branches(cursor: Cursor, param_idx: int) -> tuple[list[str], list[Any]]:
+    """SQL predicates selecting rows after `cursor` under ORDER BY field NULLS LAST, condition_id.
+
+    Rows after a non-NULL cursor value are the rest of the non-NULL block
+    plus the whole trailing NULL block. Those are returned as two separate
+    predicates because an OR of them stops Postgres from using the row
+    comparison as an index condition; the caller runs each branch with its
+    own ORDER BY/LIMIT and merges them.
+
+    Returns:
+        (predicates, params) with placeholders starting at `param_idx`
+    """
+    field = cursor.field
+    op = "<" if cursor.descending else ">"
+    if cursor.value is None:
+        # Already inside the trailing NULL block: only the tiebreaker advances
+        return (
+            [f"{field} IS NULL AND condition_id {op} ${param_idx}::text"],
+            [cursor.condition_id],
+        )
+    cast = "timestamptz" if field in TIMESTAMP_SORT_FIELDS else "numeric"
+    return (
+        [
+            f"({field}, condition_id) {op} (${param_idx}::{cast}, ${param_idx + 1}::text)",
+            f"{field} IS NULL",
+        ],
+        [cursor.value, cursor.condition_id],
+    )
+
+
+class CountCache:
+    """Per-filter totals invalidated when a sync run completes."""
+
+    GENERATION_QUERY = """
+        SELECT MAX(finished_at)
+        FROM explorer_sync_runs
+        WHERE status = 'success'
+    """
+
+    def __init__(
+        self,
+        generation_check_seconds: float = 5.0,
+        max_age_seconds: float = 600.0,
+        max_entries: int = 1024,
+    ) -> None:
+        """
+        Args:
+            generation_check_seconds: How often to re-read the latest sync run
+            max_age_seconds: Upper bound on a total's age even without a new
+                sync run (covers writers that do not record sync runs)
+            max_entries: Max cached filter combinations
+        """
+        self._generation_check_seconds = generation_check_seconds
+        self._max_age_seconds = max_age_seconds
+        self._max_entries = max_entries
+        self._entries: dict[tuple[str, tuple[Any, ...]], tuple[int, float]] = {}
+        self._generation: Any = None
+        self._generation_checked_at: Optional[float] = None
+        self.hits = 0
+        self.misses = 0
+
+    async def _refresh_generation(self, db: Any) -> None:
+        now = time.monotonic()
+        if (
+            self._generation_checked_at is not None
+            and now - self._generation_checked_at < self._generation_check_seconds
+        ):
+            return
+        self._generation_checked_at = now
+        try:
+            generation = await db.fetchval(self.GENERATION_QUERY)
+        except Exception:
+            # explorer_sync_runs missing: rely on max_age_seconds alone
+            generation = None
+        if generation != self._generation:
+            self._generation = generation
+            self._entries.clear()
+
+    async def get_or_count(self, db: Any, count_query: str, params: list[Any]) -> int:
+        """Return the cached total for this query, running it on a miss."""
+        await self._refresh_generation(db)
+        key = (count_query, tuple(tuple(p) if isinstance(p, list) else p for p in params))
+        now = time.monotonic()
+        cached = self._entries.get(key)
+        if cached is not None and now - cached[1] < self._max_age_seconds:
+            self.hits += 1
+            return cached[0]
+
+        self.misses += 1
+        total = await db.fetchval(count_query, *params) or 0
+        if len(self._entries) >= self._max_entries:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (total, now)
+        return total
+
+    def invalidate(self) -> None:
+        """Drop all cached totals."""
+        self._entries.clear()
@@ -13,6 +13,12 @@ from decimal import Decimal
 from math import ceil
 from typing import Any, Generic, Optional, Protocol, Sequence, TypeVar
 
+from explorer.db.pagination import (
+    CountCache,
+    Cursor,
+    InvalidCursorError,
+    keyset_branches,
+)
 from explorer.models.market import (
     Market,
     MarketStatus,
@@ -91,6 +97,12 @@ class SortOrder:
             )
 
 
+# Market search predicates (defined in shared/migrations/006_market_search.sql
+# and shared with the trading dashboard). Both take the search term as $n.
+SEARCH_MATCH_SQL = "market_search_match(search_tsv, question, ${idx})"
+SEARCH_RANK_SQL = "market_search_rank(search_tsv, question, ${idx})"
+
+
 T = TypeVar("T")
 
 
@@ -103,10 +115,18 @@ class PaginatedResult(Generic[T]):
     page: int
     page_size: int
     total_pages: int
+    # Opaque keyset cursor for the page after this one (None on the last page)
+    next_cursor: Optional[str] = None
+    # True when total is a planner estimate rather than an exact count
+    total_is_estimate: bool = False
+    # Set by cursor queries, which know whether more rows follow without a count
+    has_more: Optional[bool] = None
 
     @property
     def has_next(self) -> bool:
         """Check if there's a next page."""
+        if self.has_more is not None:
+            return self.has_more
         return self.page < self.total_pages
 
     @property
@@ -179,9 +199,24 @@ class MarketRepository:
     pagination, and sorting support.
     """
 
-    def __init__(self, db: AsyncDatabase) -> None:
+    def __init__(self, db: AsyncDatabase, count_cache: Optional[CountCache] = None) -> None:
         """Initialize with a database connection."""
         self._db = db
+        self._count_cache = count_cache or CountCache()
+
+    @property
+    def count_cache(self) -> CountCache:
+        """Cache of listing totals, invalidated by completed sync runs."""
+        return self._count_cache
+
+    async def _estimate_total(self) -> Optional[int]:
+        """Planner row estimate for the whole table (None if never analyzed)."""
+        estimate = await self._db.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = 'explorer_markets'::regclass"
+        )
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
 
     async def get_by_id(self, condition_id: str) -> Optional[Market]:
         """Get a market by its condition ID.
@@ -208,20 +243,29 @@ class MarketRepository:
         sort: Optional[SortOrder] = None,
         page: int = 1,
         page_size: int = 50,
+        cursor: Optional[str] = None,
     ) -> PaginatedResult[Market]:
         """List markets with filtering, sorting, and pagination.
 
+        Rows are ordered by the sort field and then condition_id, so every
+        page ends at a unique position that next_cursor can resume from.
+        Totals come from the count cache, or from the planner estimate when
+        no filter applies at all.
+
         Args:
             market_filter: Optional filter criteria
             sort: Optional sort order (default: volume_24h DESC)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); ignored when cursor is given
             page_size: Items per page
+            cursor: next_cursor from a previous page (keyset pagination)
 
         Returns:
             PaginatedResult containing markets and metadata
 
         Raises:
             ValueError: If page < 1 or page_size not in valid range
+            InvalidCursorError: If cursor is malformed or was issued for a
+                different sort order
         """
         # Validate pagination parameters
         if page < 1:
@@ -232,6 +276,12 @@ class MarketRepository:
         if sort is None:
             sort = SortOrder()
 
+        after: Optional[Cursor] = None
+        if cursor:
+            after = Cursor.decode(cursor)
+            if after.field != sort.field or after.descending != sort.descending:
+                raise InvalidCursorError("Cursor was issued for a different sort order")
+
         # Use market_filter to avoid shadowing builtin
         filter = market_filter
 
@@ -277,8 +327,8 @@ class MarketRepository:
                 param_idx += 1
 
             if filter.search_query:
-                conditions.append(f"question ILIKE ${param_idx}")
-                params.append(f"%{filter.search_query}%")
+                conditions.append(SEARCH_MATCH_SQL.format(idx=param_idx))
+                params.append(filter.search_query)
                 param_idx += 1
 
             if filter.resolved is not None:
@@ -293,38 +343,81 @@ class MarketRepository:
         # Sort direction
         direction = "DESC" if sort.descending else "ASC"
 
-        # Count total
-        count_query = f"""
-            SELECT COUNT(*)
-            FROM explorer_markets
-            {where_clause}
-        """
-        total = await self._db.fetchval(count_query, *params)
-        total = total or 0
+        # Total: planner estimate for the unfiltered table, else cached count
+        total: Optional[int] = None
+        total_is_estimate = False
+        if not conditions:
+            total = await self._estimate_total()
+            total_is_estimate = total is not None
+        if total is None:
+            count_query = f"""
+                SELECT COUNT(*)
+                FROM explorer_markets
+                {where_clause}
+            """
+            total = await self._count_cache.get_or_count(self._db, count_query, params)
 
-        # Calculate pagination
         total_pages = max(1, ceil(total / page_size))
-        offset = (page - 1) * page_size
 
-        # Main query - NULLS LAST ensures null values sort to end regardless of direction
-        query = f"""
-            SELECT *
-            FROM explorer_markets
-            {where_clause}
-            ORDER BY {sort.field} {direction} NULLS LAST
-            LIMIT ${param_idx} OFFSET ${param_idx + 1}
-        """
-        params.extend([page_size, offset])
+        if after is not None:
+            # Keyset: resume after the cursor row; one extra row tells us if more follow
+            predicates, cursor_params = keyset_branches(after, param_idx)
+            param_idx += len(cursor_params)
+            order_by = f"ORDER BY {sort.field} {direction} NULLS LAST, condition_id {direction}"
+            branches = [
+                f"""(
+                    SELECT *
+                    FROM explorer_markets
+                    WHERE {" AND ".join([*conditions, predicate])}
+                    {order_by}
+                    LIMIT ${param_idx}
+                )"""
+                for predicate in predicates
+            ]
+            query = f"""
+                SELECT *
+                FROM ({" UNION ALL ".join(branches)}) page
+                {order_by}
+                LIMIT ${param_idx}
+            """
+            rows = await self._db.fetch(query, *params, *cursor_params, page_size + 1)
+            has_more: Optional[bool] = len(rows) > page_size
+            rows = rows[:page_size]
+        else:
+            offset = (page - 1) * page_size
+            # Main query - NULLS LAST ensures null values sort to end regardless of direction
+            query = f"""
+                SELECT *
+                FROM explorer_markets
+                {where_clause}
+                ORDER BY {sort.field} {direction} NULLS LAST, condition_id {direction}
+                LIMIT ${param_idx} OFFSET ${param_idx + 1}
+            """
+            rows = await self._db.fetch(query, *params, page_size, offset)
+            has_more = None
 
-        rows = await self._db.fetch(query, *params)
         markets = [_row_to_market(dict(row)) for row in rows]
 
+        next_cursor = None
+        more = has_more if has_more is not None else page < total_pages
+        if rows and len(rows) == page_size and more:
+            last = rows[-1]
+            next_cursor = Cursor(
+                field=sort.field,
+                descending=sort.descending,
+                value=last.get(sort.field),
+                condition_id=last["condition_id"],
+            ).encode()
+
         return PaginatedResult(
             items=markets,
             total=total,
             page=page,
             page_size=page_size,
             total_pages=total_pages,
+            next_cursor=next_cursor,
+            total_is_estimate=total_is_estimate,
+            has_more=has_more,
         )
 
     async def get_categories(
@@ -414,7 +507,10 @@ class MarketRepository:
         query: str,
         limit: int = 20,
     ) -> list[Market]:
-        """Search markets by question text.
+        """Search markets by question, slug and description text.
+
+        Uses the full-text and trigram indexes; results are ranked by
+        relevance, then 24h volume.
 
         Args:
             query: Search query string
@@ -423,17 +519,55 @@ class MarketRepository:
         Returns:
             List of matching markets
         """
-        sql = """
+        sql = f"""
             SELECT *
             FROM explorer_markets
-            WHERE question ILIKE $1
-               OR description ILIKE $1
-            ORDER BY volume_24h DESC
+            WHERE {SEARCH_MATCH_SQL.format(idx=1)}
+            ORDER BY {SEARCH_RANK_SQL.format(idx=1)} DESC, volume_24h DESC NULLS LAST
             LIMIT $2
         """
-        rows = await self._db.fetch(sql, f"%{query}%", limit)
+        rows = await self._db.fetch(sql, query, limit)
         return [_row_to_market(dict(row)) for row in rows]
 
+    async def autocomplete(
+        self,
+        prefix: str,
+        limit: int = 10,
+        active_only: bool = True,
+    ) -> list[dict[str, Any]]:
+        """Suggest market questions whose words start with the typed prefix.
+
+        Prefix-only (no fuzzy matching) so it stays an index lookup on
+        every keystroke; suggestions are ordered by 24h volume.
+
+        Args:
+            prefix: Text typed so far
+            limit: Maximum suggestions
+            active_only: Only suggest active markets
+
+        Returns:
+            List of {"condition_id", "question", "category"} dicts
+        """
+        active_filter = ""
+        if active_only:
+            active_filter = "AND (status = 'active' AND (active = true OR active IS NULL))"
+        sql = f"""
+            SELECT condition_id, question, category
+            FROM explorer_markets
+            WHERE search_tsv @@ market_search_tsquery($1) {active_filter}
+            ORDER BY volume_24h DESC NULLS LAST
+            LIMIT $2
+        """
+        rows = await self._db.fetch(sql, prefix, limit)
+        return [
+            {
+                "condition_id": row["condition_id"],
+                "question": row["question"],
+                "category": row.get("category"),
+            }
+            for row in rows
+        ]
+
     async def get_volume_leaders(
         self,
         limit: int = 10,
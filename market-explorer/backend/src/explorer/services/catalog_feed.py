@@ -0,0 +1,106 @@
+"""
+Apply the bot's market_catalog change feed to explorer_markets.
+
+The bot's MarketCatalog (polymarket_bot.ingestion.catalog) is the single
+fetcher of the Polymarket market list. Every market whose payload changes
+is written to market_catalog with a new seq. With SYNC_SOURCE=catalog the
+sync service stops calling the Gamma API; CatalogFeedConsumer reads rows
+past its cursor, parses them with parse_market, writes them through
+BulkMarketWriter and advances the cursor in explorer_sync_cursors.
+
+The catalog also reports a market resolved when it drops out of the open
+listing while its last payload still says open. Such markets are marked
+stale, as mark_unseen_stale does after a full API sync.
+
+Usage:
+    stats = await CatalogFeedConsumer(conn).run()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+
+import asyncpg
+
+from explorer.services.market_ingest import BulkMarketWriter, IngestStats
+from explorer.services.market_records import parse_market
+from explorer.services.sync_cursors import load_cursor, save_cursor
+
+logger = logging.getLogger(__name__)
+
+CURSOR_NAME = "market_catalog"
+
+FEED_SQL = """
+    SELECT seq, resolved, payload
+    FROM market_catalog
+    WHERE seq > $1
+    ORDER BY seq
+    LIMIT $2
+"""
+
+MARK_DELISTED_SQL = """
+    UPDATE explorer_markets
+    SET status = 'stale',
+        active = false,
+        updated_at = NOW()
+    WHERE condition_id = ANY($1::text[])
+      AND status = 'active'
+"""
+
+
+class CatalogFeedConsumer:
+    """Drains market_catalog rows past the stored cursor into explorer_markets."""
+
+    def __init__(self, conn: asyncpg.Connection, batch_size: int = 1000) -> None:
+        """
+        Args:
+            conn: Connection to the database holding both tables
+            batch_size: Feed rows per read and per COPY + merge round-trip
+        """
+        self._conn = conn
+        self._batch_size = batch_size
+        self.stats = IngestStats()
+        self.cursor = 0
+
+    async def run(self) -> IngestStats:
+        started = time.monotonic()
+        try:
+            writer = BulkMarketWriter(
+                self._conn, self.stats, batch_size=self._batch_size, preload_hashes=False
+            )
+            await writer.prepare()
+            self.cursor = await load_cursor(self._conn, CURSOR_NAME) or 0
+
+            while True:
+                rows = await self._conn.fetch(FEED_SQL, self.cursor, self._batch_size)
+                if not rows:
+                    break
+                self.stats.fetched += len(rows)
+
+                delisted: list[str] = []
+                for row in rows:
+                    payload = row["payload"]
+                    record = parse_market(
+                        json.loads(payload) if isinstance(payload, str) else payload
+                    )
+                    if record is None:
+                        self.stats.failed += 1
+                    elif row["resolved"] and record.status == "active":
+                        delisted.append(record.condition_id)
+                    else:
+                        await writer.add(record)
+                await writer.flush()
+                if delisted:
+                    await self._conn.execute(MARK_DELISTED_SQL, delisted)
+
+                # At-least-once: a crash before this re-applies the batch,
+                # which the merge's content_hash check makes a no-op
+                self.cursor = rows[-1]["seq"]
+                await save_cursor(self._conn, CURSOR_NAME, self.cursor)
+                if len(rows) < self._batch_size:
+                    break
+        finally:
+            self.stats.elapsed_seconds = time.monotonic() - started
+        return self.stats
@@ -0,0 +1,321 @@
+"""
+Streaming bulk ingest of Gamma /events pages into explorer_events.
+
+sync_events.py used to fetch every event first, then for each event run
+its own upsert and one UPDATE per child market on a single connection.
+EventIngestPipeline reuses the market pipeline's pieces (fetch_pages,
+RateBudget, COPY-to-staging) so that each batch of events costs three
+statements:
+
+1. COPY the batch into a temp staging table.
+2. Merge it into explorer_events with INSERT ... ON CONFLICT.
+3. Link every child market in the batch with one
+   UPDATE explorer_markets ... FROM unnest($1, $2).
+
+If a batch fails it is split in half and retried, so one bad row only
+costs itself.
+
+Incremental mode walks /events ordered by updatedAt (newest first). It
+stops at the watermark stored in explorer_sync_cursors, minus a small
+overlap for events updated while the last run was paging. Batches are
+committed as they arrive, newest first, so the watermark is advanced only
+after a walk that fetched every page: a walk cut short by a page error,
+the limit or a crash leaves it where it was and the next run re-reads the
+gap. Without a stored watermark the walk covers every event.
+
+Usage:
+    pipeline = EventIngestPipeline(conn, client, incremental=True)
+    stats = await pipeline.run()
+    stats.rows_per_second, stats.markets_linked, pipeline.watermark_advanced
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from decimal import Decimal
+from operator import attrgetter
+from typing import Any
+
+import asyncpg
+import httpx
+
+from explorer.services.market_ingest import GAMMA_API, IngestStats, RateBudget, fetch_pages
+from explorer.services.market_records import parse_bool, parse_date, safe_decimal
+from explorer.services.sync_cursors import (
+    datetime_to_position,
+    load_cursor,
+    position_to_datetime,
+    save_cursor,
+)
+
+logger = logging.getLogger(__name__)
+
+STAGE_TABLE = "explorer_events_stage"
+
+# explorer_events amounts are NUMERIC(20,2)
+MAX_EVENT_AMOUNT = 1e17
+
+# Re-read events updated this long before the watermark
+INCREMENTAL_OVERLAP = timedelta(minutes=5)
+
+# explorer_sync_cursors row holding the incremental watermark
+CURSOR_NAME = "gamma_events"
+
+
+@dataclass(frozen=True)
+class EventRecord:
+    """One explorer_events row, in EVENT_COLUMNS order."""
+
+    event_id: str
+    title: str
+    slug: str | None
+    description: str | None
+    category: str | None
+    image: str | None
+    icon: str | None
+    start_date: datetime | None
+    end_date: datetime | None
+    volume: Decimal | None
+    volume_24h: Decimal | None
+    volume_7d: Decimal | None
+    liquidity: Decimal | None
+    open_interest: Decimal | None
+    market_count: int
+    active_market_count: int
+    active: bool
+    closed: bool
+    featured: bool
+    source_updated_at: datetime | None
+
+
+EVENT_COLUMNS: tuple[str, ...] = tuple(f.name for f in fields(EventRecord))
+_event_values = attrgetter(*EVENT_COLUMNS)
+
+STAGE_DDL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE}
+    (LIKE explorer_events) ON COMMIT DELETE ROWS
+"""
+
+MERGE_SQL = f"""
+    INSERT INTO explorer_events ({", ".join(EVENT_COLUMNS)}, updated_at)
+    SELECT {", ".join(EVENT_COLUMNS)}, NOW()
+    FROM {STAGE_TABLE}
+    ON CONFLICT (event_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in EVENT_COLUMNS if c != "event_id")},
+        updated_at = NOW()
+"""
+
+LINK_SQL = """
+    UPDATE explorer_markets m
+    SET event_id = link.event_id
+    FROM unnest($1::text[], $2::text[]) AS link(condition_id, event_id)
+    WHERE m.condition_id = link.condition_id
+      AND m.event_id IS DISTINCT FROM link.event_id
+"""
+
+
+def parse_event(event: dict[str, Any]) -> tuple[EventRecord, list[str]] | None:
+    """Build an EventRecord and its child condition IDs from a Gamma /events item."""
+    event_id = event.get("id")
+    if not event_id:
+        return None
+    markets = event.get("markets") or []
+    record = EventRecord(
+        event_id=str(event_id),
+        title=event.get("title") or "",
+        slug=event.get("slug") or "",
+        description=event.get("description") or "",
+        category=event.get("category") or "",
+        image=event.get("image") or "",
+        icon=event.get("icon") or "",
+        start_date=parse_date(event.get("startDate")),
+        end_date=parse_date(event.get("endDate")),
+        volume=safe_decimal(event.get("volume"), max_val=MAX_EVENT_AMOUNT),
+        volume_24h=safe_decimal(event.get("volume24hr"), max_val=MAX_EVENT_AMOUNT),
+        volume_7d=safe_decimal(event.get("volume1wk"), max_val=MAX_EVENT_AMOUNT),
+        liquidity=safe_decimal(event.get("liquidity"), max_val=MAX_EVENT_AMOUNT),
+        open_interest=safe_decimal(event.get("openInterest"), max_val=MAX_EVENT_AMOUNT),
+        market_count=len(markets),
+        active_market_count=sum(1 for m in markets if m.get("active") and not m.get("closed")),
+        active=parse_bool(event.get("active"), True),
+        closed=parse_bool(event.get("closed"), False),
+        featured=parse_bool(event.get("featured"), False),
+        source_updated_at=parse_date(event.get("updatedAt")),
+    )
+    condition_ids = [m["conditionId"] for m in markets if m.get("conditionId")]
+    return record, condition_ids
+
+
+@dataclass
+class EventIngestStats(IngestStats):
+    """IngestStats plus market linking counts."""
+
+    markets_linked: int = 0
+
+
+class EventIngestPipeline:
+    """Fetch, parse and bulk-write Gamma events, linking their markets."""
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        client: httpx.AsyncClient,
+        active_only: bool = False,
+        limit: int | None = None,
+        incremental: bool = False,
+        page_size: int = 100,
+        concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        batch_size: int = 500,
+    ) -> None:
+        """
+        Args:
+            conn: Connection to write on
+            client: HTTP client for the Gamma API
+            active_only: Only fetch active events
+            limit: Stop after this many events
+            incremental: Only fetch events updated since the last run
+            page_size: Events per API page
+            concurrency: Pages in flight at once
+            requests_per_second: API request budget shared by all workers
+            batch_size: Events per COPY + merge + link round-trip
+        """
+        self._conn = conn
+        self._client = client
+        self._active_only = active_only
+        self._limit = limit
+        self._incremental = incremental
+        self._page_size = page_size
+        self._concurrency = concurrency
+        self._budget = RateBudget(requests_per_second)
+        self._batch_size = batch_size
+        self._buffer: dict[str, tuple[EventRecord, list[str]]] = {}
+        self._cursor_name = f"{CURSOR_NAME}:active" if active_only else CURSOR_NAME
+        self._newest: datetime | None = None
+        self.since: datetime | None = None
+        self.watermark_advanced = False
+        self.stats = EventIngestStats()
+
+    def _params(self) -> dict[str, Any]:
+        params: dict[str, Any] = (
+            {"order": "updatedAt", "ascending": "false"}
+            if self._incremental
+            else {"order": "volume", "ascending": "false"}
+        )
+        if self._active_only:
+            params["active"] = "true"
+        return params
+
+    def _is_old(self, event: dict[str, Any]) -> bool:
+        updated = parse_date(event.get("updatedAt"))
+        return updated is not None and self.since is not None and updated < self.since
+
+    def _page_is_past_watermark(self, page: list[dict[str, Any]]) -> bool:
+        return all(self._is_old(e) for e in page)
+
+    @property
+    def complete(self) -> bool:
+        """True if the walk fetched every page down to the watermark."""
+        if self.stats.page_errors:
+            return False
+        return self._limit is None or self.stats.fetched < self._limit
+
+    async def run(self) -> EventIngestStats:
+        started = time.monotonic()
+        try:
+            await self._conn.execute(STAGE_DDL)
+            if self._incremental:
+                position = await load_cursor(self._conn, self._cursor_name)
+                if position is not None:
+                    watermark = position_to_datetime(position)
+                    self._newest = watermark
+                    self.since = watermark - INCREMENTAL_OVERLAP
+
+            async for page in fetch_pages(
+                self._client,
+                self._params(),
+                self.stats,
+                self._budget,
+                url=f"{GAMMA_API}/events",
+                page_size=self._page_size,
+                concurrency=self._concurrency,
+                limit=self._limit,
+                stop_when=self._page_is_past_watermark if self.since else None,
+            ):
+                self.stats.fetched += len(page)
+                for event in page:
+                    if self.since and self._is_old(event):
+                        self.stats.unchanged += 1
+                        continue
+                    parsed = parse_event(event)
+                    if parsed is not None:
+                        self._buffer[parsed[0].event_id] = parsed
+                        self._track_newest(parsed[0].source_updated_at)
+                if len(self._buffer) >= self._batch_size:
+                    await self._flush()
+            await self._flush()
+            if self._incremental:
+                await self._advance_watermark()
+        finally:
+            self.stats.elapsed_seconds = time.monotonic() - started
+        return self.stats
+
+    def _track_newest(self, updated: datetime | None) -> None:
+        if updated is not None and (self._newest is None or updated > self._newest):
+            self._newest = updated
+
+    async def _advance_watermark(self) -> None:
+        if not self.complete:
+            logger.warning(
+                f"Event walk incomplete ({self.stats.page_errors} page errors), "
+                f"keeping watermark {self.since}"
+            )
+            return
+        if self._newest is None:
+            return
+        await save_cursor(self._conn, self._cursor_name, datetime_to_position(self._newest))
+        self.watermark_advanced = True
+
+    async def _flush(self) -> None:
+        if not self._buffer:
+            return
+        batch = list(self._buffer.values())
+        self._buffer.clear()
+        await self._write(batch)
+
+    async def _write(self, batch: list[tuple[EventRecord, list[str]]]) -> None:
+        try:
+            linked = await self._merge(batch)
+        except asyncpg.PostgresError as e:
+            if len(batch) == 1:
+                logger.debug(f"Failed to upsert event {batch[0][0].event_id}: {e}")
+                self.stats.failed += 1
+                return
+            # Isolate the offending row(s)
+            mid = len(batch) // 2
+            await self._write(batch[:mid])
+            await self._write(batch[mid:])
+            return
+        self.stats.batches += 1
+        self.stats.upserted += len(batch)
+        self.stats.markets_linked += linked
+
+    async def _merge(self, batch: list[tuple[EventRecord, list[str]]]) -> int:
+        link_ids: list[str] = []
+        link_events: list[str] = []
+        for record, condition_ids in batch:
+            link_ids.extend(condition_ids)
+            link_events.extend([record.event_id] * len(condition_ids))
+
+        async with self._conn.transaction():
+            await self._conn.copy_records_to_table(
+                STAGE_TABLE,
+                records=[_event_values(record) for record, _ in batch],
+                columns=EVENT_COLUMNS,
+            )
+            await self._conn.execute(MERGE_SQL)
+            linked = await self._conn.execute(LINK_SQL, link_ids, link_events)
+        return int(linked.split()[-1])
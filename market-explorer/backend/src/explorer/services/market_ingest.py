@@ -0,0 +1,405 @@
+"""
+Streaming bulk ingest of Gamma /markets pages into explorer_markets.
+
+The sync used to page through the API one request at a time, collect every
+market in memory, then upsert them one row (one round-trip) at a time on
+the connection holding the sync's advisory lock. This module replaces
+that with a pipeline:
+
+1. Fetch: `concurrency` workers claim page offsets and fetch them under a
+   shared RateBudget (requests per second, with Retry-After honoured on
+   429). A short page marks the end, and workers stop claiming offsets
+   past it.
+2. Parse: each page is turned into MarketRecords (market_records.py) as it
+   arrives, while later pages are still being fetched.
+3. Write: records are buffered into batches. Rows whose content_hash
+   matches the stored one are dropped before they reach the database.
+   Each batch is COPY'd into a temp staging table and merged with one
+   INSERT ... ON CONFLICT statement. If a batch fails it is split in
+   half and retried, so one bad row only costs itself.
+
+Usage:
+    pipeline = MarketIngestPipeline(conn, client, active_only=True)
+    stats = await pipeline.run()
+    stats.rows_per_second, pipeline.seen_ids, pipeline.complete
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import asyncpg
+import httpx
+
+from explorer.services.market_records import (
+    MARKET_COLUMNS,
+    PRICE_COLUMNS,
+    MarketRecord,
+    parse_market,
+)
+
+logger = logging.getLogger(__name__)
+
+GAMMA_API = "https://gamma-api.polymarket.com"
+
+STAGE_TABLE = "explorer_markets_stage"
+PRICE_STAGE_TABLE = "explorer_market_prices_stage"
+
+STAGE_DDL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {STAGE_TABLE}
+    (LIKE explorer_markets) ON COMMIT DELETE ROWS
+"""
+
+PRICE_STAGE_DDL = f"""
+    CREATE TEMP TABLE IF NOT EXISTS {PRICE_STAGE_TABLE} ON COMMIT DELETE ROWS AS
+    SELECT condition_id, {", ".join(PRICE_COLUMNS)} FROM explorer_markets WITH NO DATA
+"""
+
+_UPDATE_COLUMNS = [c for c in MARKET_COLUMNS if c != "condition_id"]
+
+MERGE_SQL = f"""
+    INSERT INTO explorer_markets ({", ".join(MARKET_COLUMNS)}, content_hash, updated_at)
+    SELECT {", ".join(MARKET_COLUMNS)}, content_hash, NOW()
+    FROM {STAGE_TABLE}
+    ON CONFLICT (condition_id) DO UPDATE SET
+        {", ".join(f"{c} = EXCLUDED.{c}" for c in _UPDATE_COLUMNS)},
+        content_hash = EXCLUDED.content_hash,
+        updated_at = EXCLUDED.updated_at
+    WHERE explorer_markets.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+"""
+
+PRICE_MERGE_SQL = f"""
+    UPDATE explorer_markets m
+    SET {", ".join(f"{c} = s.{c}" for c in PRICE_COLUMNS)},
+        updated_at = NOW()
+    FROM {PRICE_STAGE_TABLE} s
+    WHERE m.condition_id = s.condition_id
+      AND ({", ".join(f"m.{c}" for c in PRICE_COLUMNS)})
+          IS DISTINCT FROM ({", ".join(f"s.{c}" for c in PRICE_COLUMNS)})
+"""
+
+
+@dataclass
+class IngestStats:
+    """Counters for one ingest run."""
+
+    fetched: int = 0
+    upserted: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    api_calls: int = 0
+    api_retries: int = 0
+    page_errors: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        """Fetched rows processed per second of wall time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.fetched / self.elapsed_seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["rows_per_second"] = round(self.rows_per_second, 1)
+        return data
+
+
+class RateBudget:
+    """Spaces requests at most `rate_per_second` apart across all callers."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for the next request slot."""
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for `seconds` (e.g. after a 429)."""
+        self._next_slot = max(self._next_slot, time.monotonic() + seconds)
+
+
+async def fetch_pages(
+    client: httpx.AsyncClient,
+    params: dict[str, Any],
+    stats: IngestStats,
+    budget: RateBudget,
+    url: str = f"{GAMMA_API}/markets",
+    page_size: int = 100,
+    concurrency: int = 4,
+    limit: int | None = None,
+    max_retries: int = 4,
+    stop_when: Callable[[list[dict[str, Any]]], bool] | None = None,
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield pages of an offset-paginated endpoint, fetched concurrently.
+
+    Pages are yielded in completion order, not offset order. A page that
+    still fails after `max_retries` is counted in stats.page_errors and
+    ends the walk (later offsets are not claimed). `stop_when(page)`
+    returning True also ends the walk after that page, for sorted
+    endpoints walked down to a watermark.
+    """
+    queue: asyncio.Queue[list[dict[str, Any]]] = asyncio.Queue(maxsize=concurrency * 2)
+    next_offset = 0
+    end_offset = limit if limit is not None else float("inf")
+    done: list[dict[str, Any]] = []  # Sentinel; empty pages are never queued
+
+    async def fetch_one(offset: int) -> list[dict[str, Any]] | None:
+        request_params = {**params, "limit": page_size, "offset": offset}
+        for attempt in range(max_retries + 1):
+            await budget.acquire()
+            stats.api_calls += 1
+            try:
+                resp = await client.get(url, params=request_params)
+                if resp.status_code == 429:
+                    retry_after = float(resp.headers.get("Retry-After", "60"))
+                    logger.warning(f"Rate limited at offset {offset}, pausing {retry_after}s")
+                    budget.pause(retry_after)
+                    stats.api_retries += 1
+                    continue
+                resp.raise_for_status()
+                page: list[dict[str, Any]] = resp.json()
+                return page
+            except (httpx.HTTPError, ValueError) as e:
+                if attempt == max_retries:
+                    logger.error(f"API error at offset {offset}: {e}")
+                    return None
+                stats.api_retries += 1
+                await asyncio.sleep(0.5 * 2**attempt)
+        logger.error(f"API still rate limiting at offset {offset}")
+        return None
+
+    async def worker() -> None:
+        nonlocal next_offset, end_offset
+        while next_offset < end_offset:
+            offset = next_offset
+            next_offset += page_size
+            page = await fetch_one(offset)
+            if page is None:
+                stats.page_errors += 1
+                end_offset = min(end_offset, offset)
+                return
+            if len(page) < page_size or (stop_when is not None and stop_when(page)):
+                end_offset = min(end_offset, offset + 1)
+            if limit is not None:
+                page = page[: max(0, limit - offset)]
+            if page:
+                await queue.put(page)
+
+    async def run_workers() -> None:
+        try:
+            await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        except Exception:
+            await queue.put(done)
+            raise
+        await queue.put(done)
+
+    runner = asyncio.create_task(run_workers())
+    try:
+        while True:
+            page = await queue.get()
+            if page is done:
+                break
+            yield page
+        await runner  # Surface unexpected worker errors
+    finally:
+        if not runner.done():
+            runner.cancel()
+            try:
+                await runner
+            except asyncio.CancelledError:
+                pass
+
+
+class BulkMarketWriter:
+    """Batches MarketRecords into COPY + merge round-trips on one connection."""
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        stats: IngestStats,
+        batch_size: int = 1000,
+        price_only: bool = False,
+        preload_hashes: bool = True,
+    ) -> None:
+        self._conn = conn
+        self._stats = stats
+        self._batch_size = batch_size
+        self._price_only = price_only
+        # Sources that only deliver changed rows skip the hash preload;
+        # the merge's content_hash check still skips no-op updates
+        self._preload_hashes = preload_hashes and not price_only
+        self._buffer: dict[str, MarketRecord] = {}
+        self._known_hashes: dict[str, str | None] | None = None
+        self._stage_ready = False
+        self.seen_ids: set[str] = set()
+
+    async def prepare(self) -> None:
+        """Create the staging table and load stored content hashes."""
+        if not self._stage_ready:
+            await self._conn.execute(PRICE_STAGE_DDL if self._price_only else STAGE_DDL)
+            self._stage_ready = True
+        if self._known_hashes is None and self._preload_hashes:
+            rows = await self._conn.fetch("SELECT condition_id, content_hash FROM explorer_markets")
+            self._known_hashes = {r["condition_id"]: r["content_hash"] for r in rows}
+
+    async def add(self, record: MarketRecord) -> None:
+        """Queue a record, flushing when the batch is full."""
+        self.seen_ids.add(record.condition_id)
+        if self._known_hashes is not None and (
+            self._known_hashes.get(record.condition_id) == record.content_hash
+        ):
+            self._stats.unchanged += 1
+            return
+        # Offset pagination can return a market twice; keep the latest copy
+        self._buffer[record.condition_id] = record
+        if len(self._buffer) >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write buffered records."""
+        if not self._buffer:
+            return
+        batch = list(self._buffer.values())
+        self._buffer.clear()
+        await self._write(batch)
+
+    async def _write(self, batch: list[MarketRecord]) -> None:
+        try:
+            written = await self._merge(batch)
+        except asyncpg.PostgresError as e:
+            if len(batch) == 1:
+                logger.debug(f"Failed to upsert market {batch[0].condition_id}: {e}")
+                self._stats.failed += 1
+                return
+            # Isolate the offending row(s)
+            mid = len(batch) // 2
+            await self._write(batch[:mid])
+            await self._write(batch[mid:])
+            return
+        self._stats.batches += 1
+        self._stats.upserted += written
+        self._stats.unchanged += len(batch) - written
+        if self._known_hashes is not None:
+            for record in batch:
+                self._known_hashes[record.condition_id] = record.content_hash
+
+    async def _merge(self, batch: list[MarketRecord]) -> int:
+        if self._price_only:
+            columns = ("condition_id",) + PRICE_COLUMNS
+            records = [
+                (r.condition_id,) + tuple(getattr(r, c) for c in PRICE_COLUMNS) for r in batch
+            ]
+            table, merge_sql = PRICE_STAGE_TABLE, PRICE_MERGE_SQL
+        else:
+            columns = MARKET_COLUMNS + ("content_hash",)
+            records = [r.values() + (r.content_hash,) for r in batch]
+            table, merge_sql = STAGE_TABLE, MERGE_SQL
+        async with self._conn.transaction():
+            await self._conn.copy_records_to_table(table, records=records, columns=columns)
+            status = await self._conn.execute(merge_sql)
+        return int(status.split()[-1])
+
+
+class MarketIngestPipeline:
+    """Fetch, parse and bulk-write Gamma markets."""
+
+    def __init__(
+        self,
+        conn: asyncpg.Connection,
+        client: httpx.AsyncClient,
+        active_only: bool = True,
+        limit: int | None = None,
+        price_only: bool = False,
+        page_size: int = 100,
+        concurrency: int = 4,
+        requests_per_second: float = 10.0,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Args:
+            conn: Connection to write on (may hold the sync advisory lock)
+            client: HTTP client for the Gamma API
+            active_only: Only fetch active, unclosed markets
+            limit: Stop after this many markets
+            price_only: Only refresh PRICE_COLUMNS of existing rows
+            page_size: Markets per API page
+            concurrency: Pages in flight at once
+            requests_per_second: API request budget shared by all workers
+            batch_size: Records per COPY + merge round-trip
+        """
+        self._client = client
+        self._params: dict[str, Any] = {}
+        if active_only:
+            self._params.update(active="true", closed="false")
+        self._limit = limit
+        self._page_size = page_size
+        self._concurrency = concurrency
+        self._budget = RateBudget(requests_per_second)
+        self.stats = IngestStats()
+        self._writer = BulkMarketWriter(conn, self.stats, batch_size, price_only)
+
+    @property
+    def seen_ids(self) -> set[str]:
+        """Condition IDs returned by the API during run()."""
+        return self._writer.seen_ids
+
+    @property
+    def complete(self) -> bool:
+        """True if every page was fetched (safe to treat unseen markets as gone)."""
+        return self.stats.page_errors == 0
+
+    async def run(self) -> IngestStats:
+        started = time.monotonic()
+        try:
+            await self._writer.prepare()
+            async for page in fetch_pages(
+                self._client,
+                self._params,
+                self.stats,
+                self._budget,
+                page_size=self._page_size,
+                concurrency=self._concurrency,
+                limit=self._limit,
+            ):
+                self.stats.fetched += len(page)
+                for item in page:
+                    record = parse_market(item)
+                    if record is not None:
+                        await self._writer.add(record)
+            await self._writer.flush()
+        finally:
+            self.stats.elapsed_seconds = time.monotonic() - started
+        return self.stats
+
+
+async def mark_unseen_stale(conn: asyncpg.Connection, seen_ids: set[str]) -> int:
+    """Mark active markets missing from a complete active-only sync as stale."""
+    result = await conn.execute(
+        """
+        UPDATE explorer_markets
+        SET status = 'stale',
+            active = false,
+            updated_at = NOW()
+        WHERE status = 'active'
+          AND active = true
+          AND NOT (condition_id = ANY($1::text[]))
+        """,
+        list(seen_ids),
+    )
+    return int(result.split()[-1]) if result else 0
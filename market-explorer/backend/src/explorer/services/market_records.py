@@ -0,0 +1,379 @@
+"""
+Typed market records parsed from Gamma API payloads.
+
+The parsing helpers used to live in sync_markets_v2.py; SyncService had
+its own, narrower copy. Both now build a MarketRecord with parse_market()
+so the two sync paths write identical rows.
+
+A record's content_hash covers every column it writes. The bulk writer
+(explorer.services.market_ingest) compares it with the stored
+explorer_markets.content_hash to skip rows that did not change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from operator import attrgetter
+from typing import Any
+
+# Cap for volume/liquidity columns (DECIMAL(14,2) / DECIMAL(18,2))
+MAX_AMOUNT = 999999999.99
+
+
+def parse_date(date_str: Any) -> datetime | None:
+    """Parse an ISO-8601 date string to an aware datetime (UTC if naive)."""
+    if not date_str:
+        return None
+    try:
+        text = str(date_str).strip()
+        if text.endswith("Z"):
+            text = text[:-1] + "+00:00"
+        dt = datetime.fromisoformat(text)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt
+    except ValueError:
+        return None
+
+
+def safe_float(val: Any, default: float | None = None) -> float | None:
+    """Safely convert to float."""
+    if val is None:
+        return default
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return default
+
+
+def safe_decimal(val: Any, max_val: float = 9999.99) -> Decimal | None:
+    """Safely convert to Decimal, capping to avoid overflow."""
+    if val is None:
+        return None
+    try:
+        f = float(val)
+        if f > max_val:
+            f = max_val
+        if f < -max_val:
+            f = -max_val
+        return Decimal(str(round(f, 2)))
+    except (ValueError, TypeError, InvalidOperation):
+        return None
+
+
+def parse_outcome_prices(market: dict[str, Any]) -> tuple[float | None, float | None]:
+    """Extract YES and NO prices from outcome prices.
+
+    Returns tuple of (yes_price, no_price).
+    For binary markets, index 0 is typically YES and index 1 is NO.
+    """
+    try:
+        prices = market.get("outcomePrices")
+        if not prices:
+            return None, None
+        if isinstance(prices, str):
+            prices = json.loads(prices)
+        if prices and len(prices) >= 2:
+            return safe_float(prices[0]), safe_float(prices[1])
+        elif prices and len(prices) == 1:
+            yes_price = safe_float(prices[0])
+            # For single outcome, NO price is complement
+            no_price = 1.0 - yes_price if yes_price is not None else None
+            return yes_price, no_price
+    except (ValueError, TypeError):
+        pass
+    return None, None
+
+
+def get_best_bid_ask(market: dict[str, Any]) -> tuple[float | None, float | None]:
+    """Extract best bid/ask from market."""
+    best_bid = safe_float(market.get("bestBid"))
+    best_ask = safe_float(market.get("bestAsk"))
+    return best_bid, best_ask
+
+
+def normalize_category(market: dict[str, Any]) -> str:
+    """Normalize category from various fields.
+
+    This function consolidates granular categories into broader parent categories
+    for better filtering UX. For example, "Donald Trump", "Joe Biden", "Democratic Party"
+    all get mapped to "Politics".
+    """
+    question = market.get("question") or ""
+
+    # Get raw category from API
+    raw_cat = market.get("groupItemTitle") or market.get("category") or ""
+
+    # Try to infer from tags if no category
+    if not raw_cat or raw_cat == "Other":
+        tags = market.get("tags") or []
+        if isinstance(tags, str):
+            try:
+                tags = json.loads(tags)
+            except ValueError:
+                tags = []
+        if tags:
+            raw_cat = tags[0].get("label", "") if isinstance(tags[0], dict) else str(tags[0])
+
+    # Normalize to parent categories
+    # Check if raw category or question indicates Politics
+    politics_categories = [
+        "trump",
+        "biden",
+        "harris",
+        "obama",
+        "clinton",
+        "pence",
+        "vance",
+        "newsom",
+        "desantis",
+        "haley",
+        "ramaswamy",
+        "vivek",
+        "democrat",
+        "republican",
+        "gop",
+        "dnc",
+        "rnc",
+        "democratic party",
+        "republican party",
+        "us-current-affairs",
+        "us current affairs",
+        "election",
+        "presidential",
+        "governor",
+        "senate",
+        "congress",
+        "politics",
+        "political",
+        "walz",
+        "shapiro",
+        "whitmer",
+        "pritzker",
+        "buttigieg",
+        "aoc",
+        "pelosi",
+        "mccarthy",
+        "schumer",
+        "mcconnell",
+    ]
+
+    raw_cat_lower = raw_cat.lower()
+    question_lower = question.lower()
+
+    # Check if category name suggests politics
+    for pol_term in politics_categories:
+        if pol_term in raw_cat_lower:
+            return "Politics"
+
+    # Check question for political context
+    if re.search(
+        r"\b(Trump|Biden|Harris|election|Congress|Senate|House|governor|president|presidential|Republican|Democrat|GOP|vote|ballot|nominee|nomination|primary|caucus|electoral|White House|Capitol|impeach|pardon|veto|administration)\b",
+        question,
+        re.IGNORECASE,
+    ):
+        return "Politics"
+
+    # Sports detection - check both category and question
+    sports_categories = [
+        "nba",
+        "nfl",
+        "mlb",
+        "nhl",
+        "mls",
+        "ufc",
+        "mma",
+        "atp",
+        "wta",
+        "premier league",
+        "champions league",
+        "la liga",
+        "bundesliga",
+        "playoffs",
+        "championship",
+        "super bowl",
+        "world series",
+        "stanley cup",
+    ]
+
+    for sport_term in sports_categories:
+        if sport_term in raw_cat_lower:
+            return "Sports"
+
+    sports_teams = r"\b(vs\.|versus|Lakers|Celtics|Warriors|Bulls|Heat|Knicks|Nets|76ers|Clippers|Mavericks|Suns|Bucks|Nuggets|Grizzlies|Pelicans|Hawks|Cavaliers|Raptors|Pacers|Hornets|Magic|Pistons|Wizards|Kings|Spurs|Rockets|Thunder|Timberwolves|Trail Blazers|Jazz|Chiefs|Eagles|Cowboys|Bills|49ers|Dolphins|Lions|Ravens|Bengals|Commanders|Jets|Patriots|Steelers|Chargers|Broncos|Raiders|Browns|Colts|Texans|Jaguars|Titans|Packers|Vikings|Bears|Saints|Falcons|Panthers|Buccaneers|Cardinals|Seahawks|Rams|Giants|Yankees|Dodgers|Mets|Red Sox|Cubs|Braves|Phillies|Astros|Padres|Guardians|Mariners|Rangers|Orioles|Rays|Blue Jays|Twins|White Sox|Brewers|Cardinals|Reds|Pirates|Marlins|Nationals|Rockies|Diamondbacks|Giants|Athletics|Angels|Tigers|Royals|Maple Leafs|Bruins|Rangers|Hurricanes|Panthers|Lightning|Senators|Canadiens|Sabres|Red Wings|Penguins|Flyers|Capitals|Devils|Islanders|Blue Jackets|Jets|Wild|Avalanche|Stars|Predators|Blues|Blackhawks|Kraken|Flames|Oilers|Canucks|Golden Knights|Coyotes|Ducks|Kings|Sharks|NHL|NFL|NBA|MLB|Premier League|Champions League|UFC|MMA|ATP|WTA|O/U \d)\b"
+    if re.search(sports_teams, question, re.IGNORECASE):
+        return "Sports"
+
+    # Crypto detection
+    crypto_terms = [
+        "bitcoin",
+        "btc",
+        "ethereum",
+        "eth",
+        "crypto",
+        "solana",
+        "sol",
+        "xrp",
+        "dogecoin",
+        "doge",
+        "altcoin",
+        "defi",
+        "nft",
+        "blockchain",
+    ]
+    for crypto_term in crypto_terms:
+        if crypto_term in raw_cat_lower or crypto_term in question_lower:
+            return "Crypto"
+
+    # If we have a specific category that's not "Other", keep it
+    if raw_cat and raw_cat not in ["Other", ""]:
+        return raw_cat
+
+    return "Other"
+
+
+def parse_bool(value: Any, default: bool) -> bool:
+    """Coerce an API boolean that may arrive as a string or be missing."""
+    if value is None:
+        return default
+    if isinstance(value, str):
+        return value.lower() == "true"
+    return bool(value)
+
+
+def _extract_event_id(market: dict[str, Any]) -> str | None:
+    # Event ID is in the events array, NOT a flat eventId field
+    # API returns: {"events": [{"id": "16092", ...}]}
+    events = market.get("events")
+    if events and isinstance(events, list) and isinstance(events[0], dict):
+        event_id = events[0].get("id")
+        if event_id:
+            return str(event_id)
+    # Fallback to legacy fields (some old APIs may use these)
+    event_id = market.get("eventId") or market.get("event_id")
+    return str(event_id) if event_id else None
+
+
+@dataclass(frozen=True)
+class MarketRecord:
+    """One explorer_markets row, in MARKET_COLUMNS order."""
+
+    condition_id: str
+    market_id: str | None
+    event_id: str | None
+    question: str
+    description: str | None
+    category: str | None
+    end_time: datetime | None
+    resolved: bool
+    status: str
+    yes_price: float | None
+    no_price: float | None
+    best_bid: float | None
+    best_ask: float | None
+    volume_24h: Decimal | None
+    volume_7d: Decimal | None
+    open_interest: Decimal | None
+    liquidity_score: Decimal | None
+    volume: Decimal | None
+    volume_num: Decimal | None
+    liquidity: Decimal | None
+    liquidity_num: Decimal | None
+    active: bool
+    closed: bool
+    spread: float | None
+    market_slug: str | None
+    event_slug: str | None
+    tokens_json: str | None
+    content_hash: str = field(default="", compare=False)
+
+    def with_hash(self) -> MarketRecord:
+        """Return a copy with content_hash computed from the column values."""
+        digest = hashlib.md5(repr(self.values()).encode("utf-8")).hexdigest()
+        return replace(self, content_hash=digest)
+
+    def values(self) -> tuple[Any, ...]:
+        """Column values in MARKET_COLUMNS order (without content_hash)."""
+        return _column_values(self)
+
+
+# Columns written by the sync, in MarketRecord field order
+MARKET_COLUMNS: tuple[str, ...] = tuple(f.name for f in fields(MarketRecord))[:-1]
+
+_column_values = attrgetter(*MARKET_COLUMNS)
+
+# Columns the price-only sync refreshes
+PRICE_COLUMNS: tuple[str, ...] = (
+    "yes_price",
+    "no_price",
+    "volume_24h",
+    "volume_7d",
+    "liquidity_score",
+)
+
+
+def parse_market(market: dict[str, Any]) -> MarketRecord | None:
+    """Build a MarketRecord from a Gamma /markets item, or None without a condition ID."""
+    condition_id = market.get("conditionId") or market.get("condition_id")
+    if not condition_id:
+        return None
+
+    description = market.get("description")
+    if description:
+        description = description[:2000]
+
+    active = parse_bool(market.get("active"), True)
+    closed = parse_bool(market.get("closed"), False)
+    resolved = closed or parse_bool(market.get("resolved"), False)
+
+    yes_price, no_price = parse_outcome_prices(market)
+    best_bid, best_ask = get_best_bid_ask(market)
+    spread = best_ask - best_bid if best_bid is not None and best_ask is not None else None
+
+    # volume24hr specifically; the API's "volume"/"volumeNum" are LIFETIME totals
+    volume_24h = safe_decimal(market.get("volume24hr"), max_val=MAX_AMOUNT)
+    liquidity_num = safe_decimal(
+        market.get("liquidityNum") or market.get("liquidity"), max_val=MAX_AMOUNT
+    )
+    tokens = market.get("tokens") or market.get("clobTokenIds")
+
+    return MarketRecord(
+        condition_id=condition_id,
+        market_id=str(market.get("id") or market.get("market_id") or "") or None,
+        event_id=_extract_event_id(market),
+        question=(market.get("question") or "")[:500],
+        description=description,
+        category=normalize_category(market),
+        end_time=parse_date(market.get("endDate") or market.get("end_date_iso")),
+        resolved=resolved,
+        status="resolved" if resolved else "active",
+        yes_price=yes_price,
+        no_price=no_price,
+        best_bid=best_bid,
+        best_ask=best_ask,
+        volume_24h=volume_24h,
+        volume_7d=safe_decimal(market.get("volume1wk"), max_val=MAX_AMOUNT),
+        open_interest=safe_decimal(
+            market.get("openInterest") or market.get("open_interest"), max_val=MAX_AMOUNT
+        ),
+        liquidity_score=liquidity_num,
+        volume=volume_24h,  # Also stored in volume for compatibility
+        volume_num=safe_decimal(
+            market.get("volumeNum") or market.get("volume"), max_val=MAX_AMOUNT
+        ),
+        liquidity=safe_decimal(
+            market.get("liquidity") or market.get("liquidityNum"), max_val=MAX_AMOUNT
+        ),
+        liquidity_num=liquidity_num,
+        active=active,
+        closed=closed,
+        spread=spread,
+        market_slug=market.get("slug") or market.get("market_slug"),
+        event_slug=market.get("eventSlug") or market.get("event_slug"),
+        tokens_json=json.dumps(tokens) if tokens else None,
+    ).with_hash()
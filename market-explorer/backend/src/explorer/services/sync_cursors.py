@@ -0,0 +1,62 @@
+"""
+Named sync positions in explorer_sync_cursors.
+
+A feed consumer stores how far it got under its own name: the catalog
+change feed stores the last seq it applied, and the incremental event sync
+stores the Gamma updatedAt it has fully caught up to (as epoch
+microseconds).
+
+Usage:
+    position = await load_cursor(conn, "market_catalog")
+    await save_cursor(conn, "market_catalog", position)
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import asyncpg
+
+CURSOR_DDL = """
+    CREATE TABLE IF NOT EXISTS explorer_sync_cursors (
+        name TEXT PRIMARY KEY,
+        position BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    )
+"""
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+async def load_cursor(conn: asyncpg.Connection, name: str) -> int | None:
+    """Return the stored position for `name`, or None if it has none yet."""
+    await conn.execute(CURSOR_DDL)
+    position: int | None = await conn.fetchval(
+        "SELECT position FROM explorer_sync_cursors WHERE name = $1", name
+    )
+    return position
+
+
+async def save_cursor(conn: asyncpg.Connection, name: str, position: int) -> None:
+    """Store `position` for `name`."""
+    await conn.execute(
+        """
+        INSERT INTO explorer_sync_cursors (name, position, updated_at)
+        VALUES ($1, $2, NOW())
+        ON CONFLICT (name) DO UPDATE SET
+            position = EXCLUDED.position,
+            updated_at = EXCLUDED.updated_at
+        """,
+        name,
+        position,
+    )
+
+
+def datetime_to_position(value: datetime) -> int:
+    """Encode a timestamp as a cursor position (epoch microseconds)."""
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def position_to_datetime(position: int) -> datetime:
+    """Decode a cursor position written by datetime_to_position."""
+    return _EPOCH + timedelta(microseconds=position)
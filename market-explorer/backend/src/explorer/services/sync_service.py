@@ -11,6 +11,9 @@ Environment variables:
     EXPLORER_DATABASE_URL - PostgreSQL connection string
     SYNC_INTERVAL_SECONDS - Full sync interval (default: 300 = 5 min)
     SYNC_PRICE_INTERVAL_SECONDS - Price-only sync interval (default: 30)
+    SYNC_SOURCE - "api" (default) fetches from the Gamma API; "catalog"
+        drains the bot's market_catalog change feed every
+        SYNC_PRICE_INTERVAL_SECONDS instead (see catalog_feed.py)
 """
 
 import asyncio
@@ -30,6 +33,10 @@ import httpx
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from explorer.config import settings
+from explorer.db.notifications import SYNC_COMPLETE_CHANNEL
+from explorer.services.catalog_feed import CatalogFeedConsumer
+from explorer.services.market_ingest import MarketIngestPipeline
+from explorer.services.sync_cursors import CURSOR_DDL
 
 logging.basicConfig(
     level=logging.INFO,
@@ -39,10 +46,12 @@ logging.basicConfig(
 logger = logging.getLogger("sync_service")
 
 # Configuration
-GAMMA_API = "https://gamma-api.polymarket.com"
 SYNC_INTERVAL = int(os.environ.get("SYNC_INTERVAL_SECONDS", "300"))  # 5 min default
 PRICE_SYNC_INTERVAL = int(os.environ.get("SYNC_PRICE_INTERVAL_SECONDS", "30"))
 ADVISORY_LOCK_ID = 12345  # Unique lock ID for market sync
+SYNC_CONCURRENCY = int(os.environ.get("SYNC_CONCURRENCY", "4"))  # Gamma pages in flight
+SYNC_REQUESTS_PER_SECOND = float(os.environ.get("SYNC_REQUESTS_PER_SECOND", "10"))
+SYNC_SOURCE = os.environ.get("SYNC_SOURCE", "api")  # "api" or "catalog"
 
 
 class SyncService:
@@ -59,7 +68,10 @@ class SyncService:
     async def start(self):
         """Start the sync service."""
         logger.info("Starting Market Explorer Sync Service")
-        logger.info(f"Full sync interval: {SYNC_INTERVAL}s, Price sync: {PRICE_SYNC_INTERVAL}s")
+        if SYNC_SOURCE == "catalog":
+            logger.info(f"Source: market_catalog change feed, every {PRICE_SYNC_INTERVAL}s")
+        else:
+            logger.info(f"Full sync interval: {SYNC_INTERVAL}s, Price sync: {PRICE_SYNC_INTERVAL}s")
 
         # Connect to database
         self.pool = await asyncpg.create_pool(
@@ -72,11 +84,15 @@ class SyncService:
         # Ensure schema exists
         await self._ensure_schema()
 
-        # Run sync loops
-        await asyncio.gather(
-            self._full_sync_loop(),
-            self._price_sync_loop(),
-        )
+        # Run sync loops. The catalog feed only carries changed markets, so
+        # one frequent loop replaces both the full and the price sync.
+        if SYNC_SOURCE == "catalog":
+            await self._full_sync_loop(interval=PRICE_SYNC_INTERVAL)
+        else:
+            await asyncio.gather(
+                self._full_sync_loop(),
+                self._price_sync_loop(),
+            )
 
     async def stop(self):
         """Stop the sync service gracefully."""
@@ -107,6 +123,17 @@ class SyncService:
                     api_retry_count INT DEFAULT 0
                 )
             """)
+            # Added by migration 007; repeated here for databases created by this service
+            await conn.execute("""
+                ALTER TABLE explorer_sync_runs
+                    ADD COLUMN IF NOT EXISTS rows_unchanged INT DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS rows_per_second NUMERIC(10,1)
+            """)
+            await conn.execute("""
+                ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS content_hash TEXT
+            """)
+            # Added by migration 009
+            await conn.execute(CURSOR_DDL)
 
     async def _acquire_lock(self, conn, lock_id: int) -> bool:
         """Try to acquire PostgreSQL advisory lock (non-blocking)."""
@@ -138,21 +165,40 @@ class SyncService:
         rows_failed: int = 0,
         error_message: Optional[str] = None,
         api_calls: int = 0,
+        api_retry_count: int = 0,
+        rows_unchanged: int = 0,
+        rows_per_second: Optional[float] = None,
     ):
-        """Record sync job completion."""
-        await conn.execute("""
-            UPDATE explorer_sync_runs
-            SET status = $2,
-                finished_at = NOW(),
-                duration_ms = EXTRACT(MILLISECONDS FROM (NOW() - started_at))::INT,
-                rows_fetched = $3,
-                rows_upserted = $4,
-                rows_failed = $5,
-                error_message = $6,
-                api_calls = $7
-            WHERE id = $1
+        """Record sync job completion.
+
+        Also notifies SYNC_COMPLETE_CHANNEL in the same statement, so API
+        caches are invalidated exactly when this run's writes are visible.
+        """
+        await conn.execute(f"""
+            WITH run AS (
+                UPDATE explorer_sync_runs
+                SET status = $2,
+                    finished_at = NOW(),
+                    duration_ms = EXTRACT(MILLISECONDS FROM (NOW() - started_at))::INT,
+                    rows_fetched = $3,
+                    rows_upserted = $4,
+                    rows_failed = $5,
+                    error_message = $6,
+                    api_calls = $7,
+                    api_retry_count = $8,
+                    rows_unchanged = $9,
+                    rows_per_second = $10
+                WHERE id = $1
+                RETURNING id, job_name, status, rows_upserted
+            )
+            SELECT pg_notify('{SYNC_COMPLETE_CHANNEL}', json_build_object(
+                'run_id', id, 'job_name', job_name,
+                'status', status, 'rows_upserted', rows_upserted
+            )::text)
+            FROM run
         """, run_id, status, rows_fetched, rows_upserted, rows_failed,
-             error_message[:500] if error_message else None, api_calls)
+             error_message[:500] if error_message else None, api_calls,
+             api_retry_count, rows_unchanged, rows_per_second)
 
     async def _record_sync_skipped(self, conn, job_name: str):
         """Record that sync was skipped due to lock."""
@@ -161,7 +207,7 @@ class SyncService:
             VALUES ($1, 'skipped', FALSE, NOW())
         """, job_name)
 
-    async def _full_sync_loop(self):
+    async def _full_sync_loop(self, interval: int = SYNC_INTERVAL):
         """Main loop for full market sync."""
         while self.running:
             try:
@@ -170,7 +216,7 @@ class SyncService:
                 logger.error(f"Full sync error: {e}", exc_info=True)
 
             # Wait for next interval
-            await asyncio.sleep(SYNC_INTERVAL)
+            await asyncio.sleep(interval)
 
     async def _price_sync_loop(self):
         """Loop for frequent price updates (lighter sync)."""
@@ -205,8 +251,10 @@ class SyncService:
 
                 elapsed = time.time() - start_time
                 logger.info(
-                    f"Full sync complete: {stats['upserted']} markets "
-                    f"in {elapsed:.1f}s ({stats['api_calls']} API calls)"
+                    f"Full sync complete: {stats['upserted']} changed, "
+                    f"{stats['unchanged']} unchanged of {stats['fetched']} markets "
+                    f"in {elapsed:.1f}s ({stats['rows_per_second']} rows/s, "
+                    f"{stats['api_calls']} API calls)"
                 )
 
                 await self._record_sync_end(
@@ -215,6 +263,9 @@ class SyncService:
                     rows_upserted=stats["upserted"],
                     rows_failed=stats["failed"],
                     api_calls=stats["api_calls"],
+                    api_retry_count=stats["api_retries"],
+                    rows_unchanged=stats["unchanged"],
+                    rows_per_second=stats["rows_per_second"],
                 )
 
             except Exception as e:
@@ -254,6 +305,9 @@ class SyncService:
                     rows_fetched=stats["fetched"],
                     rows_upserted=stats["upserted"],
                     api_calls=stats["api_calls"],
+                    api_retry_count=stats["api_retries"],
+                    rows_unchanged=stats["unchanged"],
+                    rows_per_second=stats["rows_per_second"],
                 )
 
             except Exception as e:
@@ -272,153 +326,28 @@ class SyncService:
         limit: Optional[int] = None,
         price_only: bool = False,
     ) -> dict:
-        """Fetch and sync markets from Polymarket Gamma API."""
-        import json
-        from decimal import Decimal, InvalidOperation
-
-        def safe_float(val):
-            if val is None:
-                return None
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return None
-
-        def safe_decimal(val, max_val=999999999.99):
-            if val is None:
-                return None
-            try:
-                f = float(val)
-                if f > max_val:
-                    f = max_val
-                return Decimal(str(round(f, 2)))
-            except (ValueError, TypeError, InvalidOperation):
-                return None
+        """Fetch and sync markets from Polymarket Gamma API.
 
-        stats = {"fetched": 0, "upserted": 0, "failed": 0, "api_calls": 0}
+        Pages are fetched concurrently and written in bulk batches on
+        `conn` (see explorer.services.market_ingest). With
+        SYNC_SOURCE=catalog, applies the bot's change feed instead.
+        """
+        if SYNC_SOURCE == "catalog":
+            stats = await CatalogFeedConsumer(conn).run()
+            return stats.as_dict()
 
         async with httpx.AsyncClient(timeout=30.0) as client:
-            all_markets = []
-            offset = 0
-            batch_size = 100
-
-            while True:
-                params = {"limit": batch_size, "offset": offset}
-                if active_only:
-                    params["active"] = "true"
-                    params["closed"] = "false"
-
-                try:
-                    resp = await client.get(f"{GAMMA_API}/markets", params=params)
-                    stats["api_calls"] += 1
-
-                    if resp.status_code == 429:
-                        # Rate limited - wait and retry
-                        retry_after = int(resp.headers.get("Retry-After", "60"))
-                        logger.warning(f"Rate limited, waiting {retry_after}s")
-                        await asyncio.sleep(retry_after)
-                        continue
-
-                    resp.raise_for_status()
-                    markets = resp.json()
-
-                except Exception as e:
-                    logger.error(f"API error at offset {offset}: {e}")
-                    break
-
-                if not markets:
-                    break
-
-                all_markets.extend(markets)
-                offset += batch_size
-
-                if limit and len(all_markets) >= limit:
-                    all_markets = all_markets[:limit]
-                    break
-
-                # Rate limit protection
-                await asyncio.sleep(0.1)
-
-            stats["fetched"] = len(all_markets)
-
-            # Upsert markets
-            for market in all_markets:
-                try:
-                    condition_id = market.get("conditionId") or market.get("condition_id")
-                    if not condition_id:
-                        continue
-
-                    # Parse prices
-                    prices = market.get("outcomePrices")
-                    yes_price = no_price = None
-                    if prices:
-                        if isinstance(prices, str):
-                            prices = json.loads(prices)
-                        if prices and len(prices) >= 2:
-                            yes_price = safe_float(prices[0])
-                            no_price = safe_float(prices[1])
-                        elif prices and len(prices) == 1:
-                            yes_price = safe_float(prices[0])
-                            no_price = 1.0 - yes_price if yes_price else None
-
-                    # Parse volumes
-                    volume_24h = safe_decimal(market.get("volume24hr"))
-                    volume_7d = safe_decimal(market.get("volume1wk"))
-                    liquidity = safe_decimal(market.get("liquidityNum") or market.get("liquidity"))
-
-                    # Extract event_id from events array
-                    event_id = None
-                    events = market.get("events")
-                    if events and isinstance(events, list) and len(events) > 0:
-                        event_id = events[0].get("id")
-                    # Fallback to legacy fields
-                    if not event_id:
-                        event_id = market.get("eventId") or market.get("event_id")
-
-                    if price_only:
-                        # Lighter update - just prices and volume
-                        await conn.execute("""
-                            UPDATE explorer_markets
-                            SET yes_price = $2,
-                                no_price = $3,
-                                volume_24h = $4,
-                                volume_7d = $5,
-                                liquidity_score = $6,
-                                updated_at = NOW()
-                            WHERE condition_id = $1
-                        """, condition_id, yes_price, no_price, volume_24h, volume_7d, liquidity)
-                    else:
-                        # Full upsert
-                        question = (market.get("question") or "")[:500]
-                        description = market.get("description")
-                        if description:
-                            description = description[:2000]
-
-                        await conn.execute("""
-                            INSERT INTO explorer_markets (
-                                condition_id, event_id, question, description, yes_price, no_price,
-                                volume_24h, volume_7d, liquidity_score, updated_at
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, NOW())
-                            ON CONFLICT (condition_id) DO UPDATE SET
-                                event_id = EXCLUDED.event_id,
-                                question = EXCLUDED.question,
-                                description = EXCLUDED.description,
-                                yes_price = EXCLUDED.yes_price,
-                                no_price = EXCLUDED.no_price,
-                                volume_24h = EXCLUDED.volume_24h,
-                                volume_7d = EXCLUDED.volume_7d,
-                                liquidity_score = EXCLUDED.liquidity_score,
-                                updated_at = NOW()
-                        """, condition_id, event_id, question, description, yes_price, no_price,
-                             volume_24h, volume_7d, liquidity)
-
-                    stats["upserted"] += 1
-
-                except Exception as e:
-                    logger.debug(f"Failed to upsert market: {e}")
-                    stats["failed"] += 1
-
-        return stats
+            pipeline = MarketIngestPipeline(
+                conn,
+                client,
+                active_only=active_only,
+                limit=limit,
+                price_only=price_only,
+                concurrency=SYNC_CONCURRENCY,
+                requests_per_second=SYNC_REQUESTS_PER_SECOND,
+            )
+            stats = await pipeline.run()
+        return stats.as_dict()
 
 
 async def main():
@@ -11,6 +11,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from explorer.api.response_cache import ResponseCache
+from explorer.db.pagination import InvalidCursorError
 from explorer.db.repositories import MarketRepository, PaginatedResult
 from explorer.models.market import (
     Market,
@@ -60,11 +62,13 @@ def create_test_app(mock_repo: MarketRepository) -> FastAPI:
         list_markets,
         get_market_by_id,
         search_markets,
+        autocomplete_markets,
         get_categories,
         get_volume_leaders,
         get_event_markets,
         get_market_repo,
         set_market_repo,
+        get_sync_status,
         HealthResponse,
         PaginatedMarketsResponse,
         MarketResponse,
@@ -83,10 +87,16 @@ def create_test_app(mock_repo: MarketRepository) -> FastAPI:
     test_app.get("/health", response_model=HealthResponse)(health_check)
     test_app.get("/api/markets", response_model=PaginatedMarketsResponse)(list_markets)
     test_app.get("/api/markets/search")(search_markets)
-    test_app.get("/api/markets/leaders/volume")(get_volume_leaders)
+    test_app.get("/api/markets/autocomplete")(autocomplete_markets)
+    test_app.get("/api/markets/leaders/volume", response_model=list[MarketResponse])(
+        get_volume_leaders
+    )
     test_app.get("/api/markets/{condition_id}", response_model=MarketResponse)(get_market_by_id)
-    test_app.get("/api/categories")(get_categories)
-    test_app.get("/api/events/{event_id}/markets")(get_event_markets)
+    test_app.get("/api/categories", response_model=dict[str, int])(get_categories)
+    test_app.get("/api/events/{event_id}/markets", response_model=list[MarketResponse])(
+        get_event_markets
+    )
+    test_app.get("/api/sync/status")(get_sync_status)
 
     return test_app
 
@@ -266,6 +276,20 @@ class TestSearchEndpoint:
 
         assert response.status_code == 422
 
+    def test_autocomplete(self, client, mock_repo):
+        """GET /api/markets/autocomplete should return prefix suggestions."""
+        mock_repo.autocomplete.return_value = [
+            {"condition_id": "0x001", "question": "Will Bitcoin hit $150k?", "category": "crypto"},
+        ]
+
+        response = client.get("/api/markets/autocomplete", params={"q": "bitc", "limit": 5})
+
+        assert response.status_code == 200
+        assert response.json() == [
+            {"condition_id": "0x001", "question": "Will Bitcoin hit $150k?", "category": "crypto"},
+        ]
+        mock_repo.autocomplete.assert_called_once_with("bitc", limit=5, active_only=True)
+
 
 class TestCategoriesEndpoint:
     """Test the categories endpoint."""
@@ -394,3 +418,128 @@ class TestMarketResponseSchema:
         data = response.json()
         assert data["price"] is None
         assert data["liquidity"] is None
+
+
+class TestCursorPagination:
+    """Test keyset pagination through /api/markets."""
+
+    def test_cursor_passed_through_and_returned(self, client, mock_repo, sample_market):
+        """?cursor= should reach the repository and next_cursor should be returned."""
+        mock_repo.list_markets.return_value = PaginatedResult(
+            items=[sample_market],
+            total=100,
+            page=1,
+            page_size=1,
+            total_pages=100,
+            next_cursor="abc",
+            has_more=True,
+        )
+
+        response = client.get("/api/markets", params={"cursor": "xyz", "page_size": 1})
+
+        assert response.status_code == 200
+        assert mock_repo.list_markets.call_args[1]["cursor"] == "xyz"
+        data = response.json()
+        assert data["next_cursor"] == "abc"
+        assert data["has_next"] is True
+        assert data["total_is_estimate"] is False
+
+    def test_invalid_cursor_is_400(self, client, mock_repo):
+        """Malformed cursors should be rejected with 400."""
+        mock_repo.list_markets.side_effect = InvalidCursorError("Malformed cursor")
+
+        response = client.get("/api/markets", params={"cursor": "bad"})
+
+        assert response.status_code == 400
+
+
+class TestResponseCache:
+    """Test cached aggregate endpoints."""
+
+    @pytest.fixture
+    def cache(self):
+        from explorer.api.main import set_response_cache
+
+        cache = ResponseCache()
+        set_response_cache(cache)
+        yield cache
+        set_response_cache(None)
+
+    def test_repeat_requests_served_from_cache(self, client, mock_repo, cache):
+        """Equivalent requests should hit the repository once."""
+        mock_repo.get_categories.return_value = {"crypto": 150}
+
+        first = client.get("/api/categories")
+        # Explicit default and an unknown param normalize to the same key
+        second = client.get("/api/categories", params={"include_closed": "false", "x": "1"})
+
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json() == {"crypto": 150}
+        assert mock_repo.get_categories.call_count == 1
+        assert first.headers["etag"] == second.headers["etag"]
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["bytes"] > 0
+
+    def test_if_none_match_returns_304(self, client, mock_repo, cache):
+        """A matching If-None-Match should get an empty 304."""
+        mock_repo.get_volume_leaders.return_value = []
+
+        etag = client.get("/api/markets/leaders/volume").headers["etag"]
+        response = client.get("/api/markets/leaders/volume", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert cache.get_stats()["not_modified"] == 1
+
+    def test_invalidate_forces_recompute(self, client, mock_repo, cache):
+        """A sync notification should drop cached responses."""
+        mock_repo.get_categories.return_value = {"crypto": 150}
+        client.get("/api/categories")
+
+        cache.invalidate({"job_name": "market_sync_full", "status": "success"})
+        mock_repo.get_categories.return_value = {"crypto": 151}
+        response = client.get("/api/categories")
+
+        assert response.json() == {"crypto": 151}
+        assert mock_repo.get_categories.call_count == 2
+
+    def test_sync_status_reports_cache_stats(self, client, mock_repo, cache):
+        """/api/sync/status should expose hit ratio and memory use."""
+        mock_repo.get_categories.return_value = {"crypto": 150}
+        client.get("/api/categories")
+        client.get("/api/categories")
+
+        with patch("explorer.api.main.db") as mock_db:
+            mock_db.fetch = AsyncMock(return_value=[])
+            response = client.get("/api/sync/status")
+
+        stats = response.json()["response_cache"]
+        assert stats["hit_ratio"] == 0.5
+        assert stats["entries"] == 1
+        assert stats["bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_computation(self):
+        """Concurrent misses coalesce; results computed across an invalidation are not stored."""
+        import asyncio
+
+        cache = ResponseCache()
+        calls = 0
+        release = asyncio.Event()
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return {"n": calls}
+
+        tasks = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(3)]
+        await asyncio.sleep(0)
+        cache.invalidate()
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert {r.body for r in results} == {b'{"n":1}'}
+        assert cache.get_stats()["entries"] == 0
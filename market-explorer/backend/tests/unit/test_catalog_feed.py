@@ -0,0 +1,79 @@
+"""
+Tests for the market_catalog change-feed consumer.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from explorer.services.catalog_feed import FEED_SQL, MARK_DELISTED_SQL, CatalogFeedConsumer
+from explorer.services.market_ingest import MERGE_SQL
+
+
+def feed_row(seq: int, condition_id: str, resolved: bool = False, closed: bool = False) -> dict:
+    payload = {
+        "conditionId": condition_id,
+        "question": f"{condition_id}?",
+        "slug": condition_id,
+        "active": True,
+        "closed": closed,
+        "outcomePrices": json.dumps(["0.6", "0.4"]),
+    }
+    return {"seq": seq, "resolved": resolved, "payload": json.dumps(payload)}
+
+
+class TestCatalogFeedConsumer:
+    """Test cursor handling and delisting."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = MagicMock()
+        conn.saved = []
+        conn.rows = []
+
+        async def execute(sql, *args):
+            if sql is MERGE_SQL:
+                return f"INSERT 0 {conn.staged}"
+            if "explorer_sync_cursors" in sql and args:
+                conn.saved.append(args[1])
+            return "OK"
+
+        async def fetch(sql, after, limit):
+            assert sql is FEED_SQL
+            return [r for r in conn.rows if r["seq"] > after][:limit]
+
+        async def copy_records_to_table(table, records, columns):
+            conn.staged = len(records)
+
+        conn.execute = AsyncMock(side_effect=execute)
+        conn.fetch = AsyncMock(side_effect=fetch)
+        conn.fetchval = AsyncMock(return_value=2)
+        conn.copy_records_to_table = AsyncMock(side_effect=copy_records_to_table)
+        conn.transaction = MagicMock(return_value=AsyncMock())
+        return conn
+
+    async def test_resumes_after_stored_cursor(self, conn):
+        conn.rows = [feed_row(seq, f"0x{seq}") for seq in range(1, 8)]
+
+        stats = await CatalogFeedConsumer(conn, batch_size=2).run()
+
+        assert stats.fetched == 5
+        assert stats.upserted == 5
+        assert conn.saved == [4, 6, 7]
+
+    async def test_delisted_open_market_is_marked_stale(self, conn):
+        conn.fetchval.return_value = None
+        conn.rows = [
+            feed_row(1, "0xopen"),
+            feed_row(2, "0xgone", resolved=True),
+            feed_row(3, "0xclosed", resolved=True, closed=True),
+        ]
+
+        stats = await CatalogFeedConsumer(conn).run()
+
+        delisted = [c.args[1] for c in conn.execute.call_args_list if c.args[0] is MARK_DELISTED_SQL]
+        assert delisted == [["0xgone"]]
+        # The closed payload carries its own status; it goes through the merge
+        assert stats.upserted == 2
+        assert conn.saved == [3]
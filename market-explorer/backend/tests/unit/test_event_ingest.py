@@ -0,0 +1,204 @@
+"""
+Tests for the bulk event sync pipeline.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import httpx
+import pytest
+
+from explorer.services.event_ingest import (
+    CURSOR_NAME,
+    EVENT_COLUMNS,
+    LINK_SQL,
+    EventIngestPipeline,
+    parse_event,
+)
+from explorer.services.market_ingest import IngestStats, RateBudget, fetch_pages
+from explorer.services.sync_cursors import datetime_to_position, position_to_datetime
+
+
+def gamma_event(i: int, updated: str = "2026-10-01T00:00:00Z", markets: int = 2) -> dict:
+    return {
+        "id": str(i),
+        "title": f"Event {i}",
+        "slug": f"event-{i}",
+        "volume": "1500000.5",
+        "volume24hr": 2500,
+        "active": True,
+        "closed": False,
+        "updatedAt": updated,
+        "markets": [
+            {"conditionId": f"0x{i:03d}{j}", "active": True, "closed": j == 1}
+            for j in range(markets)
+        ],
+    }
+
+
+def client_for(
+    events: list[dict], fail_at: int | None = None
+) -> tuple[httpx.AsyncClient, list[int]]:
+    offsets: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        offsets.append(offset)
+        if offset == fail_at:
+            return httpx.Response(500)
+        return httpx.Response(200, json=events[offset : offset + limit])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler)), offsets
+
+
+class TestParseEvent:
+    """Test EventRecord parsing."""
+
+    def test_parses_event_and_children(self):
+        record, condition_ids = parse_event(gamma_event(7))
+
+        assert record.event_id == "7"
+        assert str(record.volume) == "1500000.5"
+        assert (record.market_count, record.active_market_count) == (2, 1)
+        assert record.source_updated_at.tzinfo is not None
+        assert condition_ids == ["0x0070", "0x0071"]
+        assert len(EVENT_COLUMNS) == 20
+
+    def test_missing_id_is_skipped(self):
+        assert parse_event({"title": "No id"}) is None
+
+
+class TestFetchPagesStopWhen:
+    """Test early stop for incremental walks."""
+
+    async def test_stops_after_matching_page(self):
+        client, offsets = client_for([{"n": i} for i in range(100)])
+        items = []
+
+        async for page in fetch_pages(
+            client,
+            {},
+            IngestStats(),
+            RateBudget(0),
+            page_size=10,
+            concurrency=1,
+            stop_when=lambda page: page[0]["n"] >= 30,
+        ):
+            items.extend(page)
+
+        assert len(items) == 40
+        assert max(offsets) < 100
+
+
+class TestEventIngestPipeline:
+    """Test batched writes, market linking and incremental mode."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = MagicMock()
+
+        async def execute(sql, *args):
+            if sql is LINK_SQL:
+                return f"UPDATE {len(args[0])}"
+            return "OK"
+
+        conn.execute = AsyncMock(side_effect=execute)
+        conn.fetchval = AsyncMock(return_value=None)
+        conn.copy_records_to_table = AsyncMock()
+        conn.transaction = MagicMock(return_value=AsyncMock())
+        return conn
+
+    def link_calls(self, conn) -> list[tuple]:
+        return [c.args[1:] for c in conn.execute.call_args_list if c.args[0] is LINK_SQL]
+
+    def saved_watermarks(self, conn) -> list[datetime]:
+        return [
+            position_to_datetime(c.args[2])
+            for c in conn.execute.call_args_list
+            if "INSERT INTO explorer_sync_cursors" in c.args[0]
+        ]
+
+    async def test_links_markets_once_per_batch(self, conn):
+        client, _ = client_for([gamma_event(i) for i in range(5)])
+        pipeline = EventIngestPipeline(
+            conn, client, page_size=10, batch_size=3, requests_per_second=0
+        )
+
+        stats = await pipeline.run()
+
+        links = self.link_calls(conn)
+        assert len(links) == stats.batches == 1
+        condition_ids, event_ids = links[0]
+        assert condition_ids[:2] == ["0x0000", "0x0001"]
+        assert event_ids[:2] == ["0", "0"]
+        assert (stats.upserted, stats.markets_linked) == (5, 10)
+
+    async def test_incremental_stops_at_watermark(self, conn):
+        conn.fetchval.return_value = datetime_to_position(
+            datetime(2026, 10, 1, tzinfo=timezone.utc)
+        )
+        events = [gamma_event(i, updated="2026-10-02T00:00:00Z") for i in range(3)] + [
+            gamma_event(i, updated="2026-09-01T00:00:00Z") for i in range(3, 50)
+        ]
+        client, offsets = client_for(events)
+        pipeline = EventIngestPipeline(
+            conn, client, incremental=True, page_size=5, concurrency=1, requests_per_second=0
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.upserted == 3
+        assert stats.unchanged == 7
+        assert max(offsets) < 50
+        assert conn.fetchval.call_args.args[1] == CURSOR_NAME
+        assert self.saved_watermarks(conn) == [datetime(2026, 10, 2, tzinfo=timezone.utc)]
+        assert pipeline.watermark_advanced
+
+    async def test_watermark_kept_when_walk_is_cut_short(self, conn, monkeypatch):
+        """Newer events were written, but the gap below them must be re-read."""
+        monkeypatch.setattr("explorer.services.market_ingest.asyncio.sleep", AsyncMock())
+        conn.fetchval.return_value = datetime_to_position(datetime(2026, 9, 1, tzinfo=timezone.utc))
+        events = [gamma_event(i, updated="2026-10-02T00:00:00Z") for i in range(20)]
+        client, _ = client_for(events, fail_at=5)
+        pipeline = EventIngestPipeline(
+            conn, client, incremental=True, page_size=5, concurrency=1, requests_per_second=0
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.upserted == 5
+        assert stats.page_errors == 1
+        assert self.saved_watermarks(conn) == []
+        assert not pipeline.watermark_advanced
+
+    async def test_first_incremental_run_walks_everything(self, conn):
+        events = [gamma_event(i, updated=f"2026-10-0{1 + i % 3}T00:00:00Z") for i in range(7)]
+        client, _ = client_for(events)
+        pipeline = EventIngestPipeline(
+            conn, client, incremental=True, page_size=5, requests_per_second=0
+        )
+
+        stats = await pipeline.run()
+
+        assert pipeline.since is None
+        assert stats.upserted == 7
+        assert self.saved_watermarks(conn) == [datetime(2026, 10, 3, tzinfo=timezone.utc)]
+
+    async def test_bad_event_does_not_abort_batch(self, conn):
+        def copy(table, records, columns):
+            if any(r[0] == "3" for r in records):
+                raise asyncpg.DataError("numeric field overflow")
+
+        conn.copy_records_to_table = AsyncMock(side_effect=copy)
+        client, _ = client_for([gamma_event(i) for i in range(8)])
+        pipeline = EventIngestPipeline(
+            conn, client, page_size=10, batch_size=8, requests_per_second=0
+        )
+
+        stats = await pipeline.run()
+
+        assert stats.failed == 1
+        assert stats.upserted == 7
+        assert stats.markets_linked == 14
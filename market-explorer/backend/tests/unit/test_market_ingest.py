@@ -0,0 +1,175 @@
+"""
+Tests for the bulk market sync pipeline.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import asyncpg
+import httpx
+import pytest
+
+from explorer.services.market_ingest import (
+    BulkMarketWriter,
+    IngestStats,
+    RateBudget,
+    fetch_pages,
+)
+from explorer.services.market_records import MARKET_COLUMNS, parse_market
+
+
+def gamma_market(i: int, price: str = "0.42") -> dict:
+    return {
+        "conditionId": f"0x{i:04d}",
+        "id": str(i),
+        "question": f"Will Bitcoin hit ${i}k?",
+        "outcomePrices": json.dumps([price, "0.58"]),
+        "bestBid": "0.41",
+        "bestAsk": "0.43",
+        "volume24hr": 1250.5,
+        "liquidityNum": "900",
+        "events": [{"id": "ev1"}],
+        "endDate": "2026-12-31T00:00:00Z",
+        "active": True,
+        "closed": False,
+    }
+
+
+class TestParseMarket:
+    """Test MarketRecord parsing."""
+
+    def test_parses_typed_fields(self):
+        record = parse_market(gamma_market(1))
+
+        assert record.condition_id == "0x0001"
+        assert record.event_id == "ev1"
+        assert record.yes_price == 0.42
+        assert str(record.volume_24h) == "1250.5"
+        assert record.end_time.tzinfo is not None
+        assert record.category == "Crypto"
+        assert record.status == "active"
+        assert len(record.values()) == len(MARKET_COLUMNS)
+
+    def test_missing_condition_id_is_skipped(self):
+        assert parse_market({"question": "No id?"}) is None
+
+    def test_content_hash_tracks_content(self):
+        assert parse_market(gamma_market(1)).content_hash == parse_market(gamma_market(1)).content_hash
+        assert (
+            parse_market(gamma_market(1)).content_hash
+            != parse_market(gamma_market(1, price="0.43")).content_hash
+        )
+
+
+class TestFetchPages:
+    """Test concurrent page fetching."""
+
+    @staticmethod
+    def client_for(total: int, fail_first: int = 0) -> tuple[httpx.AsyncClient, list[int]]:
+        offsets: list[int] = []
+        calls = {"n": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["n"] += 1
+            if calls["n"] <= fail_first:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            offsets.append(offset)
+            return httpx.Response(200, json=[gamma_market(i) for i in range(offset, min(offset + limit, total))])
+
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler)), offsets
+
+    async def collect(self, client, stats, **kwargs) -> list[dict]:
+        items = []
+        async for page in fetch_pages(client, {}, stats, RateBudget(0), page_size=10, **kwargs):
+            items.extend(page)
+        return items
+
+    async def test_fetches_every_page_concurrently(self):
+        client, offsets = self.client_for(95)
+        stats = IngestStats()
+
+        items = await self.collect(client, stats, concurrency=4)
+
+        assert sorted(m["conditionId"] for m in items) == [f"0x{i:04d}" for i in range(95)]
+        # Short page at offset 90 ends the walk; at most `concurrency` extra calls
+        assert set(range(0, 100, 10)) <= set(offsets)
+        assert stats.page_errors == 0
+
+    async def test_limit_trims_last_page(self):
+        client, _ = self.client_for(1000)
+
+        items = await self.collect(client, IngestStats(), concurrency=3, limit=25)
+
+        assert len(items) == 25
+
+    async def test_rate_limited_page_is_retried(self):
+        client, _ = self.client_for(15, fail_first=1)
+        stats = IngestStats()
+
+        items = await self.collect(client, stats, concurrency=1)
+
+        assert len(items) == 15
+        assert stats.api_retries == 1
+
+
+class TestBulkMarketWriter:
+    """Test batching, hash skipping and bad-row isolation."""
+
+    @pytest.fixture
+    def conn(self):
+        conn = MagicMock()
+        conn.execute = AsyncMock(side_effect=lambda sql, *a: "INSERT 0 %d" % conn.last_batch)
+        conn.fetch = AsyncMock(return_value=[])
+        conn.last_batch = 0
+
+        async def copy(table, records, columns):
+            conn.last_batch = len(records)
+            if any(r[0] == "0xbad" for r in records):
+                raise asyncpg.DataError("numeric field overflow")
+
+        conn.copy_records_to_table = AsyncMock(side_effect=copy)
+        conn.transaction = MagicMock(return_value=AsyncMock())
+        return conn
+
+    async def test_unchanged_rows_are_not_written(self, conn):
+        unchanged = parse_market(gamma_market(1))
+        conn.fetch.return_value = [{"condition_id": "0x0001", "content_hash": unchanged.content_hash}]
+        stats = IngestStats()
+        writer = BulkMarketWriter(conn, stats, batch_size=10)
+        await writer.prepare()
+
+        await writer.add(unchanged)
+        await writer.add(parse_market(gamma_market(2)))
+        await writer.flush()
+
+        written = conn.copy_records_to_table.call_args[1]["records"]
+        assert [r[0] for r in written] == ["0x0002"]
+        assert (stats.upserted, stats.unchanged) == (1, 1)
+        assert writer.seen_ids == {"0x0001", "0x0002"}
+
+    async def test_batches_flush_at_batch_size(self, conn):
+        stats = IngestStats()
+        writer = BulkMarketWriter(conn, stats, batch_size=2)
+        await writer.prepare()
+
+        for i in range(5):
+            await writer.add(parse_market(gamma_market(i)))
+        await writer.flush()
+
+        assert conn.copy_records_to_table.call_count == 3
+        assert stats.upserted == 5
+
+    async def test_bad_row_is_isolated(self, conn):
+        stats = IngestStats()
+        writer = BulkMarketWriter(conn, stats, batch_size=100)
+        await writer.prepare()
+        bad = dict(gamma_market(9), conditionId="0xbad")
+
+        for market in [gamma_market(1), gamma_market(2), bad, gamma_market(3)]:
+            await writer.add(parse_market(market))
+        await writer.flush()
+
+        assert stats.failed == 1
+        assert stats.upserted == 3
@@ -18,6 +18,7 @@ from explorer.models.market import (
     PriceData,
     LiquidityData,
 )
+from explorer.db.pagination import CountCache, Cursor, InvalidCursorError
 from explorer.db.repositories import (
     MarketRepository,
     MarketFilter,
@@ -314,8 +315,10 @@ class TestMarketRepository:
 
         call_args = mock_db.fetch.call_args
         query = call_args[0][0]
-        # Should use ILIKE or full-text search
-        assert "question" in query.lower() or "search" in query.lower()
+        # Indexed full-text/trigram match with the raw term, not ILIKE '%term%'
+        assert "market_search_match(search_tsv, question, $1)" in query
+        assert "ilike" not in query.lower()
+        assert call_args[0][1] == "bitcoin"
 
     @pytest.mark.asyncio
     async def test_list_markets_pagination(self, repo, mock_db):
@@ -391,6 +394,27 @@ class TestMarketRepository:
         assert len(results) == 1
         assert "bitcoin" in results[0].question.lower()
 
+        query = mock_db.fetch.call_args[0][0]
+        assert "market_search_match(search_tsv, question, $1)" in query
+        assert "ORDER BY market_search_rank(search_tsv, question, $1) DESC" in query
+
+    @pytest.mark.asyncio
+    async def test_autocomplete(self, repo, mock_db):
+        """autocomplete should prefix-match via the tsvector index."""
+        mock_db.fetch.return_value = [
+            {"condition_id": "0x001", "question": "Will Bitcoin hit $150k?", "category": "crypto"},
+        ]
+
+        suggestions = await repo.autocomplete("bitc", limit=5)
+
+        assert suggestions == [
+            {"condition_id": "0x001", "question": "Will Bitcoin hit $150k?", "category": "crypto"},
+        ]
+        query, prefix, limit = mock_db.fetch.call_args[0]
+        assert "search_tsv @@ market_search_tsquery($1)" in query
+        assert "status = 'active'" in query
+        assert (prefix, limit) == ("bitc", 5)
+
     @pytest.mark.asyncio
     async def test_get_volume_leaders(self, repo, mock_db):
         """get_volume_leaders should return top markets by volume."""
@@ -468,3 +492,121 @@ class TestMarketRepository:
         call_args = mock_db.fetch.call_args
         query = call_args[0][0]
         assert "event_id" in query.lower()
+
+
+def _page_rows(n: int, start: int = 0) -> list[dict]:
+    """Minimal market rows sorted by volume_24h DESC."""
+    return [
+        {
+            "condition_id": f"0x{i:03d}",
+            "question": f"Market {i}?",
+            "status": "active",
+            "volume_24h": Decimal(1000 - i),
+        }
+        for i in range(start, start + n)
+    ]
+
+
+class TestKeysetPagination:
+    """Test cursor-based pagination and cached totals."""
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create a mock database connection."""
+        return AsyncMock()
+
+    @pytest.fixture
+    def repo(self, mock_db):
+        """Create a repository with mock db."""
+        return MarketRepository(mock_db)
+
+    def test_cursor_roundtrip(self):
+        """Cursors should survive encode/decode with typed values."""
+        cursor = Cursor(field="end_time", descending=False,
+                        value=datetime(2025, 1, 2, tzinfo=timezone.utc), condition_id="0xabc")
+        assert Cursor.decode(cursor.encode()) == cursor
+
+        numeric = Cursor(field="volume_24h", descending=True, value=Decimal("12.50"), condition_id="0x1")
+        assert Cursor.decode(numeric.encode()) == numeric
+
+    def test_malformed_cursor_rejected(self):
+        """Garbage cursors should raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            Cursor.decode("not-a-cursor")
+
+    @pytest.mark.asyncio
+    async def test_offset_page_returns_next_cursor(self, repo, mock_db):
+        """A full offset page should hand out a cursor for the following page."""
+        mock_db.fetch.return_value = _page_rows(2)
+        mock_db.fetchval.return_value = 10
+
+        result = await repo.list_markets(page_size=2)
+
+        cursor = Cursor.decode(result.next_cursor)
+        assert cursor.field == "volume_24h"
+        assert cursor.value == Decimal(999)
+        assert cursor.condition_id == "0x001"
+
+    @pytest.mark.asyncio
+    async def test_cursor_page_uses_keyset_predicate(self, repo, mock_db):
+        """Cursor pages should seek past the cursor row instead of using OFFSET."""
+        token = Cursor("volume_24h", True, Decimal("999"), "0x001").encode()
+        mock_db.fetch.return_value = _page_rows(3, start=2)
+        mock_db.fetchval.return_value = 10
+
+        result = await repo.list_markets(page_size=2, cursor=token)
+
+        query, *args = mock_db.fetch.call_args[0]
+        assert "offset" not in query.lower()
+        assert "(volume_24h, condition_id) <" in query
+        assert "volume_24h IS NULL" in query
+        assert args[-3:] == [Decimal("999"), "0x001", 3]  # page_size + 1 lookahead
+        assert len(result.items) == 2
+        assert result.has_next is True
+        assert Cursor.decode(result.next_cursor).condition_id == "0x003"
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort_rejected(self, repo, mock_db):
+        """A cursor issued for one sort order cannot be used with another."""
+        token = Cursor("volume_24h", True, Decimal("1"), "0x001").encode()
+
+        with pytest.raises(InvalidCursorError):
+            await repo.list_markets(sort=SortOrder(field="end_time"), cursor=token)
+
+    @pytest.mark.asyncio
+    async def test_count_cached_until_sync_completes(self, mock_db):
+        """Totals are reused until explorer_sync_runs reports a new completed run."""
+        repo = MarketRepository(mock_db, count_cache=CountCache(generation_check_seconds=0))
+        generation = {"value": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+        counts = []
+
+        async def fetchval(query, *args):
+            if "explorer_sync_runs" in query:
+                return generation["value"]
+            counts.append(query)
+            return 42
+
+        mock_db.fetchval.side_effect = fetchval
+        mock_db.fetch.return_value = []
+
+        await repo.list_markets(page=1)
+        await repo.list_markets(page=2)
+        assert len(counts) == 1
+
+        generation["value"] = datetime(2025, 1, 1, 0, 1, tzinfo=timezone.utc)
+        result = await repo.list_markets(page=3)
+        assert len(counts) == 2
+        assert result.total == 42
+
+    @pytest.mark.asyncio
+    async def test_unfiltered_total_uses_planner_estimate(self, repo, mock_db):
+        """With no filter at all, the total comes from pg_class instead of COUNT(*)."""
+        mock_db.fetchval.return_value = 5000
+        mock_db.fetch.return_value = []
+
+        result = await repo.list_markets(market_filter=MarketFilter(active_only=False))
+
+        query = mock_db.fetchval.call_args[0][0]
+        assert "reltuples" in query
+        assert result.total == 5000
+        assert result.total_is_estimate is True
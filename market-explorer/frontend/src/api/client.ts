@@ -2,7 +2,7 @@
  * API Client for Market Explorer Backend
  */
 
-import type { Market, PaginatedMarkets, CategoryCounts, MarketFilter, SortConfig, PaginatedCategories } from '../types/market'
+import type { Market, PaginatedMarkets, CategoryCounts, MarketFilter, SortConfig, PaginatedCategories, MarketSuggestion } from '../types/market'
 
 const API_BASE = '/api'
 
@@ -71,6 +71,11 @@ export async function searchMarkets(query: string, limit = 20, signal?: AbortSig
   return fetchJson<Market[]>(`${API_BASE}/markets/search?${searchParams}`, signal)
 }
 
+export async function autocompleteMarkets(prefix: string, limit = 10, signal?: AbortSignal): Promise<MarketSuggestion[]> {
+  const searchParams = new URLSearchParams({ q: prefix, limit: limit.toString() })
+  return fetchJson<MarketSuggestion[]>(`${API_BASE}/markets/autocomplete?${searchParams}`, signal)
+}
+
 export async function getCategories(resolved?: boolean, signal?: AbortSignal): Promise<CategoryCounts> {
   const params = new URLSearchParams()
   if (resolved !== undefined) {
@@ -47,6 +47,17 @@ export interface PaginatedMarkets {
   total_pages: number
   has_next: boolean
   has_prev: boolean
+  /** Opaque keyset cursor for the next page (pass as ?cursor=) */
+  next_cursor?: string | null
+  /** True when total is a planner estimate rather than an exact count */
+  total_is_estimate?: boolean
+}
+
+/** Search-box suggestion from /api/markets/autocomplete */
+export interface MarketSuggestion {
+  condition_id: string
+  question: string
+  category?: string | null
 }
 
 /** Sortable fields that match the backend's allowed sort fields */
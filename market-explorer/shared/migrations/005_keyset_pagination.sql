@@ -0,0 +1,22 @@
+-- Keyset pagination indexes
+--
+-- /api/markets pages by (sort field, condition_id): cursor pages seek with
+--   WHERE (volume_24h, condition_id) < ($v, $c) ... ORDER BY volume_24h DESC NULLS LAST, condition_id DESC
+-- These composite indexes match that ORDER BY for the most used sorts, so
+-- any page is an index seek plus page_size rows instead of an OFFSET walk.
+
+CREATE INDEX IF NOT EXISTS idx_explorer_markets_keyset_volume_24h
+    ON explorer_markets (volume_24h DESC NULLS LAST, condition_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_explorer_markets_keyset_liquidity_score
+    ON explorer_markets (liquidity_score DESC NULLS LAST, condition_id DESC);
+
+CREATE INDEX IF NOT EXISTS idx_explorer_markets_keyset_end_time
+    ON explorer_markets (end_time ASC NULLS LAST, condition_id ASC);
+
+-- Superseded by the keyset index above (same leading column)
+DROP INDEX IF EXISTS idx_explorer_markets_volume_24h;
+
+-- Count-cache invalidation reads the latest completed run
+CREATE INDEX IF NOT EXISTS idx_explorer_sync_runs_success_finished
+    ON explorer_sync_runs (finished_at DESC) WHERE status = 'success';
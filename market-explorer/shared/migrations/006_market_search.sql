@@ -0,0 +1,59 @@
+-- Indexed market search (explorer API and bot dashboard)
+--
+-- Both the explorer API and the trading dashboard search explorer_markets.
+-- Matching and ranking are defined once here as SQL functions so the two
+-- callers cannot drift:
+--
+--   market_search_tsquery(term)            prefix tsquery: 'bitc ha' -> 'bitc':* & 'ha':*
+--   market_search_match(tsv, question, t)  full-text prefix match OR fuzzy word match
+--   market_search_rank(tsv, question, t)   relevance score for ORDER BY
+--
+-- The functions are simple SQL and get inlined by the planner, so the
+-- predicates below still use the GIN indexes:
+--   - search_tsv: generated tsvector over question/slug/description (GIN)
+--   - question gin_trgm_ops: substring / typo-tolerant word matching
+--
+-- Existing databases never re-run explorer migrations, so the bot ships the
+-- same functions in seed/15_market_search.sql (with pg_trgm optional).
+-- Keep the two files in step.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Added by the v2 sync script; make sure it exists before the generated column uses it
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS market_slug TEXT;
+
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS search_tsv tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', coalesce(question, '')), 'A') ||
+        setweight(to_tsvector('simple', replace(coalesce(market_slug, ''), '-', ' ')), 'B') ||
+        setweight(to_tsvector('simple', left(coalesce(description, ''), 2000)), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_explorer_markets_search_tsv
+    ON explorer_markets USING gin (search_tsv);
+
+CREATE INDEX IF NOT EXISTS idx_explorer_markets_question_trgm
+    ON explorer_markets USING gin (question gin_trgm_ops);
+
+-- Superseded: the ad-hoc index from sync_markets_v2 used 'english' and only the question
+DROP INDEX IF EXISTS idx_explorer_markets_question_search;
+
+CREATE OR REPLACE FUNCTION market_search_tsquery(term TEXT) RETURNS tsquery
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT to_tsquery('simple', coalesce(string_agg(quote_literal(word) || ':*', ' & '), ''))
+    FROM regexp_split_to_table(lower(term), '[^[:alnum:]]+') AS word
+    WHERE word <> ''
+$$;
+
+CREATE OR REPLACE FUNCTION market_search_match(tsv tsvector, question TEXT, term TEXT) RETURNS boolean
+LANGUAGE sql STABLE PARALLEL SAFE AS $$
+    SELECT tsv @@ market_search_tsquery(term) OR term <% question
+$$;
+
+CREATE OR REPLACE FUNCTION market_search_rank(tsv tsvector, question TEXT, term TEXT) RETURNS real
+LANGUAGE sql STABLE PARALLEL SAFE AS $$
+    SELECT ts_rank(tsv, market_search_tsquery(term)) * 2 + word_similarity(term, question)
+$$;
+
+COMMENT ON COLUMN explorer_markets.search_tsv IS
+    'Weighted tsvector (question A, slug B, description C) for market_search_match()';
@@ -0,0 +1,26 @@
+-- Bulk market sync support
+-- The sync writes markets in COPY + merge batches and skips rows whose
+-- content did not change (explorer.services.market_ingest).
+
+-- Columns historically added at runtime by sync_markets_v2.ensure_schema;
+-- the bulk merge writes all of them, so make sure they exist
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS volume DECIMAL(18,2);
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS volume_num DECIMAL(18,2);
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS liquidity DECIMAL(14,2);
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS liquidity_num DECIMAL(14,2);
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS active BOOLEAN DEFAULT true;
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS closed BOOLEAN DEFAULT false;
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS spread DECIMAL(6,4);
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS market_slug TEXT;
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS event_slug TEXT;
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS tokens_json JSONB;
+
+-- md5 of the synced column values; unchanged rows are not rewritten
+ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS content_hash TEXT;
+
+COMMENT ON COLUMN explorer_markets.content_hash IS
+'md5 of the synced column values (MarketRecord.with_hash). updated_at only moves when this changes.';
+
+-- Sync throughput
+ALTER TABLE explorer_sync_runs ADD COLUMN IF NOT EXISTS rows_unchanged INT DEFAULT 0;
+ALTER TABLE explorer_sync_runs ADD COLUMN IF NOT EXISTS rows_per_second NUMERIC(10,1);
@@ -0,0 +1,15 @@
+-- Incremental event sync
+-- sync_events.py --incremental walks /events newest-updated first and stops
+-- at MAX(source_updated_at). explorer_events is created by
+-- backend/seed/08_events_table.sql, so this is a no-op before that runs.
+
+ALTER TABLE IF EXISTS explorer_events
+    ADD COLUMN IF NOT EXISTS source_updated_at TIMESTAMPTZ;
+
+DO $$
+BEGIN
+    IF to_regclass('explorer_events') IS NOT NULL THEN
+        CREATE INDEX IF NOT EXISTS idx_explorer_events_source_updated_at
+            ON explorer_events (source_updated_at DESC NULLS LAST);
+    END IF;
+END $$;
@@ -0,0 +1,10 @@
+-- Sync cursors
+-- SyncService with SYNC_SOURCE=catalog reads the bot's market_catalog
+-- change feed (seed/12_market_catalog.sql in the bot repo) and records the
+-- last seq it applied here, one row per feed.
+
+CREATE TABLE IF NOT EXISTS explorer_sync_cursors (
+    name TEXT PRIMARY KEY,
+    position BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Print the top database statements of a running bot.
+
+Reads /api/db/queries from the monitoring dashboard (the statistics live
+in the bot process, see storage.query_stats). Uses DASHBOARD_API_KEY if set.
+
+Usage:
+    python scripts/db_query_stats.py
+    python scripts/db_query_stats.py --sort p99_ms --limit 10
+    python scripts/db_query_stats.py --url http://127.0.0.1:9050 --slow
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.parse
+import urllib.request
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from polymarket_bot.storage.query_stats import QueryStats, format_table
+
+
+def fetch(url: str, limit: int, sort: str) -> dict:
+    query = urllib.parse.urlencode({"limit": limit, "sort": sort})
+    request = urllib.request.Request(f"{url.rstrip('/')}/api/db/queries?{query}")
+    api_key = os.environ.get("DASHBOARD_API_KEY")
+    if api_key:
+        request.add_header("X-API-Key", api_key)
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return json.loads(response.read())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--url",
+        default=f"http://127.0.0.1:{os.environ.get('DASHBOARD_PORT', '9050')}",
+        help="Dashboard base URL",
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--sort", choices=QueryStats.SORT_KEYS, default="total_ms")
+    parser.add_argument("--slow", action="store_true", help="Also print recent slow queries")
+    parser.add_argument("--json", action="store_true", help="Print the raw response")
+    args = parser.parse_args()
+
+    data = fetch(args.url, args.limit, args.sort)
+    if args.json:
+        print(json.dumps(data, indent=2))
+        return
+
+    summary = data["summary"]
+    wait = summary["acquire_wait"]
+    print(
+        f"{summary['calls']:,} calls over {summary['statements']} statements, "
+        f"{summary['total_ms'] / 1000:,.1f}s total, {summary['errors']} errors, "
+        f"{summary['retries']} retries"
+    )
+    print(f"Pool acquire wait: p50 {wait['p50_us']}us, p99 {wait['p99_us']}us, max {wait['max_us']}us\n")
+    print(format_table(data["statements"]))
+
+    if args.slow:
+        print(f"\nSlow queries (>= {summary['slow_query_ms']}ms):")
+        for slow in data["slow_queries"]:
+            print(f"  {slow['at']} {slow['duration_ms']:.1f}ms {slow['site']}")
+            print(f"    {slow['statement'][:200]}")
+            print(f"    params={slow['params']}")
+
+
+if __name__ == "__main__":
+    main()
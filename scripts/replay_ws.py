@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Replay a recorded WebSocket session through the trading pipeline.
+
+Frames recorded with WS_RECORD_DIR (or IngestionConfig.record_dir) are fed
+through IngestionService -> TradingBot._handle_price_update ->
+TradingEngine.process_event, with no connection to Polymarket. The engine
+always runs in dry-run mode against DATABASE_URL.
+
+Modes:
+    inject  Frames go straight into PolymarketWebSocket.inject (default)
+    server  Frames are served on a local WebSocket; the real client
+            connects to it through the websocket_url override. Frames the
+            client cannot keep up with are dropped by its buffer, as in
+            production.
+
+Usage:
+    python scripts/replay_ws.py recordings/ws
+    python scripts/replay_ws.py recordings/ws --speed 10
+    python scripts/replay_ws.py recordings/ws --speed 0 --mode server
+    python scripts/replay_ws.py recordings/ws --speed 0 --no-engine
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from polymarket_bot.ingestion import (
+    IngestionConfig,
+    IngestionService,
+    ReplayServer,
+    read_frames,
+    replay_frames,
+)
+from polymarket_bot.main import BotConfig, TradingBot
+
+# Server mode: the replay is over once the client has been idle this long
+IDLE_SECONDS = 0.5
+
+
+async def build_bot() -> TradingBot:
+    """TradingBot with only the database and engine started."""
+    config = BotConfig.from_env()
+    config.dry_run = True
+    config.ws_record_dir = None
+    bot = TradingBot(config)
+    await bot._init_database()
+    await bot._init_engine()
+    bot._running = True
+    return bot
+
+
+async def wait_idle(service: IngestionService, quiet: float = 0.5) -> None:
+    """Wait until the client has processed everything the server sent."""
+    ws = service.websocket
+    while True:
+        await ws.drain()
+        last = ws.last_message_time or 0.0
+        if time.time() - last >= quiet:
+            return
+        await asyncio.sleep(quiet / 5)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    speed = args.speed or None
+    bot = None if args.no_engine else await build_bot()
+    updates = 0
+
+    async def on_price_update(update) -> None:
+        nonlocal updates
+        updates += 1
+        if bot is not None:
+            await bot._handle_price_update(update)
+
+    server = ReplayServer(args.recording, speed=speed) if args.mode == "server" else None
+    if server:
+        await server.start()
+
+    config = IngestionConfig(
+        websocket_url=server.url if server else IngestionConfig.websocket_url,
+        connect_websocket=server is not None,
+        dashboard_enabled=False,
+        startup_market_limit=0,      # No REST market fetch
+        backfill_missing_size=False,  # No REST calls per event
+        check_price_divergence=False,
+        heartbeat_timeout=args.heartbeat_timeout,
+    )
+    service = IngestionService(config=config, on_price_update=on_price_update)
+    started = time.monotonic()
+
+    try:
+        await service.start()
+        if server:
+            stats = await server.wait_done()
+            await wait_idle(service, quiet=IDLE_SECONDS)
+            # Exclude the idle wait from the throughput figure
+            elapsed = time.monotonic() - started - IDLE_SECONDS
+        else:
+            stats = await replay_frames(read_frames(args.recording), service.websocket.inject, speed)
+            elapsed = time.monotonic() - started
+    finally:
+        await service.stop()
+        if server:
+            await server.stop()
+        if bot is not None:
+            await bot.stop()
+
+    return {
+        "mode": args.mode,
+        "speed": speed or "max",
+        **stats.to_dict(),
+        "price_updates": updates,
+        "updates_per_second": round(updates / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("recording", help="Recording directory or segment file")
+    parser.add_argument("--speed", type=float, default=1.0,
+                        help="1 = real time, N = N x speed, 0 = as fast as possible")
+    parser.add_argument("--mode", choices=("inject", "server"), default="inject")
+    parser.add_argument("--no-engine", action="store_true",
+                        help="Stop at IngestionService (no database needed)")
+    parser.add_argument("--heartbeat-timeout", type=float, default=30.0,
+                        help="Client reconnect timeout in server mode")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@
 #   ./scripts/run_tests.sh integration  # Run integration tests only
 #   ./scripts/run_tests.sh coverage     # Run with coverage report
 #   ./scripts/run_tests.sh quick        # Run fast tests only
+#   ./scripts/run_tests.sh bench        # Hot-path benchmarks vs baseline
 # =============================================================================
 
 set -e
@@ -40,6 +41,10 @@ case "${1:-all}" in
         echo "Running quick tests (no integration, no slow)..."
         pytest src/polymarket_bot/ -v -m "not integration and not slow" --tb=short -x
         ;;
+    bench)
+        echo "Running hot-path benchmarks..."
+        python -m tests.benchmarks
+        ;;
     storage)
         echo "Running storage layer tests..."
         pytest src/polymarket_bot/storage/tests/ -v --tb=short
@@ -12,6 +12,9 @@ CREATE TABLE IF NOT EXISTS stream_watchlist (
     condition_id TEXT
 );
 
+-- Partitioned by day on timestamp (epoch seconds); daily partitions are
+-- created/dropped by storage.partitions.TradePartitionManager.
+-- See seed/09_partition_polymarket_trades.sql for the upgrade path.
 CREATE TABLE IF NOT EXISTS polymarket_trades (
     condition_id TEXT NOT NULL,
     trade_id TEXT NOT NULL,
@@ -19,12 +22,25 @@ CREATE TABLE IF NOT EXISTS polymarket_trades (
     price REAL,
     size REAL,
     side TEXT,
-    timestamp BIGINT,
-    raw_json TEXT,
+    timestamp BIGINT NOT NULL,
     outcome TEXT,
     outcome_index INTEGER,
-    PRIMARY KEY (condition_id, trade_id)
-);
+    PRIMARY KEY (condition_id, trade_id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE IF NOT EXISTS polymarket_trades_default
+    PARTITION OF polymarket_trades DEFAULT;
+
+CREATE TABLE IF NOT EXISTS polymarket_trade_payloads (
+    condition_id TEXT NOT NULL,
+    trade_id TEXT NOT NULL,
+    timestamp BIGINT NOT NULL,
+    payload BYTEA NOT NULL,
+    PRIMARY KEY (condition_id, trade_id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+CREATE TABLE IF NOT EXISTS polymarket_trade_payloads_default
+    PARTITION OF polymarket_trade_payloads DEFAULT;
 
 CREATE TABLE IF NOT EXISTS trade_watermarks (
     condition_id TEXT PRIMARY KEY,
@@ -259,6 +275,9 @@ CREATE TABLE IF NOT EXISTS trade_watchlist (
     updated_at BIGINT
 );
 
+CREATE INDEX IF NOT EXISTS idx_trades_condition_token_ts ON polymarket_trades(condition_id, token_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_trades_condition_ts ON polymarket_trades(condition_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_ts_brin ON polymarket_trades USING BRIN (timestamp);
 CREATE INDEX IF NOT EXISTS idx_paper_trades_candidate ON paper_trades(candidate_id);
 CREATE INDEX IF NOT EXISTS idx_live_orders_status ON live_orders(status);
 CREATE INDEX IF NOT EXISTS idx_live_orders_candidate ON live_orders(candidate_id);
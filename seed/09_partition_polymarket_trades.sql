@@ -0,0 +1,136 @@
+-- Migration: Time-partitioned polymarket_trades
+--
+-- Converts polymarket_trades to declarative RANGE partitioning on `timestamp`
+-- (epoch seconds, one partition per UTC day) so that:
+--   - candle aggregation and get_recent/get_latest_timestamp prune to the
+--     partitions covering their time window
+--   - retention is a DROP TABLE of expired partitions instead of a DELETE scan
+--
+-- Raw trade payloads move to polymarket_trade_payloads (zlib-compressed BYTEA,
+-- written only when TradeRepository is created with store_raw_payloads=True).
+--
+-- Future partitions are created (and expired ones dropped) by
+-- storage.partitions.TradePartitionManager, run from the universe updater's
+-- retention cycle. Rows outside any daily partition land in the DEFAULT
+-- partition and are moved out when their partition is created.
+--
+-- Legacy rows written by the old populate_markets.py carry millisecond
+-- timestamps; they are converted to seconds while being copied so retention,
+-- candle aggregation and ORDER BY timestamp readers treat them like any
+-- other trade.
+--
+-- Idempotent: does nothing if polymarket_trades is already partitioned
+-- (fresh installs get the partitioned layout from 01_schema.sql).
+
+DO $$
+DECLARE
+    day_start BIGINT;
+    first_day BIGINT;
+    last_day BIGINT;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE relname = 'polymarket_trades' AND relkind = 'p'
+    ) THEN
+        RAISE NOTICE 'polymarket_trades already partitioned, skipping';
+        RETURN;
+    END IF;
+
+    ALTER TABLE polymarket_trades RENAME TO polymarket_trades_legacy;
+    ALTER TABLE polymarket_trades_legacy
+        RENAME CONSTRAINT polymarket_trades_pkey TO polymarket_trades_legacy_pkey;
+
+    CREATE TABLE polymarket_trades (
+        condition_id TEXT NOT NULL,
+        trade_id TEXT NOT NULL,
+        token_id TEXT,
+        price REAL,
+        size REAL,
+        side TEXT,
+        timestamp BIGINT NOT NULL,
+        outcome TEXT,
+        outcome_index INTEGER,
+        -- Partition key must be part of the PK; a trade's timestamp never
+        -- changes, so dedup semantics are unchanged.
+        PRIMARY KEY (condition_id, trade_id, timestamp)
+    ) PARTITION BY RANGE (timestamp);
+
+    CREATE TABLE polymarket_trades_default
+        PARTITION OF polymarket_trades DEFAULT;
+
+    CREATE TABLE polymarket_trade_payloads (
+        condition_id TEXT NOT NULL,
+        trade_id TEXT NOT NULL,
+        timestamp BIGINT NOT NULL,
+        payload BYTEA NOT NULL,
+        PRIMARY KEY (condition_id, trade_id, timestamp)
+    ) PARTITION BY RANGE (timestamp);
+
+    CREATE TABLE polymarket_trade_payloads_default
+        PARTITION OF polymarket_trade_payloads DEFAULT;
+
+    -- Daily partitions for the last 30 days (retention window) plus a week
+    -- ahead. Older trades land in the DEFAULT partition until retention
+    -- purges them.
+    first_day := (floor(extract(epoch FROM NOW()) / 86400) - 30)::BIGINT * 86400;
+    last_day := (floor(extract(epoch FROM NOW()) / 86400) + 7)::BIGINT * 86400;
+    day_start := first_day;
+    WHILE day_start <= last_day LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF polymarket_trades '
+            'FOR VALUES FROM (%s) TO (%s)',
+            'polymarket_trades_p' || to_char(to_timestamp(day_start) AT TIME ZONE 'UTC', 'YYYYMMDD'),
+            day_start, day_start + 86400
+        );
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF polymarket_trade_payloads '
+            'FOR VALUES FROM (%s) TO (%s)',
+            'polymarket_trade_payloads_p' || to_char(to_timestamp(day_start) AT TIME ZONE 'UTC', 'YYYYMMDD'),
+            day_start, day_start + 86400
+        );
+        day_start := day_start + 86400;
+    END LOOP;
+
+    INSERT INTO polymarket_trades (
+        condition_id, trade_id, token_id, price, size, side,
+        timestamp, outcome, outcome_index
+    )
+    SELECT condition_id, trade_id, token_id, price, size, side,
+           CASE WHEN timestamp > 1e11 THEN timestamp / 1000 ELSE timestamp END,
+           outcome, outcome_index
+    FROM polymarket_trades_legacy
+    WHERE timestamp IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    INSERT INTO polymarket_trade_payloads (condition_id, trade_id, timestamp, payload)
+    SELECT condition_id, trade_id,
+           CASE WHEN timestamp > 1e11 THEN timestamp / 1000 ELSE timestamp END,
+           convert_to(raw_json, 'UTF8')
+    FROM polymarket_trades_legacy
+    WHERE timestamp IS NOT NULL AND raw_json IS NOT NULL
+    ON CONFLICT DO NOTHING;
+
+    -- Legacy rows are kept for manual verification; drop once satisfied:
+    --   DROP TABLE polymarket_trades_legacy;
+END $$;
+
+-- =============================================================================
+-- Indexes matching the real access paths (created on every partition)
+-- =============================================================================
+
+-- Candle aggregation: WHERE condition_id = $1 AND token_id = $2 AND timestamp >= $3
+CREATE INDEX IF NOT EXISTS idx_trades_condition_token_ts
+    ON polymarket_trades(condition_id, token_id, timestamp);
+
+-- get_by_condition / get_recent / get_latest_timestamp / dashboard last trade
+CREATE INDEX IF NOT EXISTS idx_trades_condition_ts
+    ON polymarket_trades(condition_id, timestamp DESC);
+
+-- Time-range scans across all markets (append-only, naturally ordered)
+CREATE INDEX IF NOT EXISTS idx_trades_ts_brin
+    ON polymarket_trades USING BRIN (timestamp);
+
+COMMENT ON TABLE polymarket_trades IS
+    'Trades partitioned by day on timestamp (epoch seconds); see TradePartitionManager';
+COMMENT ON TABLE polymarket_trade_payloads IS
+    'Optional zlib-compressed raw trade JSON, partitioned like polymarket_trades';
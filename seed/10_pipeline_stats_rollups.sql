@@ -0,0 +1,30 @@
+-- Migration: Multi-resolution pipeline rejection stats
+--
+-- pipeline_rejection_stats now holds three resolutions of the same counters:
+--   - 'minute': closed minute buckets flushed from PipelineTracker's in-memory
+--     ring (one bulk insert per flush), with one sampled rejection per bucket
+--   - 'hour' / 'day': rollups recomputed from the finer resolution
+--
+-- Writers upsert on (resolution, bucket_start, stage) so re-flushing or
+-- re-rolling a bucket is idempotent. Retention is per resolution; see
+-- core.pipeline_stats.PipelineStatsFlusher.
+
+ALTER TABLE pipeline_rejection_stats
+    ADD COLUMN IF NOT EXISTS resolution TEXT NOT NULL DEFAULT 'minute';
+
+-- Collapse any duplicate buckets written before the unique key existed
+DELETE FROM pipeline_rejection_stats a
+USING pipeline_rejection_stats b
+WHERE a.resolution = b.resolution
+  AND a.bucket_start = b.bucket_start
+  AND a.stage = b.stage
+  AND a.id < b.id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_pipeline_stats_res_bucket_stage
+    ON pipeline_rejection_stats(resolution, bucket_start, stage);
+
+-- Superseded by the unique index above
+DROP INDEX IF EXISTS idx_pipeline_stats_bucket_stage;
+
+COMMENT ON COLUMN pipeline_rejection_stats.resolution IS
+    'Bucket width: minute (flushed from memory), hour or day (rollups)';
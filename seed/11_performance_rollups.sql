@@ -0,0 +1,55 @@
+-- Migration: Incrementally maintained performance rollups
+--
+-- One row per (period, period_start) with the aggregates /api/performance
+-- needs, so the endpoint reads O(periods) rows instead of re-deriving
+-- everything from exit_events on each request:
+--   - 'day' / 'week' / 'month': UTC calendar buckets (week = ISO, Monday start)
+--   - 'all': single all-history row, period_start = 1970-01-01
+--
+-- Rows are upserted for every exit event by PositionTracker via
+-- PerformanceRollupRepository.record_exit(). Rebuild from exit_events with:
+--   python scripts/backfill_performance_rollups.py
+
+CREATE TABLE IF NOT EXISTS performance_rollups (
+    period TEXT NOT NULL,
+    period_start DATE NOT NULL,
+    trades INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    gross_profit DOUBLE PRECISION NOT NULL DEFAULT 0,
+    gross_loss DOUBLE PRECISION NOT NULL DEFAULT 0,  -- magnitude of losing trades
+    net_pnl DOUBLE PRECISION NOT NULL DEFAULT 0,
+    best_trade DOUBLE PRECISION,
+    worst_trade DOUBLE PRECISION,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (period, period_start)
+);
+
+-- Initial backfill on upgrade (no-op once rollups exist)
+INSERT INTO performance_rollups (
+    period, period_start, trades, wins, losses,
+    gross_profit, gross_loss, net_pnl, best_trade, worst_trade
+)
+SELECT period, period_start,
+       COUNT(*),
+       COUNT(*) FILTER (WHERE pnl > 0),
+       COUNT(*) FILTER (WHERE pnl < 0),
+       COALESCE(SUM(pnl) FILTER (WHERE pnl > 0), 0),
+       COALESCE(-SUM(pnl) FILTER (WHERE pnl < 0), 0),
+       SUM(pnl), MAX(pnl), MIN(pnl)
+FROM (
+    SELECT p.period,
+           CASE p.period
+               WHEN 'all' THEN DATE '1970-01-01'
+               ELSE date_trunc(p.period, e.ts)::date
+           END AS period_start,
+           e.pnl
+    FROM (
+        SELECT created_at::timestamptz AT TIME ZONE 'UTC' AS ts,
+               net_pnl::double precision AS pnl
+        FROM exit_events
+    ) e
+    CROSS JOIN (VALUES ('day'), ('week'), ('month'), ('all')) AS p(period)
+) buckets
+WHERE NOT EXISTS (SELECT 1 FROM performance_rollups)
+GROUP BY period, period_start;
@@ -0,0 +1,27 @@
+-- Migration: MarketCatalog change feed
+--
+-- MarketCatalog (polymarket_bot.ingestion.catalog) is the single fetcher of
+-- the Polymarket market list. In-process consumers (ingestion token map,
+-- market_universe, polymarket_token_meta) subscribe to it directly; this
+-- table carries the same changes to other processes (the explorer sync).
+--
+-- One row per market with its latest raw Gamma payload. Every content
+-- change takes a new seq, so consumers poll WHERE seq > <cursor> ORDER BY
+-- seq and listen on the market_catalog_changed channel. Written by
+-- MarketCatalogRepository.apply_changes; resolved rows are pruned after
+-- 7 days by MarketCatalogRepository.prune_resolved.
+
+CREATE SEQUENCE IF NOT EXISTS market_catalog_seq;
+
+CREATE TABLE IF NOT EXISTS market_catalog (
+    condition_id TEXT PRIMARY KEY,
+    seq BIGINT NOT NULL DEFAULT nextval('market_catalog_seq'),
+    content_hash TEXT NOT NULL,
+    resolved BOOLEAN NOT NULL DEFAULT FALSE,
+    payload JSONB NOT NULL,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_market_catalog_seq ON market_catalog (seq);
+CREATE INDEX IF NOT EXISTS idx_market_catalog_resolved
+    ON market_catalog (changed_at) WHERE resolved;
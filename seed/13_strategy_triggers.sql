@@ -0,0 +1,40 @@
+-- Migration: Per-strategy first-trigger deduplication
+--
+-- TradingEngine evaluates several strategies against one event stream, and
+-- each strategy trades the first trigger of a market once. The dedup key of
+-- polymarket_first_triggers gains the strategy name:
+--
+--   PK        (token_id, condition_id, threshold, strategy)
+--   G2 unique (condition_id, threshold, strategy)
+--
+-- Rows recorded before this migration came from the single-strategy engine,
+-- whose default (and only built-in) strategy is high_prob_yes; they are
+-- attributed to it so upgrading does not re-open markets already traded.
+-- Deployments that ran a custom STRATEGY_NAME should re-attribute them:
+--
+--   UPDATE polymarket_first_triggers SET strategy = '<name>'
+--   WHERE strategy = 'high_prob_yes';
+--
+-- Callers that do not pass a strategy (TriggerRepository) write ''.
+
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name = 'polymarket_first_triggers'
+          AND column_name = 'strategy'
+    ) THEN
+        ALTER TABLE polymarket_first_triggers ADD COLUMN strategy TEXT NOT NULL DEFAULT '';
+        UPDATE polymarket_first_triggers SET strategy = 'high_prob_yes';
+    END IF;
+END $$;
+
+ALTER TABLE polymarket_first_triggers DROP CONSTRAINT IF EXISTS polymarket_first_triggers_pkey;
+ALTER TABLE polymarket_first_triggers
+ADD CONSTRAINT polymarket_first_triggers_pkey
+PRIMARY KEY (token_id, condition_id, threshold, strategy);
+
+DROP INDEX IF EXISTS idx_triggers_condition_threshold_unique;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_triggers_condition_threshold_strategy_unique
+    ON polymarket_first_triggers(condition_id, threshold, strategy);
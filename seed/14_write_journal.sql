@@ -0,0 +1,15 @@
+-- Migration: Write-behind journal checkpoints
+--
+-- With WRITE_JOURNAL_PATH set, order, position and exit-event writes are
+-- appended to a local fsync'd journal and applied to Postgres in batches by
+-- a background writer (polymarket_bot.execution.journal). Each batch
+-- records the sequence number of its last journal record here, in the same
+-- transaction, so replay after a crash skips exactly the records that were
+-- already applied (exit_events and performance_rollups writes are not
+-- idempotent).
+
+CREATE TABLE IF NOT EXISTS write_journal_checkpoints (
+    journal TEXT PRIMARY KEY,
+    applied_seq BIGINT NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
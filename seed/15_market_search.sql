@@ -0,0 +1,90 @@
+-- Migration: Indexed market search for the dashboard
+--
+-- Dashboard._get_markets searches explorer_markets with the shared
+-- market_search_match()/market_search_rank() functions from
+-- market-explorer/shared/migrations/006_market_search.sql. Explorer
+-- migrations only run when its database volume is first created, so
+-- existing deployments get the same functions (and the search_tsv column)
+-- from this migration. Keep the two files in step.
+--
+-- pg_trgm is optional. Where it can be installed, matching also accepts
+-- fuzzy word matches (term <% question) and ranking adds
+-- word_similarity(term, question). Without it both use the full-text
+-- prefix query alone.
+--
+-- Idempotent. The column and indexes are skipped while explorer_markets
+-- does not exist yet; re-run after the explorer creates it.
+
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION WHEN OTHERS THEN
+    RAISE NOTICE 'pg_trgm unavailable (%), market search uses full-text matching only', SQLERRM;
+END $$;
+
+DO $$
+BEGIN
+    IF to_regclass('explorer_markets') IS NULL THEN
+        RAISE NOTICE 'explorer_markets does not exist, skipping search_tsv';
+        RETURN;
+    END IF;
+
+    ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS market_slug TEXT;
+
+    ALTER TABLE explorer_markets ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(question, '')), 'A') ||
+            setweight(to_tsvector('simple', replace(coalesce(market_slug, ''), '-', ' ')), 'B') ||
+            setweight(to_tsvector('simple', left(coalesce(description, ''), 2000)), 'C')
+        ) STORED;
+
+    CREATE INDEX IF NOT EXISTS idx_explorer_markets_search_tsv
+        ON explorer_markets USING gin (search_tsv);
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        EXECUTE 'CREATE INDEX IF NOT EXISTS idx_explorer_markets_question_trgm '
+                'ON explorer_markets USING gin (question gin_trgm_ops)';
+    END IF;
+
+    COMMENT ON COLUMN explorer_markets.search_tsv IS
+        'Weighted tsvector (question A, slug B, description C) for market_search_match()';
+END $$;
+
+CREATE OR REPLACE FUNCTION market_search_tsquery(term TEXT) RETURNS tsquery
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT to_tsquery('simple', coalesce(string_agg(quote_literal(word) || ':*', ' & '), ''))
+    FROM regexp_split_to_table(lower(term), '[^[:alnum:]]+') AS word
+    WHERE word <> ''
+$$;
+
+-- The trigram operators only exist with pg_trgm, so pick the bodies at run time
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        EXECUTE $fn$
+            CREATE OR REPLACE FUNCTION market_search_match(tsv tsvector, question TEXT, term TEXT)
+            RETURNS boolean LANGUAGE sql STABLE PARALLEL SAFE AS $body$
+                SELECT tsv @@ market_search_tsquery(term) OR term <% question
+            $body$
+        $fn$;
+        EXECUTE $fn$
+            CREATE OR REPLACE FUNCTION market_search_rank(tsv tsvector, question TEXT, term TEXT)
+            RETURNS real LANGUAGE sql STABLE PARALLEL SAFE AS $body$
+                SELECT ts_rank(tsv, market_search_tsquery(term)) * 2 + word_similarity(term, question)
+            $body$
+        $fn$;
+    ELSE
+        EXECUTE $fn$
+            CREATE OR REPLACE FUNCTION market_search_match(tsv tsvector, question TEXT, term TEXT)
+            RETURNS boolean LANGUAGE sql STABLE PARALLEL SAFE AS $body$
+                SELECT tsv @@ market_search_tsquery(term)
+            $body$
+        $fn$;
+        EXECUTE $fn$
+            CREATE OR REPLACE FUNCTION market_search_rank(tsv tsvector, question TEXT, term TEXT)
+            RETURNS real LANGUAGE sql STABLE PARALLEL SAFE AS $body$
+                SELECT ts_rank(tsv, market_search_tsquery(term)) * 2
+            $body$
+        $fn$;
+    END IF;
+END $$;
@@ -6,6 +6,7 @@ Handles periodic tasks like:
 - Order status sync
 - Exit evaluation
 - Position monitoring
+- Pipeline rejection stats persistence
 """
 from __future__ import annotations
 
@@ -53,6 +54,10 @@ class BackgroundTaskConfig:
     score_refresh_enabled: bool = True
     score_stale_threshold_seconds: float = 3600  # Re-score after 1 hour
 
+    # Pipeline rejection stats flush + rollup (needs engine and db)
+    pipeline_stats_flush_interval_seconds: float = 60
+    pipeline_stats_flush_enabled: bool = True
+
 
 class BackgroundTasksManager:
     """
@@ -93,7 +98,8 @@ class BackgroundTasksManager:
                            Should accept list of token_ids and return dict of {token_id: Decimal}
             position_sync_service: PositionSyncService for syncing external trades
             wallet_address: Polymarket wallet address for position sync
-            db: Database for score refresh (BackgroundScorer)
+            db: Database for score refresh (BackgroundScorer) and
+                pipeline stats persistence
         """
         self._engine = engine
         self._execution_service = execution_service
@@ -108,6 +114,7 @@ class BackgroundTasksManager:
         self._stop_event = asyncio.Event()
         self._last_full_sync = datetime.min.replace(tzinfo=timezone.utc)
         self._background_scorer = None
+        self._pipeline_stats_flusher = None
 
     @property
     def is_running(self) -> bool:
@@ -207,6 +214,22 @@ class BackgroundTasksManager:
                 "Market scores will not be refreshed automatically."
             )
 
+        if self._config.pipeline_stats_flush_enabled and self._engine and self._db:
+            from .pipeline_stats import PipelineStatsFlusher
+
+            self._pipeline_stats_flusher = PipelineStatsFlusher(
+                self._engine.pipeline_tracker, self._db
+            )
+            task = asyncio.create_task(
+                self._pipeline_stats_loop(),
+                name="pipeline_stats",
+            )
+            self._tasks.append(task)
+            logger.info(
+                f"Started pipeline stats flush task "
+                f"(interval={self._config.pipeline_stats_flush_interval_seconds}s)"
+            )
+
         logger.info(f"Background tasks started: {len(self._tasks)} tasks")
 
     async def stop(self) -> None:
@@ -236,6 +259,15 @@ class BackgroundTasksManager:
             await asyncio.gather(*self._tasks, return_exceptions=True)
 
         self._tasks.clear()
+
+        # Persist the last closed minutes before shutdown
+        if self._pipeline_stats_flusher:
+            try:
+                await self._pipeline_stats_flusher.run_cycle()
+            except Exception as e:
+                logger.warning(f"Error flushing pipeline stats: {e}")
+            self._pipeline_stats_flusher = None
+
         logger.info("Background tasks stopped")
 
     async def _watchlist_rescore_loop(self) -> None:
@@ -278,6 +310,39 @@ class BackgroundTasksManager:
                 logger.error(f"Error in watchlist rescore: {e}")
                 await asyncio.sleep(5)  # Brief pause before retry
 
+    async def _pipeline_stats_loop(self) -> None:
+        """
+        Periodically flush closed minute buckets and refresh rollups.
+
+        One bulk insert per cycle regardless of rejection volume.
+        """
+        interval = self._config.pipeline_stats_flush_interval_seconds
+
+        while self._running:
+            try:
+                # Wait for interval or stop
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(),
+                        timeout=interval,
+                    )
+                    break  # Stop requested
+                except asyncio.TimeoutError:
+                    pass  # Continue with flush
+
+                if not self._running:
+                    break
+
+                written = await self._pipeline_stats_flusher.run_cycle()
+                if written:
+                    logger.debug(f"Pipeline stats: flushed {written} rows")
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in pipeline stats flush: {e}")
+                await asyncio.sleep(5)
+
     async def _execute_promotion(self, promotion: Any) -> None:
         """Execute a promoted watchlist entry."""
         if not self._engine:
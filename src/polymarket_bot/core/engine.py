@@ -5,9 +5,19 @@ The engine coordinates all components:
 1. Receives events from ingestion
 2. Processes through event processor
 3. Checks trigger deduplication
-4. Evaluates strategy
+4. Evaluates strategies
 5. Routes signals to execution or watchlist
 
+Several strategies can run in one engine. Each has its own price threshold
+and trigger dedup key (its name); an event is parsed, looked up and
+filtered once, and only strategies whose threshold it crossed are
+evaluated against the shared StrategyContext.
+
+With an entry_sink and exit_sink (a shard worker, see
+polymarket_bot.sharding) ENTRY and EXIT signals are forwarded instead of
+executed; the receiving engine runs them through submit_entry, which
+applies G5, G2 and max positions, and submit_exit.
+
 Critical Gotchas:
     - G2: Dual-key trigger deduplication
     - G5: Orderbook verification before execution
@@ -17,6 +27,7 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+from collections.abc import Awaitable, Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
@@ -27,6 +38,7 @@ if TYPE_CHECKING:
 
 from polymarket_bot.execution.balance_manager import PreSubmitValidationError
 from polymarket_bot.strategies import (
+    DuplicateStrategyError,
     EntrySignal,
     ExitSignal,
     HoldSignal,
@@ -37,6 +49,8 @@ from polymarket_bot.strategies import (
     StrategyContext,
     WatchlistSignal,
 )
+from polymarket_bot.telemetry import registry
+from polymarket_bot.tracing import Stage, stamp
 
 from .event_processor import EventProcessor
 from .trigger_tracker import TriggerTracker
@@ -45,6 +59,17 @@ from .pipeline_tracker import PipelineTracker, RejectionStage
 
 logger = logging.getLogger(__name__)
 
+_CACHE_REQUESTS = registry.counter(
+    "polymarket_cache_requests_total", "In-memory cache lookups", ("cache", "result")
+)
+_QUESTION_CACHE_HIT = _CACHE_REQUESTS.labels("market_question", "hit")
+_QUESTION_CACHE_MISS = _CACHE_REQUESTS.labels("market_question", "miss")
+
+# (signal, context, event, strategy name, threshold)
+EntrySink = Callable[[EntrySignal, StrategyContext, dict, str, Decimal], Awaitable[None]]
+# (signal, context, strategy name)
+ExitSink = Callable[[ExitSignal, StrategyContext, str], Awaitable[None]]
+
 
 @dataclass
 class EngineConfig:
@@ -53,6 +78,10 @@ class EngineConfig:
     # Price threshold
     price_threshold: Decimal = Decimal("0.95")
 
+    # Per-strategy thresholds (strategy name -> threshold); strategies not
+    # listed use price_threshold
+    strategy_thresholds: dict[str, Decimal] = field(default_factory=dict)
+
     # Position sizing
     position_size: Decimal = Decimal("20")
     max_positions: int = 50
@@ -104,6 +133,13 @@ class TradingEngine:
         await engine.process_event(event)
 
         await engine.stop()
+
+    Several strategies:
+        engine = TradingEngine(
+            config=EngineConfig(strategy_thresholds={"fast": Decimal("0.90")}),
+            db=database,
+            strategies=[HighProbYesStrategy(), FastStrategy()],
+        )
     """
 
     def __init__(
@@ -113,6 +149,9 @@ class TradingEngine:
         strategy: Optional[Strategy] = None,
         api_client: Optional[Any] = None,  # For orderbook verification
         execution_service: Optional[Any] = None,  # ExecutionService for order execution
+        strategies: Sequence[Strategy] | None = None,
+        entry_sink: EntrySink | None = None,
+        exit_sink: ExitSink | None = None,
     ) -> None:
         """
         Initialize the trading engine.
@@ -123,18 +162,34 @@ class TradingEngine:
             strategy: Trading strategy to use (required for trading)
             api_client: Optional API client for orderbook verification (G5)
             execution_service: Optional ExecutionService for order execution
+            strategies: Several strategies to run instead of one; the first
+                is the primary (watchlist promotions trade under it)
+            entry_sink: Receives ENTRY signals as (signal, context, event,
+                strategy name, threshold) instead of _handle_entry
+            exit_sink: Receives EXIT signals as (signal, context, strategy
+                name) instead of _handle_exit
         """
         self.config = config
         self._db = db
-        self.strategy = strategy
         self._api_client = api_client
         self._execution_service = execution_service
+        self._entry_sink = entry_sink
+        self._exit_sink = exit_sink
 
         # Initialize components
         self._event_processor = EventProcessor(
             threshold=config.price_threshold,
             max_trade_age_seconds=config.max_trade_age_seconds,
         )
+
+        # (strategy, threshold) pairs; the event processor holds the lowest
+        self._strategies: list[tuple[Strategy, Decimal]] = []
+        self._lowest_threshold = config.price_threshold
+        if strategies is not None:
+            self.set_strategies(strategies)
+        else:
+            self.strategy = strategy
+
         self._trigger_tracker = TriggerTracker(db)
         self._watchlist_service = WatchlistService(db)
         self._pipeline_tracker = PipelineTracker(
@@ -161,6 +216,49 @@ class TradingEngine:
         # Order management (used when no execution_service provided)
         self._pending_orders: list[dict] = []
 
+    @property
+    def strategy(self) -> Strategy | None:
+        """Primary strategy (the first configured)."""
+        return self._strategies[0][0] if self._strategies else None
+
+    @strategy.setter
+    def strategy(self, strategy: Strategy | None) -> None:
+        self.set_strategies([strategy] if strategy is not None else [])
+
+    @property
+    def strategies(self) -> list[Strategy]:
+        """All configured strategies, primary first."""
+        return [strategy for strategy, _ in self._strategies]
+
+    def set_strategies(self, strategies: Sequence[Strategy]) -> None:
+        """
+        Replace the strategies the engine evaluates.
+
+        Raises:
+            DuplicateStrategyError: If two strategies share a name (the
+                name is the trigger dedup key)
+        """
+        names = [strategy.name for strategy in strategies]
+        if len(set(names)) != len(names):
+            raise DuplicateStrategyError(f"Strategy names must be unique: {names}")
+        self._strategies = [(strategy, Decimal("0")) for strategy in strategies]
+        self._sync_thresholds()
+
+    def threshold_for(self, strategy: Strategy) -> Decimal:
+        """Price threshold for a strategy."""
+        return self.config.strategy_thresholds.get(strategy.name, self.config.price_threshold)
+
+    def _sync_thresholds(self) -> None:
+        """Resolve per-strategy thresholds after a config or strategy change."""
+        self._strategies = [
+            (strategy, self.threshold_for(strategy)) for strategy, _ in self._strategies
+        ]
+        self._lowest_threshold = min(
+            (threshold for _, threshold in self._strategies),
+            default=self.config.price_threshold,
+        )
+        self._event_processor.set_threshold(self._lowest_threshold)
+
     @property
     def is_running(self) -> bool:
         """Whether the engine is currently running."""
@@ -218,10 +316,13 @@ class TradingEngine:
             logger.warning("Engine already running")
             return
 
-        if self.strategy is None:
+        if not self._strategies:
             raise ValueError("Engine requires a strategy to be set before starting")
 
-        logger.info(f"Starting trading engine with strategy: {self.strategy.name}")
+        logger.info(
+            "Starting trading engine with strategies: "
+            + ", ".join(f"{s.name} (>= {t})" for s, t in self._strategies)
+        )
         logger.info(f"Mode: {'DRY RUN' if self.config.dry_run else 'LIVE'}")
 
         # Initialize ScoreService singleton and wire into EventProcessor
@@ -273,7 +374,7 @@ class TradingEngine:
         """Update runtime engine configuration."""
         if price_threshold is not None:
             self.config.price_threshold = price_threshold
-            self._event_processor.set_threshold(price_threshold)
+            self._sync_thresholds()
         if position_size is not None:
             self.config.position_size = position_size
         if max_positions is not None:
@@ -316,18 +417,19 @@ class TradingEngine:
         Pipeline:
         1. Filter event type
         2. Extract trigger data
-        3. Check price threshold
-        4. Check trigger deduplication (G2)
+        3. Check price threshold (per strategy)
+        4. Check trigger deduplication (G2, per strategy)
         5. Build strategy context
         6. Apply hard filters
-        7. Evaluate strategy
-        8. Route signal (execute, watchlist, or ignore)
+        7. Evaluate each strategy that passed 3 and 4
+        8. Route signals (execute, watchlist, or ignore)
 
         Args:
             event: Raw event from ingestion
 
         Returns:
-            The signal generated, or None if filtered
+            The signal generated, or None if filtered. With several
+            strategies, the first ENTRY signal, else the first evaluated.
         """
         self._stats.events_processed += 1
 
@@ -350,7 +452,9 @@ class TradingEngine:
         # Use cache to minimize DB queries - fetches for ALL events now
         question = await self._fetch_market_question(trigger_data.condition_id)
 
-        # 3. Check price threshold
+        # 3. Check price threshold. The event processor holds the lowest
+        # strategy threshold; strategies whose own threshold the price did
+        # not cross are not evaluated.
         if not self._event_processor.meets_threshold(trigger_data.price):
             # Track rejection (sampled - high frequency)
             self._pipeline_tracker.record_rejection(
@@ -359,9 +463,16 @@ class TradingEngine:
                 stage=RejectionStage.THRESHOLD,
                 price=trigger_data.price,
                 question=question,
-                rejection_values={"threshold": float(self.config.price_threshold)},
+                rejection_values={"threshold": float(self._lowest_threshold)},
             )
             return None
+        crossed = [
+            (strategy, threshold)
+            for strategy, threshold in self._strategies
+            if trigger_data.price >= threshold
+        ]
+
+        stamp(Stage.THRESHOLD)
 
         # 3b. Manual blocklist
         if trigger_data.condition_id in self._blocked_conditions:
@@ -381,33 +492,23 @@ class TradingEngine:
 
         self._stats.triggers_evaluated += 1
 
-        # 4. Check trigger deduplication (G2)
-        should_trigger = await self._trigger_tracker.should_trigger(
-            token_id=trigger_data.token_id,
-            condition_id=trigger_data.condition_id,
-            threshold=self.config.price_threshold,
-        )
-
-        if not should_trigger:
-            self._pipeline_tracker.record_rejection(
-                token_id=trigger_data.token_id,
-                condition_id=trigger_data.condition_id,
-                stage=RejectionStage.DUPLICATE,
-                price=trigger_data.price,
-                question=question,
-            )
+        # 4. Check trigger deduplication (G2), per strategy
+        crossed = await self._untriggered(trigger_data, question, crossed)
+        if not crossed:
             logger.debug(
                 f"Duplicate trigger ignored: {trigger_data.token_id} "
                 f"@ {trigger_data.price}"
             )
             return None
+        stamp(Stage.DEDUP)
 
-        # 5. Build strategy context
+        # 5. Build strategy context (once, shared by all strategies)
         context = await self._event_processor.build_context(
             event, self._db, trigger_data
         )
         if context is None:
             return None
+        stamp(Stage.BUILD_CONTEXT)
 
         # 6. Apply hard filters
         should_reject, reason = self._event_processor.apply_filters(context)
@@ -427,20 +528,80 @@ class TradingEngine:
             self._stats.filters_rejected += 1
             logger.debug(f"Hard filter rejected: {reason}")
             return IgnoreSignal(reason=reason, filter_name=reason.split(":")[0])
+        stamp(Stage.FILTERS)
+
+        # 7-8. Evaluate strategies and route their signals
+        return await self._evaluate_strategies(crossed, context, event)
+
+    async def _untriggered(
+        self,
+        trigger_data: Any,
+        question: str,
+        crossed: list[tuple[Strategy, Decimal]],
+    ) -> list[tuple[Strategy, Decimal]]:
+        """Strategies in crossed that have not triggered on this market (G2)."""
+        fresh = await self._trigger_tracker.untriggered_strategies(
+            token_id=trigger_data.token_id,
+            condition_id=trigger_data.condition_id,
+            keys=[(strategy.name, threshold) for strategy, threshold in crossed],
+        )
+        if len(fresh) == len(crossed):
+            return crossed
 
-        # 7. Evaluate strategy
-        signal = self.strategy.evaluate(context)
+        for strategy, _ in crossed:
+            if strategy.name not in fresh:
+                self._pipeline_tracker.record_rejection(
+                    token_id=trigger_data.token_id,
+                    condition_id=trigger_data.condition_id,
+                    stage=RejectionStage.DUPLICATE,
+                    price=trigger_data.price,
+                    question=question,
+                    strategy=strategy.name,
+                )
+        return [(s, t) for s, t in crossed if s.name in fresh]
 
-        # 8. Route signal
-        await self._route_signal(signal, context, event)
+    async def _evaluate_strategies(
+        self,
+        crossed: list[tuple[Strategy, Decimal]],
+        context: StrategyContext,
+        event: dict,
+    ) -> Signal:
+        """
+        Evaluate each strategy against the shared context and route its signal.
+
+        A failed entry for one strategy does not skip the others; the first
+        error is raised once all signals are routed.
 
-        return signal
+        Returns:
+            The first ENTRY signal, else the first strategy's signal
+        """
+        evaluated = [
+            (strategy, threshold, strategy.evaluate(context))
+            for strategy, threshold in crossed
+        ]
+        stamp(Stage.STRATEGY)
+
+        error: BaseException | None = None
+        for strategy, threshold, signal in evaluated:
+            self._pipeline_tracker.record_signal(strategy.name, signal.type.value)
+            try:
+                await self._route_signal(signal, context, event, strategy, threshold)
+            except Exception as e:
+                if error is None:
+                    error = e
+        if error is not None:
+            raise error
+
+        signals = [signal for _, _, signal in evaluated]
+        return next((s for s in signals if s.type == SignalType.ENTRY), signals[0])
 
     async def _route_signal(
         self,
         signal: Signal,
         context: Any,
         event: dict,
+        strategy: Strategy | None = None,
+        threshold: Decimal | None = None,
     ) -> None:
         """
         Route a signal to the appropriate handler.
@@ -449,12 +610,22 @@ class TradingEngine:
             signal: The strategy signal
             context: The strategy context
             event: Original event
+            strategy: Strategy that produced the signal (default: primary)
+            threshold: Its price threshold
         """
+        name, threshold = self._strategy_key(strategy, threshold)
+
         if signal.type == SignalType.ENTRY:
-            await self._handle_entry(signal, context, event)
+            if self._entry_sink is not None:
+                await self._entry_sink(signal, context, event, name, threshold)
+            else:
+                await self._handle_entry(signal, context, event, strategy, threshold)
 
         elif signal.type == SignalType.EXIT:
-            await self._handle_exit(signal, context)
+            if self._exit_sink is not None:
+                await self._exit_sink(signal, context, name)
+            else:
+                await self._handle_exit(signal, context)
 
         elif signal.type == SignalType.WATCHLIST:
             # Track as candidate before adding to watchlist
@@ -463,7 +634,7 @@ class TradingEngine:
                 condition_id=context.condition_id,
                 question=context.question,
                 price=context.trigger_price,
-                threshold=self.config.price_threshold,
+                threshold=threshold,
                 signal="WATCHLIST",
                 signal_reason=signal.reason,
                 model_score=context.model_score,
@@ -481,6 +652,7 @@ class TradingEngine:
                 stage=RejectionStage.STRATEGY_IGNORE,
                 price=context.trigger_price,
                 question=context.question,
+                strategy=name,
                 rejection_values={"reason": signal.reason},
             )
             self._stats.filters_rejected += 1
@@ -493,6 +665,7 @@ class TradingEngine:
                 stage=RejectionStage.STRATEGY_HOLD,
                 price=context.trigger_price,
                 question=context.question,
+                strategy=name,
                 rejection_values={"reason": signal.reason},
             )
             # Also track as candidate (close to trading)
@@ -501,7 +674,7 @@ class TradingEngine:
                 condition_id=context.condition_id,
                 question=context.question,
                 price=context.trigger_price,
-                threshold=self.config.price_threshold,
+                threshold=threshold,
                 signal="HOLD",
                 signal_reason=signal.reason,
                 model_score=context.model_score,
@@ -512,12 +685,89 @@ class TradingEngine:
 
         # HOLD signals need no further action
 
+    async def submit_entry(
+        self,
+        signal: EntrySignal,
+        context: StrategyContext,
+        event: dict,
+        strategy_name: str,
+        threshold: Decimal,
+    ) -> bool:
+        """
+        Execute an entry signal evaluated by another engine (a shard worker).
+
+        The pause state and blocklist are checked again, since the evaluating
+        engine does not see dashboard controls; then the signal takes the
+        _handle_entry path (max positions, G5, atomic G2 record, execution).
+
+        Args:
+            signal: The entry signal
+            context: Strategy context it was evaluated on
+            event: Original event
+            strategy_name: Name of the strategy that produced it
+            threshold: Its price threshold
+
+        Returns:
+            True if the entry was executed (dry run: would have been)
+        """
+        if not self._is_running or self._paused:
+            return False
+
+        if context.condition_id in self._blocked_conditions:
+            self._pipeline_tracker.record_rejection(
+                token_id=context.token_id,
+                condition_id=context.condition_id,
+                stage=RejectionStage.MANUAL_BLOCK,
+                price=context.trigger_price,
+                question=context.question,
+                strategy=strategy_name,
+                rejection_values={"block_reason": self._blocked_conditions[context.condition_id]},
+            )
+            self._stats.filters_rejected += 1
+            return False
+
+        strategy = next(
+            (s for s, _ in self._strategies if s.name == strategy_name), None
+        )
+        if strategy is None:
+            logger.warning(
+                f"Entry for {context.token_id} from unknown strategy "
+                f"'{strategy_name}' dropped"
+            )
+            return False
+
+        self._pipeline_tracker.record_signal(strategy_name, signal.type.value)
+        return await self._handle_entry(signal, context, event, strategy, threshold)
+
+    async def submit_exit(
+        self,
+        signal: ExitSignal,
+        context: StrategyContext,
+        strategy_name: str,
+    ) -> None:
+        """
+        Execute an exit signal evaluated by another engine (a shard worker).
+
+        Skipped while paused, like exits from this engine's own events.
+
+        Args:
+            signal: The exit signal
+            context: Strategy context it was evaluated on
+            strategy_name: Name of the strategy that produced it
+        """
+        if not self._is_running or self._paused:
+            return
+        self._pipeline_tracker.record_signal(strategy_name, signal.type.value)
+        await self._handle_exit(signal, context)
+
     async def _handle_entry(
         self,
         signal: EntrySignal,
         context: Any,
         event: dict,
-    ) -> None:
+        strategy: Strategy | None = None,
+        threshold: Decimal | None = None,
+    ) -> bool:
         """
         Handle an entry signal.
 
@@ -535,7 +785,15 @@ class TradingEngine:
             signal: The entry signal
             context: Strategy context
             event: Original event
+            strategy: Strategy whose trigger key is claimed (default: primary)
+            threshold: Its price threshold
+
+        Returns:
+            True if the entry was executed (dry run: would have been);
+            False if it was rejected or deduplicated
         """
+        name, threshold = self._strategy_key(strategy, threshold)
+
         if self._execution_service and self.config.max_positions is not None:
             open_positions = len(
                 self._execution_service.position_tracker.get_open_positions()
@@ -547,6 +805,7 @@ class TradingEngine:
                     stage=RejectionStage.MAX_POSITIONS,
                     price=context.trigger_price,
                     question=context.question,
+                    strategy=name,
                     rejection_values={
                         "open_positions": open_positions,
                         "max_positions": self.config.max_positions,
@@ -557,7 +816,7 @@ class TradingEngine:
                     f"Max positions reached ({open_positions}/{self.config.max_positions}), "
                     f"skipping entry for {context.token_id}"
                 )
-                return
+                return False
 
         # G5: Verify orderbook matches trigger price
         if self.config.verify_orderbook and self._api_client:
@@ -572,6 +831,7 @@ class TradingEngine:
                     stage=RejectionStage.G5_ORDERBOOK,
                     price=context.trigger_price,
                     question=context.question,
+                    strategy=name,
                     rejection_values={
                         "trigger_price": float(context.trigger_price),
                         "max_deviation": float(self.config.max_price_deviation),
@@ -581,7 +841,8 @@ class TradingEngine:
                 logger.warning(
                     f"G5: Orderbook mismatch for {context.token_id}, rejecting"
                 )
-                return
+                return False
+            stamp(Stage.G5_VERIFY)
 
         # DRY RUN: Skip trigger recording entirely to allow repeated signals
         # This helps validate the bot is working without any DB writes
@@ -590,13 +851,15 @@ class TradingEngine:
             is_first = await self._trigger_tracker.is_first_trigger(
                 token_id=context.token_id,
                 condition_id=context.condition_id,
-                threshold=self.config.price_threshold,
+                threshold=threshold,
+                strategy=name,
             )
             # Also check condition-level (G2)
             if is_first:
                 condition_triggered = await self._trigger_tracker.has_condition_triggered(
                     condition_id=context.condition_id,
-                    threshold=self.config.price_threshold,
+                    threshold=threshold,
+                    strategy=name,
                 )
                 is_first = not condition_triggered
 
@@ -604,25 +867,26 @@ class TradingEngine:
                 logger.debug(
                     f"DRY RUN: Would skip duplicate for {context.token_id}"
                 )
-                return
+                return False
 
             self._stats.dry_run_signals += 1
             logger.info(
                 f"DRY RUN: Would buy {signal.size} of {signal.token_id} "
                 f"@ {signal.price} ({signal.reason})"
             )
-            return
+            return True
 
         # LIVE MODE: Use atomic check-and-record to prevent TOCTOU race
         is_first = await self._trigger_tracker.try_record_trigger_atomic(
             token_id=context.token_id,
             condition_id=context.condition_id,
-            threshold=self.config.price_threshold,
+            threshold=threshold,
             price=context.trigger_price,
             trade_size=context.trade_size,
             model_score=context.model_score,
             outcome=context.outcome,
             outcome_index=context.outcome_index,
+            strategy=name,
         )
 
         if not is_first:
@@ -630,7 +894,7 @@ class TradingEngine:
             logger.debug(
                 f"G2: Atomic dedup blocked duplicate for {context.token_id}"
             )
-            return
+            return False
 
         # Execute the trade
         try:
@@ -639,13 +903,15 @@ class TradingEngine:
             logger.info(
                 f"Successfully executed entry for {context.token_id}"
             )
+            return True
         except PreSubmitValidationError as e:
             # Pre-execution validation errors - safe to retry
             # These errors occur BEFORE order submission (price/balance checks)
             await self._trigger_tracker.remove_trigger(
                 token_id=context.token_id,
                 condition_id=context.condition_id,
-                threshold=self.config.price_threshold,
+                threshold=threshold,
+                strategy=name,
             )
             logger.warning(
                 f"Pre-submit validation failed for {context.token_id}: {e}. "
@@ -664,6 +930,17 @@ class TradingEngine:
             self._stats.errors += 1
             raise
 
+    def _strategy_key(
+        self,
+        strategy: Strategy | None,
+        threshold: Decimal | None,
+    ) -> tuple[str, Decimal]:
+        """Trigger dedup key and threshold, defaulting to the primary strategy."""
+        strategy = strategy or self.strategy
+        if strategy is None:
+            return "", threshold or self.config.price_threshold
+        return strategy.name, threshold or self.threshold_for(strategy)
+
     async def _handle_exit(
         self,
         signal: ExitSignal,
@@ -910,7 +1187,7 @@ class TradingEngine:
         trigger_price = (
             entry.trigger_price
             if entry.trigger_price and entry.trigger_price > 0
-            else self.config.price_threshold
+            else self._strategy_key(None, None)[1]
         )
         signal = EntrySignal(
             reason=f"Watchlist promotion (score={promotion.new_score:.2f})",
@@ -986,7 +1263,9 @@ class TradingEngine:
 
         # Check cache first
         if condition_id in self._question_cache:
+            _QUESTION_CACHE_HIT.inc()
             return self._question_cache[condition_id]
+        _QUESTION_CACHE_MISS.inc()
 
         try:
             query = """
@@ -16,10 +16,31 @@ if TYPE_CHECKING:
     from polymarket_bot.storage import Database
     from polymarket_bot.core.score_service import ScoreService
 
+from polymarket_bot.storage.statements import statements
 from polymarket_bot.strategies import StrategyContext, apply_hard_filters
 
 logger = logging.getLogger(__name__)
 
+# build_context lookups, run for every event that passes the threshold
+TOKEN_META = statements.register("context.token_meta", """
+    SELECT question, outcome, outcome_index, market_id
+    FROM polymarket_token_meta
+    WHERE token_id = $1
+""")
+EXPLORER_QUESTION = statements.register("context.explorer_question", """
+    SELECT question FROM explorer_markets
+    WHERE condition_id = $1
+    LIMIT 1
+""")
+WATCHLIST_CATEGORY = statements.register(
+    "context.watchlist_category",
+    "SELECT category FROM stream_watchlist WHERE market_id = $1",
+)
+TOKEN_CONDITION = statements.register("context.token_condition", """
+    SELECT condition_id FROM polymarket_token_meta
+    WHERE token_id = $1 LIMIT 1
+""")
+
 
 @dataclass
 class TriggerData:
@@ -189,23 +210,13 @@ class EventProcessor:
             return None
 
         # Fetch token metadata
-        query = """
-            SELECT question, outcome, outcome_index, market_id
-            FROM polymarket_token_meta
-            WHERE token_id = $1
-        """
-        meta = await db.fetchrow(query, trigger_data.token_id)
+        meta = await db.fetchrow(TOKEN_META, trigger_data.token_id)
 
         question = meta["question"] if meta else event.get("question", "")
 
         # Fall back to explorer_markets if question is empty
         if not question and trigger_data.condition_id:
-            explorer_query = """
-                SELECT question FROM explorer_markets
-                WHERE condition_id = $1
-                LIMIT 1
-            """
-            explorer_row = await db.fetchrow(explorer_query, trigger_data.condition_id)
+            explorer_row = await db.fetchrow(EXPLORER_QUESTION, trigger_data.condition_id)
             if explorer_row and explorer_row.get("question"):
                 question = explorer_row["question"]
         outcome = meta["outcome"] if meta else event.get("outcome")
@@ -215,8 +226,7 @@ class EventProcessor:
         category = event.get("category")
         market_id = meta.get("market_id") if meta and hasattr(meta, "get") else (meta["market_id"] if meta and "market_id" in meta else None)
         if not category and market_id:
-            market_query = "SELECT category FROM stream_watchlist WHERE market_id = $1"
-            market = await db.fetchrow(market_query, market_id)
+            market = await db.fetchrow(WATCHLIST_CATEGORY, market_id)
             category = market.get("category") if market and hasattr(market, "get") else (market["category"] if market and "category" in market else None)
 
         # Calculate time to end
@@ -244,11 +254,7 @@ class EventProcessor:
                 # Ensure condition_id is available (backfill from token_meta if missing)
                 condition_id = trigger_data.condition_id
                 if not condition_id and trigger_data.token_id:
-                    cid_query = """
-                        SELECT condition_id FROM polymarket_token_meta
-                        WHERE token_id = $1 LIMIT 1
-                    """
-                    cid_row = await db.fetchrow(cid_query, trigger_data.token_id)
+                    cid_row = await db.fetchrow(TOKEN_CONDITION, trigger_data.token_id)
                     if cid_row:
                         condition_id = cid_row.get("condition_id", "")
 
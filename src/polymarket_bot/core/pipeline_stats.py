@@ -0,0 +1,295 @@
+"""
+Pipeline Stats Persistence - Flushes PipelineTracker counters to the DB.
+
+PipelineTracker keeps per-minute rejection counts in a bounded in-memory
+ring (4 hours by default). PipelineStatsFlusher persists that history to
+pipeline_rejection_stats so longer windows survive restarts:
+
+1. Flush: closed minute buckets (plus the latest sampled rejection for each
+   bucket) are written in a single bulk INSERT per cycle.
+2. Rollup: minute rows are summed into hour rows, hour rows into day rows.
+   Only the current and previous hour/day are recomputed each cycle, so
+   the cost is constant regardless of history length.
+3. Retention: each resolution is trimmed to its own horizon.
+
+Reads for windows longer than the in-memory ring go through
+fetch_rollup_totals(), which sums a handful of precomputed hour or day
+rows instead of scanning raw minutes.
+
+Usage:
+    flusher = PipelineStatsFlusher(engine.pipeline_tracker, db)
+    await flusher.run_cycle()  # called every minute by BackgroundTasksManager
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+from .pipeline_tracker import PipelineTracker, RejectionStage
+
+if TYPE_CHECKING:
+    from polymarket_bot.storage import Database
+
+logger = logging.getLogger(__name__)
+
+_STAGES: tuple[RejectionStage, ...] = tuple(RejectionStage)
+
+# Resolution -> (bucket width, date_trunc unit)
+RESOLUTIONS: dict[str, tuple[timedelta, str]] = {
+    "minute": (timedelta(minutes=1), "minute"),
+    "hour": (timedelta(hours=1), "hour"),
+    "day": (timedelta(days=1), "day"),
+}
+
+_INSERT_MINUTES_SQL = """
+    INSERT INTO pipeline_rejection_stats (
+        resolution, bucket_start, bucket_end, stage, count,
+        sample_token_id, sample_condition_id, sample_price,
+        sample_question, sample_rejection_values
+    )
+    SELECT 'minute', u.bucket_start, u.bucket_start + INTERVAL '1 minute',
+           u.stage, u.count, u.token_id, u.condition_id, u.price,
+           u.question, u.rejection_values::jsonb
+    FROM unnest(
+        $1::timestamp[], $2::text[], $3::int[], $4::text[],
+        $5::text[], $6::real[], $7::text[], $8::text[]
+    ) AS u(bucket_start, stage, count, token_id, condition_id,
+           price, question, rejection_values)
+    ON CONFLICT (resolution, bucket_start, stage) DO UPDATE SET
+        count = EXCLUDED.count,
+        sample_token_id = COALESCE(EXCLUDED.sample_token_id, pipeline_rejection_stats.sample_token_id),
+        sample_condition_id = COALESCE(EXCLUDED.sample_condition_id, pipeline_rejection_stats.sample_condition_id),
+        sample_price = COALESCE(EXCLUDED.sample_price, pipeline_rejection_stats.sample_price),
+        sample_question = COALESCE(EXCLUDED.sample_question, pipeline_rejection_stats.sample_question),
+        sample_rejection_values = COALESCE(EXCLUDED.sample_rejection_values, pipeline_rejection_stats.sample_rejection_values)
+"""
+
+# Recompute coarse buckets from the finer resolution, keeping the newest sample
+_ROLLUP_SQL = """
+    INSERT INTO pipeline_rejection_stats (
+        resolution, bucket_start, bucket_end, stage, count,
+        sample_token_id, sample_condition_id, sample_price,
+        sample_question, sample_rejection_values
+    )
+    SELECT $2, date_trunc($3, bucket_start), date_trunc($3, bucket_start) + $4::interval,
+           stage, SUM(count)::int,
+           (array_agg(sample_token_id ORDER BY bucket_start DESC) FILTER (WHERE sample_token_id IS NOT NULL))[1],
+           (array_agg(sample_condition_id ORDER BY bucket_start DESC) FILTER (WHERE sample_token_id IS NOT NULL))[1],
+           (array_agg(sample_price ORDER BY bucket_start DESC) FILTER (WHERE sample_token_id IS NOT NULL))[1],
+           (array_agg(sample_question ORDER BY bucket_start DESC) FILTER (WHERE sample_token_id IS NOT NULL))[1],
+           (array_agg(sample_rejection_values ORDER BY bucket_start DESC) FILTER (WHERE sample_token_id IS NOT NULL))[1]
+    FROM pipeline_rejection_stats
+    WHERE resolution = $1 AND bucket_start >= $5
+    GROUP BY date_trunc($3, bucket_start), stage
+    ON CONFLICT (resolution, bucket_start, stage) DO UPDATE SET
+        count = EXCLUDED.count,
+        sample_token_id = EXCLUDED.sample_token_id,
+        sample_condition_id = EXCLUDED.sample_condition_id,
+        sample_price = EXCLUDED.sample_price,
+        sample_question = EXCLUDED.sample_question,
+        sample_rejection_values = EXCLUDED.sample_rejection_values
+"""
+
+
+def _utc_naive(dt: datetime) -> datetime:
+    """pipeline_rejection_stats uses TIMESTAMP columns holding UTC."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _truncate(dt: datetime, resolution: str) -> datetime:
+    """Floor a naive UTC datetime to the start of its bucket."""
+    if resolution == "day":
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if resolution == "hour":
+        return dt.replace(minute=0, second=0, microsecond=0)
+    return dt.replace(second=0, microsecond=0)
+
+
+def _minute_start(epoch_minute: int) -> datetime:
+    return datetime.fromtimestamp(epoch_minute * 60, tz=timezone.utc).replace(tzinfo=None)
+
+
+@dataclass
+class PipelineStatsRetention:
+    """How long each resolution is kept."""
+
+    minute_hours: int = 48
+    hour_days: int = 30
+    day_days: int = 365
+
+    def cutoff(self, resolution: str, now: datetime) -> datetime:
+        if resolution == "minute":
+            return now - timedelta(hours=self.minute_hours)
+        if resolution == "hour":
+            return now - timedelta(days=self.hour_days)
+        return now - timedelta(days=self.day_days)
+
+
+def rollup_resolution_for(minutes: int, retention: PipelineStatsRetention | None = None) -> str:
+    """Coarsest-needed rollup for a window: hour rows while retained, else day rows."""
+    retention = retention or PipelineStatsRetention()
+    if minutes <= retention.hour_days * 24 * 60:
+        return "hour"
+    return "day"
+
+
+async def fetch_rollup_totals(
+    db: Database,
+    minutes: int,
+    retention: PipelineStatsRetention | None = None,
+    now: datetime | None = None,
+) -> dict[str, int]:
+    """
+    Per-stage rejection totals for the last `minutes` from persisted rollups.
+
+    The window start is floored to the rollup bucket, so the result may
+    include up to one extra hour (or day) of history.
+    """
+    resolution = rollup_resolution_for(minutes, retention)
+    now = _utc_naive(now or datetime.now(timezone.utc))
+    cutoff = _truncate(now - timedelta(minutes=minutes), resolution)
+
+    records = await db.fetch(
+        """
+        SELECT stage, COALESCE(SUM(count), 0) AS count
+        FROM pipeline_rejection_stats
+        WHERE resolution = $1 AND bucket_start >= $2
+        GROUP BY stage
+        """,
+        resolution,
+        cutoff,
+    )
+    totals = {stage.value: 0 for stage in _STAGES}
+    for r in records:
+        totals[r["stage"]] = int(r["count"])
+    return totals
+
+
+class PipelineStatsFlusher:
+    """
+    Persists closed minute buckets from a PipelineTracker and maintains rollups.
+
+    Not a task itself - BackgroundTasksManager calls run_cycle() on its
+    interval and flush() once more on shutdown.
+    """
+
+    def __init__(
+        self,
+        tracker: PipelineTracker,
+        db: Database,
+        retention: PipelineStatsRetention | None = None,
+        retention_interval_seconds: float = 3600,
+    ) -> None:
+        self._tracker = tracker
+        self._db = db
+        self._retention = retention or PipelineStatsRetention()
+        self._retention_interval = timedelta(seconds=retention_interval_seconds)
+        self._last_flushed_minute = -1
+        self._last_retention: datetime | None = None
+
+    @property
+    def last_flushed_minute(self) -> int:
+        """Epoch minute of the newest bucket written (-1 before the first flush)."""
+        return self._last_flushed_minute
+
+    async def flush(self, now_minute: int | None = None) -> int:
+        """
+        Write all closed, not-yet-flushed minute buckets in one bulk insert.
+
+        Returns:
+            Number of (minute, stage) rows written
+        """
+        closed = self._tracker.get_closed_minutes(self._last_flushed_minute, now_minute)
+        if not closed:
+            return 0
+
+        samples = self._tracker.get_minute_samples(closed[0][0], closed[-1][0])
+
+        bucket_starts: list[datetime] = []
+        stages: list[str] = []
+        counts: list[int] = []
+        token_ids: list[str | None] = []
+        condition_ids: list[str | None] = []
+        prices: list[float | None] = []
+        questions: list[str | None] = []
+        values: list[str | None] = []
+
+        for minute, row in closed:
+            bucket_start = _minute_start(minute)
+            for i, count in enumerate(row):
+                if not count:
+                    continue
+                stage = _STAGES[i]
+                sample = samples.get((minute, stage))
+                bucket_starts.append(bucket_start)
+                stages.append(stage.value)
+                counts.append(count)
+                token_ids.append(sample.token_id if sample else None)
+                condition_ids.append(sample.condition_id if sample else None)
+                prices.append(float(sample.price) if sample else None)
+                questions.append(sample.question if sample else None)
+                values.append(json.dumps(sample.rejection_values, default=str) if sample else None)
+
+        if bucket_starts:
+            await self._db.execute(
+                _INSERT_MINUTES_SQL,
+                bucket_starts,
+                stages,
+                counts,
+                token_ids,
+                condition_ids,
+                prices,
+                questions,
+                values,
+            )
+
+        self._last_flushed_minute = closed[-1][0]
+        return len(bucket_starts)
+
+    async def rollup(self, now: datetime | None = None) -> None:
+        """Recompute the current and previous hour and day buckets."""
+        now = _utc_naive(now or datetime.now(timezone.utc))
+        for source, target, step in (
+            ("minute", "hour", timedelta(hours=1)),
+            ("hour", "day", timedelta(days=1)),
+        ):
+            width, unit = RESOLUTIONS[target]
+            since = _truncate(now - step, target)
+            await self._db.execute(_ROLLUP_SQL, source, target, unit, width, since)
+
+    async def apply_retention(self, now: datetime | None = None) -> int:
+        """Delete rows past each resolution's horizon. Returns rows deleted."""
+        now = _utc_naive(now or datetime.now(timezone.utc))
+        deleted = 0
+        for resolution in RESOLUTIONS:
+            result = await self._db.execute(
+                "DELETE FROM pipeline_rejection_stats WHERE resolution = $1 AND bucket_start < $2",
+                resolution,
+                self._retention.cutoff(resolution, now),
+            )
+            try:
+                deleted += int(result.split()[-1]) if result else 0
+            except (ValueError, IndexError):
+                pass
+        return deleted
+
+    async def run_cycle(self, now: datetime | None = None) -> int:
+        """Flush, roll up, and (at most once per retention interval) trim."""
+        now = now or datetime.now(timezone.utc)
+        written = await self.flush(int(now.timestamp()) // 60)
+        if written:
+            await self.rollup(now)
+
+        if self._last_retention is None or now - self._last_retention >= self._retention_interval:
+            deleted = await self.apply_retention(now)
+            self._last_retention = now
+            if deleted:
+                logger.info(f"Pipeline stats retention: deleted {deleted} rows")
+
+        return written
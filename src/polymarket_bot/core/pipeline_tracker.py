@@ -15,17 +15,24 @@ Tracks rejections at each stage of the pipeline:
 
 Design:
 - In-memory counters for high-frequency tracking (no DB bloat)
+- Per-minute counts in a fixed-size ring of per-stage integer arrays,
+  indexed by epoch minute (no string keys, no per-minute dict allocation,
+  bounded memory without explicit cleanup)
 - Sampled recent rejections for drill-down (ring buffer)
-- Candidate tracking for near-miss markets
-- Periodic aggregation to DB for historical analysis
+- Candidate tracking for near-miss markets (LRU-ordered for O(1) eviction)
+- Per-strategy counters (evaluations, signals, rejections) when the engine
+  runs several strategies; shared pre-strategy stages carry no strategy
+- Closed minutes are flushed to pipeline_rejection_stats and rolled up to
+  hour/day buckets by PipelineStatsFlusher (see pipeline_stats.py)
 """
 
 from __future__ import annotations
 
 import threading
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import Optional
@@ -51,6 +58,12 @@ class RejectionStage(Enum):
     STRATEGY_IGNORE = "strategy_ignore"   # Strategy returned IGNORE
 
 
+# Stage -> column index in the per-minute count arrays
+_STAGES: tuple[RejectionStage, ...] = tuple(RejectionStage)
+_STAGE_INDEX: dict[RejectionStage, int] = {stage: i for i, stage in enumerate(_STAGES)}
+_NUM_STAGES = len(_STAGES)
+
+
 @dataclass
 class RejectionEvent:
     """A single rejection event with details."""
@@ -65,6 +78,7 @@ class RejectionEvent:
     trade_age_seconds: Optional[float] = None
     rejection_values: dict = field(default_factory=dict)
     outcome: Optional[str] = None  # "Yes" or "No" - the direction of the trade
+    strategy: str | None = None  # None for stages shared by all strategies
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
@@ -79,6 +93,7 @@ class RejectionEvent:
             "trade_age_seconds": self.trade_age_seconds,
             "rejection_values": self.rejection_values,
             "outcome": self.outcome,
+            "strategy": self.strategy,
             "rejection_reason": self._format_rejection_reason(),
         }
 
@@ -221,6 +236,7 @@ class PipelineTracker:
         max_recent_rejections: int = 1000,
         max_candidates: int = 200,
         sample_rate: int = 50,  # Store 1 in N detailed rejections
+        window_minutes: int = 240,
     ):
         """
         Initialize pipeline tracker.
@@ -229,31 +245,49 @@ class PipelineTracker:
             max_recent_rejections: Max detailed rejections to keep in memory
             max_candidates: Max candidate markets to track
             sample_rate: Store 1 in N rejections for detail view (reduces memory)
+            window_minutes: Minutes of per-stage history kept in the ring;
+                windowed stats are capped at this span
         """
         self._max_recent = max_recent_rejections
         self._max_candidates = max_candidates
         self._sample_rate = sample_rate
+        self._window_minutes = window_minutes
+
+        # Single lock guarding counters, the minute ring and the sample counter.
+        # Writers run on the event loop; readers are dashboard (Flask) threads.
+        self._lock = threading.Lock()
 
-        # Counters by stage (thread-safe via lock)
-        self._counters: dict[RejectionStage, int] = {stage: 0 for stage in RejectionStage}
-        self._counter_lock = threading.Lock()
+        # All-time counters by stage index
+        self._totals: list[int] = [0] * _NUM_STAGES
 
-        # Time-bucketed counters for trends (minute buckets)
-        self._minute_buckets: dict[str, dict[RejectionStage, int]] = {}
-        self._bucket_lock = threading.Lock()
+        # Minute ring: slot = epoch_minute % window_minutes. _ring_minutes holds
+        # the epoch minute each slot currently represents (-1 = never used).
+        self._ring_counts: list[list[int]] = [
+            [0] * _NUM_STAGES for _ in range(window_minutes)
+        ]
+        self._ring_minutes: list[int] = [-1] * window_minutes
 
         # Recent detailed rejections (sampled)
         self._recent_rejections: deque[RejectionEvent] = deque(maxlen=max_recent_rejections)
         self._recent_lock = threading.Lock()
         self._sample_counter = 0
 
-        # Candidate markets
-        self._candidates: dict[str, CandidateMarket] = {}  # keyed by condition_id
+        # Per-strategy all-time counters, guarded by _lock
+        self._strategy_rejections: dict[str, list[int]] = {}
+        self._strategy_signals: dict[str, dict[str, int]] = {}
+
+        # Candidate markets, least recently updated first
+        self._candidates: OrderedDict[str, CandidateMarket] = OrderedDict()  # keyed by condition_id
         self._candidate_lock = threading.Lock()
 
         # Tracking start time
         self._started_at = datetime.now(timezone.utc)
 
+    @property
+    def window_minutes(self) -> int:
+        """Minutes of per-minute history held in memory."""
+        return self._window_minutes
+
     def record_rejection(
         self,
         token_id: str,
@@ -265,6 +299,7 @@ class PipelineTracker:
         trade_age_seconds: Optional[float] = None,
         rejection_values: Optional[dict] = None,
         outcome: Optional[str] = None,
+        strategy: str | None = None,
     ) -> None:
         """
         Record a pipeline rejection.
@@ -279,22 +314,31 @@ class PipelineTracker:
             trade_age_seconds: Age of trade data if relevant (G1)
             rejection_values: Extra details about why rejected
             outcome: "Yes" or "No" - which outcome token this is
+            strategy: Strategy the rejection applies to, for per-strategy
+                stages (duplicate, strategy hold/ignore, max positions, G5)
         """
-        now = datetime.now(timezone.utc)
-        minute_bucket = now.strftime("%Y-%m-%d %H:%M")
-
-        # Always increment counters (fast, always)
-        with self._counter_lock:
-            self._counters[stage] += 1
-
-        with self._bucket_lock:
-            if minute_bucket not in self._minute_buckets:
-                self._minute_buckets[minute_bucket] = {s: 0 for s in RejectionStage}
-            self._minute_buckets[minute_bucket][stage] += 1
-
-        # Sample detailed rejections to avoid memory bloat
-        # Use counter lock for thread safety
-        with self._counter_lock:
+        minute = int(time.time()) // 60
+        idx = _STAGE_INDEX[stage]
+        slot = minute % self._window_minutes
+
+        with self._lock:
+            self._totals[idx] += 1
+
+            if self._ring_minutes[slot] != minute:
+                # Slot held an older minute: recycle it in place
+                row = self._ring_counts[slot]
+                for i in range(_NUM_STAGES):
+                    row[i] = 0
+                self._ring_minutes[slot] = minute
+            self._ring_counts[slot][idx] += 1
+
+            if strategy is not None:
+                counts = self._strategy_rejections.get(strategy)
+                if counts is None:
+                    counts = self._strategy_rejections[strategy] = [0] * _NUM_STAGES
+                counts[idx] += 1
+
+            # Sample detailed rejections to avoid memory bloat
             self._sample_counter += 1
             should_sample = self._sample_counter % self._sample_rate == 0
 
@@ -303,17 +347,57 @@ class PipelineTracker:
                 token_id=token_id,
                 condition_id=condition_id,
                 stage=stage,
-                timestamp=now,
+                timestamp=datetime.now(timezone.utc),
                 price=price,
                 question=question,
                 trade_size=trade_size,
                 trade_age_seconds=trade_age_seconds,
                 rejection_values=rejection_values or {},
                 outcome=outcome,
+                strategy=strategy,
             )
             with self._recent_lock:
                 self._recent_rejections.append(event)
 
+    def record_signal(self, strategy: str, signal: str) -> None:
+        """
+        Count a strategy evaluation and the signal it returned.
+
+        Args:
+            strategy: Strategy name
+            signal: Signal type value (entry, hold, watchlist, ...)
+        """
+        with self._lock:
+            signals = self._strategy_signals.get(strategy)
+            if signals is None:
+                signals = self._strategy_signals[strategy] = {}
+            signals[signal] = signals.get(signal, 0) + 1
+
+    def get_strategy_stats(self) -> dict[str, dict]:
+        """
+        All-time per-strategy counters.
+
+        Returns:
+            {strategy: {"evaluated", "signals", "rejections", "total_rejections"}}
+        """
+        with self._lock:
+            names = set(self._strategy_signals) | set(self._strategy_rejections)
+            stats = {}
+            for name in sorted(names):
+                signals = dict(self._strategy_signals.get(name, {}))
+                counts = self._strategy_rejections.get(name, [0] * _NUM_STAGES)
+                stats[name] = {
+                    "evaluated": sum(signals.values()),
+                    "signals": signals,
+                    "rejections": {
+                        stage.value: counts[i]
+                        for i, stage in enumerate(_STAGES)
+                        if counts[i]
+                    },
+                    "total_rejections": sum(counts),
+                }
+        return stats
+
     def update_candidate(
         self,
         token_id: str,
@@ -367,14 +451,11 @@ class PipelineTracker:
                     candidate.outcome = outcome
                 if price > candidate.highest_price_seen:
                     candidate.highest_price_seen = price
+                self._candidates.move_to_end(condition_id)
             else:
-                # Evict oldest if at capacity
+                # Evict least recently updated if at capacity
                 if len(self._candidates) >= self._max_candidates:
-                    oldest_key = min(
-                        self._candidates.keys(),
-                        key=lambda k: self._candidates[k].last_updated
-                    )
-                    del self._candidates[oldest_key]
+                    self._candidates.popitem(last=False)
 
                 # Create new
                 self._candidates[condition_id] = CandidateMarket(
@@ -405,39 +486,97 @@ class PipelineTracker:
         Get rejection statistics.
 
         Args:
-            minutes: If provided, only count last N minutes. Otherwise all-time.
+            minutes: If provided, only count last N minutes (capped at
+                window_minutes). Otherwise all-time.
 
         Returns:
             Dict with totals by stage and grand total
         """
         if minutes is None:
             # All-time totals
-            with self._counter_lock:
-                totals = {stage.value: count for stage, count in self._counters.items()}
+            with self._lock:
+                counts = list(self._totals)
+            totals = {stage.value: counts[i] for i, stage in enumerate(_STAGES)}
             return {
                 "totals": totals,
-                "total": sum(totals.values()),
+                "total": sum(counts),
                 "since": self._started_at.isoformat(),
             }
 
-        # Time-windowed totals
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=minutes)
-        cutoff_bucket = cutoff.strftime("%Y-%m-%d %H:%M")
-
-        totals = {stage.value: 0 for stage in RejectionStage}
-
-        with self._bucket_lock:
-            for bucket, stages in self._minute_buckets.items():
-                if bucket >= cutoff_bucket:
-                    for stage, count in stages.items():
-                        totals[stage.value] += count
+        counts = self._window_counts(minutes)
+        totals = {stage.value: counts[i] for i, stage in enumerate(_STAGES)}
 
         return {
             "totals": totals,
-            "total": sum(totals.values()),
+            "total": sum(counts),
             "minutes": minutes,
         }
 
+    def _window_counts(self, minutes: int, now_minute: int | None = None) -> list[int]:
+        """
+        Sum per-stage counts over the current minute and the `minutes` before it.
+
+        O(window) array sums; slots holding minutes outside the window are skipped.
+        """
+        if now_minute is None:
+            now_minute = int(time.time()) // 60
+        span = min(max(minutes, 0) + 1, self._window_minutes)
+        first_minute = now_minute - span + 1
+
+        counts = [0] * _NUM_STAGES
+        with self._lock:
+            for minute in range(first_minute, now_minute + 1):
+                slot = minute % self._window_minutes
+                if self._ring_minutes[slot] != minute:
+                    continue
+                row = self._ring_counts[slot]
+                for i in range(_NUM_STAGES):
+                    counts[i] += row[i]
+        return counts
+
+    def get_closed_minutes(
+        self,
+        after_minute: int,
+        now_minute: int | None = None,
+    ) -> list[tuple[int, list[int]]]:
+        """
+        Per-stage counts for completed minutes still held in the ring.
+
+        Args:
+            after_minute: Only return minutes strictly after this epoch minute
+            now_minute: Current epoch minute (excluded, still open)
+
+        Returns:
+            (epoch_minute, counts by stage index) pairs, oldest first
+        """
+        if now_minute is None:
+            now_minute = int(time.time()) // 60
+
+        closed = []
+        with self._lock:
+            for slot, minute in enumerate(self._ring_minutes):
+                if after_minute < minute < now_minute:
+                    closed.append((minute, list(self._ring_counts[slot])))
+        closed.sort(key=lambda item: item[0])
+        return closed
+
+    def get_minute_samples(
+        self,
+        first_minute: int,
+        last_minute: int,
+    ) -> dict[tuple[int, RejectionStage], RejectionEvent]:
+        """
+        Latest sampled rejection per (epoch minute, stage) in [first_minute, last_minute].
+        """
+        samples: dict[tuple[int, RejectionStage], RejectionEvent] = {}
+        with self._recent_lock:
+            events = list(self._recent_rejections)
+        for event in events:
+            minute = int(event.timestamp.timestamp()) // 60
+            if first_minute <= minute <= last_minute:
+                samples[(minute, event.stage)] = event
+        return samples
+
     def get_recent_rejections(
         self,
         stage: Optional[RejectionStage] = None,
@@ -509,15 +648,24 @@ class PipelineTracker:
                 if c.is_above_threshold  # Price >= threshold
             ]
 
-    def get_funnel_summary(self, minutes: int = 60) -> dict:
+    def get_funnel_summary(
+        self,
+        minutes: int = 60,
+        totals: dict[str, int] | None = None,
+    ) -> dict:
         """
         Get a funnel summary for dashboard display.
 
+        Args:
+            minutes: Window size in minutes
+            totals: Per-stage counts to summarize instead of the in-memory
+                window (e.g. persisted rollups for windows past the ring)
+
         Returns breakdown of rejections suitable for funnel visualization.
         """
-        stats = self.get_stats(minutes)
-        totals = stats["totals"]
-        grand_total = stats["total"]
+        if totals is None:
+            totals = self.get_stats(minutes)["totals"]
+        grand_total = sum(totals.values())
 
         # Order stages in pipeline order
         pipeline_order = [
@@ -553,10 +701,24 @@ class PipelineTracker:
             reverse=True
         )[:3]
 
-        samples = {}
-        for stage, _ in top_stages:
-            recent = self.get_recent_rejections(stage=stage, limit=3)
-            samples[stage.value] = [r.to_dict() for r in recent]
+        # One newest-first pass over the sample buffer for all top stages.
+        # Tuple membership compares by identity, avoiding Enum.__hash__.
+        wanted = tuple(stage for stage, _ in top_stages)
+        picked: list[list[RejectionEvent]] = [[] for _ in wanted]
+        remaining = 3 * len(wanted)
+        with self._recent_lock:
+            for event in reversed(self._recent_rejections):
+                if event.stage in wanted:
+                    bucket = picked[wanted.index(event.stage)]
+                    if len(bucket) < 3:
+                        bucket.append(event)
+                        remaining -= 1
+                        if remaining == 0:
+                            break
+        samples = {
+            stage.value: [r.to_dict() for r in events]
+            for stage, events in zip(wanted, picked, strict=True)
+        }
 
         return {
             "funnel": funnel,
@@ -569,23 +731,28 @@ class PipelineTracker:
 
     def cleanup_old_buckets(self, max_age_minutes: int = 120) -> int:
         """
-        Remove old minute buckets to prevent memory growth.
+        Clear minute slots older than max_age_minutes.
+
+        Not required for bounded memory (the ring recycles slots), but keeps
+        windowed stats from including minutes the caller considers expired.
 
         Args:
-            max_age_minutes: Remove buckets older than this
+            max_age_minutes: Clear slots older than this
 
         Returns:
-            Number of buckets removed
+            Number of slots cleared
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
-        cutoff_bucket = cutoff.strftime("%Y-%m-%d %H:%M")
+        cutoff_minute = int(time.time()) // 60 - max_age_minutes
 
         removed = 0
-        with self._bucket_lock:
-            old_keys = [k for k in self._minute_buckets.keys() if k < cutoff_bucket]
-            for key in old_keys:
-                del self._minute_buckets[key]
-                removed += 1
+        with self._lock:
+            for slot, minute in enumerate(self._ring_minutes):
+                if 0 <= minute < cutoff_minute:
+                    row = self._ring_counts[slot]
+                    for i in range(_NUM_STAGES):
+                        row[i] = 0
+                    self._ring_minutes[slot] = -1
+                    removed += 1
 
         return removed
 
@@ -609,13 +776,17 @@ class PipelineTracker:
 
     def reset(self) -> None:
         """Reset all counters and buffers (for testing)."""
-        with self._counter_lock:
-            self._counters = {stage: 0 for stage in RejectionStage}
-        with self._bucket_lock:
-            self._minute_buckets = {}
+        with self._lock:
+            self._totals = [0] * _NUM_STAGES
+            for row in self._ring_counts:
+                for i in range(_NUM_STAGES):
+                    row[i] = 0
+            self._ring_minutes = [-1] * self._window_minutes
+            self._sample_counter = 0
+            self._strategy_rejections = {}
+            self._strategy_signals = {}
         with self._recent_lock:
             self._recent_rejections.clear()
         with self._candidate_lock:
-            self._candidates = {}
-        self._sample_counter = 0
+            self._candidates = OrderedDict()
         self._started_at = datetime.now(timezone.utc)
@@ -27,6 +27,8 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+from polymarket_bot.telemetry import registry
+
 from .score_bridge import ScoreBridge, get_score_bridge
 
 if TYPE_CHECKING:
@@ -35,6 +37,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_CACHE_REQUESTS = registry.counter(
+    "polymarket_cache_requests_total", "In-memory cache lookups", ("cache", "result")
+)
+_SCORE_CACHE_HIT = _CACHE_REQUESTS.labels("score", "hit")
+_SCORE_CACHE_MISS = _CACHE_REQUESTS.labels("score", "miss")
+
 # Scoring configuration
 DEFAULT_SCORE_VERSION = "postgres-v1"
 
@@ -169,6 +177,7 @@ class ScoreService:
             score, version, cached_at = self._memory_cache[cache_key]
             age = (datetime.now(timezone.utc) - cached_at).total_seconds()
             if age < self._cache_ttl_seconds:
+                _SCORE_CACHE_HIT.inc()
                 return ScoreResult(
                     score=score,
                     version=version,
@@ -177,6 +186,7 @@ class ScoreService:
                 )
             # Expired, remove from cache
             del self._memory_cache[cache_key]
+        _SCORE_CACHE_MISS.inc()
 
         # 2. Check PostgreSQL cache
         if condition_id and self._score_cache_repo:
@@ -10,12 +10,15 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from polymarket_bot.core import TradingEngine, EngineConfig, EngineStats
 from polymarket_bot.strategies import (
+    DuplicateStrategyError,
     EntrySignal,
     ExitSignal,
     HoldSignal,
     WatchlistSignal,
     IgnoreSignal,
     SignalType,
+    Strategy,
+    StrategyContext,
 )
 
 
@@ -478,3 +481,246 @@ class TestExecutionCount:
         trading_engine._stats.dry_run_signals = 7
 
         assert trading_engine.dry_run_signals == 7
+
+
+def _named_strategy(name: str, signal):
+    strategy = MagicMock(spec=Strategy)
+    strategy.name = name
+    strategy.evaluate.return_value = signal
+    return strategy
+
+
+class TestMultiStrategy:
+    """Tests for fanning one event out to several strategies."""
+
+    @pytest.fixture
+    def token_meta(self, mock_db):
+        mock_db.fetchrow.return_value = {
+            "question": "Test?",
+            "outcome": "Yes",
+            "outcome_index": 0,
+            "market_id": "market_123",
+        }
+
+    @pytest.fixture
+    async def engine(self, mock_db, engine_config, token_meta):
+        engine_config.strategy_thresholds = {"strict": Decimal("0.97")}
+        engine = TradingEngine(
+            config=engine_config,
+            db=mock_db,
+            strategies=[
+                _named_strategy("loose", HoldSignal(reason="hold")),
+                _named_strategy("strict", EntrySignal(
+                    token_id="tok_yes_abc",
+                    side="BUY",
+                    price=Decimal("0.98"),
+                    size=Decimal("20"),
+                    reason="enter",
+                )),
+            ],
+        )
+        await engine.start()
+        yield engine
+        await engine.stop()
+
+    @pytest.mark.asyncio
+    async def test_only_strategies_past_their_threshold_are_evaluated(
+        self, engine, price_trigger_event, mock_db
+    ):
+        loose, strict = engine.strategies
+
+        signal = await engine.process_event(price_trigger_event)  # price 0.95
+
+        assert signal.type == SignalType.HOLD
+        loose.evaluate.assert_called_once()
+        strict.evaluate.assert_not_called()
+        # One strategy crossed: the single-key dedup path
+        assert mock_db.fetchval.call_args_list[0].args[-1] == "loose"
+
+    @pytest.mark.asyncio
+    async def test_strategies_share_context_and_dedup_per_strategy(
+        self, engine, price_trigger_event, mock_db
+    ):
+        loose, strict = engine.strategies
+        mock_db.fetch.return_value = [{"strategy": "loose"}]
+        price_trigger_event["price"] = "0.98"
+
+        signal = await engine.process_event(price_trigger_event)
+
+        assert signal.type == SignalType.ENTRY
+        loose.evaluate.assert_not_called()
+        strict.evaluate.assert_called_once()
+        query, condition_id, names, thresholds = mock_db.fetch.call_args.args
+        assert names == ["loose", "strict"]
+        assert thresholds == [0.95, 0.97]
+        stats = engine.pipeline_tracker.get_strategy_stats()
+        assert stats["loose"]["rejections"] == {"duplicate": 1}
+        assert stats["strict"]["signals"] == {"entry": 1}
+
+    @pytest.mark.asyncio
+    async def test_each_strategy_routes_its_own_signal(
+        self, engine, price_trigger_event, mock_db
+    ):
+        loose, strict = engine.strategies
+        price_trigger_event["price"] = "0.98"
+
+        await engine.process_event(price_trigger_event)
+
+        assert loose.evaluate.call_args.args[0] is strict.evaluate.call_args.args[0]
+        assert engine.stats.dry_run_signals == 1
+        stats = engine.pipeline_tracker.get_strategy_stats()
+        assert stats["loose"]["rejections"] == {"strategy_hold": 1}
+        # Dry-run dedup checks used the strict strategy's key and threshold
+        assert mock_db.fetchval.call_args.args[-2:] == (0.97, "strict")
+
+    def test_lowest_threshold_prefilters_events(self, engine):
+        assert engine._event_processor.meets_threshold(Decimal("0.95"))
+        assert not engine._event_processor.meets_threshold(Decimal("0.94"))
+
+        engine.update_config(price_threshold=Decimal("0.98"))
+
+        assert engine.threshold_for(engine.strategies[1]) == Decimal("0.97")
+        assert not engine._event_processor.meets_threshold(Decimal("0.96"))
+
+    def test_strategy_names_must_be_unique(self, mock_db, engine_config):
+        with pytest.raises(DuplicateStrategyError):
+            TradingEngine(
+                config=engine_config,
+                db=mock_db,
+                strategies=[
+                    _named_strategy("same", HoldSignal(reason="a")),
+                    _named_strategy("same", HoldSignal(reason="b")),
+                ],
+            )
+
+
+class TestEntrySink:
+    """Tests for forwarding entries between engines (shard worker -> coordinator)."""
+
+    @pytest.fixture
+    def strategies(self):
+        return [
+            _named_strategy("loose", HoldSignal(reason="hold")),
+            _named_strategy("strict", EntrySignal(
+                token_id="tok_yes_abc",
+                side="BUY",
+                price=Decimal("0.98"),
+                size=Decimal("20"),
+                reason="enter",
+            )),
+        ]
+
+    @pytest.fixture
+    async def coordinator(self, mock_db, engine_config, strategies):
+        engine_config.strategy_thresholds = {"strict": Decimal("0.97")}
+        engine = TradingEngine(config=engine_config, db=mock_db, strategies=strategies)
+        await engine.start()
+        yield engine
+        await engine.stop()
+
+    @pytest.fixture
+    def context(self):
+        return StrategyContext(
+            condition_id="0xtest123",
+            token_id="tok_yes_abc",
+            question="Test?",
+            category=None,
+            trigger_price=Decimal("0.98"),
+            trade_size=None,
+            time_to_end_hours=100.0,
+            trade_age_seconds=1.0,
+            model_score=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_worker_forwards_entries_instead_of_handling(
+        self, mock_db, engine_config, strategies, price_trigger_event
+    ):
+        mock_db.fetchrow.return_value = {"question": "Test?", "outcome": "Yes", "outcome_index": 0}
+        engine_config.strategy_thresholds = {"strict": Decimal("0.97")}
+        sink = AsyncMock()
+        engine = TradingEngine(
+            config=engine_config, db=mock_db, strategies=strategies, entry_sink=sink
+        )
+        await engine.start()
+        price_trigger_event["price"] = "0.98"
+
+        signal = await engine.process_event(price_trigger_event)
+
+        assert signal.type == SignalType.ENTRY
+        sink.assert_awaited_once()
+        forwarded, context, event, name, threshold = sink.await_args.args
+        assert forwarded is signal
+        assert context.token_id == "tok_yes_abc"
+        assert (name, threshold) == ("strict", Decimal("0.97"))
+        assert engine.stats.dry_run_signals == 0
+
+    @pytest.mark.asyncio
+    async def test_submit_entry_takes_the_entry_path(self, coordinator, context, mock_db):
+        signal = coordinator.strategies[1].evaluate.return_value
+
+        assert await coordinator.submit_entry(
+            signal, context, {}, "strict", Decimal("0.97")
+        )
+
+        assert coordinator.stats.dry_run_signals == 1
+        assert mock_db.fetchval.call_args.args[-2:] == (0.97, "strict")
+        stats = coordinator.pipeline_tracker.get_strategy_stats()
+        assert stats["strict"]["signals"] == {"entry": 1}
+
+    @pytest.mark.asyncio
+    async def test_submit_entry_applies_coordinator_controls(self, coordinator, context):
+        signal = coordinator.strategies[1].evaluate.return_value
+
+        coordinator.block_market("0xtest123", "halted")
+        assert not await coordinator.submit_entry(signal, context, {}, "strict", Decimal("0.97"))
+        coordinator.unblock_market("0xtest123")
+        coordinator.pause("maintenance")
+        assert not await coordinator.submit_entry(signal, context, {}, "strict", Decimal("0.97"))
+        coordinator.resume()
+        assert not await coordinator.submit_entry(signal, context, {}, "unknown", Decimal("0.97"))
+
+        assert coordinator.stats.dry_run_signals == 0
+        stats = coordinator.pipeline_tracker.get_strategy_stats()
+        assert stats["strict"]["rejections"] == {"manual_block": 1}
+
+    @pytest.mark.asyncio
+    async def test_worker_forwards_exits_instead_of_handling(
+        self, mock_db, engine_config, price_trigger_event
+    ):
+        mock_db.fetchrow.return_value = {"question": "Test?", "outcome": "Yes", "outcome_index": 0}
+        exit_signal = ExitSignal(reason="take profit", position_id="pos_1")
+        sink = AsyncMock()
+        engine = TradingEngine(
+            config=engine_config,
+            db=mock_db,
+            strategies=[_named_strategy("exiter", exit_signal)],
+            entry_sink=AsyncMock(),
+            exit_sink=sink,
+        )
+        engine._handle_exit = AsyncMock()
+        await engine.start()
+        price_trigger_event["price"] = "0.98"
+
+        await engine.process_event(price_trigger_event)
+
+        sink.assert_awaited_once()
+        forwarded, context, name = sink.await_args.args
+        assert forwarded is exit_signal
+        assert context.token_id == "tok_yes_abc"
+        assert name == "exiter"
+        engine._handle_exit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_submit_exit_takes_the_exit_path(self, coordinator, context):
+        exit_signal = ExitSignal(reason="take profit", position_id="pos_1")
+        coordinator._handle_exit = AsyncMock()
+
+        coordinator.pause("maintenance")
+        await coordinator.submit_exit(exit_signal, context, "strict")
+        coordinator.resume()
+        await coordinator.submit_exit(exit_signal, context, "strict")
+
+        coordinator._handle_exit.assert_awaited_once_with(exit_signal, context)
+        stats = coordinator.pipeline_tracker.get_strategy_stats()
+        assert stats["strict"]["signals"] == {"exit": 1}
@@ -0,0 +1,119 @@
+"""
+Tests for PipelineStatsFlusher and rollup reads.
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from polymarket_bot.core import PipelineTracker, RejectionStage
+from polymarket_bot.core.pipeline_stats import (
+    PipelineStatsFlusher,
+    fetch_rollup_totals,
+    rollup_resolution_for,
+)
+
+BASE = 1_700_000_000  # 2023-11-14 22:13:20 UTC
+BASE_MINUTE = BASE // 60
+
+
+def _reject_at(tracker: PipelineTracker, ts: int, stage: RejectionStage, n: int = 1) -> None:
+    with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=ts):
+        for _ in range(n):
+            tracker.record_rejection(
+                token_id="tok_abc",
+                condition_id="0x123",
+                stage=stage,
+                price=Decimal("0.90"),
+            )
+
+
+@pytest.fixture
+def db():
+    mock = AsyncMock()
+    mock.execute = AsyncMock(return_value="DELETE 0")
+    mock.fetch = AsyncMock(return_value=[])
+    return mock
+
+
+class TestFlush:
+    """Closed minutes are written once, in a single statement."""
+
+    async def test_flushes_closed_minutes_in_one_insert(self, db):
+        tracker = PipelineTracker()
+        _reject_at(tracker, BASE - 120, RejectionStage.DUPLICATE, 3)
+        _reject_at(tracker, BASE - 60, RejectionStage.THRESHOLD, 2)
+        _reject_at(tracker, BASE, RejectionStage.THRESHOLD, 5)  # still open
+
+        flusher = PipelineStatsFlusher(tracker, db)
+        written = await flusher.flush(now_minute=BASE_MINUTE)
+
+        assert written == 2
+        assert db.execute.await_count == 1
+        args = db.execute.await_args.args
+        assert args[2] == ["duplicate", "threshold"]
+        assert args[3] == [3, 2]
+        assert flusher.last_flushed_minute == BASE_MINUTE - 1
+
+    async def test_does_not_rewrite_flushed_minutes(self, db):
+        tracker = PipelineTracker()
+        _reject_at(tracker, BASE - 60, RejectionStage.THRESHOLD, 2)
+
+        flusher = PipelineStatsFlusher(tracker, db)
+        await flusher.flush(now_minute=BASE_MINUTE)
+        db.execute.reset_mock()
+
+        assert await flusher.flush(now_minute=BASE_MINUTE + 1) == 0
+        db.execute.assert_not_awaited()
+
+    async def test_attaches_sample_for_bucket(self, db):
+        tracker = PipelineTracker(sample_rate=1)
+        with patch("polymarket_bot.core.pipeline_tracker.datetime") as mock_dt:
+            mock_dt.now.return_value = datetime.fromtimestamp(BASE - 60, tz=timezone.utc)
+            _reject_at(tracker, BASE - 60, RejectionStage.G5_ORDERBOOK)
+
+        flusher = PipelineStatsFlusher(tracker, db)
+        await flusher.flush(now_minute=BASE_MINUTE)
+
+        args = db.execute.await_args.args
+        assert args[4] == ["tok_abc"]
+        assert args[6] == [pytest.approx(0.90)]
+
+    async def test_run_cycle_rolls_up_after_write(self, db):
+        tracker = PipelineTracker()
+        _reject_at(tracker, BASE - 60, RejectionStage.THRESHOLD)
+
+        flusher = PipelineStatsFlusher(tracker, db)
+        await flusher.run_cycle(now=datetime.fromtimestamp(BASE, tz=timezone.utc))
+
+        # insert + minute->hour + hour->day + 3 retention deletes
+        assert db.execute.await_count == 6
+
+
+class TestRollupReads:
+    """Long windows read hour or day rollups."""
+
+    def test_resolution_for_window(self):
+        assert rollup_resolution_for(24 * 60) == "hour"
+        assert rollup_resolution_for(90 * 24 * 60) == "day"
+
+    async def test_fetch_rollup_totals_fills_all_stages(self, db):
+        db.fetch = AsyncMock(return_value=[{"stage": "duplicate", "count": 7}])
+
+        totals = await fetch_rollup_totals(db, 24 * 60, now=datetime(2024, 1, 2, 12, 30))
+
+        assert totals["duplicate"] == 7
+        assert totals["threshold"] == 0
+        assert db.fetch.await_args.args[1:] == ("hour", datetime(2024, 1, 1, 12, 0))
+
+    def test_funnel_summary_accepts_external_totals(self):
+        tracker = PipelineTracker()
+        summary = tracker.get_funnel_summary(
+            minutes=24 * 60, totals={"duplicate": 3, "threshold": 1}
+        )
+
+        assert summary["total_rejections"] == 4
+        by_stage = {row["stage"]: row for row in summary["funnel"]}
+        assert by_stage["duplicate"]["percentage"] == 75.0
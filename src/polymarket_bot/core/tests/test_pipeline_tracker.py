@@ -0,0 +1,145 @@
+"""
+Tests for PipelineTracker counters, minute ring and candidate eviction.
+"""
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from polymarket_bot.core import PipelineTracker, RejectionStage
+
+
+def _reject(tracker: PipelineTracker, stage: RejectionStage, n: int = 1) -> None:
+    for _ in range(n):
+        tracker.record_rejection(
+            token_id="tok_abc",
+            condition_id="0x123",
+            stage=stage,
+            price=Decimal("0.90"),
+        )
+
+
+class TestRejectionCounters:
+    """Tests for all-time and windowed counts."""
+
+    def test_all_time_totals(self):
+        tracker = PipelineTracker()
+        _reject(tracker, RejectionStage.DUPLICATE, 3)
+        _reject(tracker, RejectionStage.G5_ORDERBOOK, 2)
+
+        stats = tracker.get_stats()
+
+        assert stats["totals"]["duplicate"] == 3
+        assert stats["totals"]["g5_orderbook"] == 2
+        assert stats["total"] == 5
+
+    def test_window_excludes_old_minutes(self):
+        tracker = PipelineTracker(window_minutes=60)
+        base = 1_700_000_000
+
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base):
+            _reject(tracker, RejectionStage.THRESHOLD, 4)
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base + 600):
+            _reject(tracker, RejectionStage.THRESHOLD, 1)
+            recent = tracker.get_stats(minutes=5)
+            wide = tracker.get_stats(minutes=30)
+
+        assert recent["total"] == 1
+        assert wide["total"] == 5
+
+    def test_ring_slot_reuse_drops_stale_counts(self):
+        """A slot recycled for a newer minute must not carry old counts."""
+        tracker = PipelineTracker(window_minutes=10)
+        base = 1_700_000_000
+
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base):
+            _reject(tracker, RejectionStage.CATEGORY, 7)
+        # Same slot, 10 minutes later
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base + 600):
+            _reject(tracker, RejectionStage.CATEGORY, 1)
+            stats = tracker.get_stats(minutes=60)
+
+        assert stats["total"] == 1
+        assert tracker.get_stats()["total"] == 8
+
+    def test_cleanup_old_buckets_clears_expired_slots(self):
+        tracker = PipelineTracker(window_minutes=60)
+        base = 1_700_000_000
+
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base):
+            _reject(tracker, RejectionStage.TRADE_SIZE, 2)
+        with patch("polymarket_bot.core.pipeline_tracker.time.time", return_value=base + 1800):
+            removed = tracker.cleanup_old_buckets(max_age_minutes=10)
+            stats = tracker.get_stats(minutes=59)
+
+        assert removed == 1
+        assert stats["total"] == 0
+
+    def test_funnel_summary_uses_window(self):
+        tracker = PipelineTracker(sample_rate=1)
+        _reject(tracker, RejectionStage.DUPLICATE, 3)
+        _reject(tracker, RejectionStage.G1_TRADE_AGE, 1)
+
+        summary = tracker.get_funnel_summary(minutes=60)
+
+        assert summary["total_rejections"] == 4
+        assert len(summary["samples"]["duplicate"]) == 3
+        assert len(summary["samples"]["g1_trade_age"]) == 1
+
+
+class TestCandidateEviction:
+    """Tests for least-recently-updated candidate eviction."""
+
+    def _update(self, tracker: PipelineTracker, condition_id: str) -> None:
+        tracker.update_candidate(
+            token_id=f"tok_{condition_id}",
+            condition_id=condition_id,
+            question="Q?",
+            price=Decimal("0.93"),
+            threshold=Decimal("0.95"),
+            signal="HOLD",
+            signal_reason="test",
+        )
+
+    def test_evicts_least_recently_updated(self):
+        tracker = PipelineTracker(max_candidates=2)
+        self._update(tracker, "a")
+        self._update(tracker, "b")
+        self._update(tracker, "a")  # refresh a, b is now oldest
+        self._update(tracker, "c")
+
+        ids = {c.condition_id for c in tracker.get_candidates()}
+
+        assert ids == {"a", "c"}
+
+
+class TestStrategyStats:
+    """Tests for per-strategy counters."""
+
+    def test_counts_signals_and_rejections_per_strategy(self):
+        tracker = PipelineTracker(sample_rate=1)
+        tracker.record_signal("a", "entry")
+        tracker.record_signal("a", "hold")
+        tracker.record_signal("b", "hold")
+        tracker.record_rejection(
+            token_id="tok_abc",
+            condition_id="0x123",
+            stage=RejectionStage.STRATEGY_HOLD,
+            price=Decimal("0.96"),
+            strategy="b",
+        )
+        _reject(tracker, RejectionStage.THRESHOLD)
+
+        stats = tracker.get_strategy_stats()
+
+        assert stats["a"] == {
+            "evaluated": 2,
+            "signals": {"entry": 1, "hold": 1},
+            "rejections": {},
+            "total_rejections": 0,
+        }
+        assert stats["b"]["rejections"] == {"strategy_hold": 1}
+        assert tracker.get_stats()["total"] == 2
+        assert tracker.get_recent_rejections(limit=2)[1].to_dict()["strategy"] == "b"
+
+        tracker.reset()
+        assert tracker.get_strategy_stats() == {}
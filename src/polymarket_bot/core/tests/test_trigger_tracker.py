@@ -123,6 +123,38 @@ class TestDualKeyDeduplication:
         assert has_triggered is True
 
 
+class TestStrategyKeys:
+    """Tests for per-strategy dedup keys."""
+
+    @pytest.mark.asyncio
+    async def test_single_strategy_uses_point_lookups(self, mock_db):
+        mock_db.fetchval.side_effect = [None, None]
+
+        tracker = TriggerTracker(mock_db)
+
+        fresh = await tracker.untriggered_strategies(
+            "tok_abc", "0x123", [("a", Decimal("0.95"))]
+        )
+
+        assert fresh == ["a"]
+        assert mock_db.fetchval.call_args.args[-1] == "a"
+        mock_db.fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_several_strategies_take_one_query(self, mock_db):
+        mock_db.fetch.return_value = [{"strategy": "b"}]
+
+        tracker = TriggerTracker(mock_db)
+
+        fresh = await tracker.untriggered_strategies(
+            "tok_abc", "0x123", [("a", Decimal("0.95")), ("b", Decimal("0.97")), ("c", Decimal("0.9"))]
+        )
+
+        assert fresh == ["a", "c"]
+        mock_db.fetch.assert_called_once()
+        mock_db.fetchval.assert_not_called()
+
+
 class TestTriggerRecording:
     """Tests for recording triggers."""
 
@@ -7,18 +7,57 @@ tracks triggers and prevents duplicate trading on the same market.
 Critical Gotcha (G2):
     Multiple token_ids can map to the same market (condition_id).
     We MUST deduplicate by (token_id, condition_id, threshold), not just token_id.
+
+Each strategy the engine runs has its own dedup key (the strategy name), so
+strategies trade the same market independently. Callers that pass no
+strategy use the empty key.
 """
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
+from polymarket_bot.storage.statements import statements
+
 if TYPE_CHECKING:
     from polymarket_bot.storage import Database
 
+# Dedup statements run for every event that reaches the trigger check
+_INSERT_TRIGGER_SQL = """
+    INSERT INTO polymarket_first_triggers
+    (token_id, condition_id, threshold, trigger_timestamp, price, size,
+     model_score, created_at, outcome, outcome_index, strategy)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
+    ON CONFLICT (token_id, condition_id, threshold, strategy) DO NOTHING
+"""
+TOKEN_TRIGGERED = statements.register("trigger.token_triggered", """
+    SELECT 1 FROM polymarket_first_triggers
+    WHERE token_id = $1 AND condition_id = $2 AND threshold = $3 AND strategy = $4
+    LIMIT 1
+""")
+CONDITION_TRIGGERED = statements.register("trigger.condition_triggered", """
+    SELECT 1 FROM polymarket_first_triggers
+    WHERE condition_id = $1 AND threshold = $2 AND strategy = $3
+    LIMIT 1
+""")
+# One round trip for every strategy whose threshold an event crossed
+TRIGGERED_STRATEGIES = statements.register("trigger.triggered_strategies", """
+    SELECT DISTINCT t.strategy
+    FROM polymarket_first_triggers t
+    JOIN unnest($2::text[], $3::real[]) AS k(strategy, threshold)
+      ON t.strategy = k.strategy AND t.threshold = k.threshold
+    WHERE t.condition_id = $1
+""")
+RECORD_TRIGGER = statements.register("trigger.record", _INSERT_TRIGGER_SQL)
+CLAIM_TRIGGER = statements.register(
+    "trigger.claim", _INSERT_TRIGGER_SQL + "    RETURNING token_id\n"
+)
+CONDITION_LOCK = statements.register("trigger.condition_lock", "SELECT pg_advisory_xact_lock($1)")
+
 
 @dataclass
 class TriggerInfo:
@@ -31,6 +70,7 @@ class TriggerInfo:
     trade_size: Optional[Decimal]
     model_score: Optional[float]
     triggered_at: datetime
+    strategy: str = ""
 
 
 class TriggerTracker:
@@ -65,6 +105,7 @@ class TriggerTracker:
         token_id: str,
         condition_id: str,
         threshold: Decimal = Decimal("0.95"),
+        strategy: str = "",
     ) -> bool:
         """
         Check if this is the first trigger for this token/condition/threshold.
@@ -75,22 +116,21 @@ class TriggerTracker:
             token_id: The token that triggered
             condition_id: The market condition ID
             threshold: The price threshold
+            strategy: Strategy dedup key
 
         Returns:
             True if this is the first trigger, False if already triggered
         """
-        query = """
-            SELECT 1 FROM polymarket_first_triggers
-            WHERE token_id = $1 AND condition_id = $2 AND threshold = $3
-            LIMIT 1
-        """
-        result = await self._db.fetchval(query, token_id, condition_id, float(threshold))
+        result = await self._db.fetchval(
+            TOKEN_TRIGGERED, token_id, condition_id, float(threshold), strategy
+        )
         return result is None
 
     async def has_condition_triggered(
         self,
         condition_id: str,
         threshold: Decimal = Decimal("0.95"),
+        strategy: str = "",
     ) -> bool:
         """
         Check if ANY token for this condition has triggered.
@@ -101,16 +141,14 @@ class TriggerTracker:
         Args:
             condition_id: The market condition ID
             threshold: The price threshold
+            strategy: Strategy dedup key
 
         Returns:
             True if any token for this condition has triggered
         """
-        query = """
-            SELECT 1 FROM polymarket_first_triggers
-            WHERE condition_id = $1 AND threshold = $2
-            LIMIT 1
-        """
-        result = await self._db.fetchval(query, condition_id, float(threshold))
+        result = await self._db.fetchval(
+            CONDITION_TRIGGERED, condition_id, float(threshold), strategy
+        )
         return result is not None
 
     async def should_trigger(
@@ -118,6 +156,7 @@ class TriggerTracker:
         token_id: str,
         condition_id: str,
         threshold: Decimal = Decimal("0.95"),
+        strategy: str = "",
     ) -> bool:
         """
         Comprehensive check: Should we trigger for this token?
@@ -130,20 +169,57 @@ class TriggerTracker:
             token_id: The token that triggered
             condition_id: The market condition ID
             threshold: The price threshold
+            strategy: Strategy dedup key
 
         Returns:
             True if we should trigger, False otherwise
         """
         # Check if this token has triggered
-        if not await self.is_first_trigger(token_id, condition_id, threshold):
+        if not await self.is_first_trigger(token_id, condition_id, threshold, strategy):
             return False
 
         # G2: Check if any token for this condition has triggered
-        if await self.has_condition_triggered(condition_id, threshold):
+        if await self.has_condition_triggered(condition_id, threshold, strategy):
             return False
 
         return True
 
+    async def untriggered_strategies(
+        self,
+        token_id: str,
+        condition_id: str,
+        keys: Sequence[tuple[str, Decimal]],
+    ) -> list[str]:
+        """
+        should_trigger() for several strategies at once.
+
+        A single key takes the should_trigger() path. Several keys are
+        checked in one query at condition level, which covers the token
+        check too (a token row carries its condition_id).
+
+        Args:
+            token_id: The token that triggered
+            condition_id: The market condition ID
+            keys: (strategy, threshold) pairs to check
+
+        Returns:
+            Strategies from keys that should trigger, in keys order
+        """
+        if len(keys) == 1:
+            strategy, threshold = keys[0]
+            if await self.should_trigger(token_id, condition_id, threshold, strategy):
+                return [strategy]
+            return []
+
+        records = await self._db.fetch(
+            TRIGGERED_STRATEGIES,
+            condition_id,
+            [strategy for strategy, _ in keys],
+            [float(threshold) for _, threshold in keys],
+        )
+        triggered = {r["strategy"] for r in records}
+        return [strategy for strategy, _ in keys if strategy not in triggered]
+
     async def record_trigger(
         self,
         token_id: str,
@@ -154,6 +230,7 @@ class TriggerTracker:
         model_score: Optional[float] = None,
         outcome: Optional[str] = None,
         outcome_index: Optional[int] = None,
+        strategy: str = "",
     ) -> None:
         """
         Record a new trigger.
@@ -167,19 +244,13 @@ class TriggerTracker:
             model_score: Model score at trigger time
             outcome: The outcome (Yes/No)
             outcome_index: The outcome index (0/1)
+            strategy: Strategy dedup key
         """
         now = datetime.now(timezone.utc)
         timestamp = int(now.timestamp() * 1000)
 
-        query = """
-            INSERT INTO polymarket_first_triggers
-            (token_id, condition_id, threshold, trigger_timestamp, price, size,
-             model_score, created_at, outcome, outcome_index)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            ON CONFLICT (token_id, condition_id, threshold) DO NOTHING
-        """
         await self._db.execute(
-            query,
+            RECORD_TRIGGER,
             token_id,
             condition_id,
             float(threshold),
@@ -190,6 +261,7 @@ class TriggerTracker:
             now.isoformat(),
             outcome,
             outcome_index,
+            strategy,
         )
 
     async def try_record_trigger_atomic(
@@ -202,6 +274,7 @@ class TriggerTracker:
         model_score: Optional[float] = None,
         outcome: Optional[str] = None,
         outcome_index: Optional[int] = None,
+        strategy: str = "",
     ) -> bool:
         """
         Atomically check and record a trigger.
@@ -225,6 +298,7 @@ class TriggerTracker:
             model_score: Model score at trigger time
             outcome: The outcome (Yes/No)
             outcome_index: The outcome index (0/1)
+            strategy: Strategy dedup key
 
         Returns:
             True if this was the FIRST trigger (inserted successfully),
@@ -245,37 +319,32 @@ class TriggerTracker:
             # FIX: Use stable SHA256 hash instead of Python's randomized hash()
             # This ensures consistent locking across processes
             lock_input = f"{condition_id}:{float(threshold)}".encode()
+            if strategy:
+                # Strategies claim the same market independently
+                lock_input += f":{strategy}".encode()
             lock_hash = hashlib.sha256(lock_input).digest()
             # Use first 8 bytes as two 32-bit ints for pg_advisory_xact_lock(bigint)
             lock_key = int.from_bytes(lock_hash[:8], 'big', signed=True)
-            await conn.execute("SELECT pg_advisory_xact_lock($1)", lock_key)
+            await statements.run(conn, "execute", CONDITION_LOCK, lock_key)
 
             # Now check if ANY token for this condition has triggered (G2)
-            condition_check_query = """
-                SELECT 1 FROM polymarket_first_triggers
-                WHERE condition_id = $1 AND threshold = $2
-                LIMIT 1
-            """
-            existing = await conn.fetchval(
-                condition_check_query,
+            existing = await statements.run(
+                conn,
+                "fetchval",
+                CONDITION_TRIGGERED,
                 condition_id,
                 float(threshold),
+                strategy,
             )
             if existing is not None:
                 # Another token for this condition already triggered
                 return False
 
             # Now insert atomically - we hold the lock so no race possible
-            insert_query = """
-                INSERT INTO polymarket_first_triggers
-                (token_id, condition_id, threshold, trigger_timestamp, price, size,
-                 model_score, created_at, outcome, outcome_index)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                ON CONFLICT (token_id, condition_id, threshold) DO NOTHING
-                RETURNING token_id
-            """
-            result = await conn.fetchval(
-                insert_query,
+            result = await statements.run(
+                conn,
+                "fetchval",
+                CLAIM_TRIGGER,
                 token_id,
                 condition_id,
                 float(threshold),
@@ -286,6 +355,7 @@ class TriggerTracker:
                 now.isoformat(),
                 outcome,
                 outcome_index,
+                strategy,
             )
 
             # If RETURNING returned a value, the insert succeeded
@@ -297,6 +367,7 @@ class TriggerTracker:
         token_id: str,
         condition_id: str,
         threshold: Decimal = Decimal("0.95"),
+        strategy: str = "",
     ) -> bool:
         """
         Remove a trigger record.
@@ -307,16 +378,19 @@ class TriggerTracker:
             token_id: The token ID
             condition_id: The condition ID
             threshold: The price threshold
+            strategy: Strategy dedup key
 
         Returns:
             True if a trigger was removed, False if not found
         """
         query = """
             DELETE FROM polymarket_first_triggers
-            WHERE token_id = $1 AND condition_id = $2 AND threshold = $3
+            WHERE token_id = $1 AND condition_id = $2 AND threshold = $3 AND strategy = $4
             RETURNING token_id
         """
-        result = await self._db.fetchval(query, token_id, condition_id, float(threshold))
+        result = await self._db.fetchval(
+            query, token_id, condition_id, float(threshold), strategy
+        )
         return result is not None
 
     async def get_trigger(
@@ -324,6 +398,7 @@ class TriggerTracker:
         token_id: str,
         condition_id: str,
         threshold: Decimal = Decimal("0.95"),
+        strategy: str = "",
     ) -> Optional[TriggerInfo]:
         """
         Get information about a recorded trigger.
@@ -332,16 +407,19 @@ class TriggerTracker:
             token_id: The token ID
             condition_id: The condition ID
             threshold: The price threshold
+            strategy: Strategy dedup key
 
         Returns:
             TriggerInfo if found, None otherwise
         """
         query = """
-            SELECT token_id, condition_id, threshold, price, size, model_score, created_at
+            SELECT token_id, condition_id, threshold, price, size, model_score, created_at, strategy
             FROM polymarket_first_triggers
-            WHERE token_id = $1 AND condition_id = $2 AND threshold = $3
+            WHERE token_id = $1 AND condition_id = $2 AND threshold = $3 AND strategy = $4
         """
-        record = await self._db.fetchrow(query, token_id, condition_id, float(threshold))
+        record = await self._db.fetchrow(
+            query, token_id, condition_id, float(threshold), strategy
+        )
 
         if not record:
             return None
@@ -354,6 +432,7 @@ class TriggerTracker:
             trade_size=Decimal(str(record["size"])) if record["size"] else None,
             model_score=record["model_score"],
             triggered_at=datetime.fromisoformat(record["created_at"]),
+            strategy=record.get("strategy") or "",
         )
 
     async def get_triggers_for_condition(
@@ -370,7 +449,7 @@ class TriggerTracker:
             List of triggers for this condition
         """
         query = """
-            SELECT token_id, condition_id, threshold, price, size, model_score, created_at
+            SELECT token_id, condition_id, threshold, price, size, model_score, created_at, strategy
             FROM polymarket_first_triggers
             WHERE condition_id = $1
             ORDER BY created_at DESC
@@ -386,6 +465,7 @@ class TriggerTracker:
                 trade_size=Decimal(str(r["size"])) if r["size"] else None,
                 model_score=r["model_score"],
                 triggered_at=datetime.fromisoformat(r["created_at"]),
+                strategy=r.get("strategy") or "",
             )
             for r in records
         ]
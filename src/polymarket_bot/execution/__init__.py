@@ -16,6 +16,7 @@ This module provides:
     - ExitConfig: Configuration for exit strategies
     - BalanceManager: USDC balance tracking with cache refresh (G4 fix)
     - BalanceConfig: Configuration for balance management
+    - WriteJournal: Write-behind journal for order/position persistence
     - Exceptions: PriceTooHighError, InsufficientBalanceError
 
 Critical Gotchas Handled:
@@ -76,6 +77,9 @@ from .exit_manager import (
     ExitConfig,
 )
 
+# Write-behind persistence
+from .journal import JournalClosedError, WriteJournal
+
 __all__ = [
     # Execution service (main facade)
     "ExecutionService",
@@ -100,4 +104,7 @@ __all__ = [
     # Exit strategies
     "ExitManager",
     "ExitConfig",
+    # Write-behind persistence
+    "JournalClosedError",
+    "WriteJournal",
 ]
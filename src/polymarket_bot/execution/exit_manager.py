@@ -469,8 +469,11 @@ class ExitManager:
                 # Check if claiming is stale (stuck for > 60 seconds)
                 claiming_timeout_seconds = 60.0
                 if stale_after_seconds:
-                    # Fetch position updated_at from DB to check staleness
+                    # Fetch position updated_at from DB to check staleness;
+                    # journaled writes must land first or it reads old
                     try:
+                        if not await self._position_tracker.flush_journal():
+                            raise RuntimeError("journal not caught up")
                         result = await self._db.fetchrow(
                             "SELECT updated_at FROM positions WHERE token_id = $1 AND status = 'open'",
                             position.token_id,
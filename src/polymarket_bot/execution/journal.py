@@ -0,0 +1,385 @@
+"""
+Write-behind journal for execution state.
+
+OrderManager and PositionTracker keep their in-memory state authoritative
+and, with a journal, no longer wait on Postgres for each state change:
+
+    journal.append((UPSERT_ORDER, args))    # fsync'd to the local file
+    ...                                     # background writer, batched:
+    BEGIN; <records>; <checkpoint seq>; COMMIT
+
+A record is one or more registered statements (storage.statements) with
+their arguments, applied in one transaction. The writer applies records
+in order, in batches, and stores the last applied sequence number in
+write_journal_checkpoints in the same transaction. On start the file is
+replayed from that checkpoint, so records committed before a crash are
+not applied twice; load_orders/load_positions then read a database that
+includes the journal tail. The file is truncated whenever the writer has
+caught up.
+
+Postgres being slow or down delays the writer, not the order path; the
+writer retries with backoff. A record Postgres rejects for its content
+(data exceptions and constraint violations) is moved to <path>.failed and
+skipped so it cannot block the records behind it. Schema and permission
+errors (a missed migration, a revoked grant) are not the record's fault;
+they are retried like an outage until fixed.
+
+Readers that need the database to reflect every state change (an atomic
+UPDATE ... WHERE on the same rows) await flush() first, bounded by
+FLUSH_TIMEOUT_SECONDS: a writer stuck on Postgres fails the read instead
+of hanging it.
+
+append() needs a started journal and raises JournalClosedError otherwise.
+write() is what the execution managers call: once the journal has been
+stopped with everything applied, it writes straight to Postgres, so a
+state change that races shutdown is still persisted, in order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from collections import deque
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import asyncpg
+
+from polymarket_bot.storage.statements import Statement, statements
+from polymarket_bot.telemetry import registry
+
+if TYPE_CHECKING:
+    from polymarket_bot.storage import Database
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_PENDING = registry.gauge(
+    "polymarket_write_journal_pending", "Journal records not yet applied to Postgres"
+)
+JOURNAL_BATCH_SECONDS = registry.histogram(
+    "polymarket_write_journal_batch_seconds", "Journal batch apply time"
+)
+JOURNAL_QUARANTINED = registry.counter(
+    "polymarket_write_journal_quarantined_total", "Journal records Postgres rejected"
+)
+
+READ_CHECKPOINT = statements.register(
+    "journal.checkpoint.read",
+    """
+    SELECT applied_seq FROM write_journal_checkpoints WHERE journal = $1
+""",
+)
+WRITE_CHECKPOINT = statements.register(
+    "journal.checkpoint.write",
+    """
+    INSERT INTO write_journal_checkpoints (journal, applied_seq, updated_at)
+    VALUES ($1, $2, NOW())
+    ON CONFLICT (journal) DO UPDATE
+    SET applied_seq = $2, updated_at = NOW()
+""",
+)
+
+# How long readers wait for flush() before giving up
+FLUSH_TIMEOUT_SECONDS = 10.0
+
+# SQLSTATE classes that mean the record itself is bad: data exception and
+# integrity constraint violation. Class 42 (undefined table/column,
+# insufficient privilege) is a deployment problem and is retried instead.
+_REJECTED_CLASSES = ("22", "23")
+
+Op = tuple[Statement, tuple]
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"$date": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    return value
+
+
+def _decode(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "$dt" in value:
+            return datetime.fromisoformat(value["$dt"])
+        if "$date" in value:
+            return date.fromisoformat(value["$date"])
+        if "$dec" in value:
+            return Decimal(value["$dec"])
+    return value
+
+
+class JournalClosedError(RuntimeError):
+    """Raised when a record is appended to a journal that is not running."""
+
+
+def _rejected(error: Exception) -> bool:
+    sqlstate = getattr(error, "sqlstate", None) or ""
+    return isinstance(error, asyncpg.PostgresError) and sqlstate[:2] in _REJECTED_CLASSES
+
+
+class WriteJournal:
+    """
+    Durable write-behind queue in front of Postgres.
+
+    Usage:
+        journal = WriteJournal("data/execution.journal", db)
+        await journal.start()          # replays the previous run's tail
+        seq = journal.append((UPSERT_ORDER, args))
+        await journal.flush()          # wait until applied
+        await journal.stop()
+    """
+
+    def __init__(
+        self,
+        path: str,
+        db: Database,
+        name: str = "execution",
+        batch_size: int = 200,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 30.0,
+    ) -> None:
+        """
+        Initialize the journal.
+
+        Args:
+            path: Journal file (created if missing)
+            db: Database the records are applied to
+            name: Checkpoint key; one per journal file
+            batch_size: Most records per transaction
+            retry_delay: First backoff after a failed batch
+            max_retry_delay: Backoff ceiling
+        """
+        self._path = Path(path)
+        self._db = db
+        self._name = name
+        self._batch_size = batch_size
+        self._retry_delay = retry_delay
+        self._max_retry_delay = max_retry_delay
+
+        self._file = None
+        self._pending: deque[tuple[int, list[Op]]] = deque()
+        self._seq = 0
+        self._applied_seq = 0
+        self._wake = asyncio.Event()
+        self._applied = asyncio.Condition()
+        self._task: asyncio.Task | None = None
+        self._stopped = False
+        self.stats = {"appended": 0, "applied": 0, "batches": 0, "retries": 0, "quarantined": 0}
+
+    @property
+    def pending(self) -> int:
+        """Records appended but not yet applied."""
+        return len(self._pending)
+
+    @property
+    def is_open(self) -> bool:
+        """Whether append() accepts records (between start and stop)."""
+        return self._file is not None
+
+    async def start(self) -> None:
+        """Replay the previous run's unapplied records, then start the writer."""
+        if self._task is not None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._applied_seq = await self._db.fetchval(READ_CHECKPOINT, self._name) or 0
+        self._seq = self._applied_seq
+        replayed = self._read_tail()
+        if replayed:
+            logger.info(f"Journal: replaying {len(replayed)} records from {self._path}")
+            self._pending.extend(replayed)
+            self._seq = max(self._seq, replayed[-1][0])
+            await self._drain()
+
+        self._file = open(self._path, "w", encoding="utf-8")
+        self._fsync()
+        self._task = asyncio.create_task(self._writer())
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Apply what is pending (up to timeout) and stop the writer."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Journal: {self.pending} records left in {self._path} (applied on next start)"
+            )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._file.close()
+        self._file = None
+        self._stopped = True
+
+    def append(self, *ops: Op) -> int:
+        """
+        Durably record one state change: written and fsync'd before return.
+
+        The ops are applied together, in one transaction.
+
+        Returns:
+            The record's sequence number
+
+        Raises:
+            JournalClosedError: The journal is not started, or stopped
+        """
+        if self._file is None:
+            raise JournalClosedError(
+                f"Journal {self._name} is {'stopped' if self._stopped else 'not started'}"
+            )
+        self._seq += 1
+        record = {
+            "seq": self._seq,
+            "ops": [[stmt.name, [_encode(a) for a in args]] for stmt, args in ops],
+        }
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._fsync()
+        self._pending.append((self._seq, list(ops)))
+        self.stats["appended"] += 1
+        JOURNAL_PENDING.set(len(self._pending))
+        self._wake.set()
+        return self._seq
+
+    async def write(self, *ops: Op) -> None:
+        """
+        append(), or after stop() with every record applied, the same ops
+        directly in one transaction.
+
+        Raises:
+            JournalClosedError: Not started yet, or stopped with records
+                left in the file (a direct write would be overwritten
+                when they are replayed)
+        """
+        if self._file is not None or not self._stopped or self._pending:
+            self.append(*ops)
+            return
+        logger.warning(f"Journal {self._name} is stopped; writing to Postgres directly")
+        async with self._db.transaction() as conn:
+            for stmt, args in ops:
+                await statements.run(conn, "execute", stmt, *args)
+
+    async def flush(self) -> None:
+        """Wait until every record appended so far is in Postgres."""
+        target = self._seq
+        async with self._applied:
+            await self._applied.wait_for(lambda: self._applied_seq >= target)
+
+    def _fsync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def _read_tail(self) -> list[tuple[int, list[Op]]]:
+        """Records in the file past the checkpoint. A torn last line is ignored."""
+        if not self._path.exists():
+            return []
+        records = []
+        with open(self._path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Journal: skipping unreadable line {line_no} in {self._path}")
+                    continue
+                if record["seq"] <= self._applied_seq:
+                    continue
+                ops = []
+                for name, args in record["ops"]:
+                    stmt = statements.get(name)
+                    if stmt is None:
+                        raise RuntimeError(
+                            f"Journal record {record['seq']}: unknown statement {name}"
+                        )
+                    ops.append((stmt, tuple(_decode(a) for a in args)))
+                records.append((record["seq"], ops))
+        return records
+
+    async def _writer(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            await self._drain()
+
+    async def _drain(self) -> None:
+        """Apply pending records until none are left, backing off on errors."""
+        delay = self._retry_delay
+        while self._pending:
+            batch = [self._pending[i] for i in range(min(self._batch_size, len(self._pending)))]
+            started = asyncio.get_running_loop().time()
+            try:
+                try:
+                    await self._apply(batch)
+                except Exception as e:
+                    if not _rejected(e):
+                        raise
+                    await self._apply_each(batch)
+                else:
+                    JOURNAL_BATCH_SECONDS.observe(asyncio.get_running_loop().time() - started)
+                    self.stats["batches"] += 1
+                    await self._mark_applied(len(batch), batch[-1][0])
+            except Exception as e:
+                self.stats["retries"] += 1
+                logger.warning(f"Journal: batch failed ({e}), retrying in {delay:.0f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_retry_delay)
+                continue
+            delay = self._retry_delay
+
+    async def _apply(self, batch: list[tuple[int, list[Op]]]) -> None:
+        async with self._db.transaction() as conn:
+            for _, ops in batch:
+                for stmt, args in ops:
+                    await statements.run(conn, "execute", stmt, *args)
+            await statements.run(conn, "execute", WRITE_CHECKPOINT, self._name, batch[-1][0])
+
+    async def _apply_each(self, batch: list[tuple[int, list[Op]]]) -> None:
+        """Apply a batch record by record, quarantining the ones Postgres rejects."""
+        for record in batch:
+            try:
+                await self._apply([record])
+            except Exception as e:
+                if not _rejected(e):
+                    raise
+                self._quarantine(record, e)
+                async with self._db.transaction() as conn:
+                    await statements.run(conn, "execute", WRITE_CHECKPOINT, self._name, record[0])
+            await self._mark_applied(1, record[0])
+
+    def _quarantine(self, record: tuple[int, list[Op]], error: Exception) -> None:
+        seq, ops = record
+        logger.error(f"Journal: record {seq} rejected by Postgres ({error}); moved to .failed")
+        with open(f"{self._path}.failed", "a", encoding="utf-8") as f:
+            f.write(
+                json.dumps(
+                    {
+                        "seq": seq,
+                        "error": str(error),
+                        "ops": [[stmt.name, [_encode(a) for a in args]] for stmt, args in ops],
+                    }
+                )
+                + "\n"
+            )
+        self.stats["quarantined"] += 1
+        JOURNAL_QUARANTINED.inc()
+
+    async def _mark_applied(self, count: int, seq: int) -> None:
+        for _ in range(count):
+            self._pending.popleft()
+        self.stats["applied"] += count
+        JOURNAL_PENDING.set(len(self._pending))
+        # Caught up: everything in the file is in Postgres
+        if not self._pending and self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        async with self._applied:
+            self._applied_seq = seq
+            self._applied.notify_all()
@@ -14,6 +14,9 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from polymarket_bot.storage.statements import statements
+from polymarket_bot.tracing import Stage, stamp
+
 from .balance_manager import (
     BalanceManager,
     InsufficientBalanceError,
@@ -23,8 +26,23 @@ from .balance_manager import (
 if TYPE_CHECKING:
     from polymarket_bot.storage import Database
 
+    from .journal import WriteJournal
+
 logger = logging.getLogger(__name__)
 
+# Written on submit and on every status sync
+UPSERT_ORDER = statements.register("orders.upsert", """
+    INSERT INTO orders
+    (order_id, token_id, condition_id, side, price, size, filled_size,
+     avg_fill_price, status, created_at, updated_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $10)
+    ON CONFLICT (order_id) DO UPDATE
+    SET filled_size = $7,
+        avg_fill_price = $8,
+        status = $9,
+        updated_at = $10
+""")
+
 
 class PriceTooHighError(PreSubmitValidationError):
     """Raised when order price exceeds maximum allowed."""
@@ -107,6 +125,7 @@ class OrderManager:
         clob_client: Optional[Any] = None,
         config: Optional[OrderConfig] = None,
         balance_manager: Optional[BalanceManager] = None,
+        journal: WriteJournal | None = None,
     ) -> None:
         """
         Initialize the order manager.
@@ -116,8 +135,10 @@ class OrderManager:
             clob_client: Polymarket CLOB client
             config: Order configuration
             balance_manager: Balance manager for reservations
+            journal: Write-behind journal for order writes (None writes through)
         """
         self._db = db
+        self._journal = journal
         self._clob_client = clob_client
         self._config = config or OrderConfig()
         self._balance_manager = balance_manager or BalanceManager(db, clob_client)
@@ -169,10 +190,12 @@ class OrderManager:
         temp_order_id = f"pending_{token_id}_{datetime.now(timezone.utc).timestamp()}"
         if side == "BUY":
             self._balance_manager.reserve(order_cost, temp_order_id)
+        stamp(Stage.BALANCE_CHECK)
 
         try:
             # Submit to CLOB
             order_id = await self._submit_to_clob(token_id, side, price, size)
+            stamp(Stage.SUBMIT)
 
             # CRITICAL FIX: Reject empty order IDs
             if not order_id or not str(order_id).strip():
@@ -360,6 +383,81 @@ class OrderManager:
             logger.error(f"Failed to cancel order {order_id}: {e}")
             return False
 
+    async def cancel_orders(self, order_ids: list[str]) -> list[str]:
+        """
+        Cancel several orders in one CLOB request.
+
+        Uses the client's batch cancel (py-clob-client cancel_orders) when
+        it has one; otherwise cancels the orders one by one.
+
+        Args:
+            order_ids: Orders to cancel
+
+        Returns:
+            IDs of the orders that were cancelled
+        """
+        if not self._clob_client or not order_ids:
+            return []
+
+        cancel_batch = getattr(self._clob_client, "cancel_orders", None)
+        if cancel_batch is None:
+            return [oid for oid in order_ids if await self.cancel_order(oid)]
+
+        try:
+            if inspect.iscoroutinefunction(cancel_batch):
+                result = await cancel_batch(order_ids)
+            else:
+                result = await asyncio.to_thread(cancel_batch, order_ids)
+        except Exception as e:
+            logger.error(f"Failed to cancel {len(order_ids)} orders: {e}")
+            return []
+
+        # CLOB response: {"canceled": [...], "not_canceled": {id: reason}}
+        if not (isinstance(result, dict) and "canceled" in result):
+            # Outcome unknown: keep the orders tracked and ask the CLOB
+            logger.error(
+                f"Unrecognized batch cancel response for {len(order_ids)} orders, "
+                f"re-querying: {result!r}"
+            )
+            return await self._requery_cancelled(order_ids)
+
+        accepted = set(result.get("canceled") or [])
+        cancelled = [oid for oid in order_ids if oid in accepted]
+        for oid, reason in (result.get("not_canceled") or {}).items():
+            logger.warning(f"CLOB did not cancel order {oid}: {reason}")
+
+        now = datetime.now(timezone.utc)
+        for order_id in cancelled:
+            order = self._orders.get(order_id)
+            if order is not None:
+                order.status = OrderStatus.CANCELLED
+                order.updated_at = now
+                await self._save_order(order)
+            self._balance_manager.release_reservation(order_id)
+
+        logger.info(f"Cancelled {len(cancelled)}/{len(order_ids)} orders")
+        return cancelled
+
+    async def _requery_cancelled(self, order_ids: list[str]) -> list[str]:
+        """
+        Sync orders whose cancel outcome is unknown.
+
+        Args:
+            order_ids: Orders to re-query
+
+        Returns:
+            IDs of the orders the CLOB reports as cancelled
+        """
+        cancelled = []
+        for order_id in order_ids:
+            try:
+                order = await self.sync_order_status(order_id)
+            except Exception:
+                continue  # Logged by sync_order_status; order stays tracked
+            if order is not None and order.status == OrderStatus.CANCELLED:
+                cancelled.append(order_id)
+        return cancelled
+
     def get_order(self, order_id: str) -> Optional[Order]:
         """
         Get an order by ID.
@@ -455,22 +553,10 @@ class OrderManager:
             raise
 
     async def _save_order(self, order: Order) -> None:
-        """Persist order to database."""
+        """Persist order to database (through the journal when there is one)."""
         now = int(datetime.now(timezone.utc).timestamp())
 
-        query = """
-            INSERT INTO orders
-            (order_id, token_id, condition_id, side, price, size, filled_size,
-             avg_fill_price, status, created_at, updated_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $10)
-            ON CONFLICT (order_id) DO UPDATE
-            SET filled_size = $7,
-                avg_fill_price = $8,
-                status = $9,
-                updated_at = $10
-        """
-        await self._db.execute(
-            query,
+        args = (
             order.order_id,
             order.token_id,
             order.condition_id,
@@ -482,6 +568,10 @@ class OrderManager:
             order.status.value,
             now,
         )
+        if self._journal is not None:
+            await self._journal.write((UPSERT_ORDER, args))
+        else:
+            await self._db.execute(UPSERT_ORDER, *args)
 
     async def load_orders(self) -> int:
         """
@@ -5,6 +5,7 @@ Tracks positions created from filled orders and calculates P&L.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import uuid
 from dataclasses import dataclass, field
@@ -12,15 +13,40 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Dict, List, Optional
 
+from polymarket_bot.storage.statements import statements
+
+from .journal import FLUSH_TIMEOUT_SECONDS
 from .order_manager import Order, OrderStatus
 
 if TYPE_CHECKING:
     from polymarket_bot.storage import Database
 
+    from .journal import WriteJournal
+
 logger = logging.getLogger(__name__)
 
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
+# Written on every fill and exit state change
+UPSERT_POSITION = statements.register("positions.upsert", """
+    INSERT INTO positions
+    (token_id, condition_id, size, entry_price, entry_cost,
+     entry_timestamp, realized_pnl, status, exit_order_id, exit_pending,
+     exit_status, exit_timestamp, created_at, updated_at, import_source, age_source, hold_start_at)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
+    ON CONFLICT (token_id, entry_timestamp) DO UPDATE
+    SET size = $3,
+        entry_price = $4,
+        entry_cost = $5,
+        realized_pnl = $7,
+        status = $8,
+        exit_order_id = $9,
+        exit_pending = $10,
+        exit_status = $11,
+        exit_timestamp = COALESCE($12, positions.exit_timestamp),
+        updated_at = $14
+""")
+
 
 def _format_timestamp(value: datetime) -> str:
     """Format timestamps consistently for storage."""
@@ -114,14 +140,17 @@ class PositionTracker:
         await tracker.close_position(position_id, exit_price, "profit_target")
     """
 
-    def __init__(self, db: "Database") -> None:
+    def __init__(self, db: Database, journal: WriteJournal | None = None) -> None:
         """
         Initialize the position tracker.
 
         Args:
             db: Database connection
+            journal: Write-behind journal for position and exit writes
+                (None writes through)
         """
         self._db = db
+        self._journal = journal
 
         # Position cache by position_id
         self.positions: Dict[str, Position] = {}
@@ -575,26 +604,7 @@ class PositionTracker:
         age_source = position.age_source if position.age_source != "unknown" else "bot_created"
         hold_start_str = _format_timestamp(position.hold_start_at) if position.hold_start_at else entry_timestamp
 
-        query = """
-            INSERT INTO positions
-            (token_id, condition_id, size, entry_price, entry_cost,
-             entry_timestamp, realized_pnl, status, exit_order_id, exit_pending,
-             exit_status, exit_timestamp, created_at, updated_at, import_source, age_source, hold_start_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
-            ON CONFLICT (token_id, entry_timestamp) DO UPDATE
-            SET size = $3,
-                entry_price = $4,
-                entry_cost = $5,
-                realized_pnl = $7,
-                status = $8,
-                exit_order_id = $9,
-                exit_pending = $10,
-                exit_status = $11,
-                exit_timestamp = COALESCE($12, positions.exit_timestamp),
-                updated_at = $14
-        """
-        await self._db.execute(
-            query,
+        args = (
             position.token_id,
             position.condition_id,
             float(position.size),
@@ -613,6 +623,10 @@ class PositionTracker:
             age_source,
             hold_start_str,
         )
+        if self._journal is not None:
+            await self._journal.write((UPSERT_POSITION, args))
+        else:
+            await self._db.execute(UPSERT_POSITION, *args)
 
     async def mark_exit_pending(self, position_id: str, exit_order_id: str) -> bool:
         """Mark a position as having a pending exit order."""
@@ -683,6 +697,11 @@ class PositionTracker:
         if position.exit_pending:
             return False
 
+        # The UPDATE below must see this position's journaled writes; if
+        # they cannot be applied in time, the claim fails
+        if not await self.flush_journal():
+            return False
+
         # Atomic update: only succeeds if exit_pending is currently FALSE (or NULL)
         # This prevents TOCTOU race conditions at the database level
         # Uses COALESCE to handle NULL exit_pending values from legacy data
@@ -711,17 +730,41 @@ class PositionTracker:
             logger.debug(f"Exit claim failed for {position_id} - already claimed or invalid state")
             return False
 
+    async def flush_journal(self) -> bool:
+        """
+        Wait until journaled writes are in Postgres, for callers that read
+        or update positions there directly.
+
+        Returns:
+            True when the database is current (always, without a journal);
+            False if the journal did not catch up within FLUSH_TIMEOUT_SECONDS
+        """
+        if self._journal is None:
+            return True
+        try:
+            await asyncio.wait_for(self._journal.flush(), FLUSH_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Journal: {self._journal.pending} records not applied after "
+                f"{FLUSH_TIMEOUT_SECONDS:.0f}s; positions table is behind"
+            )
+            return False
+        return True
+
     async def _save_exit_event(self, event: ExitEvent) -> None:
-        """Persist exit event to database."""
-        query = """
-            INSERT INTO exit_events
-            (position_id, token_id, condition_id, exit_type, entry_price,
-             exit_price, size, gross_pnl, net_pnl, hours_held,
-             exit_order_id, status, reason, created_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
         """
-        await self._db.execute(
-            query,
+        Persist exit event and its performance rollups to database (through
+        the journal when there is one).
+
+        One statement writes both, so the rollups cannot drift from
+        exit_events and a retried save cannot count the exit twice.
+        """
+        from polymarket_bot.storage.repositories.position_repo import (
+            INSERT_EXIT_EVENT,
+            PerformanceRollupRepository,
+        )
+
+        args = (
             event.position_id,
             event.token_id,
             event.condition_id,
@@ -736,4 +779,9 @@ class PositionTracker:
             event.status,
             event.reason,
             _format_timestamp(event.created_at),
+            *PerformanceRollupRepository.period_args(event.created_at),
         )
+        if self._journal is not None:
+            await self._journal.write((INSERT_EXIT_EVENT, args))
+        else:
+            await self._db.execute(INSERT_EXIT_EVENT, *args)
@@ -9,12 +9,18 @@ The engine should not call individual managers directly.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from polymarket_bot.tracing import Stage, stamp
+
 from .balance_manager import (
     BalanceConfig,
     BalanceManager,
@@ -22,6 +28,7 @@ from .balance_manager import (
     PreSubmitValidationError,
 )
 from .exit_manager import ExitConfig, ExitManager
+from .journal import WriteJournal
 from .order_manager import Order, OrderConfig, OrderManager, OrderStatus, PriceTooHighError
 from .position_sync import PositionSyncService
 from .position_tracker import ExitEvent, Position, PositionTracker
@@ -33,6 +40,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _tracked(method):
+    """Count a call as in flight; close() waits for it before stopping the journal."""
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        self._inflight += 1
+        self._idle.clear()
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            self._inflight -= 1
+            if not self._inflight:
+                self._idle.set()
+    return wrapper
+
+
 @dataclass
 class ExecutionConfig:
     """Configuration for the execution service."""
@@ -66,6 +88,10 @@ class ExecutionConfig:
     stale_order_min_age_hours: float = 1.0  # Don't cancel orders younger than 1 hour
     verify_entry_liquidity: bool = True  # G14: Check liquidity before placing orders
     entry_max_spread: Decimal = Decimal("0.30")  # Max 30% spread for new orders
+    stale_scan_concurrency: int = 8  # Orderbook fetches in flight per stale-order pass
+
+    # Write-behind journal for order/position persistence (None = write through)
+    journal_path: str | None = None
 
     @property
     def order_config(self) -> OrderConfig:
@@ -150,6 +176,14 @@ class ExecutionService:
         self._clob_client = clob_client
         self._config = config or ExecutionConfig()
         self._event_sink: Optional[Any] = None
+        # Calls that may still write state (see _tracked)
+        self._inflight = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._journal: WriteJournal | None = (
+            WriteJournal(self._config.journal_path, db)
+            if self._config.journal_path else None
+        )
 
         # Initialize managers
         self._balance_manager = BalanceManager(
@@ -162,8 +196,9 @@ class ExecutionService:
             clob_client=clob_client,
             config=self._config.order_config,
             balance_manager=self._balance_manager,
+            journal=self._journal,
         )
-        self._position_tracker = PositionTracker(db=db)
+        self._position_tracker = PositionTracker(db=db, journal=self._journal)
         self._exit_manager = ExitManager(
             db=db,
             clob_client=clob_client,
@@ -206,6 +241,26 @@ class ExecutionService:
         """Access to order manager for queries."""
         return self._order_manager
 
+    @property
+    def journal(self) -> WriteJournal | None:
+        """Write-behind journal, if configured."""
+        return self._journal
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Wait for executions in flight (up to timeout), then apply pending
+        journal records and stop the journal writer.
+        """
+        if self._inflight:
+            try:
+                await asyncio.wait_for(self._idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Execution: {self._inflight} operations still running at close"
+                )
+        if self._journal:
+            await self._journal.stop()
+
     async def load_state(self) -> None:
         """
         Load state from database on startup.
@@ -214,7 +269,13 @@ class ExecutionService:
         - Open positions (reconciled with Polymarket if wallet_address configured)
         - Open orders (with balance reservations)
         - Balance cache
+
+        With a journal, the previous run's unapplied records are replayed
+        first so the loads see every persisted state change.
         """
+        if self._journal:
+            await self._journal.start()
+
         # Refresh balance from CLOB first (before loading orders that reserve balance)
         self._balance_manager.refresh_balance()
 
@@ -279,6 +340,10 @@ class ExecutionService:
         logger.info(f"Startup position sync: reconciling with Polymarket...")
 
         try:
+            # Sync writes positions directly; journaled writes go first
+            if not await self._position_tracker.flush_journal():
+                logger.warning("Startup position sync skipped: journal not caught up")
+                return
             result = await self._position_sync.sync_positions(
                 wallet_address=wallet_address,
                 dry_run=False,
@@ -319,6 +384,7 @@ class ExecutionService:
                 "Run manual sync or wait for background reconciliation."
             )
 
+    @_tracked
     async def sync_position_sizes(self) -> int:
         """
         Sync position sizes from Polymarket API.
@@ -336,6 +402,9 @@ class ExecutionService:
             return 0
 
         logger.info(f"sync_position_sizes: syncing for {wallet_address[:10]}...")
+        if not await self._position_tracker.flush_journal():
+            logger.warning("sync_position_sizes: journal not caught up, skipping")
+            return 0
         result = await self._position_sync.quick_sync_sizes(wallet_address)
         return result.get("updated", 0)
 
@@ -370,6 +439,7 @@ class ExecutionService:
             self._config.min_hold_days = min_hold_days
             self._exit_manager._config.min_hold_days = min_hold_days
 
+    @_tracked
     async def execute_entry(
         self,
         signal: "EntrySignal",
@@ -422,6 +492,7 @@ class ExecutionService:
 
             # Sync order status
             order = await self._order_manager.sync_order_status(order_id)
+            stamp(Stage.FILL)
 
             # Create position if filled
             position_id = None
@@ -492,6 +563,7 @@ class ExecutionService:
                 error_type="execution_error",
             )
 
+    @_tracked
     async def execute_exit(
         self,
         signal: "ExitSignal",
@@ -579,6 +651,7 @@ class ExecutionService:
                 error_type="exit_error",
             )
 
+    @_tracked
     async def close_position(
         self,
         position_id: str,
@@ -630,6 +703,7 @@ class ExecutionService:
                 closed_count += 1
         return closed_count
 
+    @_tracked
     async def cancel_order(self, order_id: str) -> bool:
         """Cancel a single open order."""
         success = await self._order_manager.cancel_order(order_id)
@@ -641,6 +715,7 @@ class ExecutionService:
             })
         return success
 
+    @_tracked
     async def cancel_all_orders(self) -> int:
         """Cancel all open orders."""
         open_orders = list(self._order_manager.get_open_orders())
@@ -650,6 +725,7 @@ class ExecutionService:
                 cancelled += 1
         return cancelled
 
+    @_tracked
     async def sync_open_orders(self) -> int:
         """
         Sync status of all open orders with CLOB.
@@ -704,6 +780,7 @@ class ExecutionService:
 
         return synced_count
 
+    @_tracked
     async def evaluate_exits(
         self,
         current_prices: dict[str, Decimal],
@@ -744,6 +821,7 @@ class ExecutionService:
 
         return exits_to_execute
 
+    @_tracked
     async def handle_resolution(
         self,
         token_id: str,
@@ -784,6 +862,7 @@ class ExecutionService:
     # G14: Stale Order Management - Capital Efficiency
     # =========================================================================
 
+    @_tracked
     async def cancel_stale_orders(self) -> dict:
         """
         G14: Cancel stale orders that are unlikely to fill.
@@ -793,147 +872,186 @@ class ExecutionService:
         2. Order cannot fill (BUY price < best ask)
         3. Order is old enough (> stale_order_min_age_hours)
 
+        Orders are grouped by token and each token's orderbook is fetched
+        once, stale_scan_concurrency books at a time. Every order is
+        evaluated before anything is cancelled, and the stale ones go out
+        in one batch cancel.
+
         This prevents capital from being locked in dead markets.
 
         Returns:
-            Dict with 'cancelled', 'checked', 'freed_capital', 'details'
+            Dict with 'cancelled', 'checked', 'freed_capital', 'details',
+            'books_fetched', 'duration_seconds'
         """
+        empty = {
+            "cancelled": 0, "checked": 0, "freed_capital": Decimal("0"),
+            "details": [], "books_fetched": 0, "duration_seconds": 0.0,
+        }
         if not self._clob_client:
             logger.debug("cancel_stale_orders: No CLOB client, skipping")
-            return {"cancelled": 0, "checked": 0, "freed_capital": Decimal("0"), "details": []}
+            return empty
 
         open_orders = self._order_manager.get_open_orders()
         if not open_orders:
-            return {"cancelled": 0, "checked": 0, "freed_capital": Decimal("0"), "details": []}
+            return empty
 
+        started = time.perf_counter()
         now = datetime.now(timezone.utc)
-        cancelled = 0
-        checked = 0
-        freed_capital = Decimal("0")
-        details = []
 
+        # Skip orders that are too young; group the rest by token
+        by_token: dict[str, list[tuple[Order, float | None]]] = {}
         for order in open_orders:
-            checked += 1
-
-            # Skip orders that are too young
+            age_hours = None
             if order.created_at:
                 age_hours = (now - order.created_at).total_seconds() / 3600
                 if age_hours < self._config.stale_order_min_age_hours:
                     logger.debug(f"Order {order.order_id[:16]}... too young ({age_hours:.1f}h)")
                     continue
+            by_token.setdefault(order.token_id, []).append((order, age_hours))
 
-            try:
-                # Check orderbook liquidity
-                is_stale, reason, spread = await self._check_order_staleness(order)
+        semaphore = asyncio.Semaphore(max(1, self._config.stale_scan_concurrency))
+
+        async def fetch(token_id: str) -> Any:
+            async with semaphore:
+                try:
+                    return await self._fetch_order_book(token_id)
+                except Exception as e:
+                    logger.warning(f"Error checking orderbook for {token_id[:20]}...: {e}")
+                    return None
+
+        tokens = list(by_token)
+        books = await asyncio.gather(*(fetch(token_id) for token_id in tokens))
 
+        stale = []
+        for token_id, ob in zip(tokens, books, strict=True):
+            if ob is None:
+                continue
+            for order, age_hours in by_token[token_id]:
+                try:
+                    is_stale, reason, spread = self._evaluate_staleness(order, ob)
+                except Exception as e:
+                    logger.warning(f"Error checking order {order.order_id[:16]}...: {e}")
+                    continue
                 if is_stale:
-                    # Calculate locked capital before cancelling
-                    unfilled = order.size - order.filled_size
-                    locked = order.price * unfilled
-
-                    success = await self._order_manager.cancel_order(order.order_id)
-                    if success:
-                        cancelled += 1
-                        freed_capital += locked
-                        details.append({
-                            "order_id": order.order_id,
-                            "token_id": order.token_id,
-                            "reason": reason,
-                            "spread": str(spread) if spread else None,
-                            "freed": str(locked),
-                            "age_hours": age_hours if order.created_at else None,
-                        })
-                        logger.info(
-                            f"G14: Cancelled stale order {order.order_id[:16]}... "
-                            f"({reason}, freed ${locked:.2f})"
-                        )
-                        self._emit_event({
-                            "type": "order",
-                            "action": "cancelled_stale",
-                            "order_id": order.order_id,
-                            "reason": reason,
-                            "freed_capital": str(locked),
-                        })
+                    stale.append((order, age_hours, reason, spread))
 
-            except Exception as e:
-                logger.warning(f"Error checking order {order.order_id[:16]}...: {e}")
+        # Locked capital is computed before cancelling (cancel updates the order)
+        locked_by_id = {
+            order.order_id: order.price * (order.size - order.filled_size)
+            for order, _, _, _ in stale
+        }
+        cancelled_ids = set(
+            await self._order_manager.cancel_orders([o.order_id for o, _, _, _ in stale])
+        )
 
-        if cancelled > 0:
+        freed_capital = Decimal("0")
+        details = []
+        for order, age_hours, reason, spread in stale:
+            if order.order_id not in cancelled_ids:
+                continue
+            locked = locked_by_id[order.order_id]
+            freed_capital += locked
+            details.append({
+                "order_id": order.order_id,
+                "token_id": order.token_id,
+                "reason": reason,
+                "spread": str(spread) if spread else None,
+                "freed": str(locked),
+                "age_hours": age_hours,
+            })
+            logger.info(
+                f"G14: Cancelled stale order {order.order_id[:16]}... "
+                f"({reason}, freed ${locked:.2f})"
+            )
+            self._emit_event({
+                "type": "order",
+                "action": "cancelled_stale",
+                "order_id": order.order_id,
+                "reason": reason,
+                "freed_capital": str(locked),
+            })
+
+        duration = time.perf_counter() - started
+        if details:
             logger.info(
-                f"G14: Cancelled {cancelled} stale orders, freed ${freed_capital:.2f}"
+                f"G14: Cancelled {len(details)} stale orders, freed ${freed_capital:.2f} "
+                f"({len(open_orders)} checked, {len(tokens)} books, {duration:.1f}s)"
             )
 
         return {
-            "cancelled": cancelled,
-            "checked": checked,
+            "cancelled": len(details),
+            "checked": len(open_orders),
             "freed_capital": freed_capital,
             "details": details,
+            "books_fetched": len(tokens),
+            "duration_seconds": duration,
         }
 
-    async def _check_order_staleness(
+    async def _fetch_order_book(self, token_id: str) -> Any:
+        """Fetch an orderbook without blocking the event loop."""
+        get_order_book = self._clob_client.get_order_book
+        if inspect.iscoroutinefunction(get_order_book):
+            return await get_order_book(token_id)
+        return await asyncio.to_thread(get_order_book, token_id)
+
+    def _evaluate_staleness(
         self,
         order: Order,
+        ob: Any,
     ) -> tuple[bool, str, Optional[Decimal]]:
         """
-        Check if an order is stale and should be cancelled.
+        Evaluate an order against its token's orderbook.
 
         Returns:
             (is_stale, reason, spread_percent)
         """
-        try:
-            ob = self._clob_client.get_order_book(order.token_id)
-
-            # Extract bids and asks (handle both dict and object formats)
-            if isinstance(ob, dict):
-                bids = ob.get("bids", [])
-                asks = ob.get("asks", [])
+        # Extract bids and asks (handle both dict and object formats)
+        if isinstance(ob, dict):
+            bids = ob.get("bids", [])
+            asks = ob.get("asks", [])
+        else:
+            bids = ob.bids if hasattr(ob, "bids") and ob.bids else []
+            asks = ob.asks if hasattr(ob, "asks") and ob.asks else []
+
+        # Get best prices
+        if bids:
+            if isinstance(bids[0], dict):
+                best_bid = Decimal(str(bids[0].get("price", 0)))
             else:
-                bids = ob.bids if hasattr(ob, "bids") and ob.bids else []
-                asks = ob.asks if hasattr(ob, "asks") and ob.asks else []
+                best_bid = Decimal(str(bids[0].price))
+        else:
+            best_bid = Decimal("0")
 
-            # Get best prices
-            if bids:
-                if isinstance(bids[0], dict):
-                    best_bid = Decimal(str(bids[0].get("price", 0)))
-                else:
-                    best_bid = Decimal(str(bids[0].price))
+        if asks:
+            if isinstance(asks[0], dict):
+                best_ask = Decimal(str(asks[0].get("price", 0)))
             else:
-                best_bid = Decimal("0")
+                best_ask = Decimal(str(asks[0].price))
+        else:
+            best_ask = Decimal("1")
 
-            if asks:
-                if isinstance(asks[0], dict):
-                    best_ask = Decimal(str(asks[0].get("price", 0)))
-                else:
-                    best_ask = Decimal(str(asks[0].price))
-            else:
-                best_ask = Decimal("1")
+        # Calculate spread
+        if best_ask > 0:
+            spread = (best_ask - best_bid) / best_ask
+        else:
+            spread = Decimal("1")
 
-            # Calculate spread
-            if best_ask > 0:
-                spread = (best_ask - best_bid) / best_ask
-            else:
-                spread = Decimal("1")
-
-            spread_pct = spread * 100
+        spread_pct = spread * 100
 
-            # Check conditions for staleness
-            # 1. BUY order can never fill if best ask > order price
-            if order.side == "BUY" and best_ask > order.price:
-                return True, f"unfillable (ask ${best_ask} > order ${order.price})", spread_pct
+        # Check conditions for staleness
+        # 1. BUY order can never fill if best ask > order price
+        if order.side == "BUY" and best_ask > order.price:
+            return True, f"unfillable (ask ${best_ask} > order ${order.price})", spread_pct
 
-            # 2. SELL order can never fill if best bid < order price
-            if order.side == "SELL" and best_bid < order.price:
-                return True, f"unfillable (bid ${best_bid} < order ${order.price})", spread_pct
+        # 2. SELL order can never fill if best bid < order price
+        if order.side == "SELL" and best_bid < order.price:
+            return True, f"unfillable (bid ${best_bid} < order ${order.price})", spread_pct
 
-            # 3. Spread too wide
-            if spread > self._config.stale_order_max_spread:
-                return True, f"spread too wide ({spread_pct:.1f}%)", spread_pct
+        # 3. Spread too wide
+        if spread > self._config.stale_order_max_spread:
+            return True, f"spread too wide ({spread_pct:.1f}%)", spread_pct
 
-            return False, "", spread_pct
-
-        except Exception as e:
-            logger.warning(f"Error checking orderbook for {order.token_id[:20]}...: {e}")
-            return False, "", None
+        return False, "", spread_pct
 
     async def verify_entry_liquidity(
         self,
@@ -64,6 +64,10 @@ def mock_clob_client():
         "avgPrice": "0.95",
     }
     client.cancel_order.return_value = {"success": True}
+    client.cancel_orders.side_effect = lambda order_ids: {
+        "canceled": list(order_ids),
+        "not_canceled": {},
+    }
     client.cancel.return_value = {"success": True}
     # G13/G14: Default healthy orderbook for liquidity checks
     # Ask ($0.95) matches order price, allowing entries and exits
@@ -1334,6 +1338,110 @@ class TestG14StaleOrderManagement:
         # Freed capital = 0.80 * (100 - 25) = 60.00
         assert result["freed_capital"] == Decimal("60.00")
 
+    @pytest.mark.asyncio
+    async def test_fetches_each_token_book_once(
+        self, mock_db, mock_illiquid_orderbook, g14_config
+    ):
+        """Orders on the same token share one orderbook fetch."""
+        service = ExecutionService(
+            db=mock_db,
+            clob_client=mock_illiquid_orderbook,
+            config=g14_config,
+        )
+        for i in range(6):
+            order = Order(
+                order_id=f"order_{i}",
+                token_id=f"tok_{i % 2}",
+                condition_id="0xtest",
+                side="BUY",
+                price=Decimal("0.95"),
+                size=Decimal("20"),
+                status=OrderStatus.LIVE,
+                created_at=datetime.now(timezone.utc) - timedelta(hours=3),
+            )
+            service._order_manager._orders[order.order_id] = order
+
+        result = await service.cancel_stale_orders()
+
+        assert mock_illiquid_orderbook.get_order_book.call_count == 2
+        assert result["books_fetched"] == 2
+        assert result["cancelled"] == 6
+        assert result["duration_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_stale_orders_cancelled_in_one_batch(
+        self, mock_db, mock_illiquid_orderbook, g14_config
+    ):
+        """With a batch cancel, stale orders go out in one request."""
+        mock_illiquid_orderbook.cancel_orders = MagicMock(return_value={
+            "canceled": ["order_0", "order_1"],
+            "not_canceled": {"order_2": "order already matched"},
+        })
+        service = ExecutionService(
+            db=mock_db,
+            clob_client=mock_illiquid_orderbook,
+            config=g14_config,
+        )
+        for i in range(3):
+            order = Order(
+                order_id=f"order_{i}",
+                token_id=f"tok_{i}",
+                condition_id="0xtest",
+                side="BUY",
+                price=Decimal("0.50"),
+                size=Decimal("10"),
+                status=OrderStatus.LIVE,
+                created_at=datetime.now(timezone.utc) - timedelta(hours=3),
+            )
+            service._order_manager._orders[order.order_id] = order
+
+        result = await service.cancel_stale_orders()
+
+        mock_illiquid_orderbook.cancel_orders.assert_called_once()
+        assert sorted(mock_illiquid_orderbook.cancel_orders.call_args.args[0]) == [
+            "order_0", "order_1", "order_2",
+        ]
+        mock_illiquid_orderbook.cancel.assert_not_called()
+        assert result["cancelled"] == 2
+        assert result["freed_capital"] == Decimal("10.00")
+        assert service._order_manager.get_order("order_2").status == OrderStatus.LIVE
+
+    @pytest.mark.asyncio
+    async def test_unrecognized_batch_cancel_response_requeries(
+        self, mock_db, mock_illiquid_orderbook, g14_config
+    ):
+        """An unknown cancel response does not mark orders cancelled."""
+        mock_illiquid_orderbook.cancel_orders = MagicMock(return_value="ok")
+        mock_illiquid_orderbook.get_order = MagicMock(side_effect=lambda oid: {
+            "status": "CANCELED" if oid == "order_0" else "LIVE",
+            "size": "10",
+            "filledSize": "0",
+        })
+        service = ExecutionService(
+            db=mock_db,
+            clob_client=mock_illiquid_orderbook,
+            config=g14_config,
+        )
+        for i in range(2):
+            order = Order(
+                order_id=f"order_{i}",
+                token_id=f"tok_{i}",
+                condition_id="0xtest",
+                side="BUY",
+                price=Decimal("0.50"),
+                size=Decimal("10"),
+                status=OrderStatus.LIVE,
+                created_at=datetime.now(timezone.utc) - timedelta(hours=3),
+            )
+            service._order_manager._orders[order.order_id] = order
+
+        result = await service.cancel_stale_orders()
+
+        assert mock_illiquid_orderbook.get_order.call_count == 2
+        assert result["cancelled"] == 1
+        assert service._order_manager.get_order("order_0").status == OrderStatus.CANCELLED
+        assert service._order_manager.get_order("order_1").status == OrderStatus.LIVE
+
     # -------------------------------------------------------------------------
     # Pre-Entry Liquidity Verification Tests
     # -------------------------------------------------------------------------
@@ -3,7 +3,9 @@ Ingestion Layer - External data sources and API clients.
 
 This module provides real-time data ingestion from Polymarket APIs:
     - REST client for market data, trades, and orderbooks
+    - Market catalog: one shared market-list fetch with a change feed
     - WebSocket client for real-time price updates
+    - Frame recording and offline replay of WebSocket sessions
     - Event processor with gotcha protections (G1, G3, G5)
     - Ingestion service orchestrator
     - Dashboard for monitoring
@@ -63,12 +65,32 @@ from .client import (
     verify_orderbook_price,
 )
 
+# Market Catalog
+from .catalog import (
+    CatalogChange,
+    CatalogMarket,
+    CatalogStats,
+    ChangeKind,
+    MarketCatalog,
+    StoredMarketCatalog,
+)
+
 # WebSocket Client
 from .websocket import (
     PolymarketWebSocket,
     WebSocketState,
 )
 
+# Record / Replay
+from .replay import (
+    FrameRecorder,
+    RecordedFrame,
+    ReplayServer,
+    ReplayStats,
+    read_frames,
+    replay_frames,
+)
+
 # Event Processor
 from .processor import (
     EventBuffer,
@@ -119,9 +141,23 @@ __all__ = [
     "PolymarketRestClient",
     "RateLimitError",
     "verify_orderbook_price",
+    # Market Catalog
+    "CatalogChange",
+    "CatalogMarket",
+    "CatalogStats",
+    "ChangeKind",
+    "MarketCatalog",
+    "StoredMarketCatalog",
     # WebSocket
     "PolymarketWebSocket",
     "WebSocketState",
+    # Record / Replay
+    "FrameRecorder",
+    "RecordedFrame",
+    "ReplayServer",
+    "ReplayStats",
+    "read_frames",
+    "replay_frames",
     # Processor
     "EventBuffer",
     "EventProcessor",
@@ -0,0 +1,573 @@
+"""
+Market Catalog - one shared, incremental view of the Polymarket market list.
+
+The bot used to download the full Gamma /markets list separately for the
+ingestion token map, market_universe, polymarket_token_meta and the
+explorer. MarketCatalog fetches it once, through a single rate-limited
+PolymarketRestClient, and publishes what changed to every consumer:
+
+- ADDED: first time the catalog sees an open market
+- UPDATED: an open market whose payload changed since the last refresh
+- RESOLVED: a known market that closed, was deactivated, or dropped out of
+  the open listing
+
+Refresh modes:
+- Full: walk every open market (active=true, closed=false). Run first and
+  every `full_refresh_interval`; markets missing from a complete walk
+  are reported RESOLVED.
+- Incremental: walk /markets ordered by updatedAt, newest first, without
+  the closed filter (so closures are seen), stopping once a whole page
+  predates the watermark minus `incremental_overlap`.
+
+Subscribers receive each batch of changes as it is applied (a full walk
+publishes once per window of pages, so consumers start work before the
+walk ends). Callbacks may be sync or async. A subscriber that raises
+gets the same changes again with its next delivery (at the latest after
+the next refresh), merged per market, until it accepts them; the
+catalog's own view has already moved on, so a later walk would not
+report them again. Out-of-process consumers read the same changes from
+the market_catalog table written by MarketCatalogRepository.apply_changes;
+StoredMarketCatalog turns those rows back into a change feed, so a shard
+worker gets its markets without walking Gamma itself.
+
+Usage:
+    catalog = MarketCatalog(PolymarketRestClient(rate_limit=5.0))
+    catalog.subscribe(universe_fetcher.apply_changes)
+    await catalog.start()  # refresh loop
+    ...
+    await catalog.stop()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from types import MappingProxyType
+from typing import Any
+
+from .client import PolymarketRestClient
+from .models import Market
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeKind(str, Enum):
+    """Kind of catalog change."""
+
+    ADDED = "added"
+    UPDATED = "updated"
+    RESOLVED = "resolved"
+
+
+@dataclass(frozen=True)
+class CatalogMarket:
+    """
+    One market as last seen by the catalog.
+
+    Attributes:
+        condition_id: Market condition ID
+        market: Parsed ingestion model (tokens, question, end date)
+        raw: Unparsed Gamma /markets item, for consumers with their own parser
+        content_hash: md5 of the raw payload; changes mean UPDATED
+        updated_at: Gamma updatedAt, drives the incremental watermark
+    """
+
+    condition_id: str
+    market: Market
+    raw: dict[str, Any] = field(repr=False, compare=False)
+    content_hash: str
+    updated_at: datetime | None = None
+
+    @property
+    def token_ids(self) -> list[str]:
+        return [token.token_id for token in self.market.tokens]
+
+
+@dataclass(frozen=True)
+class CatalogChange:
+    """One entry of the change feed."""
+
+    seq: int
+    kind: ChangeKind
+    market: CatalogMarket
+
+    @property
+    def condition_id(self) -> str:
+        return self.market.condition_id
+
+
+# Subscriber callback: called with each batch of changes (sync or async)
+CatalogCallback = Callable[[list[CatalogChange]], Any]
+
+
+@dataclass
+class CatalogStats:
+    """Counters for the status endpoints."""
+
+    markets: int = 0
+    refreshes: int = 0
+    full_refreshes: int = 0
+    api_calls: int = 0
+    page_errors: int = 0
+    subscriber_errors: int = 0
+    undelivered: int = 0
+    added: int = 0
+    updated: int = 0
+    resolved: int = 0
+    last_refresh_seconds: float = 0.0
+    last_refresh_at: datetime | None = None
+    watermark: datetime | None = None
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        data = asdict(self)
+        data["last_refresh_seconds"] = round(self.last_refresh_seconds, 2)
+        for key in ("last_refresh_at", "watermark"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+
+def _parse_timestamp(value: Any) -> datetime | None:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _is_open(raw: dict) -> bool:
+    """Open = active and not closed (booleans may arrive as strings)."""
+
+    def flag(key: str, default: bool) -> bool:
+        value = raw.get(key)
+        if value is None:
+            return default
+        if isinstance(value, str):
+            return value.lower() in ("true", "1", "yes")
+        return bool(value)
+
+    return flag("active", True) and not flag("closed", False)
+
+
+def _content_hash(raw: dict) -> str:
+    payload = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.md5(payload.encode("utf-8")).hexdigest()
+
+
+class MarketCatalog:
+    """
+    Shared market catalog with a change feed.
+
+    Holds the latest CatalogMarket per open market and publishes deltas to
+    subscribers after each refresh.
+    """
+
+    def __init__(
+        self,
+        client: PolymarketRestClient,
+        page_size: int = 100,
+        concurrency: int = 4,
+        refresh_interval: float = 60.0,
+        full_refresh_interval: float = 900.0,
+        incremental_overlap: timedelta = timedelta(minutes=5),
+        max_pages: int = 500,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            client: REST client; its rate limit is the catalog's API budget
+            page_size: Markets per API page
+            concurrency: Pages requested at once
+            refresh_interval: Seconds between refreshes in the run loop
+            full_refresh_interval: Seconds between full walks
+            incremental_overlap: Re-read markets updated this long before
+                the watermark
+            max_pages: Safety cap on pages per walk
+        """
+        self._client = client
+        self._page_size = page_size
+        self._concurrency = concurrency
+        self._refresh_interval = refresh_interval
+        self._full_refresh_interval = full_refresh_interval
+        self._incremental_overlap = incremental_overlap
+        self._max_pages = max_pages
+
+        self._markets: dict[str, CatalogMarket] = {}
+        self._subscribers: list[CatalogCallback] = []
+        # Changes a subscriber failed on, by condition ID, redelivered next time
+        self._undelivered: dict[CatalogCallback, dict[str, CatalogChange]] = {}
+        self._seq = 0
+        self._last_full_refresh: float | None = None
+        self._refresh_lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        self.stats = CatalogStats()
+
+    @property
+    def markets(self) -> Mapping[str, CatalogMarket]:
+        """Read-only view of open markets by condition ID."""
+        return MappingProxyType(self._markets)
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last published change."""
+        return self._seq
+
+    def get(self, condition_id: str) -> CatalogMarket | None:
+        return self._markets.get(condition_id)
+
+    def subscribe(self, callback: CatalogCallback) -> None:
+        """
+        Register a change callback.
+
+        Subscribers registered after the first refresh only see later
+        changes; read `markets` for the current state.
+        """
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: CatalogCallback) -> None:
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+        self._undelivered.pop(callback, None)
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    async def start(self) -> None:
+        """Start the background refresh loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_loop(), name="market_catalog")
+            logger.info("Market catalog started")
+
+    async def stop(self) -> None:
+        """Stop the refresh loop (the REST client is left open)."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            logger.info("Market catalog stopped")
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Market catalog refresh failed: {e}")
+            await asyncio.sleep(self._refresh_interval)
+
+    # =========================================================================
+    # Refresh
+    # =========================================================================
+
+    def _full_refresh_due(self) -> bool:
+        return (
+            self._last_full_refresh is None
+            or self.stats.watermark is None
+            or time.monotonic() - self._last_full_refresh >= self._full_refresh_interval
+        )
+
+    async def refresh(self, full: bool | None = None) -> list[CatalogChange]:
+        """
+        Fetch changes from the API, apply them and notify subscribers.
+
+        Args:
+            full: Force a full (True) or incremental (False) walk; by default
+                a full walk runs first and every full_refresh_interval
+
+        Returns:
+            Every change published by this refresh
+        """
+        async with self._refresh_lock:
+            if full is None:
+                full = self._full_refresh_due()
+            elif not full and self.stats.watermark is None:
+                full = True
+
+            started = time.monotonic()
+            errors_before = self.stats.page_errors
+            published: list[CatalogChange] = []
+            seen: set[str] = set()
+
+            if full:
+                params = {"active": "true", "closed": "false"}
+                is_old = None
+            else:
+                params = {"order": "updatedAt", "ascending": "false"}
+                since = self.stats.watermark - self._incremental_overlap
+
+                def is_old(item: dict) -> bool:
+                    updated_at = _parse_timestamp(item.get("updatedAt"))
+                    return updated_at is not None and updated_at < since
+
+            stop_when = (lambda page: all(map(is_old, page))) if is_old else None
+            async for window in self._walk(params, stop_when):
+                changes = [
+                    change
+                    for raw in window
+                    if not (is_old and is_old(raw))
+                    and (change := self._apply(raw, seen)) is not None
+                ]
+                await self._publish(changes)
+                published.extend(changes)
+
+            complete = self.stats.page_errors == errors_before
+            if full and complete:
+                missing = [cid for cid in self._markets if cid not in seen]
+                changes = [
+                    self._change(ChangeKind.RESOLVED, self._markets.pop(cid)) for cid in missing
+                ]
+                await self._publish(changes)
+                published.extend(changes)
+
+            # Retry subscribers that failed, even if nothing changed since
+            await self._publish([], retry=True)
+
+            if full:
+                self.stats.full_refreshes += 1
+                if complete:
+                    self._last_full_refresh = time.monotonic()
+            self._record_refresh("full" if full else "incremental", published, started)
+            return published
+
+    def _record_refresh(self, label: str, published: list[CatalogChange], started: float) -> None:
+        self.stats.refreshes += 1
+        self.stats.markets = len(self._markets)
+        self.stats.last_refresh_seconds = time.monotonic() - started
+        self.stats.last_refresh_at = datetime.now(timezone.utc)
+
+        logger.info(
+            f"Catalog {label} refresh: "
+            f"{len(published)} changes, {len(self._markets)} open markets "
+            f"({self.stats.last_refresh_seconds:.1f}s)"
+        )
+
+    async def _walk(
+        self,
+        params: dict[str, str],
+        stop_when: Callable[[list[dict]], bool] | None,
+    ) -> AsyncIterator[list[dict]]:
+        """Yield windows of items, `concurrency` pages per window, in offset order."""
+        offset = 0
+        for _ in range(0, self._max_pages, self._concurrency):
+            offsets = [offset + i * self._page_size for i in range(self._concurrency)]
+            offset += self._concurrency * self._page_size
+            pages = await asyncio.gather(
+                *(
+                    self._client.get_market_page(offset=o, limit=self._page_size, **params)
+                    for o in offsets
+                ),
+                return_exceptions=True,
+            )
+            self.stats.api_calls += len(pages)
+
+            window: list[dict] = []
+            done = False
+            for page_offset, page in zip(offsets, pages, strict=True):
+                if isinstance(page, BaseException):
+                    if not isinstance(page, Exception):
+                        raise page
+                    self.stats.page_errors += 1
+                    logger.warning(f"Catalog page at offset {page_offset} failed: {page}")
+                    done = True
+                    break
+                window.extend(page)
+                if len(page) < self._page_size or (stop_when is not None and stop_when(page)):
+                    done = True
+                    break
+            if window:
+                yield window
+            if done:
+                return
+        logger.warning(f"Catalog walk stopped at max_pages ({self._max_pages})")
+
+    def _apply(self, raw: dict, seen: set[str]) -> CatalogChange | None:
+        """Fold one API item into the catalog and return its change, if any."""
+        condition_id = raw.get("conditionId") or raw.get("condition_id")
+        if not condition_id:
+            return None
+
+        updated_at = _parse_timestamp(raw.get("updatedAt"))
+        if updated_at is not None and (
+            self.stats.watermark is None or updated_at > self.stats.watermark
+        ):
+            self.stats.watermark = updated_at
+
+        previous = self._markets.get(condition_id)
+        is_open = _is_open(raw)
+        if not is_open and previous is None:
+            return None
+
+        content_hash = _content_hash(raw)
+        if previous is not None and previous.content_hash == content_hash:
+            seen.add(condition_id)
+            return None
+
+        market = self._client.parse_market(raw)
+        if market is None:
+            return None
+        entry = CatalogMarket(
+            condition_id=condition_id,
+            market=market,
+            raw=raw,
+            content_hash=content_hash,
+            updated_at=updated_at,
+        )
+        if not is_open:
+            del self._markets[condition_id]
+            return self._change(ChangeKind.RESOLVED, entry)
+
+        seen.add(condition_id)
+        self._markets[condition_id] = entry
+        return self._change(ChangeKind.ADDED if previous is None else ChangeKind.UPDATED, entry)
+
+    def _change(self, kind: ChangeKind, market: CatalogMarket) -> CatalogChange:
+        self._seq += 1
+        if kind == ChangeKind.ADDED:
+            self.stats.added += 1
+        elif kind == ChangeKind.UPDATED:
+            self.stats.updated += 1
+        else:
+            self.stats.resolved += 1
+        return CatalogChange(seq=self._seq, kind=kind, market=market)
+
+    async def _publish(self, changes: list[CatalogChange], retry: bool = False) -> None:
+        """Deliver `changes`, plus each subscriber's undelivered ones, to subscribers."""
+        if not changes and not (retry and self._undelivered):
+            return
+        for callback in list(self._subscribers):
+            batch = self._pending_for(callback, changes)
+            if not batch:
+                continue
+            try:
+                result = callback(batch)
+                if inspect.isawaitable(result):
+                    await result
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._undelivered[callback] = {c.condition_id: c for c in batch}
+                self.stats.subscriber_errors += 1
+                name = getattr(callback, "__qualname__", repr(callback))
+                logger.error(
+                    f"Catalog subscriber {name} failed: {e}; "
+                    f"{len(batch)} changes will be redelivered"
+                )
+            else:
+                self._undelivered.pop(callback, None)
+        self.stats.undelivered = sum(len(p) for p in self._undelivered.values())
+
+    def _pending_for(
+        self, callback: CatalogCallback, changes: list[CatalogChange]
+    ) -> list[CatalogChange]:
+        """`changes` preceded by what `callback` failed on, latest per market."""
+        pending = self._undelivered.get(callback)
+        if not pending:
+            return changes
+        merged = dict(pending)
+        for change in changes:
+            previous = merged.pop(change.condition_id, None)
+            if (
+                previous is not None
+                and previous.kind == ChangeKind.ADDED
+                and change.kind == ChangeKind.UPDATED
+            ):
+                # The subscriber never saw the market: still an addition
+                change = CatalogChange(seq=change.seq, kind=ChangeKind.ADDED, market=change.market)
+            merged[change.condition_id] = change
+        return sorted(merged.values(), key=lambda c: c.seq)
+
+
+class StoredMarketCatalog(MarketCatalog):
+    """
+    MarketCatalog that follows the market_catalog table instead of the API.
+
+    Each refresh reads the rows written since its cursor
+    (MarketCatalogRepository.changes_since), keeps the markets
+    `condition_filter` accepts and publishes them like a walk would. Engine
+    shard workers use it, so only the coordinator's catalog calls Gamma.
+    """
+
+    def __init__(
+        self,
+        repository: Any,
+        client: PolymarketRestClient,
+        refresh_interval: float = 15.0,
+        condition_filter: Callable[[str], bool] | None = None,
+        batch_size: int = 1000,
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            repository: MarketCatalogRepository (or anything with its
+                changes_since(seq, limit))
+            client: REST client, used only to parse stored payloads
+            refresh_interval: Seconds between reads in the run loop
+            condition_filter: Markets to keep; None keeps all
+            batch_size: Rows per read
+        """
+        super().__init__(client, refresh_interval=refresh_interval)
+        self._repository = repository
+        self._condition_filter = condition_filter
+        self._batch_size = batch_size
+        self._cursor = 0
+
+    @property
+    def cursor(self) -> int:
+        """market_catalog seq of the last row read."""
+        return self._cursor
+
+    async def refresh(self, full: bool | None = None) -> list[CatalogChange]:
+        """
+        Apply rows written since the last refresh and notify subscribers.
+
+        Args:
+            full: Ignored; every refresh reads from the cursor
+
+        Returns:
+            Every change published by this refresh
+        """
+        async with self._refresh_lock:
+            started = time.monotonic()
+            published: list[CatalogChange] = []
+            while True:
+                rows = await self._repository.changes_since(self._cursor, self._batch_size)
+                changes = [change for row in rows if (change := self._apply_row(row)) is not None]
+                if rows:
+                    self._cursor = rows[-1].seq
+                await self._publish(changes)
+                published.extend(changes)
+                if len(rows) < self._batch_size:
+                    break
+
+            await self._publish([], retry=True)
+            self._record_refresh("stored", published, started)
+            return published
+
+    def _apply_row(self, row: Any) -> CatalogChange | None:
+        """Fold one market_catalog row into the catalog."""
+        if self._condition_filter is not None and not self._condition_filter(row.condition_id):
+            return None
+        if row.resolved:
+            # Also covers markets a full walk no longer listed: their
+            # payload is the last open one
+            previous = self._markets.pop(row.condition_id, None)
+            return self._change(ChangeKind.RESOLVED, previous) if previous else None
+        return self._apply(row.payload, set())
@@ -13,13 +13,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 import time
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import urlsplit
 
 import aiohttp
 
+from polymarket_bot.telemetry import registry
+
 from .models import (
     Market,
     OrderbookLevel,
@@ -32,6 +37,26 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+REQUEST_SECONDS = registry.histogram(
+    "polymarket_rest_request_seconds",
+    "Polymarket REST request latency per attempt",
+    ("endpoint",),
+)
+
+# Path segments that are identifiers, not routes (condition ids, token ids)
+_ID_SEGMENT = re.compile(r"^(0x[0-9a-fA-F]+|\d+)$")
+
+
+@lru_cache(maxsize=512)
+def endpoint_label(url: str) -> str:
+    """Low-cardinality label for a request URL: host and path, ids collapsed."""
+    parts = urlsplit(url)
+    path = "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in parts.path.split("/")
+    )
+    return f"{parts.netloc}{path}"
+
 
 class PolymarketAPIError(Exception):
     """Base exception for Polymarket API errors."""
@@ -99,6 +124,11 @@ class PolymarketRestClient:
         self._request_times: list[float] = []
         self._rate_lock = asyncio.Lock()
 
+    @property
+    def session(self) -> aiohttp.ClientSession | None:
+        """The aiohttp session (None until entered); other clients may share it."""
+        return self._session
+
     async def __aenter__(self) -> "PolymarketRestClient":
         """Async context manager entry."""
         if self._session is None:
@@ -159,35 +189,40 @@ class PolymarketRestClient:
             self._owns_session = True
 
         last_error: Optional[Exception] = None
+        latency = REQUEST_SECONDS.labels(endpoint_label(url))
 
         for attempt in range(self._max_retries):
             try:
                 await self._rate_limit_wait()
 
-                async with self._session.request(method, url, **kwargs) as response:
-                    if response.status == 429:
-                        raise RateLimitError(
-                            "Rate limit exceeded",
-                            status_code=429
-                        )
-
-                    # 4xx client errors (except 429) - don't retry
-                    if 400 <= response.status < 500:
-                        text = await response.text()
-                        raise PolymarketAPIError(
-                            f"API error: {response.status} - {text}",
-                            status_code=response.status
-                        )
-
-                    # 5xx server errors - retry
-                    if response.status >= 500:
-                        text = await response.text()
-                        raise PolymarketAPIError(
-                            f"Server error: {response.status} - {text}",
-                            status_code=response.status
-                        )
-
-                    return await response.json()
+                started = time.perf_counter()
+                try:
+                    async with self._session.request(method, url, **kwargs) as response:
+                        if response.status == 429:
+                            raise RateLimitError(
+                                "Rate limit exceeded",
+                                status_code=429
+                            )
+
+                        # 4xx client errors (except 429) - don't retry
+                        if 400 <= response.status < 500:
+                            text = await response.text()
+                            raise PolymarketAPIError(
+                                f"API error: {response.status} - {text}",
+                                status_code=response.status
+                            )
+
+                        # 5xx server errors - retry
+                        if response.status >= 500:
+                            text = await response.text()
+                            raise PolymarketAPIError(
+                                f"Server error: {response.status} - {text}",
+                                status_code=response.status
+                            )
+
+                        return await response.json()
+                finally:
+                    latency.observe(time.perf_counter() - started)
 
             except RateLimitError:
                 # Longer delay for rate limiting
@@ -258,16 +293,12 @@ class PolymarketRestClient:
         Returns:
             List of Market objects
         """
-        params = {
-            "limit": limit,
-            "offset": offset,
-        }
+        params = {}
         if active_only:
             params["active"] = "true"
             params["closed"] = "false"  # Exclude closed markets
 
-        url = f"{self.GAMMA_API}/markets"
-        data = await self._request("GET", url, params=params)
+        data = await self.get_market_page(offset=offset, limit=limit, **params)
 
         markets = []
         for item in data:
@@ -280,6 +311,32 @@ class PolymarketRestClient:
 
         return markets
 
+    async def get_market_page(
+        self,
+        offset: int = 0,
+        limit: int = 100,
+        **filters: str,
+    ) -> list[dict]:
+        """
+        Fetch one page of raw Gamma /markets items.
+
+        Args:
+            offset: Pagination offset
+            limit: Page size
+            **filters: Extra query parameters (e.g. active="true",
+                order="updatedAt", ascending="false")
+
+        Returns:
+            Unparsed market dicts; see parse_market()
+        """
+        params: dict[str, Any] = {"limit": limit, "offset": offset, **filters}
+        data = await self._request("GET", f"{self.GAMMA_API}/markets", params=params)
+        return data if isinstance(data, list) else []
+
+    def parse_market(self, data: dict) -> Market | None:
+        """Parse a raw Gamma /markets item into a Market."""
+        return self._parse_market(data)
+
     async def get_market(self, condition_id: str) -> Optional[Market]:
         """
         Fetch a single market by condition ID.
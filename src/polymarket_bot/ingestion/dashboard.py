@@ -16,9 +16,11 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 
+from polymarket_bot.telemetry import CONTENT_TYPE, registry
+
 if TYPE_CHECKING:
     from .service import IngestionService
 
@@ -71,6 +73,11 @@ def create_dashboard_app(service: "IngestionService") -> FastAPI:
             return metrics.to_dict()
         return {"error": "Metrics not available"}
 
+    @app.get("/metrics")
+    async def prometheus_metrics():
+        """Prometheus text exposition of the process metrics registry."""
+        return Response(content=registry.render(), media_type=CONTENT_TYPE)
+
     @app.get("/api/events")
     async def get_events(limit: int = 50, offset: int = 0):
         """
@@ -0,0 +1,354 @@
+"""
+Record and replay raw WebSocket traffic.
+
+FrameRecorder tees every frame PolymarketWebSocket receives, with its
+receive time, into an append-only log split into fixed-size segments.
+A recorded session can then be replayed offline through the same
+pipeline (IngestionService -> on_price_update -> TradingEngine):
+
+    - ReplayServer serves the frames on a local WebSocket. Point
+      IngestionConfig.websocket_url at server.url and the real client,
+      buffer and reconnect logic are exercised.
+    - replay_frames(..., sink=service.websocket.inject) injects frames
+      directly into the message handler, with no socket in between.
+
+Both replay in real time (speed=1.0), at N x speed, or as fast as
+possible (speed=None).
+
+Segment format:
+    header   b"PMWS1\\n"
+    records  <float64 received_at><uint8 kind><uint32 length><payload>
+
+kind is 0 for text frames (payload is UTF-8) and 1 for binary frames.
+All integers are little-endian. A record cut short by a crash ends the
+segment; the reader stops at it instead of failing.
+
+Usage:
+    recorder = FrameRecorder("recordings/2026-10-18")
+    ws = PolymarketWebSocket(on_price_update=handle, recorder=recorder)
+    ...
+    recorder.close()
+
+    stats = await replay_frames(read_frames(path), sink, speed=10.0)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import struct
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import websockets
+
+logger = logging.getLogger(__name__)
+
+Frame = str | bytes
+FrameSink = Callable[[Frame], Awaitable[None]]
+
+SEGMENT_MAGIC = b"PMWS1\n"
+SEGMENT_SUFFIX = ".seg"
+SEGMENT_PREFIX = "frames-"
+_RECORD = struct.Struct("<dBI")
+_TEXT = 0
+_BINARY = 1
+
+
+@dataclass(frozen=True)
+class RecordedFrame:
+    """One WebSocket frame with the wall-clock time it was received."""
+
+    received_at: float
+    data: Frame
+
+
+class FrameRecorder:
+    """
+    Append-only, segmented log of received WebSocket frames.
+
+    Writes go to a buffered file, so record() costs a struct pack and a
+    memory copy on the receive path. Segments roll over once they pass
+    segment_bytes; file names sort in recording order.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        segment_bytes: int = 64 * 1024 * 1024,
+        buffer_bytes: int = 256 * 1024,
+    ):
+        """
+        Args:
+            directory: Directory for segment files (created if missing)
+            segment_bytes: Roll over to a new segment after this many bytes
+            buffer_bytes: Write buffer size per segment file
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._segment_bytes = segment_bytes
+        self._buffer_bytes = buffer_bytes
+
+        self._file = None
+        self._written = 0
+        # Continue after the highest existing segment (older ones may be deleted)
+        self._segment_index = max(
+            (
+                int(path.stem[len(SEGMENT_PREFIX) :])
+                for path in self._directory.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}")
+                if path.stem[len(SEGMENT_PREFIX) :].isdigit()
+            ),
+            default=0,
+        )
+
+        self.frames = 0
+        self.bytes = 0
+
+    @property
+    def directory(self) -> Path:
+        """Directory holding the segment files."""
+        return self._directory
+
+    def record(self, message: Frame, received_at: float | None = None) -> None:
+        """Append one frame. received_at defaults to now."""
+        if isinstance(message, str):
+            kind, payload = _TEXT, message.encode("utf-8")
+        else:
+            kind, payload = _BINARY, bytes(message)
+
+        if self._file is None or self._written >= self._segment_bytes:
+            self._open_segment()
+
+        self._file.write(
+            _RECORD.pack(
+                time.time() if received_at is None else received_at,
+                kind,
+                len(payload),
+            )
+        )
+        self._file.write(payload)
+        self._written += _RECORD.size + len(payload)
+        self.frames += 1
+        self.bytes += len(payload)
+
+    def flush(self) -> None:
+        """Flush buffered frames to disk."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the current segment."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open_segment(self) -> None:
+        self.close()
+        # Always a new file: appending to an existing segment would put a
+        # second SEGMENT_MAGIC in the middle of it
+        while True:
+            self._segment_index += 1
+            path = self._directory / f"{SEGMENT_PREFIX}{self._segment_index:06d}{SEGMENT_SUFFIX}"
+            try:
+                self._file = open(path, "xb", buffering=self._buffer_bytes)
+                break
+            except FileExistsError:
+                continue
+        self._file.write(SEGMENT_MAGIC)
+        self._written = len(SEGMENT_MAGIC)
+        logger.info(f"Recording WebSocket frames to {path}")
+
+
+def segment_paths(path: str | Path) -> list[Path]:
+    """Segment files for a recording directory (sorted), or [path] for one file."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob(f"*{SEGMENT_SUFFIX}"))
+    return [path]
+
+
+def read_frames(path: str | Path) -> Iterator[RecordedFrame]:
+    """
+    Iterate the frames of a recording in the order they were received.
+
+    Args:
+        path: Recording directory or a single segment file
+
+    Raises:
+        ValueError: If a file is not a frame segment
+    """
+    for segment in segment_paths(path):
+        with open(segment, "rb") as f:
+            if f.read(len(SEGMENT_MAGIC)) != SEGMENT_MAGIC:
+                raise ValueError(f"{segment} is not a WebSocket frame segment")
+            while True:
+                header = f.read(_RECORD.size)
+                if len(header) < _RECORD.size:
+                    break
+                received_at, kind, length = _RECORD.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    logger.warning(f"Truncated frame at end of {segment}")
+                    break
+                yield RecordedFrame(
+                    received_at=received_at,
+                    data=payload.decode("utf-8") if kind == _TEXT else payload,
+                )
+
+
+@dataclass
+class ReplayStats:
+    """Outcome of one replay run."""
+
+    frames: int = 0
+    bytes: int = 0
+    elapsed_seconds: float = 0.0
+    recorded_seconds: float = 0.0
+    max_lag_ms: float = 0.0
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "recorded_seconds": round(self.recorded_seconds, 3),
+            "frames_per_second": round(self.frames_per_second, 1),
+            "max_lag_ms": round(self.max_lag_ms, 2),
+        }
+
+
+async def replay_frames(
+    frames: Iterable[RecordedFrame],
+    sink: FrameSink,
+    speed: float | None = 1.0,
+) -> ReplayStats:
+    """
+    Feed recorded frames to sink, preserving their relative timing.
+
+    Args:
+        frames: Frames in receive order (e.g. read_frames(path))
+        sink: Awaited once per frame, e.g. PolymarketWebSocket.inject
+        speed: 1.0 for real time, N for N x speed, None to send as fast
+            as the sink accepts frames
+
+    Returns:
+        ReplayStats. max_lag_ms is how far the slowest frame fell behind
+        its scheduled time, i.e. where the pipeline could not keep up.
+    """
+    loop = asyncio.get_running_loop()
+    stats = ReplayStats()
+    started = loop.time()
+    first_at: float | None = None
+
+    for frame in frames:
+        if first_at is None:
+            first_at = frame.received_at
+        offset = frame.received_at - first_at
+
+        if speed:
+            due = started + offset / speed
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                stats.max_lag_ms = max(stats.max_lag_ms, -delay * 1000)
+
+        await sink(frame.data)
+        stats.frames += 1
+        stats.bytes += len(frame.data)
+        stats.recorded_seconds = offset
+
+    stats.elapsed_seconds = loop.time() - started
+    return stats
+
+
+class ReplayServer:
+    """
+    Local WebSocket server that plays a recording to its clients.
+
+    Each client gets the full recording as soon as it connects. Frames
+    go out regardless of which tokens the client subscribes to; its
+    subscription messages are read and discarded.
+
+    Usage:
+        async with ReplayServer(path, speed=None) as server:
+            config = IngestionConfig(websocket_url=server.url, ...)
+            ...
+            await server.wait_done()
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        speed: float | None = 1.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Args:
+            path: Recording directory or segment file
+            speed: Replay speed (see replay_frames)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+        """
+        self._path = Path(path)
+        self._speed = speed
+        self._host = host
+        self._port = port
+        self._server = None
+        self._done = asyncio.Event()
+        self.stats: ReplayStats | None = None
+
+    @property
+    def url(self) -> str:
+        """ws:// URL of the running server."""
+        if self._server is None:
+            raise RuntimeError("ReplayServer is not running")
+        host, port = list(self._server.sockets)[0].getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    async def start(self) -> None:
+        self._server = await websockets.serve(self._serve, self._host, self._port)
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def wait_done(self) -> ReplayStats:
+        """Wait until a client has received the whole recording."""
+        await self._done.wait()
+        return self.stats
+
+    async def __aenter__(self) -> ReplayServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
+
+    async def _serve(self, connection) -> None:
+        discard = asyncio.create_task(self._discard_incoming(connection))
+        try:
+            self.stats = await replay_frames(read_frames(self._path), connection.send, self._speed)
+            logger.info(f"Replay finished: {self.stats.to_dict()}")
+        finally:
+            self._done.set()
+        # Keep the connection open until the client leaves
+        await connection.wait_closed()
+        discard.cancel()
+
+    @staticmethod
+    async def _discard_incoming(connection) -> None:
+        try:
+            async for _ in connection:
+                pass
+        except websockets.ConnectionClosed:
+            pass
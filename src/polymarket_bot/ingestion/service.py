@@ -28,10 +28,14 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Awaitable, Callable, Optional, Union
 
+from polymarket_bot.telemetry import EventLoopLagMonitor, registry
+
+from .catalog import CatalogChange, ChangeKind, MarketCatalog
 from .client import PolymarketRestClient
 from .metrics import IngestionMetrics, MetricsCollector
 from .models import PriceUpdate
 from .processor import EventProcessor, ProcessorConfig
+from .replay import FrameRecorder
 from .websocket import PolymarketWebSocket, WebSocketState
 
 # Import for token metadata persistence
@@ -43,6 +47,17 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+BUFFER_DEPTH = registry.gauge("polymarket_ws_buffer_depth", "Frames waiting in the WebSocket event buffer")
+WS_CONNECTED = registry.gauge("polymarket_ws_connected", "1 while the WebSocket is connected")
+WS_RECONNECTS = registry.counter("polymarket_ws_reconnects_total", "WebSocket reconnection attempts")
+WS_SUBSCRIBED = registry.gauge("polymarket_ws_subscribed_tokens", "Tokens subscribed on the WebSocket")
+PROCESSED_EVENTS = registry.counter(
+    "polymarket_ingestion_events_total", "Events through the ingestion processor", ("result",)
+)
+GOTCHA_EVENTS = registry.counter(
+    "polymarket_ingestion_gotcha_total", "Events affected by gotcha protections", ("gotcha",)
+)
+
 
 class ServiceState(str, Enum):
     """Service lifecycle state."""
@@ -61,6 +76,13 @@ class IngestionConfig:
     websocket_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     heartbeat_timeout: float = 30.0
     max_reconnect_delay: float = 60.0
+    # False builds the client without connecting; frames then arrive
+    # through websocket.inject() (offline replay)
+    connect_websocket: bool = True
+
+    # Frame recording (see ingestion.replay); None disables it
+    record_dir: str | None = None
+    record_segment_mb: int = 64
 
     # REST API settings
     rate_limit: float = 10.0
@@ -81,6 +103,9 @@ class IngestionConfig:
     # Market subscription
     subscribe_all_markets: bool = False
     initial_token_ids: list[str] = field(default_factory=list)
+    # Restricts subscriptions to markets whose condition_id it accepts
+    # (an engine shard, see polymarket_bot.sharding); None takes all
+    condition_filter: Callable[[str], bool] | None = None
 
     # Health check
     max_message_age_seconds: float = 60.0
@@ -164,6 +189,7 @@ class IngestionService:
         config: Optional[IngestionConfig] = None,
         on_price_update: Optional[EventCallback] = None,
         db: Optional[Any] = None,
+        catalog: MarketCatalog | None = None,
     ):
         """
         Initialize the ingestion service.
@@ -172,10 +198,14 @@ class IngestionService:
             config: Service configuration
             on_price_update: Optional callback for price updates
             db: Optional database reference for health checking
+            catalog: Shared market catalog. When set, the token map and
+                subscriptions follow its change feed instead of the
+                service fetching markets itself.
         """
         self._config = config or IngestionConfig()
         self._external_callback = on_price_update
         self._db = db
+        self._catalog = catalog
 
         # State
         self._state = ServiceState.STOPPED
@@ -185,12 +215,14 @@ class IngestionService:
         # Components (created on start)
         self._rest_client: Optional[PolymarketRestClient] = None
         self._websocket: Optional[PolymarketWebSocket] = None
+        self._recorder: FrameRecorder | None = None
         self._processor: Optional[EventProcessor] = None
         self._metrics: Optional[MetricsCollector] = None
 
         # Dashboard app (created if enabled)
         self._dashboard_app = None
         self._dashboard_task: Optional[asyncio.Task] = None
+        self._loop_monitor: EventLoopLagMonitor | None = None
 
         # Background market fetch task (for remaining markets after startup)
         self._background_market_task: Optional[asyncio.Task] = None
@@ -277,6 +309,12 @@ class IngestionService:
                 config=processor_config,
             )
 
+            if self._config.record_dir:
+                self._recorder = FrameRecorder(
+                    self._config.record_dir,
+                    segment_bytes=self._config.record_segment_mb * 1024 * 1024,
+                )
+
             # Initialize WebSocket
             self._websocket = PolymarketWebSocket(
                 on_price_update=self._handle_price_update,
@@ -285,10 +323,15 @@ class IngestionService:
                 heartbeat_timeout=self._config.heartbeat_timeout,
                 max_reconnect_delay=self._config.max_reconnect_delay,
                 url=self._config.websocket_url,
+                recorder=self._recorder,
             )
 
-            # Fetch initial market data first (needed for subscribe_all)
-            await self._refresh_markets()
+            # Fetch initial market data first (needed for subscribe_all).
+            # With a catalog, markets arrive through _apply_catalog_changes.
+            if self._catalog is None:
+                await self._refresh_markets()
+            else:
+                self._load_catalog_snapshot()
 
             # Update processor with market lookup for question display
             if self._processor:
@@ -298,7 +341,8 @@ class IngestionService:
                 )
 
             # Start WebSocket
-            await self._websocket.start()
+            if self._config.connect_websocket:
+                await self._websocket.start()
 
             # Subscribe to markets
             if self._config.subscribe_all_markets:
@@ -317,9 +361,13 @@ class IngestionService:
             elif self._config.initial_token_ids:
                 await self._websocket.subscribe(self._config.initial_token_ids)
 
-            # Start dashboard if enabled
+            registry.add_collector("ingestion", self._collect_metrics)
+
+            # Start dashboard if enabled (standalone: it also serves /metrics)
             if self._config.dashboard_enabled:
                 await self._start_dashboard()
+                self._loop_monitor = EventLoopLagMonitor()
+                self._loop_monitor.start()
 
             self._state = ServiceState.RUNNING
             logger.info("Ingestion service started successfully")
@@ -327,10 +375,13 @@ class IngestionService:
             # Setup signal handlers
             self._setup_signal_handlers()
 
-            # If subscribe_all_markets is True, launch background task to
+            # With a catalog, follow its change feed. Otherwise, if
+            # subscribe_all_markets is True, launch background task to
             # fetch and subscribe to remaining markets (runs even if startup
             # limit=0 or errors occurred - allows recovery)
-            if self._config.subscribe_all_markets:
+            if self._catalog is not None:
+                self._catalog.subscribe(self._apply_catalog_changes)
+            elif self._config.subscribe_all_markets:
                 self._background_market_task = asyncio.create_task(
                     self._background_fetch_remaining_markets()
                 )
@@ -369,6 +420,14 @@ class IngestionService:
 
     async def _cleanup(self) -> None:
         """Clean up resources."""
+        registry.remove_collector("ingestion")
+        if self._loop_monitor is not None:
+            await self._loop_monitor.stop()
+            self._loop_monitor = None
+
+        if self._catalog is not None:
+            self._catalog.unsubscribe(self._apply_catalog_changes)
+
         # Cancel background market fetch task
         if self._background_market_task:
             self._background_market_task.cancel()
@@ -386,6 +445,13 @@ class IngestionService:
                 logger.warning(f"Error stopping WebSocket: {e}")
             self._websocket = None
 
+        if self._recorder:
+            self._recorder.close()
+            logger.info(
+                f"Recorded {self._recorder.frames} frames to {self._recorder.directory}"
+            )
+            self._recorder = None
+
         # Close REST client
         if self._rest_client:
             try:
@@ -403,6 +469,23 @@ class IngestionService:
                 pass
             self._dashboard_task = None
 
+    def _collect_metrics(self) -> None:
+        """Copy WebSocket and processor state into the metrics registry."""
+        ws = self._websocket
+        if ws is not None:
+            BUFFER_DEPTH.set(ws.buffer_depth)
+            WS_CONNECTED.set(1 if ws.state == WebSocketState.CONNECTED else 0)
+            WS_RECONNECTS.set(ws.reconnect_count)
+            WS_SUBSCRIBED.set(len(ws.subscribed_tokens))
+        if self._processor is not None:
+            stats = self._processor.stats
+            PROCESSED_EVENTS.labels("accepted").set(stats.total_accepted)
+            PROCESSED_EVENTS.labels("rejected").set(stats.total_rejected)
+            GOTCHA_EVENTS.labels("g1_filtered").set(stats.g1_filtered)
+            GOTCHA_EVENTS.labels("g3_backfilled").set(stats.g3_backfilled)
+            GOTCHA_EVENTS.labels("g3_failed").set(stats.g3_failed)
+            GOTCHA_EVENTS.labels("g5_flagged").set(stats.g5_flagged)
+
     def health(self) -> HealthStatus:
         """
         Get current health status.
@@ -601,6 +684,8 @@ class IngestionService:
 
                 for market in markets:
                     self._markets_cache[market.condition_id] = market
+                    if not self._owns(market.condition_id):
+                        continue
                     for token in market.tokens:
                         self._token_to_market[token.token_id] = market.condition_id
 
@@ -667,6 +752,8 @@ class IngestionService:
                 for market in markets:
                     if market.condition_id not in self._markets_cache:
                         self._markets_cache[market.condition_id] = market
+                        if not self._owns(market.condition_id):
+                            continue
                         new_markets.append(market)
                         for token in market.tokens:
                             if token.token_id not in self._token_to_market:
@@ -722,6 +809,67 @@ class IngestionService:
         except Exception as e:
             logger.error(f"Background market fetch failed: {e}")
 
+    def _load_catalog_snapshot(self) -> None:
+        """Seed the token map from markets the catalog already holds."""
+        for entry in self._catalog.markets.values():
+            self._markets_cache[entry.condition_id] = entry.market
+            if not self._owns(entry.condition_id):
+                continue
+            for token in entry.market.tokens:
+                self._token_to_market[token.token_id] = entry.condition_id
+
+    async def _apply_catalog_changes(self, changes: list[CatalogChange]) -> None:
+        """
+        MarketCatalog subscriber: apply market deltas.
+
+        Added markets get their tokens mapped, subscribed and persisted to
+        polymarket_token_meta; updated markets refresh the cached Market;
+        resolved markets are dropped and their tokens unsubscribed.
+        """
+        added_markets = []
+        new_tokens: list[str] = []
+        dropped_tokens: list[str] = []
+
+        for change in changes:
+            market = change.market.market
+            if change.kind == ChangeKind.RESOLVED:
+                self._markets_cache.pop(change.condition_id, None)
+                for token in market.tokens:
+                    if self._token_to_market.pop(token.token_id, None) is not None:
+                        dropped_tokens.append(token.token_id)
+                continue
+
+            self._markets_cache[change.condition_id] = market
+            if not self._owns(change.condition_id):
+                continue
+            if change.kind == ChangeKind.ADDED:
+                added_markets.append(market)
+            for token in market.tokens:
+                if token.token_id not in self._token_to_market:
+                    self._token_to_market[token.token_id] = change.condition_id
+                    new_tokens.append(token.token_id)
+
+        if added_markets:
+            await self._save_token_metadata(added_markets)
+
+        if self._config.subscribe_all_markets:
+            # Chunk subscriptions to avoid payload limits (100 tokens per chunk)
+            for i in range(0, len(new_tokens), 100):
+                await self.subscribe(new_tokens[i:i + 100])
+            if dropped_tokens:
+                await self.unsubscribe(dropped_tokens)
+
+        if new_tokens or dropped_tokens:
+            logger.debug(
+                f"Catalog: +{len(new_tokens)} / -{len(dropped_tokens)} tokens "
+                f"({len(self._token_to_market)} total)"
+            )
+
+    def _owns(self, condition_id: str) -> bool:
+        """Whether this service subscribes to the market (condition_filter)."""
+        condition_filter = self._config.condition_filter
+        return condition_filter is None or condition_filter(condition_id)
+
     async def _save_token_metadata(self, markets: list) -> None:
         """
         Persist token metadata to database for dashboard access.
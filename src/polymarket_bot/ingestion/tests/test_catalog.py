@@ -0,0 +1,286 @@
+"""
+Tests for the shared market catalog and its consumers.
+
+The API is mocked at PolymarketRestClient.get_market_page; parsing uses
+the real client parser.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from polymarket_bot.ingestion.catalog import ChangeKind, MarketCatalog, StoredMarketCatalog
+from polymarket_bot.ingestion.client import PolymarketAPIError, PolymarketRestClient
+from polymarket_bot.ingestion.service import IngestionConfig, IngestionService
+from polymarket_bot.storage.models import MarketCatalogEntry
+
+
+def gamma_market(
+    i: int, price: str = "0.6", updated: str = "2026-10-01T00:00:00Z", **extra
+) -> dict:
+    return {
+        "conditionId": f"0xcond{i}",
+        "question": f"Market {i}?",
+        "slug": f"market-{i}",
+        "clobTokenIds": json.dumps([f"yes{i}", f"no{i}"]),
+        "outcomes": json.dumps(["Yes", "No"]),
+        "outcomePrices": json.dumps([price, "0.4"]),
+        "endDate": "2026-12-31T00:00:00Z",
+        "updatedAt": updated,
+        "active": True,
+        "closed": False,
+        **extra,
+    }
+
+
+class FakeGamma:
+    """Serves `open_markets` for full walks and `recent` for updatedAt walks."""
+
+    def __init__(self, open_markets: list[dict], recent: list[dict] = ()):
+        self.open_markets = list(open_markets)
+        self.recent = list(recent)
+        self.calls: list[dict] = []
+        self.fail_offset = None
+
+    async def get_market_page(self, offset=0, limit=100, **filters):
+        self.calls.append({"offset": offset, **filters})
+        if offset == self.fail_offset:
+            raise PolymarketAPIError("Server error: 502")
+        items = self.recent if filters.get("order") == "updatedAt" else self.open_markets
+        return items[offset : offset + limit]
+
+
+class FakeCatalogTable:
+    """market_catalog in memory: apply_changes writes, changes_since reads."""
+
+    def __init__(self):
+        self.rows: dict[str, MarketCatalogEntry] = {}
+        self.seq = 0
+        self.reads = 0
+
+    def apply_changes(self, changes):
+        for change in changes:
+            self.seq += 1
+            self.rows[change.condition_id] = MarketCatalogEntry(
+                condition_id=change.condition_id,
+                seq=self.seq,
+                content_hash=change.market.content_hash,
+                resolved=change.kind == ChangeKind.RESOLVED,
+                payload=change.market.raw,
+            )
+
+    async def changes_since(self, seq, limit=1000):
+        self.reads += 1
+        rows = sorted((r for r in self.rows.values() if r.seq > seq), key=lambda r: r.seq)
+        return rows[:limit]
+
+
+@pytest.fixture
+def client():
+    return PolymarketRestClient()
+
+
+def make_catalog(client, gamma: FakeGamma, **kwargs) -> MarketCatalog:
+    client.get_market_page = gamma.get_market_page
+    return MarketCatalog(client, page_size=2, concurrency=2, **kwargs)
+
+
+class TestMarketCatalog:
+    """Tests for full and incremental refreshes."""
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_adds_every_open_market(self, client):
+        gamma = FakeGamma([gamma_market(i) for i in range(5)])
+        catalog = make_catalog(client, gamma)
+        received = []
+        catalog.subscribe(received.extend)
+
+        changes = await catalog.refresh()
+
+        assert [c.kind for c in changes] == [ChangeKind.ADDED] * 5
+        assert received == changes
+        assert [c.seq for c in changes] == [1, 2, 3, 4, 5]
+        assert catalog.get("0xcond0").token_ids == ["yes0", "no0"]
+        assert catalog.stats.markets == 5
+        assert catalog.stats.api_calls == 4  # Two windows of two pages
+
+    @pytest.mark.asyncio
+    async def test_full_refresh_publishes_only_deltas(self, client):
+        gamma = FakeGamma([gamma_market(i) for i in range(4)])
+        catalog = make_catalog(client, gamma)
+        await catalog.refresh()
+
+        gamma.open_markets = [gamma_market(0), gamma_market(1, price="0.7"), gamma_market(3)]
+        changes = await catalog.refresh(full=True)
+
+        assert {(c.kind, c.condition_id) for c in changes} == {
+            (ChangeKind.UPDATED, "0xcond1"),
+            (ChangeKind.RESOLVED, "0xcond2"),
+        }
+        assert "0xcond2" not in catalog.markets
+
+    @pytest.mark.asyncio
+    async def test_failed_walk_does_not_resolve_missing_markets(self, client):
+        gamma = FakeGamma([gamma_market(i) for i in range(6)])
+        catalog = make_catalog(client, gamma)
+        await catalog.refresh()
+
+        gamma.fail_offset = 2
+        changes = await catalog.refresh(full=True)
+
+        assert changes == []
+        assert len(catalog.markets) == 6
+        assert catalog.stats.page_errors == 1
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh_stops_at_watermark(self, client):
+        gamma = FakeGamma([gamma_market(i) for i in range(4)])
+        catalog = make_catalog(client, gamma)
+        await catalog.refresh()
+
+        gamma.recent = [
+            gamma_market(9, updated="2026-10-02T00:00:00Z"),
+            gamma_market(2, updated="2026-10-02T00:00:00Z", closed=True),
+        ] + [gamma_market(100 + i, updated="2026-09-01T00:00:00Z") for i in range(20)]
+        gamma.calls.clear()
+
+        changes = await catalog.refresh(full=False)
+
+        assert {(c.kind, c.condition_id) for c in changes} == {
+            (ChangeKind.ADDED, "0xcond9"),
+            (ChangeKind.RESOLVED, "0xcond2"),
+        }
+        # Third page is older than the watermark; the walk ends in window two
+        assert max(call["offset"] for call in gamma.calls) <= 6
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_block_others(self, client):
+        gamma = FakeGamma([gamma_market(0)])
+        catalog = make_catalog(client, gamma)
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        async_subscriber = AsyncMock()
+        catalog.subscribe(failing)
+        catalog.subscribe(async_subscriber)
+
+        await catalog.refresh()
+
+        async_subscriber.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried_next_refresh(self, client):
+        """A subscriber error (e.g. a DB blip) does not lose the changes."""
+        gamma = FakeGamma([gamma_market(0), gamma_market(1)])
+        catalog = make_catalog(client, gamma)
+        received = []
+        calls = {"n": 0}
+
+        def flaky(changes):
+            calls["n"] += 1
+            if calls["n"] <= 2:  # The walk's delivery and the end-of-refresh retry
+                raise RuntimeError("db down")
+            received.extend(changes)
+
+        catalog.subscribe(flaky)
+        await catalog.refresh()
+        assert received == []
+        assert catalog.stats.undelivered == 2
+
+        # Nothing changed upstream; the failed changes are redelivered anyway
+        gamma.open_markets[1] = gamma_market(1, price="0.7")
+        await catalog.refresh(full=True)
+
+        assert [(c.condition_id, c.kind) for c in received] == [
+            ("0xcond0", ChangeKind.ADDED),
+            ("0xcond1", ChangeKind.ADDED),
+        ]
+        assert received[1].market.raw["outcomePrices"] == json.dumps(["0.7", "0.4"])
+        assert catalog.stats.undelivered == 0
+
+
+class TestStoredMarketCatalog:
+    """Tests for a shard worker's catalog read from market_catalog."""
+
+    @pytest.mark.asyncio
+    async def test_follows_persisted_changes_for_its_shard(self, client):
+        gamma = FakeGamma([gamma_market(i) for i in range(4)])
+        catalog = make_catalog(client, gamma)
+        table = FakeCatalogTable()
+        catalog.subscribe(table.apply_changes)
+        stored = StoredMarketCatalog(
+            table,
+            PolymarketRestClient(),
+            condition_filter=lambda condition_id: condition_id != "0xcond2",
+            batch_size=2,
+        )
+        received = []
+        stored.subscribe(received.extend)
+
+        await catalog.refresh()
+        api_calls = len(gamma.calls)
+        changes = await stored.refresh()
+
+        assert [(c.condition_id, c.kind) for c in changes] == [
+            ("0xcond0", ChangeKind.ADDED),
+            ("0xcond1", ChangeKind.ADDED),
+            ("0xcond3", ChangeKind.ADDED),
+        ]
+        assert received == changes
+        assert stored.cursor == 4
+        assert table.reads == 3  # Two full batches, then an empty one
+        assert stored.get("0xcond0").token_ids == ["yes0", "no0"]
+
+        gamma.open_markets = [gamma_market(0, price="0.7"), gamma_market(2), gamma_market(3)]
+        await catalog.refresh(full=True)
+        changes = await stored.refresh()
+
+        assert {(c.condition_id, c.kind) for c in changes} == {
+            ("0xcond0", ChangeKind.UPDATED),
+            ("0xcond1", ChangeKind.RESOLVED),
+        }
+        assert set(stored.markets) == {"0xcond0", "0xcond3"}
+        assert len(gamma.calls) == api_calls + 2  # Only the coordinator's walk
+
+
+class TestIngestionCatalogConsumer:
+    """Tests for IngestionService._apply_catalog_changes."""
+
+    @pytest.mark.asyncio
+    async def test_token_map_follows_change_feed(self, client):
+        gamma = FakeGamma([gamma_market(0), gamma_market(1)])
+        catalog = make_catalog(client, gamma)
+        service = IngestionService(
+            config=IngestionConfig(subscribe_all_markets=True),
+            catalog=catalog,
+        )
+        service.subscribe = AsyncMock()
+        service.unsubscribe = AsyncMock()
+        catalog.subscribe(service._apply_catalog_changes)
+
+        await catalog.refresh()
+        gamma.open_markets = [gamma_market(1)]
+        await catalog.refresh(full=True)
+
+        assert service._token_to_market == {"yes1": "0xcond1", "no1": "0xcond1"}
+        assert set(service._markets_cache) == {"0xcond1"}
+        service.subscribe.assert_awaited_once_with(["yes0", "no0", "yes1", "no1"])
+        service.unsubscribe.assert_awaited_once_with(["yes0", "no0"])
+
+    @pytest.mark.asyncio
+    async def test_condition_filter_limits_subscriptions(self, client):
+        gamma = FakeGamma([gamma_market(0), gamma_market(1)])
+        catalog = make_catalog(client, gamma)
+        service = IngestionService(
+            config=IngestionConfig(
+                subscribe_all_markets=True,
+                condition_filter=lambda condition_id: condition_id == "0xcond1",
+            ),
+            catalog=catalog,
+        )
+        service.subscribe = AsyncMock()
+        catalog.subscribe(service._apply_catalog_changes)
+
+        await catalog.refresh()
+
+        assert service._token_to_market == {"yes1": "0xcond1", "no1": "0xcond1"}
+        service.subscribe.assert_awaited_once_with(["yes1", "no1"])
@@ -0,0 +1,165 @@
+"""
+Tests for WebSocket frame recording and replay.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from polymarket_bot.ingestion.replay import (
+    FrameRecorder,
+    RecordedFrame,
+    ReplayServer,
+    read_frames,
+    replay_frames,
+)
+from polymarket_bot.ingestion.service import IngestionConfig, IngestionService
+from polymarket_bot.ingestion.websocket import PolymarketWebSocket
+
+
+def price_frame(token_id: str, price: str) -> str:
+    return json.dumps([{"event_type": "price_change", "asset_id": token_id, "price": price}])
+
+
+def record_session(directory, count: int, interval: float = 0.01, **kwargs) -> FrameRecorder:
+    recorder = FrameRecorder(directory, **kwargs)
+    for i in range(count):
+        recorder.record(price_frame(f"tok{i}", "0.95"), received_at=1_000.0 + i * interval)
+    recorder.close()
+    return recorder
+
+
+class TestFrameRecorder:
+    """Tests for the segmented frame log."""
+
+    def test_round_trip_across_segments(self, tmp_path):
+        recorder = FrameRecorder(tmp_path, segment_bytes=200)
+        recorder.record("[]", received_at=1.5)
+        recorder.record(b"\x00\x01", received_at=2.5)
+        for i in range(10):
+            recorder.record(price_frame(f"tok{i}", "0.5"), received_at=3.0 + i)
+        recorder.close()
+
+        frames = list(read_frames(tmp_path))
+
+        assert len(list(tmp_path.glob("*.seg"))) > 1
+        assert frames[:2] == [RecordedFrame(1.5, "[]"), RecordedFrame(2.5, b"\x00\x01")]
+        assert [f.received_at for f in frames[2:]] == [3.0 + i for i in range(10)]
+        assert recorder.frames == 12
+
+    def test_new_session_after_deleted_segment(self, tmp_path):
+        """A new session starts after the highest segment, not at the file count."""
+        record_session(tmp_path, 1)
+        record_session(tmp_path, 1)
+        (tmp_path / "frames-000001.seg").unlink()
+
+        recorder = FrameRecorder(tmp_path)
+        recorder.record("[]", received_at=5.0)
+        recorder.close()
+
+        assert sorted(p.name for p in tmp_path.glob("*.seg")) == [
+            "frames-000002.seg",
+            "frames-000003.seg",
+        ]
+        assert list(read_frames(tmp_path))[-1] == RecordedFrame(5.0, "[]")
+        assert len(list(read_frames(tmp_path))) == 2
+
+    def test_truncated_tail_is_ignored(self, tmp_path):
+        record_session(tmp_path, 3)
+        [segment] = tmp_path.glob("*.seg")
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        assert len(list(read_frames(tmp_path))) == 2
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "frames-000001.seg"
+        path.write_bytes(b"not a recording")
+
+        with pytest.raises(ValueError):
+            list(read_frames(path))
+
+
+class TestReplayFrames:
+    """Tests for replay pacing."""
+
+    @pytest.mark.asyncio
+    async def test_speed_scales_recorded_timing(self, tmp_path):
+        record_session(tmp_path, 11, interval=0.02)  # 0.2s of traffic
+        received = []
+
+        async def sink(frame):
+            received.append(frame)
+
+        stats = await replay_frames(read_frames(tmp_path), sink, speed=4.0)
+
+        assert stats.frames == len(received) == 11
+        assert stats.recorded_seconds == pytest.approx(0.2)
+        assert 0.045 <= stats.elapsed_seconds < 0.2
+
+    @pytest.mark.asyncio
+    async def test_unpaced_replay_does_not_sleep(self, tmp_path):
+        record_session(tmp_path, 5, interval=60.0)
+
+        async def sink(frame):
+            pass
+
+        stats = await replay_frames(read_frames(tmp_path), sink, speed=None)
+
+        assert stats.frames == 5
+        assert stats.elapsed_seconds < 1.0
+
+
+class TestReplayThroughPipeline:
+    """Tests for both replay modes."""
+
+    @pytest.mark.asyncio
+    async def test_server_mode_feeds_real_client_and_recorder(self, tmp_path):
+        record_session(tmp_path / "in", 20)
+        updates = []
+
+        async def on_price(update):
+            updates.append(update)
+
+        async with ReplayServer(tmp_path / "in", speed=None) as server:
+            tee = FrameRecorder(tmp_path / "out")
+            ws = PolymarketWebSocket(on_price_update=on_price, url=server.url, recorder=tee)
+            await ws.start()
+            stats = await asyncio.wait_for(server.wait_done(), timeout=5)
+            for _ in range(50):
+                if len(updates) == 20:
+                    break
+                await asyncio.sleep(0.02)
+            await ws.drain()
+            await ws.stop()
+            tee.close()
+
+        assert stats.frames == 20
+        assert [u.token_id for u in updates] == [f"tok{i}" for i in range(20)]
+        assert [f.data for f in read_frames(tmp_path / "out")] == [
+            f.data for f in read_frames(tmp_path / "in")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_inject_mode_reaches_service_callback(self, tmp_path):
+        record_session(tmp_path, 3)
+        updates = []
+        service = IngestionService(
+            config=IngestionConfig(
+                connect_websocket=False,
+                dashboard_enabled=False,
+                startup_market_limit=0,
+                backfill_missing_size=False,
+                check_price_divergence=False,
+            ),
+            on_price_update=updates.append,
+        )
+
+        await service.start()
+        try:
+            stats = await replay_frames(read_frames(tmp_path), service.websocket.inject, speed=None)
+        finally:
+            await service.stop()
+
+        assert stats.frames == 3
+        assert [u.token_id for u in updates] == ["tok0", "tok1", "tok2"]
@@ -18,6 +18,8 @@ from typing import Optional
 
 import aiohttp
 
+from .catalog import CatalogChange, MarketCatalog
+
 
 def _to_naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
     """
@@ -316,10 +318,37 @@ class UniverseFetcher:
             logger.warning("No markets fetched")
             return 0
 
-        # Save to database
-        count = await self.universe_repo.upsert_batch(markets)
+        count = await self._save_markets(markets)
         logger.info(f"Updated {count} markets in universe")
 
+        # Sync resolutions from existing polymarket_resolutions table
+        await self._sync_resolutions()
+
+        return count
+
+    async def apply_changes(self, changes: list[CatalogChange]) -> int:
+        """
+        MarketCatalog subscriber: upsert only the markets that changed.
+
+        Returns count of markets updated.
+        """
+        markets = [
+            market
+            for change in changes
+            if (market := self._parse_market(change.market.raw)) is not None
+        ]
+        if not markets:
+            return 0
+
+        count = await self._save_markets(markets)
+        if any(m.is_resolved for m in markets):
+            await self._sync_resolutions()
+        return count
+
+    async def _save_markets(self, markets: list[MarketUniverse]) -> int:
+        """Upsert markets and record price snapshots for change calculation."""
+        count = await self.universe_repo.upsert_batch(markets)
+
         # Save price snapshots for change calculation
         now = datetime.utcnow()
         for m in markets:
@@ -332,9 +361,6 @@ class UniverseFetcher:
                 )
                 await self.universe_repo.save_price_snapshot(snapshot)
 
-        # Sync resolutions from existing polymarket_resolutions table
-        await self._sync_resolutions()
-
         return count
 
     async def _sync_resolutions(self) -> int:
@@ -403,7 +429,7 @@ class UniverseUpdater:
     Background task that periodically updates the market universe.
 
     Coordinates:
-    - Universe fetching (every 5 min)
+    - Universe fetching (every 5 min), or catalog deltas as they arrive
     - Score computation (every 15 min)
     - Tier promotion cycles (every 15 min)
     - Price change calculation (every 5 min)
@@ -416,12 +442,16 @@ class UniverseUpdater:
         universe_repo,
         fetch_interval: int = 300,  # 5 minutes
         tier_interval: int = 900,  # 15 minutes
+        catalog: MarketCatalog | None = None,
     ):
         self.fetcher = fetcher
         self.tier_manager = tier_manager
         self.universe_repo = universe_repo
         self.fetch_interval = fetch_interval
         self.tier_interval = tier_interval
+        # When set, market_universe follows the catalog's change feed and
+        # the fetcher's own full fetch is skipped
+        self.catalog = catalog
         self._running = False
         self._task: Optional[asyncio.Task] = None
 
@@ -431,12 +461,16 @@ class UniverseUpdater:
             return
 
         self._running = True
+        if self.catalog is not None:
+            self.catalog.subscribe(self.fetcher.apply_changes)
         self._task = asyncio.create_task(self._run_loop())
         logger.info("Universe updater started")
 
     async def stop(self):
         """Stop the background update loop."""
         self._running = False
+        if self.catalog is not None:
+            self.catalog.unsubscribe(self.fetcher.apply_changes)
         if self._task:
             self._task.cancel()
             try:
@@ -457,9 +491,10 @@ class UniverseUpdater:
 
                 # Fetch universe every fetch_interval
                 if now - last_fetch >= self.fetch_interval:
-                    logger.info("Fetching market universe...")
-                    count = await self.fetcher.update_universe()
-                    logger.info(f"Universe updated: {count} markets")
+                    if self.catalog is None:
+                        logger.info("Fetching market universe...")
+                        count = await self.fetcher.update_universe()
+                        logger.info(f"Universe updated: {count} markets")
                     last_fetch = now
 
                     # Compute price changes
@@ -576,8 +611,11 @@ class UniverseUpdater:
         - 1d candles: keep forever
         - Price snapshots: 30 days
         - Orderbook snapshots: 7 days
+        - Trades: 30 days (daily partitions dropped, future ones created)
+        - Resolved market_catalog rows: 7 days (when fed by a catalog)
         """
         try:
+            from polymarket_bot.storage.partitions import TradePartitionManager
             from polymarket_bot.storage.repositories.candle_repo import (
                 CandleRepository,
                 OrderbookRepository,
@@ -604,12 +642,28 @@ class UniverseUpdater:
             except (ValueError, IndexError):
                 snapshot_count = 0
 
-            total = candle_count + orderbook_count + snapshot_count
-            if total > 0:
+            # Trades: create upcoming partitions, drop expired ones
+            partitions = await TradePartitionManager(self.universe_repo.db).run_maintenance()
+
+            # Catalog change feed: resolved markets no consumer still needs
+            catalog_count = 0
+            if self.catalog is not None:
+                from polymarket_bot.storage.repositories.market_repo import (
+                    MarketCatalogRepository,
+                )
+
+                catalog_count = await MarketCatalogRepository(
+                    self.universe_repo.db
+                ).prune_resolved()
+
+            total = candle_count + orderbook_count + snapshot_count + catalog_count
+            if total > 0 or partitions.dropped:
                 logger.info(
                     f"Retention cleanup: {candle_count} candles, "
                     f"{orderbook_count} orderbook snapshots, "
-                    f"{snapshot_count} price snapshots deleted"
+                    f"{snapshot_count} price snapshots, "
+                    f"{catalog_count} resolved catalog markets deleted, "
+                    f"{len(partitions.dropped)} trade partitions dropped"
                 )
 
         except Exception as e:
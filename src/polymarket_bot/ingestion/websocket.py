@@ -18,10 +18,11 @@ import asyncio
 import json
 import logging
 import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Awaitable, Callable, Optional, Set
+from typing import TYPE_CHECKING, Optional, Set
 
 import websockets
 from websockets.exceptions import (
@@ -30,10 +31,23 @@ from websockets.exceptions import (
     ConnectionClosedOK,
 )
 
+from polymarket_bot.telemetry import registry
+from polymarket_bot.tracing import Stage, Trace, activate, deactivate, stamp, tracer
+
 from .models import PriceUpdate
 
+if TYPE_CHECKING:
+    from .replay import FrameRecorder
+
 logger = logging.getLogger(__name__)
 
+FRAMES_RECEIVED = registry.counter(
+    "polymarket_ws_frames_total", "WebSocket frames received (including injected)"
+)
+FRAMES_DROPPED = registry.counter(
+    "polymarket_ws_buffer_dropped_total", "Frames dropped because the event buffer was full"
+)
+
 
 class WebSocketState(str, Enum):
     """WebSocket connection state."""
@@ -87,6 +101,7 @@ class PolymarketWebSocket:
         max_reconnect_delay: float = 60.0,
         reconnect_multiplier: float = 2.0,
         url: Optional[str] = None,
+        recorder: FrameRecorder | None = None,
     ):
         """
         Initialize the WebSocket client.
@@ -100,11 +115,14 @@ class PolymarketWebSocket:
             max_reconnect_delay: Maximum delay between reconnect attempts
             reconnect_multiplier: Multiplier for exponential backoff
             url: Optional WebSocket URL override (defaults to Polymarket production)
+            recorder: Optional FrameRecorder that receives every raw frame
+                with its receive time (see ingestion.replay)
         """
         self._on_price_update = on_price_update
         self._on_state_change = on_state_change
         self._on_error = on_error
         self._url = url or self.WS_URL
+        self._recorder = recorder
 
         self._heartbeat_timeout = heartbeat_timeout
         self._initial_reconnect_delay = initial_reconnect_delay
@@ -127,8 +145,11 @@ class PolymarketWebSocket:
         self._processor_task: Optional[asyncio.Task] = None
         self._stop_event = asyncio.Event()
 
-        # Event buffer to decouple receive from processing
-        self._event_buffer: asyncio.Queue[str | bytes] = asyncio.Queue(maxsize=1000)
+        # Event buffer to decouple receive from processing; frames carry
+        # their latency trace (None unless sampled) across the queue
+        self._event_buffer: asyncio.Queue[tuple[str | bytes, Trace | None]] = (
+            asyncio.Queue(maxsize=1000)
+        )
 
         # Heartbeat tracking
         self._last_message_time: Optional[float] = None
@@ -158,6 +179,11 @@ class PolymarketWebSocket:
         """Unix timestamp of last received message."""
         return self._last_message_time
 
+    @property
+    def buffer_depth(self) -> int:
+        """Frames waiting in the event buffer."""
+        return self._event_buffer.qsize()
+
     async def _set_state(self, state: WebSocketState) -> None:
         """Update state and notify callback."""
         if self._state != state:
@@ -290,8 +316,17 @@ class PolymarketWebSocket:
                         self._ws.recv(),
                         timeout=self._heartbeat_timeout,
                     )
+                    trace = tracer.start()
+                    FRAMES_RECEIVED.inc()
                     self._last_message_time = time.time()
-                    self._enqueue_message(message)
+                    if self._recorder is not None:
+                        try:
+                            self._recorder.record(message, self._last_message_time)
+                        except OSError as e:
+                            # Recording must never take the live feed down
+                            logger.error(f"Frame recording disabled: {e}")
+                            self._recorder = None
+                    self._enqueue_message(message, trace)
 
                 except asyncio.TimeoutError:
                     # No message received within timeout - connection may be stale
@@ -332,20 +367,23 @@ class PolymarketWebSocket:
         if not self._stop_event.is_set():
             await self._schedule_reconnect()
 
-    def _enqueue_message(self, message: str | bytes) -> None:
+    def _enqueue_message(self, message: str | bytes, trace: Trace | None = None) -> None:
         """Add a message to the processing buffer without blocking."""
         if self._event_buffer.full():
             try:
                 self._event_buffer.get_nowait()
                 self._event_buffer.task_done()
+                FRAMES_DROPPED.inc()
                 logger.warning("Event buffer full - dropping oldest message")
             except asyncio.QueueEmpty:
+                FRAMES_DROPPED.inc()
                 logger.warning("Event buffer full - dropping incoming message")
                 return
 
         try:
-            self._event_buffer.put_nowait(message)
+            self._event_buffer.put_nowait((message, trace))
         except asyncio.QueueFull:
+            FRAMES_DROPPED.inc()
             logger.warning("Event buffer still full - dropping incoming message")
 
     async def _process_loop(self) -> None:
@@ -353,7 +391,7 @@ class PolymarketWebSocket:
         try:
             while not self._stop_event.is_set():
                 try:
-                    message = await asyncio.wait_for(
+                    message, trace = await asyncio.wait_for(
                         self._event_buffer.get(),
                         timeout=1.0,
                     )
@@ -361,7 +399,10 @@ class PolymarketWebSocket:
                     continue
 
                 try:
-                    await self._handle_message(message)
+                    if trace is None:
+                        await self._handle_message(message)
+                    else:
+                        await self._handle_traced(message, trace)
                 finally:
                     self._event_buffer.task_done()
 
@@ -419,6 +460,36 @@ class PolymarketWebSocket:
         if not self._stop_event.is_set():
             await self._connect()
 
+    async def inject(self, message: str | bytes) -> None:
+        """
+        Handle a raw frame as if it had been received, bypassing the socket.
+
+        Used by replay (ingestion.replay) to drive the pipeline offline.
+        Unlike the receive loop this awaits processing, so a replay runs
+        at the speed the pipeline can sustain instead of dropping frames.
+        """
+        trace = tracer.start()
+        FRAMES_RECEIVED.inc()
+        self._last_message_time = time.time()
+        if trace is None:
+            await self._handle_message(message)
+        else:
+            await self._handle_traced(message, trace)
+
+    async def drain(self) -> None:
+        """Wait until every buffered frame has been processed."""
+        await self._event_buffer.join()
+
+    async def _handle_traced(self, raw_message: str | bytes, trace: Trace) -> None:
+        """Handle a sampled frame with its trace bound to this task."""
+        trace.stamp(Stage.ENQUEUE)
+        token = activate(trace)
+        try:
+            await self._handle_message(raw_message)
+        finally:
+            deactivate(token)
+            tracer.finish(trace)
+
     async def _handle_message(self, raw_message: str | bytes) -> None:
         """Parse and handle a WebSocket message."""
         try:
@@ -436,6 +507,7 @@ class PolymarketWebSocket:
                 return
 
             data = json.loads(raw_message)
+            stamp(Stage.PARSE)
 
             # Handle list of events (Polymarket sends arrays)
             if isinstance(data, list):
@@ -23,7 +23,9 @@ Environment Variables:
     TELEGRAM_CHAT_ID          Telegram chat ID for alerts
     LOG_LEVEL                 Logging level (DEBUG/INFO/WARNING/ERROR)
     DRY_RUN                   Set to "true" for paper trading (default: true)
-    STRATEGY_NAME             Strategy to use from registry (default: high_prob_yes)
+    STRATEGY_NAME             Strategy to use from registry (default: high_prob_yes);
+                              comma-separated to run several in one engine
+    STRATEGY_THRESHOLDS       Per-strategy thresholds, e.g. "fast=0.90,slow=0.97"
     PRICE_THRESHOLD           Price threshold for triggers (default: 0.95)
     POSITION_SIZE             Position size in dollars (default: 20)
     MAX_POSITIONS             Maximum concurrent positions (default: 50)
@@ -33,6 +35,11 @@ Environment Variables:
     STOP_LOSS                 Stop loss exit price (default: 0.90)
     MIN_HOLD_DAYS             Days before applying exit strategy (default: 7)
     WATCHLIST_RESCORE_INTERVAL_HOURS  Interval for watchlist rescoring (default: 1.0)
+    ENGINE_WORKERS            Shard ingestion + evaluation over N worker
+                              processes (default: 0, single process)
+    WRITE_JOURNAL_PATH        Persist order/position changes through a local
+                              write-behind journal at this path (default:
+                              unset, write through to Postgres)
 
 Live Mode Requirements:
     When DRY_RUN=false, the bot requires:
@@ -45,6 +52,13 @@ Services:
     - ingestion: WebSocket connection, market data sync
     - engine: Trading logic, strategy evaluation
     - monitor: Health checks, dashboard, alerts
+
+Sharded mode (ENGINE_WORKERS / --workers N, with --mode all):
+    N worker processes each subscribe to and evaluate a consistent-hash
+    shard of markets; this process (the coordinator) executes the entry
+    and exit signals they forward, walks the market catalog they read
+    from market_catalog, and runs the dashboard and background tasks.
+    See polymarket_bot.sharding.
 """
 
 from __future__ import annotations
@@ -56,14 +70,23 @@ import fcntl
 import json
 import logging
 import os
+import shutil
 import signal
+import tempfile
 import sys
+from collections.abc import Generator
 from contextlib import contextmanager
 from datetime import datetime, timezone
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Optional, Generator
+from typing import TYPE_CHECKING, Any, Optional
+
+from polymarket_bot.telemetry import EventLoopLagMonitor, registry
+from polymarket_bot.tracing import Stage, stamp, tracer
+
+if TYPE_CHECKING:
+    from polymarket_bot.core import EngineConfig
 
 # Configure logging before imports
 LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
@@ -77,6 +100,9 @@ logger = logging.getLogger(__name__)
 # Default PID file location
 DEFAULT_PID_FILE = "/tmp/polymarket-bot.pid"
 
+# Hot pool size of a shard worker (the coordinator keeps DatabaseConfig's)
+WORKER_DB_CONNECTIONS = 3
+
 
 class SingletonBotError(Exception):
     """Raised when another bot instance is already running."""
@@ -164,7 +190,8 @@ class BotConfig:
     database_url: str = ""
 
     # Strategy (generic bot - configurable strategy)
-    strategy_name: str = "high_prob_yes"  # Default strategy
+    strategy_name: str = "high_prob_yes"  # Default strategy (comma-separated for several)
+    strategy_thresholds: dict = field(default_factory=dict)  # name -> Decimal
 
     # Trading parameters
     dry_run: bool = True
@@ -185,6 +212,13 @@ class BotConfig:
     # Ingestion
     websocket_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
     max_trade_age_seconds: int = 300  # G1 protection
+    ws_record_dir: str | None = None  # Tee raw WS frames here for replay
+
+    # Sharding (see polymarket_bot.sharding); 0 = single process
+    engine_workers: int = 0
+
+    # Write-behind journal (see polymarket_bot.execution.journal); "" = write through
+    write_journal_path: str = ""
 
     # Monitoring - See G11 in docs/reference/known_gotchas.md for Docker/Tailscale setup
     # Set DASHBOARD_HOST=0.0.0.0 to expose on network (required for Docker/Tailscale)
@@ -192,6 +226,10 @@ class BotConfig:
     dashboard_host: str = "0.0.0.0"  # 0.0.0.0 for Docker/Tailscale, 127.0.0.1 for local only
     dashboard_port: int = 9050  # Use a port FREE on host (not 5050, often in use)
 
+    # Latency tracing (see polymarket_bot.tracing); 1 in N frames, 0 = off
+    trace_sample_rate: int = 0
+    trace_buffer_size: int = 1000
+
     # Alerts
     telegram_bot_token: Optional[str] = None
     telegram_chat_id: Optional[str] = None
@@ -225,9 +263,14 @@ class BotConfig:
             min_hold_days=int(os.environ.get("MIN_HOLD_DAYS", "7")),
             watchlist_rescore_interval_hours=float(os.environ.get("WATCHLIST_RESCORE_INTERVAL_HOURS", "1.0")),
             max_trade_age_seconds=int(os.environ.get("MAX_TRADE_AGE_SECONDS", "300")),
+            ws_record_dir=os.environ.get("WS_RECORD_DIR") or None,
+            engine_workers=int(os.environ.get("ENGINE_WORKERS", "0")),
+            write_journal_path=os.environ.get("WRITE_JOURNAL_PATH", ""),
             dashboard_enabled=os.environ.get("DASHBOARD_ENABLED", "true").lower() == "true",
             dashboard_host=os.environ.get("DASHBOARD_HOST", "0.0.0.0"),
             dashboard_port=int(os.environ.get("DASHBOARD_PORT", "9050")),
+            trace_sample_rate=int(os.environ.get("TRACE_SAMPLE_RATE", "0")),
+            trace_buffer_size=int(os.environ.get("TRACE_BUFFER_SIZE", "1000")),
             telegram_bot_token=os.environ.get("TELEGRAM_BOT_TOKEN"),
             telegram_chat_id=os.environ.get("TELEGRAM_CHAT_ID"),
             sync_positions_on_startup=os.environ.get("SYNC_POSITIONS_ON_STARTUP", "true").lower() == "true",
@@ -247,8 +290,22 @@ class BotConfig:
             except Exception as e:
                 logger.warning(f"Failed to load credentials: {e}")
 
+        config.strategy_thresholds = {
+            name.strip(): Decimal(value)
+            for name, _, value in (
+                item.partition("=")
+                for item in os.environ.get("STRATEGY_THRESHOLDS", "").split(",")
+                if item.strip()
+            )
+        }
+
         return config
 
+    @property
+    def strategy_names(self) -> list[str]:
+        """Configured strategy names, primary first."""
+        return [name.strip() for name in self.strategy_name.split(",") if name.strip()]
+
 
 class TradingBot:
     """
@@ -259,10 +316,20 @@ class TradingBot:
     - Ingestion service (WebSocket, REST)
     - Trading engine (strategy evaluation)
     - Monitoring (health, alerts, dashboard)
+
+    As a shard worker (shard set), it runs ingestion and the engine for
+    its shard only and forwards entry signals to the coordinator.
     """
 
-    def __init__(self, config: BotConfig):
+    def __init__(
+        self,
+        config: BotConfig,
+        shard: int | None = None,
+        channel_path: str | None = None,
+    ):
         self.config = config
+        self._shard = shard
+        self._channel_path = channel_path
         self._running = False
         self._shutdown_event = asyncio.Event()
         self._started_at = None
@@ -271,7 +338,7 @@ class TradingBot:
         self._db = None
         self._ingestion = None
         self._engine = None
-        self._strategy = None
+        self._strategies: list = []
         self._execution_service = None
         self._background_tasks = None
         self._health_checker = None
@@ -283,18 +350,31 @@ class TradingBot:
         self._clob_client = None
         # Tiered Data Architecture
         self._universe_updater = None
+        # Shared market list (one fetcher for ingestion + universe + explorer)
+        self._market_catalog = None
+        self._catalog_client = None
+        self._loop_monitor = EventLoopLagMonitor()
+        # Sharding: ring + channel client (worker), server + pool (coordinator)
+        self._ring = None
+        self._signal_client = None
+        self._signal_server = None
+        self._workers = None
+        self._channel_dir = None
 
     async def start(self, mode: str = "all") -> None:
         """
         Start the trading bot.
 
         Args:
-            mode: "all", "ingestion", "engine", or "monitor"
+            mode: "all", "ingestion", "engine", "monitor", or "worker"
+                (a shard worker; set by run_shard_worker)
         """
         logger.info("=" * 60)
         logger.info("POLYMARKET TRADING BOT")
         logger.info("=" * 60)
         logger.info(f"Mode: {mode.upper()}")
+        if mode == "worker":
+            logger.info(f"Shard: {self._shard + 1}/{self.config.engine_workers}")
         logger.info(f"Trading: {'DRY RUN' if self.config.dry_run else 'LIVE'}")
         logger.info("=" * 60)
 
@@ -305,6 +385,14 @@ class TradingBot:
         # Setup signal handlers FIRST to catch early signals
         self._setup_signal_handlers()
 
+        # With workers, ingestion lives in the shard processes
+        sharded = mode == "all" and self.config.engine_workers > 0
+        run_ingestion = mode in ("all", "ingestion", "worker") and not sharded
+
+        tracer.configure(self.config.trace_sample_rate, self.config.trace_buffer_size)
+        if tracer.enabled:
+            logger.info(f"Latency tracing: 1 in {tracer.sample_rate} frames")
+
         try:
             # Always initialize database
             await self._init_database()
@@ -315,15 +403,19 @@ class TradingBot:
                 return
 
             # Initialize engine BEFORE ingestion so we don't lose early events
-            if mode in ("all", "engine"):
+            if mode in ("all", "engine", "worker"):
                 await self._init_engine()
 
             if self._shutdown_event.is_set():
                 logger.info("Shutdown requested during startup")
                 return
 
+            # Market catalog feeds both ingestion and the universe updater
+            if mode in ("all", "ingestion", "worker"):
+                await self._init_market_catalog()
+
             # Initialize ingestion AFTER engine is ready
-            if mode in ("all", "ingestion"):
+            if run_ingestion:
                 await self._init_ingestion()
 
             if self._shutdown_event.is_set():
@@ -334,6 +426,10 @@ class TradingBot:
             if mode in ("all", "ingestion"):
                 await self._init_universe_updater()
 
+            # Start fetching once every catalog subscriber is registered
+            if self._market_catalog:
+                await self._market_catalog.start()
+
             if self._shutdown_event.is_set():
                 logger.info("Shutdown requested during startup")
                 return
@@ -349,6 +445,11 @@ class TradingBot:
             if mode in ("all", "engine"):
                 await self._init_background_tasks()
 
+            if sharded:
+                await self._init_shards()
+
+            self._init_metrics()
+
             logger.info("=" * 60)
             logger.info("Bot started successfully")
             logger.info("Press Ctrl+C to stop")
@@ -372,13 +473,42 @@ class TradingBot:
         self._running = False
         self._shutdown_event.set()
 
+        registry.remove_collector("bot")
+        await self._loop_monitor.stop()
+
         # Stop components in reverse order
+        # Alerts first: they may share the market catalog's HTTP session
+        if self._alert_manager:
+            try:
+                await self._alert_manager.stop()
+            except Exception as e:
+                logger.warning(f"Error stopping alerts: {e}")
+
+        if self._workers:
+            try:
+                await asyncio.to_thread(self._workers.stop)
+                await self._signal_server.stop()
+                shutil.rmtree(self._channel_dir, ignore_errors=True)
+            except Exception as e:
+                logger.warning(f"Error stopping shard workers: {e}")
+
+        if self._signal_client:
+            await self._signal_client.close()
+
         if self._background_tasks:
             try:
                 await self._background_tasks.stop()
             except Exception as e:
                 logger.warning(f"Error stopping background tasks: {e}")
 
+        if self._market_catalog:
+            try:
+                await self._market_catalog.stop()
+                if self._catalog_client:
+                    await self._catalog_client.close()
+            except Exception as e:
+                logger.warning(f"Error stopping market catalog: {e}")
+
         if self._universe_updater:
             try:
                 await self._universe_updater.stop()
@@ -400,10 +530,18 @@ class TradingBot:
         # Stop dashboard before database (dashboard may need DB during shutdown)
         if self._dashboard:
             try:
+                await self._dashboard.stop_snapshots()
                 self._stop_dashboard()
             except Exception as e:
                 logger.warning(f"Error stopping dashboard: {e}")
 
+        # Journal after everything that executes, before the database
+        if self._execution_service:
+            try:
+                await self._execution_service.close()
+            except Exception as e:
+                logger.warning(f"Error closing execution journal: {e}")
+
         if self._db:
             try:
                 await self._db.close()
@@ -427,7 +565,18 @@ class TradingBot:
         if not self.config.database_url:
             raise ValueError("DATABASE_URL environment variable is required")
 
-        db_config = DatabaseConfig(url=self.config.database_url)
+        if self._shard is None:
+            db_config = DatabaseConfig(url=self.config.database_url)
+        else:
+            # A worker only evaluates: dedup reads, watchlist and token
+            # metadata writes. Keep K workers from multiplying the pools.
+            db_config = DatabaseConfig(
+                url=self.config.database_url,
+                min_connections=1,
+                max_connections=WORKER_DB_CONNECTIONS,
+                background_max_connections=1,
+                reporting_max_connections=0,
+            )
         self._db = Database(db_config)
         await self._db.initialize()
 
@@ -450,17 +599,58 @@ class TradingBot:
             dashboard_enabled=False,  # Dashboard runs separately
             subscribe_all_markets=True,
             backfill_missing_size=False,  # Disabled: /trades endpoint requires auth
+            record_dir=self.config.ws_record_dir,
+            condition_filter=self._owns_condition if self._shard is not None else None,
         )
 
         self._ingestion = IngestionService(
             config=ingestion_config,
             on_price_update=self._handle_price_update,
-            db=self._db,
+            db=self._db.workload("background"),
+            catalog=self._market_catalog,
         )
 
         await self._ingestion.start()
         logger.info("Ingestion: Started")
 
+    async def _init_market_catalog(self) -> None:
+        """Initialize the shared market catalog.
+
+        One rate-limited fetcher of the Polymarket market list. Ingestion and
+        the universe updater subscribe to its change feed; changes are also
+        persisted to market_catalog for the explorer sync and shard workers,
+        which follow that table for their own markets instead of walking
+        the API.
+        """
+        from polymarket_bot.ingestion import (
+            MarketCatalog,
+            PolymarketRestClient,
+            StoredMarketCatalog,
+        )
+        from polymarket_bot.storage import MarketCatalogRepository
+
+        if self._shard is not None:
+            self._market_catalog = StoredMarketCatalog(
+                MarketCatalogRepository(self._db.workload("background")),
+                PolymarketRestClient(),  # Parses stored payloads only
+                condition_filter=self._owns_condition,
+            )
+            logger.info(f"Market Catalog: Following market_catalog (shard {self._shard})")
+            return
+
+        self._catalog_client = PolymarketRestClient(rate_limit=5.0)
+        await self._catalog_client.__aenter__()
+
+        self._market_catalog = MarketCatalog(
+            self._catalog_client,
+            refresh_interval=60,        # incremental (updatedAt watermark)
+            full_refresh_interval=900,  # full walk, detects delisted markets
+        )
+        self._market_catalog.subscribe(
+            MarketCatalogRepository(self._db.workload("background")).apply_changes
+        )
+        logger.info("Market Catalog: Initialized")
+
     async def _init_universe_updater(self) -> None:
         """Initialize the tiered data architecture universe updater.
 
@@ -476,10 +666,12 @@ class TradingBot:
         from polymarket_bot.ingestion.universe_fetcher import UniverseFetcher, UniverseUpdater
         from polymarket_bot.core.tier_manager import TierManager
 
-        # Create repositories
-        universe_repo = MarketUniverseRepository(self._db)
-        position_repo = PositionRepository(self._db)
-        order_repo = LiveOrderRepository(self._db)
+        # Create repositories (background pool: bulk upserts must not hold
+        # up the trading path)
+        background_db = self._db.workload("background")
+        universe_repo = MarketUniverseRepository(background_db)
+        position_repo = PositionRepository(background_db)
+        order_repo = LiveOrderRepository(background_db)
 
         # Create tier manager
         tier_manager = TierManager(
@@ -498,6 +690,7 @@ class TradingBot:
             universe_repo=universe_repo,
             fetch_interval=300,  # 5 minutes
             tier_interval=900,   # 15 minutes
+            catalog=self._market_catalog,
         )
 
         await self._universe_updater.start()
@@ -505,7 +698,7 @@ class TradingBot:
 
     async def _init_engine(self) -> None:
         """Initialize trading engine with strategy and execution service."""
-        from polymarket_bot.core import TradingEngine, EngineConfig
+        from polymarket_bot.core import TradingEngine
         from polymarket_bot.execution import ExecutionService, ExecutionConfig
         from polymarket_bot.strategies import (
             get_default_registry,
@@ -521,8 +714,9 @@ class TradingBot:
             registry.register(HighProbYesStrategy())
 
         try:
-            self._strategy = registry.get(self.config.strategy_name)
-            logger.info(f"Strategy: Loaded '{self._strategy.name}'")
+            self._strategies = [registry.get(name) for name in self.config.strategy_names]
+            for strategy in self._strategies:
+                logger.info(f"Strategy: Loaded '{strategy.name}'")
         except StrategyNotFoundError:
             available = registry.list_all()
             logger.error(
@@ -531,6 +725,10 @@ class TradingBot:
             )
             raise
 
+        if self._shard is not None:
+            await self._init_worker_engine()
+            return
+
         # Initialize CLOB client
         if not self.config.dry_run:
             # LIVE MODE: Require credentials
@@ -561,8 +759,12 @@ class TradingBot:
 
         # max_price allows for G5-approved deviation above trigger threshold
         # If we trigger at 0.95 and allow 0.10 deviation, max_price should be min(1.05, 1.0) = 1.0
+        # With several strategies, the highest threshold bounds the price
+        highest_threshold = max(
+            [self.config.price_threshold, *self.config.strategy_thresholds.values()]
+        )
         max_price = min(
-            self.config.price_threshold + self.config.max_price_deviation,
+            highest_threshold + self.config.max_price_deviation,
             Decimal("1.0"),
         )
         exec_config = ExecutionConfig(
@@ -575,6 +777,7 @@ class TradingBot:
             wallet_address=wallet_address,
             sync_positions_on_startup=self.config.sync_positions_on_startup,
             startup_sync_hold_policy=self.config.startup_sync_hold_policy,
+            journal_path=self.config.write_journal_path or None,
         )
 
         self._execution_service = ExecutionService(
@@ -588,9 +791,25 @@ class TradingBot:
         open_positions = self._execution_service.get_open_positions()
         logger.info(f"Execution: Loaded {len(open_positions)} open positions")
 
-        # Create engine config
-        engine_config = EngineConfig(
+        # Create TradingEngine with strategy and execution service
+        self._engine = TradingEngine(
+            config=self._engine_config(),
+            db=self._db,
+            strategies=self._strategies,
+            api_client=self._clob_client,
+            execution_service=self._execution_service,
+        )
+
+        await self._engine.start()
+        logger.info(f"Engine: Started (mode={'DRY RUN' if self.config.dry_run else 'LIVE'})")
+
+    def _engine_config(self) -> EngineConfig:
+        """EngineConfig from the bot config (shared by coordinator and workers)."""
+        from polymarket_bot.core import EngineConfig
+
+        return EngineConfig(
             price_threshold=self.config.price_threshold,
+            strategy_thresholds=dict(self.config.strategy_thresholds),
             position_size=self.config.position_size,
             max_positions=self.config.max_positions,
             dry_run=self.config.dry_run,
@@ -598,17 +817,92 @@ class TradingBot:
             max_trade_age_seconds=self.config.max_trade_age_seconds,
         )
 
-        # Create TradingEngine with strategy and execution service
+    async def _init_worker_engine(self) -> None:
+        """
+        Engine for a shard worker: evaluation only.
+
+        No CLOB client or ExecutionService; entry and exit signals go to
+        the coordinator, whose engine applies G5, G2 and max positions.
+        """
+        from polymarket_bot.core import TradingEngine
+        from polymarket_bot.sharding import ShardRing, SignalClient
+
+        self._ring = ShardRing(self.config.engine_workers)
+        self._signal_client = SignalClient(self._channel_path, self._shard)
+
         self._engine = TradingEngine(
-            config=engine_config,
+            config=self._engine_config(),
             db=self._db,
-            strategy=self._strategy,
-            api_client=self._clob_client,
-            execution_service=self._execution_service,
+            strategies=self._strategies,
+            entry_sink=self._signal_client.send_entry,
+            exit_sink=self._signal_client.send_exit,
         )
-
         await self._engine.start()
-        logger.info(f"Engine: Started (mode={'DRY RUN' if self.config.dry_run else 'LIVE'})")
+        logger.info(f"Engine: Started (shard {self._shard}, entries -> {self._channel_path})")
+
+    def _owns_condition(self, condition_id: str) -> bool:
+        """Whether this shard worker owns a market."""
+        return self._ring.owns(self._shard, condition_id)
+
+    async def _init_shards(self) -> None:
+        """Start the entry channel and the shard worker processes."""
+        from polymarket_bot.sharding import SignalServer, WorkerPool
+
+        self._channel_dir = tempfile.mkdtemp(prefix="polymarket-shards-")
+        channel_path = os.path.join(self._channel_dir, "entries.sock")
+        self._signal_server = SignalServer(channel_path, self._handle_shard_message)
+        await self._signal_server.start()
+
+        self._workers = WorkerPool(
+            run_shard_worker,
+            (self.config, channel_path),
+            self.config.engine_workers,
+        )
+        self._workers.start()
+
+    async def _handle_shard_message(self, message) -> None:
+        """Execute a signal forwarded by a shard worker."""
+        from polymarket_bot.sharding import ExitMessage
+
+        if not self._running or not self._engine:
+            return
+
+        if isinstance(message, ExitMessage):
+            await self._engine.submit_exit(
+                message.signal, message.context, message.strategy
+            )
+        else:
+            await self._handle_shard_entry(message)
+
+    async def _handle_shard_entry(self, message) -> None:
+        """Execute an entry signal; alert only if it was executed."""
+        signal = message.signal
+        executed = await self._engine.submit_entry(
+            signal,
+            message.context,
+            message.event,
+            message.strategy,
+            message.threshold,
+        )
+        if not executed:
+            return
+
+        if self._dashboard:
+            self._dashboard.broadcast_event({
+                "type": "signal",
+                "signal_type": signal.type.value,
+                "token_id": signal.token_id,
+                "position_id": None,
+                "reason": signal.reason,
+            })
+
+        if self._alert_manager:
+            self._alert_manager.alert_trade_executed(
+                token_id=signal.token_id,
+                side="BUY",
+                price=signal.price,
+                size=self.config.position_size,
+            )
 
     async def _init_monitoring(self) -> None:
         """Initialize monitoring components."""
@@ -626,12 +920,14 @@ class TradingBot:
             clob_client=self._clob_client,
         )
 
-        # Alert manager
+        # Alert manager (async delivery, sharing the catalog's HTTP session)
         if self.config.telegram_bot_token and self.config.telegram_chat_id:
             self._alert_manager = AlertManager(
                 telegram_bot_token=self.config.telegram_bot_token,
                 telegram_chat_id=self.config.telegram_chat_id,
+                session=self._catalog_client.session if self._catalog_client else None,
             )
+            await self._alert_manager.start()
             logger.info("Alerts: Telegram configured")
         else:
             self._alert_manager = AlertManager()  # No-op alerts
@@ -639,7 +935,7 @@ class TradingBot:
 
         # Metrics collector
         self._metrics_collector = MetricsCollector(
-            db=self._db,
+            db=self._db.workload("reporting"),
             clob_client=self._clob_client,
         )
 
@@ -650,7 +946,7 @@ class TradingBot:
                 event_loop = asyncio.get_running_loop()
 
                 self._dashboard = Dashboard(
-                    db=self._db,
+                    db=self._db.workload("reporting"),
                     health_checker=self._health_checker,
                     metrics_collector=self._metrics_collector,
                     event_loop=event_loop,
@@ -662,6 +958,7 @@ class TradingBot:
                 )
                 await self._dashboard.ensure_control_tables()
                 await self._dashboard.load_blocklist()
+                await self._dashboard.start_snapshots()
                 if self._execution_service:
                     self._execution_service.set_event_sink(self._dashboard.broadcast_event)
                 self._start_dashboard()
@@ -737,6 +1034,49 @@ class TradingBot:
                     logger.warning("Dashboard thread did not stop cleanly")
             self._dashboard_thread = None
 
+    def _init_metrics(self) -> None:
+        """Expose component stats on /metrics (see polymarket_bot.telemetry)."""
+        registry.add_collector("bot", self._collect_metrics)
+        self._loop_monitor.start()
+
+    def _collect_metrics(self) -> None:
+        """Copy engine, execution and alert state into the metrics registry."""
+        if self._engine:
+            stats = self._engine.stats
+            for stat in fields(stats):
+                registry.counter(
+                    f"polymarket_engine_{stat.name}_total", f"Engine {stat.name.replace('_', ' ')}"
+                ).set(getattr(stats, stat.name))
+            rejections = registry.counter(
+                "polymarket_pipeline_rejections_total", "Pipeline rejections by stage", ("stage",)
+            )
+            for stage, count in self._engine.pipeline_tracker.get_stats()["totals"].items():
+                rejections.labels(stage).set(count)
+
+        if self._execution_service:
+            registry.gauge("polymarket_open_positions", "Open positions").set(
+                len(self._execution_service.get_open_positions())
+            )
+            registry.gauge("polymarket_open_orders", "Open orders").set(
+                len(self._execution_service.get_open_orders())
+            )
+
+        if self._workers:
+            registry.gauge("polymarket_shard_workers_alive", "Shard worker processes running").set(
+                self._workers.alive()
+            )
+            registry.counter("polymarket_shard_entries_total", "Entry signals received from shards").set(
+                self._signal_server.received
+            )
+            registry.counter("polymarket_shard_worker_restarts_total", "Shard worker restarts").set(
+                self._workers.restarts
+            )
+
+        if self._alert_manager:
+            registry.counter("polymarket_alerts_sent_total", "Alerts delivered").set(
+                self._alert_manager.get_alert_stats()["total_sent"]
+            )
+
     async def _init_background_tasks(self) -> None:
         """Initialize background task manager."""
         from polymarket_bot.core import BackgroundTasksManager, BackgroundTaskConfig
@@ -754,12 +1094,19 @@ class TradingBot:
             position_sync_interval_seconds=self.config.position_sync_interval_seconds,
             full_position_sync_interval_seconds=self.config.full_position_sync_interval_seconds,
             full_position_sync_enabled=self.config.position_sync_enabled,
+            # The engine runs its own ScoreService; the db is passed for
+            # pipeline stats persistence only
+            score_refresh_enabled=False,
+            pipeline_stats_flush_enabled=True,
         )
 
         # Create price fetcher using ingestion layer if available
+        # (sharded: ingestion runs in the workers; the catalog client serves)
         price_fetcher = None
         if self._ingestion and hasattr(self._ingestion, 'rest_client'):
             price_fetcher = self._create_price_fetcher()
+        elif self._catalog_client:
+            price_fetcher = self._create_price_fetcher()
 
         # Create PositionSyncService for external trade detection
         position_sync_service = None
@@ -773,7 +1120,7 @@ class TradingBot:
                     position_tracker = self._execution_service._position_tracker
 
                 position_sync_service = PositionSyncService(
-                    db=self._db,
+                    db=self._db.workload("background"),
                     position_tracker=position_tracker,
                 )
                 logger.info(
@@ -794,6 +1141,7 @@ class TradingBot:
             price_fetcher=price_fetcher,
             position_sync_service=position_sync_service,
             wallet_address=wallet_address,
+            db=self._db.workload("background"),
         )
 
         await self._background_tasks.start()
@@ -806,10 +1154,13 @@ class TradingBot:
         async def fetch_prices(token_ids: list) -> dict:
             """Fetch current prices for given token IDs."""
             prices = {}
-            if not self._ingestion or not hasattr(self._ingestion, 'rest_client'):
+            if self._ingestion and hasattr(self._ingestion, 'rest_client'):
+                client = self._ingestion.rest_client
+            elif self._catalog_client:
+                client = self._catalog_client
+            else:
                 return prices
 
-            client = self._ingestion.rest_client
             for token_id in token_ids:
                 try:
                     price = await client.get_price(token_id)
@@ -893,6 +1244,7 @@ class TradingBot:
                 "price": str(update.price),
                 "timestamp": update.timestamp.timestamp() if update.timestamp else None,
             }
+            stamp(Stage.PRICE_UPDATE)
 
             signal = await self._engine.process_event(event)
 
@@ -943,6 +1295,9 @@ class TradingBot:
                 except asyncio.TimeoutError:
                     pass  # Continue with health checks
 
+                if self._workers:
+                    self._workers.check()
+
                 # Periodic health check
                 if self._health_checker:
                     from polymarket_bot.monitoring import HealthStatus
@@ -997,6 +1352,18 @@ class TradingBot:
             pass
 
 
+def run_shard_worker(
+    config: BotConfig, channel_path: str, shard: int, shard_count: int
+) -> None:
+    """Entry point of a shard worker process (see WorkerPool)."""
+    config.engine_workers = shard_count
+    bot = TradingBot(config, shard=shard, channel_path=channel_path)
+    try:
+        asyncio.run(bot.start(mode="worker"))
+    except KeyboardInterrupt:
+        pass
+
+
 def load_env_file(path: str = ".env") -> None:
     """Load environment variables from .env file if it exists."""
     env_path = Path(path)
@@ -1029,6 +1396,12 @@ def parse_args() -> argparse.Namespace:
         default="all",
         help="Which services to run (default: all)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Shard ingestion and evaluation over N worker processes "
+             "(overrides ENGINE_WORKERS; --mode all only)",
+    )
     parser.add_argument(
         "--config",
         type=str,
@@ -1050,6 +1423,8 @@ async def main_async(args: argparse.Namespace) -> int:
     # Override with command line args
     if args.dry_run:
         config.dry_run = True
+    if args.workers is not None:
+        config.engine_workers = args.workers
 
     # Validate configuration
     if not config.database_url:
@@ -2,18 +2,54 @@
 Alert Manager for Telegram notifications.
 
 Sends alerts with deduplication to prevent spam.
+
+Once start() has been awaited, send_alert only enqueues: a background task
+delivers through aiohttp, so a slow Telegram API never stalls the trading
+loop. Alerts that pile up while it waits for a send slot go out as one
+digest message, cut between alerts at Telegram's length limit (the rest
+lead the next digest). Sends are spaced to Telegram's per-chat limits and
+retried with backoff (honouring 429 retry_after); a message Telegram
+rejects with 400 (e.g. Markdown broken by truncation) is resent as plain
+text. A full queue drops the alert.
+Without start() (scripts, tests) alerts are delivered inline.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, Optional
 
+from polymarket_bot.telemetry import registry
+
 logger = logging.getLogger(__name__)
 
+ALERT_RESULTS = registry.counter(
+    "polymarket_alert_results_total", "Alerts by delivery result", ("result",)
+)
+ALERT_SECONDS = registry.histogram(
+    "polymarket_alert_delivery_seconds",
+    "Time from send_alert to Telegram acceptance",
+    buckets=(0.1, 0.5, 1, 2, 5, 10, 30, 60, 120),
+)
+ALERT_QUEUE_DEPTH = registry.gauge(
+    "polymarket_alert_queue_depth", "Alerts waiting for delivery"
+)
+
+TELEGRAM_MAX_TEXT = 4096
+
+
+@dataclass
+class QueuedAlert:
+    """A formatted alert waiting for the dispatcher."""
+
+    text: str
+    enqueued_at: float  # time.monotonic()
+
 
 @dataclass
 class AlertRecord:
@@ -51,12 +87,23 @@ class AlertManager:
 
     DEFAULT_COOLDOWN = 300  # 5 minutes
 
+    # Telegram: about 1 message/second per chat, 20/minute in groups
+    MIN_SEND_INTERVAL = 1.0
+    MAX_PER_MINUTE = 20
+
     def __init__(
         self,
         telegram_bot_token: Optional[str] = None,
         telegram_chat_id: Optional[str] = None,
         default_cooldown: int = DEFAULT_COOLDOWN,
         _telegram_api: Optional[Any] = None,  # For testing
+        session: Any = None,  # aiohttp.ClientSession to share
+        queue_size: int = 100,
+        max_digest: int = 10,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        min_send_interval: float = MIN_SEND_INTERVAL,
+        max_per_minute: int = MAX_PER_MINUTE,
     ) -> None:
         """
         Initialize the alert manager.
@@ -66,6 +113,13 @@ class AlertManager:
             telegram_chat_id: Chat ID to send messages to
             default_cooldown: Default cooldown between duplicate alerts
             _telegram_api: Injected API client for testing
+            session: Shared aiohttp session (one is created if not provided)
+            queue_size: Alerts held for delivery before new ones are dropped
+            max_digest: Most alerts coalesced into one message
+            max_retries: Delivery attempts after the first
+            retry_delay: Base delay between retries (exponential backoff)
+            min_send_interval: Minimum seconds between messages
+            max_per_minute: Maximum messages in any 60 seconds
         """
         self._bot_token = telegram_bot_token
         self._chat_id = telegram_chat_id
@@ -75,6 +129,61 @@ class AlertManager:
         # Alert deduplication tracking
         self._sent_alerts: Dict[str, AlertRecord] = {}
 
+        # Async dispatcher (see start())
+        self._session = session
+        self._owns_session = False
+        self._queue_size = queue_size
+        self._queue: asyncio.Queue[QueuedAlert] | None = None
+        self._task: asyncio.Task | None = None
+        self._max_digest = max_digest
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._min_send_interval = min_send_interval
+        self._max_per_minute = max_per_minute
+        self._send_times: deque[float] = deque(maxlen=max_per_minute)
+        # Dequeued alerts that did not fit the last digest
+        self._held: deque[QueuedAlert] = deque()
+        self._delivery = {"dropped": 0, "failed": 0, "retries": 0, "digests": 0}
+        self._last_latency: float | None = None
+
+    @property
+    def is_async(self) -> bool:
+        """Whether send_alert enqueues for the background dispatcher."""
+        return self._task is not None
+
+    async def start(self) -> None:
+        """Start the background dispatcher; send_alert then only enqueues."""
+        if self._task is not None:
+            return
+        if self._telegram_api is None and self._session is None:
+            import aiohttp
+
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            self._owns_session = True
+        self._queue = asyncio.Queue(maxsize=self._queue_size)
+        self._task = asyncio.create_task(self._dispatch())
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """Deliver what is queued (up to timeout), then stop the dispatcher."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Alerts: {self._queue.qsize()} undelivered at shutdown")
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._owns_session:
+            await self._session.close()
+            self._session = None
+            self._owns_session = False
+
     def send_alert(
         self,
         title: str,
@@ -86,6 +195,9 @@ class AlertManager:
         """
         Send an alert via Telegram.
 
+        With the dispatcher running this never blocks: the alert is queued
+        and counted as sent for deduplication.
+
         Args:
             title: Alert title
             message: Alert message body
@@ -94,20 +206,36 @@ class AlertManager:
             priority: Priority level ("low", "normal", "high", "critical")
 
         Returns:
-            True if alert was sent, False if deduplicated
+            True if alert was sent (or queued), False if deduplicated,
+            dropped or failed
         """
         # Check deduplication
         if dedup_key:
             cooldown = cooldown_seconds or self._default_cooldown
             if not self._should_send(dedup_key, cooldown):
                 logger.debug(f"Deduplicated alert: {dedup_key}")
+                ALERT_RESULTS.labels("deduplicated").inc()
                 return False
 
         # Format message
         formatted = self._format_message(title, message, priority)
 
+        if self._task is not None:
+            try:
+                self._queue.put_nowait(QueuedAlert(formatted, time.monotonic()))
+            except asyncio.QueueFull:
+                self._delivery["dropped"] += 1
+                ALERT_RESULTS.labels("dropped").inc()
+                logger.warning(f"Alert queue full, dropped: {title}")
+                return False
+            ALERT_QUEUE_DEPTH.set(self._queue.qsize())
+            if dedup_key:
+                self._record_sent(dedup_key)
+            return True
+
         # Send via Telegram
         success = self._send_telegram(formatted)
+        ALERT_RESULTS.labels("sent" if success else "failed").inc()
 
         # Record for deduplication
         if dedup_key and success:
@@ -383,13 +511,136 @@ Reason: {reason}
             logger.error(f"Failed to send Telegram alert: {e}")
             return False
 
+    async def _dispatch(self) -> None:
+        """Background sender: wait for a send slot, then deliver a digest."""
+        while True:
+            batch = [self._held.popleft() if self._held else await self._queue.get()]
+            try:
+                await self._wait_for_slot()
+                # Coalesce held alerts and whatever arrived while waiting
+                while len(batch) < self._max_digest and (self._held or not self._queue.empty()):
+                    batch.append(self._held.popleft() if self._held else self._queue.get_nowait())
+                ALERT_QUEUE_DEPTH.set(self._queue.qsize())
+
+                text, count = self._digest(batch)
+                self._held.extendleft(reversed(batch[count:]))
+                del batch[count:]
+
+                if await self._deliver(text):
+                    now = time.monotonic()
+                    for alert in batch:
+                        ALERT_SECONDS.observe(now - alert.enqueued_at)
+                    self._last_latency = now - batch[0].enqueued_at
+                    ALERT_RESULTS.labels("sent").inc(len(batch))
+                    if len(batch) > 1:
+                        self._delivery["digests"] += 1
+                else:
+                    self._delivery["failed"] += len(batch)
+                    ALERT_RESULTS.labels("failed").inc(len(batch))
+            except Exception as e:
+                logger.error(f"Alert dispatcher error: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _wait_for_slot(self) -> None:
+        """Sleep until a message fits Telegram's rate limits."""
+        if not self._send_times:
+            return
+        now = time.monotonic()
+        wait = self._send_times[-1] + self._min_send_interval - now
+        if len(self._send_times) == self._max_per_minute:
+            wait = max(wait, self._send_times[0] + 60 - now)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _digest(self, batch: list[QueuedAlert]) -> tuple[str, int]:
+        """
+        One message for the leading alerts of a batch, within Telegram's
+        length limit.
+
+        Alerts are never cut, so their Markdown stays balanced; only a
+        single alert longer than the limit is truncated. Returns the text
+        and how many alerts it holds.
+        """
+        text = batch[0].text[:TELEGRAM_MAX_TEXT]
+        for count in range(2, len(batch) + 1):
+            digest = f"*{count} alerts*\n\n" + "\n\n".join(a.text for a in batch[:count])
+            if len(digest) > TELEGRAM_MAX_TEXT:
+                return text, count - 1
+            text = digest
+        return text, len(batch)
+
+    async def _deliver(self, text: str) -> bool:
+        """Send one message, retrying with exponential backoff."""
+        for attempt in range(self._max_retries + 1):
+            self._send_times.append(time.monotonic())
+            ok, retry_after = await self._post(text)
+            if ok:
+                return True
+            if attempt == self._max_retries:
+                break
+            self._delivery["retries"] += 1
+            await asyncio.sleep(max(retry_after, self._retry_delay * 2 ** attempt))
+        logger.error(f"Giving up on Telegram alert: {text[:50]}...")
+        return False
+
+    async def _post(self, text: str, parse_mode: str | None = "Markdown") -> tuple[bool, float]:
+        """One sendMessage call; returns (ok, retry_after seconds)."""
+        if self._telegram_api:
+            try:
+                self._telegram_api.send_message(
+                    chat_id=self._chat_id,
+                    text=text,
+                    parse_mode=parse_mode,
+                )
+                return True, 0.0
+            except Exception as e:
+                logger.error(f"Telegram API error: {e}")
+                return False, 0.0
+
+        if not self._bot_token or not self._chat_id:
+            logger.warning("Telegram credentials not configured")
+            return False, 0.0
+
+        url = f"https://api.telegram.org/bot{self._bot_token}/sendMessage"
+        payload = {"chat_id": self._chat_id, "text": text}
+        if parse_mode:
+            payload["parse_mode"] = parse_mode
+        try:
+            async with self._session.post(url, json=payload) as response:
+                if response.status == 429:
+                    body = await response.json(content_type=None)
+                    retry_after = body.get("parameters", {}).get("retry_after", 0)
+                    logger.warning(f"Telegram rate limited, retry after {retry_after}s")
+                    return False, float(retry_after)
+                if response.status == 400 and parse_mode:
+                    # Usually entities Telegram cannot parse: the same text
+                    # would fail every retry, so send it unformatted
+                    body = await response.json(content_type=None)
+                    logger.warning(
+                        f"Telegram rejected alert ({body.get('description')}), "
+                        f"resending as plain text"
+                    )
+                    self._send_times.append(time.monotonic())
+                    return await self._post(text, parse_mode=None)
+                response.raise_for_status()
+            logger.info(f"Sent Telegram alert: {text[:50]}...")
+            return True, 0.0
+        except Exception as e:
+            logger.error(f"Failed to send Telegram alert: {e}")
+            return False, 0.0
+
     def clear_dedup_cache(self) -> None:
         """Clear the deduplication cache."""
         self._sent_alerts.clear()
 
-    def get_alert_stats(self) -> Dict[str, int]:
-        """Get statistics about sent alerts."""
+    def get_alert_stats(self) -> dict[str, Any]:
+        """Get statistics about sent alerts and the dispatcher."""
         return {
             "unique_alerts": len(self._sent_alerts),
             "total_sent": sum(r.count for r in self._sent_alerts.values()),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            **self._delivery,
+            "last_latency_seconds": self._last_latency,
         }
@@ -16,13 +16,13 @@ import json
 import logging
 import math
 import os
-import queue
-import threading
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from functools import wraps
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional
 
+import asyncpg
+
 try:
     from flask import Flask, Response, jsonify, request, abort
 except ImportError:
@@ -32,6 +32,14 @@ except ImportError:
     request = None  # type: ignore
     abort = None  # type: ignore
 
+from polymarket_bot.storage.query_stats import QueryStats
+from polymarket_bot.telemetry import CONTENT_TYPE, registry
+from polymarket_bot.tracing import chrome_trace, encode_traces, tracer
+
+from .query_plan import QueryPlan
+from .snapshots import SnapshotService
+from .sse_hub import SSEHub, parse_topics
+
 if TYPE_CHECKING:
     from polymarket_bot.storage import Database
 
@@ -40,6 +48,27 @@ logger = logging.getLogger(__name__)
 # API key from environment (optional)
 DASHBOARD_API_KEY = os.environ.get("DASHBOARD_API_KEY")
 
+# Snapshot TTLs (seconds) for endpoints served from SnapshotService
+SNAPSHOT_TTLS = {
+    "health": 5.0,
+    "metrics": 10.0,
+    "activity": 5.0,
+    "performance": 30.0,
+    "market": 10.0,
+}
+
+# /health gives up on the event loop after this long and returns 503
+HEALTH_TIMEOUT_SECONDS = 5.0
+
+# SSE event types that change snapshot contents -> snapshot key prefixes
+SNAPSHOT_INVALIDATIONS = {
+    "order": ("activity", "metrics"),
+    "fill": ("activity", "metrics", "performance"),
+    "position": ("activity", "metrics", "performance"),
+    "signal": ("activity",),
+    "bot_state": ("activity", "health"),
+}
+
 
 class DecimalEncoder(json.JSONEncoder):
     """JSON encoder that handles Decimal types."""
@@ -99,7 +128,7 @@ class Dashboard:
         GET /api/positions - Current open positions
         GET /api/watchlist - Watchlist entries
         GET /api/metrics - Trading metrics
-        GET /api/stream - SSE event stream
+        GET /api/stream - SSE event stream (?topics=prices,signals,fills,orders)
 
     Usage:
         dashboard = Dashboard(db)
@@ -118,6 +147,9 @@ class Dashboard:
         bot_config: Optional[Any] = None,
         shutdown_callback: Optional[Callable[[str], Any]] = None,
         started_at: Optional[datetime] = None,
+        sse_buffer_size: int = 256,
+        sse_price_updates_per_second: float = 4.0,
+        query_concurrency: int = 4,
     ) -> None:
         """
         Initialize the dashboard.
@@ -130,6 +162,11 @@ class Dashboard:
                        CRITICAL: Flask runs in a separate thread, so we must
                        use run_coroutine_threadsafe() to execute async DB calls
                        on the main loop where asyncpg pool was created.
+            sse_buffer_size: Max queued frames per /api/stream client
+            sse_price_updates_per_second: Rate at which coalesced price
+                updates are released to stream clients
+            query_concurrency: Max pool connections one multi-query endpoint
+                request may use at once
         """
         self._db = db
         self._health_checker = health_checker
@@ -141,10 +178,22 @@ class Dashboard:
         self._shutdown_callback = shutdown_callback
         self._started_at = started_at or datetime.now(timezone.utc)
         self._max_total_exposure_override: Optional[Decimal] = None
+        self._control_tables_ready = False
+        # Cleared when the market search functions (seed/15) are missing
+        self._indexed_search = True
+
+        # Per-request connection budget and last timings for multi-query endpoints
+        self._query_concurrency = query_concurrency
+        self._endpoint_timings: dict[str, dict[str, Any]] = {}
+
+        # Pre-serialized snapshots for expensive endpoints
+        self._snapshots = SnapshotService(encoder=DecimalEncoder)
 
         # SSE subscribers
-        self._sse_queues: List[queue.Queue] = []
-        self._sse_lock = threading.Lock()
+        self._sse_hub = SSEHub(
+            buffer_size=sse_buffer_size,
+            price_updates_per_second=sse_price_updates_per_second,
+        )
 
     def _run_async(self, coro, timeout: float = 10.0) -> Any:
         """
@@ -189,9 +238,114 @@ class Dashboard:
             logger.error(f"Async operation timed out after {timeout}s")
             raise TimeoutError(f"Operation timed out after {timeout}s")
 
+    async def start_snapshots(self) -> None:
+        """Start background snapshot refresh (call on the main event loop)."""
+        await self._snapshots.start()
+
+    async def stop_snapshots(self) -> None:
+        """Stop background snapshot refresh."""
+        await self._snapshots.stop()
+
+    def _serve_snapshot(
+        self,
+        key: str,
+        producer: Callable[[], Any],
+        ttl: float,
+        timeout: float = 10.0,
+        error_status: int = 500,
+    ) -> Response:
+        """
+        Serve the cached snapshot for `key`, computing it on a cold miss.
+
+        Honors If-None-Match (304) and Accept-Encoding: gzip, and reports
+        staleness via the Age and X-Snapshot-Computed-At headers. If the
+        snapshot cannot be computed (including a timeout on a wedged event
+        loop), responds with `error_status`.
+        """
+        try:
+            snap = self._snapshots.get_or_compute(
+                key, producer, ttl, lambda coro: self._run_async(coro, timeout=timeout)
+            )
+        except Exception as e:
+            logger.error(f"Failed to compute snapshot {key}: {e}")
+            return jsonify({"error": str(e)}), error_status
+
+        headers = {
+            "ETag": f'"{snap.etag}"',
+            "Age": str(int(snap.age_seconds)),
+            "X-Snapshot-Computed-At": snap.computed_at.isoformat(),
+            "Cache-Control": "no-cache",
+            "Vary": "Accept-Encoding",
+        }
+        if snap.status == 200 and request.if_none_match.contains(snap.etag):
+            return Response(status=304, headers=headers)
+
+        body = snap.body
+        if snap.gzip_body is not None and "gzip" in request.headers.get("Accept-Encoding", ""):
+            body = snap.gzip_body
+            headers["Content-Encoding"] = "gzip"
+        return Response(body, status=snap.status, mimetype="application/json", headers=headers)
+
+    async def _health_snapshot(self) -> tuple[dict[str, Any], int]:
+        """Payload for /health."""
+        if not self._health_checker:
+            return {
+                "status": "unknown",
+                "message": "Health checker not configured",
+            }, 200
+
+        try:
+            health_result = await self._health_checker.check_all()
+        except Exception as e:
+            logger.error(f"Health check failed: {e}")
+            return {"status": "error", "error": str(e)}, 500
+
+        return {
+            "status": health_result.status.value,
+            "components": [
+                {
+                    "component": c.component,
+                    "status": c.status.value,
+                    "message": c.message,
+                    "latency_ms": c.latency_ms,
+                }
+                for c in health_result.components
+            ],
+            "checked_at": health_result.checked_at.isoformat(),
+        }, 200
+
+    async def _metrics_snapshot(self) -> tuple[dict[str, Any], int]:
+        """Payload for /api/metrics."""
+        if not self._metrics_collector:
+            return {
+                "total_trades": 0,
+                "win_rate": 0.0,
+                "error": "Metrics collector not configured",
+            }, 200
+
+        try:
+            result = await self._metrics_collector.get_all_metrics()
+        except Exception as e:
+            logger.error(f"Failed to get metrics: {e}")
+            return {"error": str(e)}, 500
+
+        return {
+            "total_trades": result.total_trades,
+            "winning_trades": result.winning_trades,
+            "losing_trades": result.losing_trades,
+            "win_rate": result.win_rate,
+            "total_pnl": float(result.total_pnl),
+            "realized_pnl": float(result.realized_pnl),
+            "unrealized_pnl": float(result.unrealized_pnl),
+            "position_count": result.position_count,
+            "capital_deployed": float(result.capital_deployed),
+            "available_balance": float(result.available_balance),
+            "calculated_at": result.calculated_at.isoformat(),
+        }, 200
+
     async def ensure_control_tables(self) -> None:
         """Ensure control/audit tables exist."""
-        if not self._db:
+        if not self._db or self._control_tables_ready:
             return
 
         await self._db.execute(
@@ -219,6 +373,18 @@ class Dashboard:
             )
             """
         )
+        self._control_tables_ready = True
+
+    def _query_plan(self, name: str) -> QueryPlan:
+        """New concurrent query group bounded by the per-request budget."""
+        return QueryPlan(name, max_concurrency=self._query_concurrency)
+
+    async def _run_query_plan(self, plan: QueryPlan) -> dict[str, Any]:
+        """Run `plan` and keep its timings for /api/system."""
+        try:
+            return await plan.run()
+        finally:
+            self._endpoint_timings[plan.name] = plan.summary()
 
     async def load_blocklist(self) -> None:
         """Load persisted market blocks into the engine."""
@@ -355,38 +521,15 @@ class Dashboard:
         def health() -> Response:
             """Get overall system health."""
             dashboard: Dashboard = app.dashboard  # type: ignore
-
-            if dashboard._health_checker:
-                # Run async health check via main event loop
-                try:
-                    health_result = dashboard._run_async(
-                        dashboard._health_checker.check_all()
-                    )
-
-                    return jsonify({
-                        "status": health_result.status.value,
-                        "components": [
-                            {
-                                "component": c.component,
-                                "status": c.status.value,
-                                "message": c.message,
-                                "latency_ms": c.latency_ms,
-                            }
-                            for c in health_result.components
-                        ],
-                        "checked_at": health_result.checked_at.isoformat(),
-                    })
-                except Exception as e:
-                    logger.error(f"Health check failed: {e}")
-                    return jsonify({
-                        "status": "error",
-                        "error": str(e),
-                    }), 500
-
-            return jsonify({
-                "status": "unknown",
-                "message": "Health checker not configured",
-            })
+            # 503 when the loop cannot produce a fresh answer, so container
+            # healthchecks detect a hung bot
+            return dashboard._serve_snapshot(
+                "health",
+                dashboard._health_snapshot,
+                SNAPSHOT_TTLS["health"],
+                timeout=HEALTH_TIMEOUT_SECONDS,
+                error_status=503,
+            )
 
         @app.route("/api/positions")
         @require_api_key
@@ -427,35 +570,15 @@ class Dashboard:
         def metrics() -> Response:
             """Get trading metrics."""
             dashboard: Dashboard = app.dashboard  # type: ignore
+            return dashboard._serve_snapshot(
+                "metrics", dashboard._metrics_snapshot, SNAPSHOT_TTLS["metrics"]
+            )
 
-            if dashboard._metrics_collector:
-                try:
-                    result = dashboard._run_async(
-                        dashboard._metrics_collector.get_all_metrics()
-                    )
-
-                    return jsonify({
-                        "total_trades": result.total_trades,
-                        "winning_trades": result.winning_trades,
-                        "losing_trades": result.losing_trades,
-                        "win_rate": result.win_rate,
-                        "total_pnl": float(result.total_pnl),
-                        "realized_pnl": float(result.realized_pnl),
-                        "unrealized_pnl": float(result.unrealized_pnl),
-                        "position_count": result.position_count,
-                        "capital_deployed": float(result.capital_deployed),
-                        "available_balance": float(result.available_balance),
-                        "calculated_at": result.calculated_at.isoformat(),
-                    })
-                except Exception as e:
-                    logger.error(f"Failed to get metrics: {e}")
-                    return jsonify({"error": str(e)}), 500
-
-            return jsonify({
-                "total_trades": 0,
-                "win_rate": 0.0,
-                "error": "Metrics collector not configured",
-            })
+        @app.route("/metrics")
+        @require_api_key
+        def prometheus_metrics() -> Response:
+            """Prometheus text exposition of the process metrics registry."""
+            return Response(registry.render(), content_type=CONTENT_TYPE)
 
         @app.route("/api/status")
         @require_api_key
@@ -501,13 +624,14 @@ class Dashboard:
             if not dashboard._db:
                 return jsonify({"events": [], "error": "Database not configured"})
 
-            try:
-                limit = request.args.get("limit", 200, type=int)
-                result = dashboard._run_async(dashboard._get_activity(limit))
-                return jsonify({"events": result})
-            except Exception as e:
-                logger.error(f"Failed to get activity: {e}")
-                return jsonify({"events": [], "error": str(e)}), 500
+            limit = request.args.get("limit", 200, type=int)
+
+            async def produce() -> tuple[dict[str, Any], int]:
+                return {"events": await dashboard._get_activity(limit)}, 200
+
+            return dashboard._serve_snapshot(
+                f"activity:{limit}", produce, SNAPSHOT_TTLS["activity"]
+            )
 
         @app.route("/api/performance")
         @require_api_key
@@ -518,16 +642,16 @@ class Dashboard:
             if not dashboard._db:
                 return jsonify({"error": "Database not configured"}), 500
 
-            try:
-                range_days = request.args.get("range_days", type=int)
-                limit = request.args.get("limit", 200, type=int)
-                result = dashboard._run_async(
-                    dashboard._get_performance(range_days=range_days, limit=limit)
-                )
-                return jsonify(result)
-            except Exception as e:
-                logger.error(f"Failed to get performance: {e}")
-                return jsonify({"error": str(e)}), 500
+            range_days = request.args.get("range_days", type=int)
+            limit = request.args.get("limit", 200, type=int)
+
+            async def produce() -> tuple[dict[str, Any], int]:
+                result = await dashboard._get_performance(range_days=range_days, limit=limit)
+                return result, 200
+
+            return dashboard._serve_snapshot(
+                f"performance:{range_days}:{limit}", produce, SNAPSHOT_TTLS["performance"]
+            )
 
         @app.route("/api/system")
         @require_api_key
@@ -815,12 +939,12 @@ class Dashboard:
             if not dashboard._db:
                 return jsonify({"error": "Database not configured"}), 500
 
-            try:
-                result = dashboard._run_async(dashboard._get_market_detail(condition_id))
-                return jsonify(result)
-            except Exception as e:
-                logger.error(f"Failed to get market detail: {e}")
-                return jsonify({"error": str(e)}), 500
+            async def produce() -> tuple[dict[str, Any], int]:
+                return await dashboard._get_market_detail(condition_id), 200
+
+            return dashboard._serve_snapshot(
+                f"market:{condition_id}", produce, SNAPSHOT_TTLS["market"]
+            )
 
         @app.route("/api/market/<condition_id>/history")
         @require_api_key
@@ -996,6 +1120,60 @@ class Dashboard:
                 )
                 return jsonify({"error": str(e)}), 500
 
+        @app.route("/api/db/queries")
+        @require_api_key
+        def db_queries() -> Response:
+            """
+            Top statements by total time (or ?sort=calls|mean_ms|p99_ms|...),
+            pool-acquire wait and recent slow queries.
+            """
+            dashboard: Dashboard = app.dashboard  # type: ignore
+            stats = getattr(dashboard._db, "query_stats", None)
+            if not isinstance(stats, QueryStats):
+                return jsonify({"error": "Query stats not available"}), 500
+
+            limit = request.args.get("limit", 20, type=int)
+            sort = request.args.get("sort", "total_ms")
+            if sort not in QueryStats.SORT_KEYS:
+                return jsonify({"error": f"sort must be one of {', '.join(QueryStats.SORT_KEYS)}"}), 400
+            return jsonify({
+                "summary": stats.summary(),
+                "statements": stats.top(limit, sort),
+                "slow_queries": stats.slow_queries(limit),
+            })
+
+        # =====================================================================
+        # Latency Tracing Endpoints
+        # =====================================================================
+
+        @app.route("/api/latency")
+        @require_api_key
+        def latency() -> Response:
+            """Get per-stage latency histograms for sampled frames."""
+            return jsonify(tracer.stats())
+
+        @app.route("/api/latency/traces")
+        @require_api_key
+        def latency_traces() -> Response:
+            """
+            Export buffered traces.
+
+            ?format=chrome (default) for chrome://tracing / Perfetto,
+            ?format=binary for the compact format (tracing.read_binary).
+            """
+            limit = request.args.get("limit", type=int)
+            fmt = request.args.get("format", "chrome")
+            traces = tracer.traces(limit)
+            if fmt == "binary":
+                return Response(
+                    encode_traces(traces),
+                    mimetype="application/octet-stream",
+                    headers={"Content-Disposition": "attachment; filename=traces.bin"},
+                )
+            if fmt != "chrome":
+                return jsonify({"error": f"Unknown format: {fmt}"}), 400
+            return jsonify(chrome_trace(traces))
+
         # =====================================================================
         # Pipeline Visibility Endpoints
         # =====================================================================
@@ -1012,12 +1190,53 @@ class Dashboard:
             try:
                 minutes = request.args.get("minutes", 60, type=int)
                 tracker = dashboard._engine.pipeline_tracker
+                if dashboard._db and minutes > tracker.window_minutes:
+                    # Past the in-memory ring: read persisted rollups
+                    from polymarket_bot.core.pipeline_stats import fetch_rollup_totals
+                    totals = dashboard._run_async(
+                        fetch_rollup_totals(dashboard._db, minutes)
+                    )
+                    return jsonify({
+                        "totals": totals,
+                        "total": sum(totals.values()),
+                        "minutes": minutes,
+                        "source": "rollup",
+                    })
                 stats = tracker.get_stats(minutes)
                 return jsonify(stats)
             except Exception as e:
                 logger.error(f"Failed to get pipeline stats: {e}")
                 return jsonify({"error": str(e)}), 500
 
+        @app.route("/api/pipeline/strategies")
+        @require_api_key
+        def pipeline_strategies() -> Response:
+            """Get per-strategy evaluations, signals and rejections."""
+            dashboard: Dashboard = app.dashboard  # type: ignore
+
+            if not dashboard._engine:
+                return jsonify({"error": "Engine not configured"}), 500
+
+            try:
+                engine = dashboard._engine
+                stats = engine.pipeline_tracker.get_strategy_stats()
+                strategies = {}
+                for strategy in engine.strategies:
+                    counts = stats.get(strategy.name) or {
+                        "evaluated": 0,
+                        "signals": {},
+                        "rejections": {},
+                        "total_rejections": 0,
+                    }
+                    strategies[strategy.name] = {
+                        "threshold": float(engine.threshold_for(strategy)),
+                        **counts,
+                    }
+                return jsonify({"strategies": strategies})
+            except Exception as e:
+                logger.error(f"Failed to get strategy stats: {e}")
+                return jsonify({"error": str(e)}), 500
+
         @app.route("/api/pipeline/funnel")
         @require_api_key
         def pipeline_funnel() -> Response:
@@ -1030,7 +1249,13 @@ class Dashboard:
             try:
                 minutes = request.args.get("minutes", 60, type=int)
                 tracker = dashboard._engine.pipeline_tracker
-                summary = tracker.get_funnel_summary(minutes)
+                totals = None
+                if dashboard._db and minutes > tracker.window_minutes:
+                    from polymarket_bot.core.pipeline_stats import fetch_rollup_totals
+                    totals = dashboard._run_async(
+                        fetch_rollup_totals(dashboard._db, minutes)
+                    )
+                summary = tracker.get_funnel_summary(minutes, totals=totals)
                 return jsonify(summary)
             except Exception as e:
                 logger.error(f"Failed to get pipeline funnel: {e}")
@@ -1156,29 +1381,28 @@ class Dashboard:
             """SSE stream for real-time updates."""
             dashboard: Dashboard = app.dashboard  # type: ignore
 
-            def generate() -> Generator[str, None, None]:
-                q: queue.Queue = queue.Queue()
+            # Optional ?topics=prices,orders (default: all topics)
+            topics = parse_topics(request.args.get("topics"))
+            hub = dashboard._sse_hub
 
-                with dashboard._sse_lock:
-                    dashboard._sse_queues.append(q)
+            def generate() -> Generator[str, None, None]:
+                client = hub.subscribe(topics)
 
                 try:
                     # Send initial connection event
-                    yield f"data: {json.dumps({'type': 'connected'})}\n\n"
+                    yield f"data: {json.dumps({'type': 'connected', 'topics': sorted(topics)})}\n\n"
 
                     while True:
-                        try:
-                            # Wait for events with timeout
-                            event = q.get(timeout=30)
-                            yield f"data: {json.dumps(event)}\n\n"
-                        except queue.Empty:
+                        # Wait for events with timeout
+                        frames = hub.next_frames(client, timeout=30)
+                        if frames:
+                            yield "".join(frames)
+                        else:
                             # Send keepalive
                             yield f": keepalive\n\n"
 
                 finally:
-                    with dashboard._sse_lock:
-                        if q in dashboard._sse_queues:
-                            dashboard._sse_queues.remove(q)
+                    hub.unsubscribe(client)
 
             return Response(
                 generate(),
@@ -1462,7 +1686,13 @@ class Dashboard:
             params.append(category)
             filters.append(f"LOWER(category) = LOWER(${len(params)})")
 
-        if search:
+        search_idx = None
+        if search and self._indexed_search:
+            # Indexed full-text (+ trigram) match, seed/15_market_search.sql
+            params.append(search)
+            search_idx = len(params)
+            filters.append(f"market_search_match(search_tsv, question, ${search_idx})")
+        elif search:
             params.append(f"%{search}%")
             filters.append(
                 f"(question ILIKE ${len(params)} OR market_slug ILIKE ${len(params)})"
@@ -1482,6 +1712,8 @@ class Dashboard:
             "updated": "updated_at DESC NULLS LAST",
         }
         order_by = sort_clauses.get(sort, sort_clauses["volume"])
+        if search_idx is not None:
+            order_by = f"market_search_rank(search_tsv, question, ${search_idx}) DESC, {order_by}"
 
         query = f"""
             SELECT market_id, condition_id, question, category,
@@ -1493,7 +1725,14 @@ class Dashboard:
             LIMIT ${len(params)}
         """
 
-        records = await self._db.fetch(query, *params)
+        try:
+            records = await self._db.fetch(query, *params)
+        except (asyncpg.UndefinedFunctionError, asyncpg.UndefinedColumnError) as e:
+            if search_idx is None:
+                raise
+            logger.warning(f"Indexed market search unavailable, using ILIKE: {e}")
+            self._indexed_search = False
+            return await self._get_markets(limit, category, search, sort)
 
         return [
             {
@@ -1875,7 +2114,10 @@ class Dashboard:
 
         events: List[Dict[str, Any]] = []
 
-        trigger_rows = await self._db.fetch(
+        await self.ensure_control_tables()
+
+        plan = self._query_plan("activity")
+        plan.add("triggers", self._db.fetch(
             """
             SELECT t.token_id, t.condition_id, t.price, t.trade_size, t.model_score, t.triggered_at,
                    p.description
@@ -1885,7 +2127,55 @@ class Dashboard:
             LIMIT $1
             """,
             limit,
-        )
+        ))
+        plan.add("orders", self._db.fetch(
+            """
+            SELECT o.order_id, o.token_id, o.condition_id, o.side, o.price, o.size,
+                   o.status, o.created_at, o.updated_at, p.description
+            FROM orders o
+            LEFT JOIN positions p ON o.condition_id = p.condition_id
+            ORDER BY o.created_at DESC
+            LIMIT $1
+            """,
+            limit,
+        ), default=[])
+        plan.add("exits", self._db.fetch(
+            """
+            SELECT e.id, e.position_id, e.token_id, e.condition_id, e.exit_price, e.size,
+                   e.net_pnl, e.reason, e.created_at, p.description
+            FROM exit_events e
+            LEFT JOIN positions p ON e.position_id::text = p.id::text
+            ORDER BY e.created_at DESC
+            LIMIT $1
+            """,
+            limit,
+        ))
+        plan.add("positions", self._db.fetch(
+            """
+            SELECT id, token_id, condition_id, entry_price, size, entry_timestamp, description
+            FROM positions
+            WHERE status = 'open'
+            ORDER BY entry_timestamp DESC
+            LIMIT $1
+            """,
+            limit,
+        ))
+        plan.add("actions", self._db.fetch(
+            """
+            SELECT id, action_type, status, details, reason, created_at
+            FROM dashboard_actions
+            ORDER BY created_at DESC
+            LIMIT $1
+            """,
+            limit,
+        ))
+        rows = await self._run_query_plan(plan)
+        trigger_rows = rows["triggers"]
+        order_rows = rows["orders"]
+        exit_rows = rows["exits"]
+        position_rows = rows["positions"]
+        action_rows = rows["actions"]
+
         for row in trigger_rows:
             timestamp = self._parse_datetime(row.get("triggered_at"))
             question = row.get("description") or f"Token {row['token_id'][:6]}..."
@@ -1909,20 +2199,6 @@ class Dashboard:
                 "_sort": timestamp or datetime.now(timezone.utc),
             })
 
-        try:
-            order_rows = await self._db.fetch(
-                """
-                SELECT o.order_id, o.token_id, o.condition_id, o.side, o.price, o.size,
-                       o.status, o.created_at, o.updated_at, p.description
-                FROM orders o
-                LEFT JOIN positions p ON o.condition_id = p.condition_id
-                ORDER BY o.created_at DESC
-                LIMIT $1
-                """,
-                limit,
-            )
-        except Exception:
-            order_rows = []
         for row in order_rows:
             status = row.get("status", "pending")
             if status == "filled":
@@ -1965,17 +2241,6 @@ class Dashboard:
                 "_sort": timestamp or datetime.now(timezone.utc),
             })
 
-        exit_rows = await self._db.fetch(
-            """
-            SELECT e.id, e.position_id, e.token_id, e.condition_id, e.exit_price, e.size,
-                   e.net_pnl, e.reason, e.created_at, p.description
-            FROM exit_events e
-            LEFT JOIN positions p ON e.position_id::text = p.id::text
-            ORDER BY e.created_at DESC
-            LIMIT $1
-            """,
-            limit,
-        )
         for row in exit_rows:
             pnl = float(row.get("net_pnl") or 0)
             severity = "success" if pnl >= 0 else "warning"
@@ -2003,16 +2268,6 @@ class Dashboard:
                 "_sort": timestamp or datetime.now(timezone.utc),
             })
 
-        position_rows = await self._db.fetch(
-            """
-            SELECT id, token_id, condition_id, entry_price, size, entry_timestamp, description
-            FROM positions
-            WHERE status = 'open'
-            ORDER BY entry_timestamp DESC
-            LIMIT $1
-            """,
-            limit,
-        )
         for row in position_rows:
             timestamp = self._parse_datetime(row.get("entry_timestamp"))
             question = row.get("description") or f"Position {row['token_id'][:6]}..."
@@ -2036,16 +2291,6 @@ class Dashboard:
                 "_sort": timestamp or datetime.now(timezone.utc),
             })
 
-        await self.ensure_control_tables()
-        action_rows = await self._db.fetch(
-            """
-            SELECT id, action_type, status, details, reason, created_at
-            FROM dashboard_actions
-            ORDER BY created_at DESC
-            LIMIT $1
-            """,
-            limit,
-        )
         for row in action_rows:
             action_type = row["action_type"]
             severity = "info"
@@ -2117,93 +2362,68 @@ class Dashboard:
         range_days: Optional[int] = None,
         limit: int = 200,
     ) -> Dict[str, Any]:
-        """Compute performance summary, equity, and trade history."""
+        """
+        Compute performance summary, equity, and trade history.
+
+        Aggregates come from performance_rollups (maintained per exit event),
+        so the cost is O(periods) regardless of how many exits exist.
+        """
         if not self._db:
             return {}
 
+        from polymarket_bot.storage.repositories.position_repo import (
+            PerformanceRollupRepository,
+        )
+
+        rollups = PerformanceRollupRepository(self._db)
+
         cutoff = None
+        since = None
         if range_days:
             cutoff = datetime.now(timezone.utc) - timedelta(days=range_days)
+            since = cutoff.date()
 
-        stats_limit = max(limit, 500)
-        records = await self._db.fetch(
-            """
+        trades_sql = """
             SELECT id, position_id, token_id, condition_id, entry_price, exit_price,
                    size, net_pnl, hours_held, reason, created_at
             FROM exit_events
+            {where}
             ORDER BY created_at DESC
             LIMIT $1
-            """,
-            stats_limit,
-        )
-
-        filtered = []
-        for row in records:
-            closed_at = self._parse_datetime(row.get("created_at"))
-            if cutoff and closed_at and closed_at < cutoff:
-                continue
-            filtered.append((row, closed_at))
-
-        pnls = [float(row.get("net_pnl") or 0) for row, _ in filtered]
-        total_trades = len(pnls)
-        total_pnl = sum(pnls)
-        wins = [p for p in pnls if p > 0]
-        losses = [p for p in pnls if p < 0]
-        win_rate = (len(wins) / total_trades) if total_trades else 0.0
-        profit_factor = (sum(wins) / abs(sum(losses))) if losses else 0.0
-        avg_win = (sum(wins) / len(wins)) if wins else 0.0
-        avg_loss = (abs(sum(losses)) / len(losses)) if losses else 0.0
-        best_trade = max(pnls) if pnls else 0.0
-        worst_trade = min(pnls) if pnls else 0.0
-
-        daily_series: List[Dict[str, Any]] = []
-        daily_records = await self._db.fetch(
-            """
-            SELECT date, total_pnl, realized_pnl, num_trades, num_wins, num_losses
-            FROM daily_pnl
-            ORDER BY date ASC
-            """
-        )
-        if daily_records:
-            for row in daily_records:
-                date_value = row["date"]
-                daily_series.append({
-                    "date": str(date_value),
-                    "pnl": float(row.get("total_pnl") or row.get("realized_pnl") or 0),
-                    "trades": int(row.get("num_trades") or 0),
-                    "wins": int(row.get("num_wins") or 0),
-                    "losses": int(row.get("num_losses") or 0),
-                })
+        """
+        plan = self._query_plan("performance")
+        plan.add("summary", rollups.get_summary(since))
+        plan.add("daily", rollups.get_series("day", since=since))
+        plan.add("pnl_week", rollups.get_series("week", since=since, limit=5))
+        plan.add("pnl_month", rollups.get_series("month", since=since, limit=5))
+        if cutoff:
+            plan.add("trades", self._db.fetch(
+                trades_sql.format(where="WHERE created_at::timestamptz >= $2"), limit, cutoff
+            ))
         else:
-            buckets: Dict[str, Dict[str, Any]] = {}
-            for row, closed_at in filtered:
-                if not closed_at:
-                    continue
-                key = closed_at.date().isoformat()
-                bucket = buckets.setdefault(
-                    key, {"date": key, "pnl": 0.0, "trades": 0, "wins": 0, "losses": 0}
-                )
-                pnl = float(row.get("net_pnl") or 0)
-                bucket["pnl"] += pnl
-                bucket["trades"] += 1
-                if pnl >= 0:
-                    bucket["wins"] += 1
-                else:
-                    bucket["losses"] += 1
-            daily_series = [buckets[k] for k in sorted(buckets.keys())]
+            plan.add("trades", self._db.fetch(trades_sql.format(where=""), limit))
+        rows = await self._run_query_plan(plan)
 
-        if cutoff:
-            daily_series = [
-                d for d in daily_series
-                if self._parse_datetime(d["date"]) and self._parse_datetime(d["date"]) >= cutoff
-            ]
+        rows["pnl_day"] = rows["daily"][-7:]
+
+        summary = rows["summary"]
+        total_trades = summary.trades
+        total_pnl = summary.net_pnl
+        win_rate = (summary.wins / total_trades) if total_trades else 0.0
+        profit_factor = (summary.gross_profit / summary.gross_loss) if summary.gross_loss else 0.0
+        avg_win = (summary.gross_profit / summary.wins) if summary.wins else 0.0
+        avg_loss = (summary.gross_loss / summary.losses) if summary.losses else 0.0
+        best_trade = summary.best_trade or 0.0
+        worst_trade = summary.worst_trade or 0.0
+
+        daily_rows = rows["daily"]
 
         equity_points: List[Dict[str, Any]] = []
         cumulative = 0.0
-        for daily in daily_series:
-            cumulative += daily["pnl"]
+        for row in daily_rows:
+            cumulative += row.net_pnl
             equity_points.append({
-                "timestamp": daily["date"],
+                "timestamp": row.period_start.isoformat(),
                 "equity": cumulative,
             })
 
@@ -2219,34 +2439,38 @@ class Dashboard:
         max_drawdown_percent = (max_drawdown / peak * 100) if peak > 0 else 0.0
 
         sharpe_ratio = 0.0
-        if len(daily_series) > 1:
-            returns = [d["pnl"] for d in daily_series]
+        if len(daily_rows) > 1:
+            returns = [row.net_pnl for row in daily_rows]
             mean = sum(returns) / len(returns)
             variance = sum((r - mean) ** 2 for r in returns) / len(returns)
             std_dev = math.sqrt(variance)
             if std_dev > 0:
                 sharpe_ratio = (mean / std_dev) * math.sqrt(252)
 
+        records = rows["trades"]
+        trade_records = [(row, self._parse_datetime(row.get("created_at"))) for row in records]
+
         trades: List[Dict[str, Any]] = []
-        trade_records = filtered[:limit]
 
         token_ids = list({row["token_id"] for row, _ in trade_records})
-        token_questions: Dict[str, str] = {}
+        condition_ids = list({row["condition_id"] for row, _ in trade_records if row.get("condition_id")})
         if token_ids:
-            meta_records = await self._db.fetch(
+            plan.add("meta", self._db.fetch(
                 "SELECT token_id, question FROM polymarket_token_meta WHERE token_id = ANY($1)",
                 token_ids,
-            )
-            token_questions = {r["token_id"]: r.get("question") or "" for r in meta_records}
-
-        condition_ids = list({row["condition_id"] for row, _ in trade_records if row.get("condition_id")})
-        categories: Dict[str, str] = {}
+            ))
         if condition_ids:
-            market_records = await self._db.fetch(
+            plan.add("categories", self._db.fetch(
                 "SELECT condition_id, category FROM stream_watchlist WHERE condition_id = ANY($1)",
                 condition_ids,
-            )
-            categories = {r["condition_id"]: r.get("category") or "Unknown" for r in market_records}
+            ))
+        lookups = await self._run_query_plan(plan) if token_ids or condition_ids else {}
+        token_questions: dict[str, str] = {
+            r["token_id"]: r.get("question") or "" for r in lookups.get("meta", [])
+        }
+        categories: dict[str, str] = {
+            r["condition_id"]: r.get("category") or "Unknown" for r in lookups.get("categories", [])
+        }
 
         for row, closed_at in trade_records:
             hours_held = float(row.get("hours_held") or 0)
@@ -2273,25 +2497,24 @@ class Dashboard:
                 "category": categories.get(row.get("condition_id"), "Unknown"),
             })
 
-        def group_by_period(period: str) -> List[Dict[str, Any]]:
-            buckets: Dict[str, Dict[str, Any]] = {}
-            for daily in daily_series:
-                dt = self._parse_datetime(daily["date"]) or datetime.now(timezone.utc)
-                if period == "weekly":
-                    key = f"{dt.isocalendar().year}-W{dt.isocalendar().week}"
-                elif period == "monthly":
-                    key = dt.strftime("%Y-%m")
+        def period_pnl(period: str) -> list[dict[str, Any]]:
+            items = []
+            for row in rows[f"pnl_{period}"]:
+                if period == "week":
+                    iso = row.period_start.isocalendar()
+                    key = f"{iso.year}-W{iso.week}"
+                elif period == "month":
+                    key = row.period_start.strftime("%Y-%m")
                 else:
-                    key = daily["date"]
-                bucket = buckets.setdefault(
-                    key, {"period": key, "pnl": 0.0, "trades": 0, "wins": 0, "losses": 0}
-                )
-                bucket["pnl"] += daily["pnl"]
-                bucket["trades"] += daily["trades"]
-                bucket["wins"] += daily["wins"]
-                bucket["losses"] += daily["losses"]
-            items = list(buckets.values())
-            return items[-5:] if period != "daily" else items[-7:]
+                    key = row.period_start.isoformat()
+                items.append({
+                    "period": key,
+                    "pnl": row.net_pnl,
+                    "trades": row.trades,
+                    "wins": row.wins,
+                    "losses": row.losses,
+                })
+            return items
 
         return {
             "stats": {
@@ -2310,9 +2533,9 @@ class Dashboard:
             "equity": equity_points,
             "trades": trades,
             "pnl": {
-                "daily": group_by_period("daily"),
-                "weekly": group_by_period("weekly"),
-                "monthly": group_by_period("monthly"),
+                "daily": period_pnl("day"),
+                "weekly": period_pnl("week"),
+                "monthly": period_pnl("month"),
             },
         }
 
@@ -2339,6 +2562,9 @@ class Dashboard:
                 "streaming": True,
             },
             "uptime": (datetime.now(timezone.utc) - self._started_at).total_seconds(),
+            "snapshots": self._snapshots.get_stats(),
+            "stream": self._sse_hub.get_stats(),
+            "endpoint_timings": dict(self._endpoint_timings),
         }
 
     async def _get_strategy(self) -> Dict[str, Any]:
@@ -2520,11 +2746,18 @@ class Dashboard:
         return decisions
 
     async def _get_market_detail(self, condition_id: str) -> Dict[str, Any]:
-        """Return detailed market snapshot."""
+        """
+        Return detailed market snapshot.
+
+        The per-table lookups are independent, so they run as one concurrent
+        query group; fallbacks for markets missing from stream_watchlist or
+        polymarket_token_meta run as a second group only when needed.
+        """
         if not self._db:
             return {}
 
-        record = await self._db.fetchrow(
+        plan = self._query_plan("market_detail")
+        plan.add("market", self._db.fetchrow(
             """
             SELECT sw.market_id, sw.condition_id, sw.question, sw.category,
                    sw.best_bid, sw.best_ask, sw.liquidity, sw.volume,
@@ -2537,10 +2770,81 @@ class Dashboard:
             LIMIT 1
             """,
             condition_id,
-        )
-
+        ))
+        plan.add("tokens", self._db.fetch(
+            """
+            SELECT token_id, outcome, outcome_index, question
+            FROM polymarket_token_meta
+            WHERE condition_id = $1
+            ORDER BY outcome_index NULLS LAST
+            """,
+            condition_id,
+        ))
+        plan.add("position", self._db.fetchrow(
+            """
+            SELECT id, token_id, size, entry_price, entry_cost, current_price, current_value,
+                   unrealized_pnl, realized_pnl, entry_timestamp, status, side, outcome
+            FROM positions
+            WHERE condition_id = $1 AND status = 'open'
+            ORDER BY entry_timestamp DESC
+            LIMIT 1
+            """,
+            condition_id,
+        ))
+        plan.add("open_orders", self._db.fetch(
+            """
+            SELECT order_id, token_id, side, price, size, status, created_at
+            FROM orders
+            WHERE condition_id = $1 AND status IN ('pending', 'live', 'partial')
+            ORDER BY created_at DESC
+            LIMIT 20
+            """,
+            condition_id,
+        ))
+        plan.add("last_trade", self._db.fetchrow(
+            """
+            SELECT trade_id, price, size, side, timestamp
+            FROM polymarket_trades
+            WHERE condition_id = $1
+            ORDER BY timestamp DESC
+            LIMIT 1
+            """,
+            condition_id,
+        ))
+        plan.add("last_signal", self._db.fetchrow(
+            """
+            SELECT token_id, status, price, threshold, model_score, created_at
+            FROM polymarket_candidates
+            WHERE condition_id = $1
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            condition_id,
+        ))
+        plan.add("last_fill", self._db.fetchrow(
+            """
+            SELECT order_id, token_id, side, price, size, filled_size, avg_fill_price, status,
+                   created_at, updated_at
+            FROM orders
+            WHERE condition_id = $1 AND status = 'filled'
+            ORDER BY updated_at DESC
+            LIMIT 1
+            """,
+            condition_id,
+        ))
+        rows = await self._run_query_plan(plan)
+
+        record = rows["market"]
+        token_rows = rows["tokens"]
+        position = rows["position"]
+        open_orders = rows["open_orders"]
+        last_trade_row = rows["last_trade"]
+        signal_row = rows["last_signal"]
+        last_fill_row = rows["last_fill"]
+
+        # Fallbacks for markets not in the watchlist / token metadata
         if not record:
-            record = await self._db.fetchrow(
+            plan.add("market_fallback", self._db.fetchrow(
                 """
                 SELECT condition_id, question, category, best_bid, best_ask, liquidity, volume,
                        end_date, updated_at
@@ -2548,25 +2852,23 @@ class Dashboard:
                 WHERE condition_id = $1
                 """,
                 condition_id,
-            )
+            ))
+        if not token_rows:
+            plan.add("universe", self._db.fetchrow(
+                "SELECT outcomes FROM market_universe WHERE condition_id = $1",
+                condition_id,
+            ))
+        if not record or not token_rows:
+            fallback_rows = await self._run_query_plan(plan)
+            record = record or fallback_rows.get("market_fallback")
+            universe_row = fallback_rows.get("universe")
+        else:
+            universe_row = None
 
         question = record.get("question") if record else None
         if not question:
-            meta = await self._db.fetchrow(
-                "SELECT question FROM polymarket_token_meta WHERE condition_id = $1 LIMIT 1",
-                condition_id,
-            )
-            question = meta.get("question") if meta else None
+            question = next((r.get("question") for r in token_rows if r.get("question")), None)
 
-        token_rows = await self._db.fetch(
-            """
-            SELECT token_id, outcome, outcome_index
-            FROM polymarket_token_meta
-            WHERE condition_id = $1
-            ORDER BY outcome_index NULLS LAST
-            """,
-            condition_id,
-        )
         tokens = [
             {
                 "token_id": r.get("token_id"),
@@ -2578,12 +2880,7 @@ class Dashboard:
 
         # Fallback: If polymarket_token_meta is empty, try market_universe.outcomes
         if not tokens:
-            universe_row = await self._db.fetchrow(
-                "SELECT outcomes FROM market_universe WHERE condition_id = $1",
-                condition_id,
-            )
             if universe_row and universe_row.get("outcomes"):
-                import json
                 outcomes_data = universe_row["outcomes"]
                 # Handle both string and already-parsed JSON
                 if isinstance(outcomes_data, str):
@@ -2657,39 +2954,6 @@ class Dashboard:
         mid_price = (best_bid + best_ask) / 2 if best_bid is not None and best_ask is not None else best_bid or best_ask
         spread = (best_ask - best_bid) if best_bid is not None and best_ask is not None else None
 
-        position = await self._db.fetchrow(
-            """
-            SELECT id, token_id, size, entry_price, entry_cost, current_price, current_value,
-                   unrealized_pnl, realized_pnl, entry_timestamp, status, side, outcome
-            FROM positions
-            WHERE condition_id = $1 AND status = 'open'
-            ORDER BY entry_timestamp DESC
-            LIMIT 1
-            """,
-            condition_id,
-        )
-
-        open_orders = await self._db.fetch(
-            """
-            SELECT order_id, token_id, side, price, size, status, created_at
-            FROM orders
-            WHERE condition_id = $1 AND status IN ('pending', 'live', 'partial')
-            ORDER BY created_at DESC
-            LIMIT 20
-            """,
-            condition_id,
-        )
-
-        last_trade_row = await self._db.fetchrow(
-            """
-            SELECT trade_id, price, size, side, timestamp
-            FROM polymarket_trades
-            WHERE condition_id = $1
-            ORDER BY timestamp DESC
-            LIMIT 1
-            """,
-            condition_id,
-        )
         last_trade = None
         if last_trade_row:
             last_trade = {
@@ -2700,16 +2964,6 @@ class Dashboard:
                 "timestamp": self._format_timestamp(last_trade_row.get("timestamp")),
             }
 
-        signal_row = await self._db.fetchrow(
-            """
-            SELECT token_id, status, price, threshold, model_score, created_at
-            FROM polymarket_candidates
-            WHERE condition_id = $1
-            ORDER BY created_at DESC
-            LIMIT 1
-            """,
-            condition_id,
-        )
         last_signal: Optional[Dict[str, Any]] = None
         if signal_row:
             status = signal_row.get("status", "pending")
@@ -2731,17 +2985,6 @@ class Dashboard:
                 "created_at": self._format_timestamp(signal_row.get("created_at")),
             }
 
-        last_fill_row = await self._db.fetchrow(
-            """
-            SELECT order_id, token_id, side, price, size, filled_size, avg_fill_price, status,
-                   created_at, updated_at
-            FROM orders
-            WHERE condition_id = $1 AND status = 'filled'
-            ORDER BY updated_at DESC
-            LIMIT 1
-            """,
-            condition_id,
-        )
         last_fill: Optional[Dict[str, Any]] = None
         if last_fill_row:
             order_price = float(last_fill_row.get("price") or 0)
@@ -3312,12 +3555,11 @@ class Dashboard:
         """Broadcast event to all SSE subscribers."""
         if "timestamp" not in event:
             event["timestamp"] = datetime.now(timezone.utc).isoformat()
-        with self._sse_lock:
-            for q in self._sse_queues:
-                try:
-                    q.put_nowait(event)
-                except queue.Full:
-                    pass  # Skip if queue is full
+        self._sse_hub.publish(event)
+
+        prefixes = SNAPSHOT_INVALIDATIONS.get(event.get("type"))
+        if prefixes:
+            self._snapshots.invalidate(*prefixes)
 
 
 def create_app(
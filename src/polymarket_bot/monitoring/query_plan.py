@@ -0,0 +1,111 @@
+"""
+Concurrent query groups for multi-query dashboard endpoints.
+
+Endpoints like /api/market/<id> and /api/activity issue several independent
+queries. Awaited one after another, their latency is the sum of every
+round-trip; QueryPlan runs them concurrently so it is close to the slowest
+single query instead.
+
+Each plan holds a per-request connection budget (a semaphore), so one
+request never takes more than `max_concurrency` pool connections and cannot
+starve the trading loop's own queries. Per-query and total timings are
+logged at DEBUG, and at WARNING when the plan exceeds `slow_ms`.
+
+Usage:
+    plan = QueryPlan("market_detail", max_concurrency=4)
+    plan.add("position", db.fetchrow(POSITION_SQL, condition_id))
+    plan.add("orders", db.fetch(ORDERS_SQL, condition_id), default=[])
+    results = await plan.run()
+    results["position"], results["orders"]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_REQUIRED = object()
+
+
+class QueryPlan:
+    """A named group of independent awaitables run under a concurrency budget."""
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int = 4,
+        slow_ms: float = 500.0,
+    ) -> None:
+        """
+        Args:
+            name: Endpoint name used in timing logs
+            max_concurrency: Max queries (pool connections) in flight at once
+            slow_ms: Log a warning when the whole plan takes longer than this
+        """
+        self.name = name
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._slow_ms = slow_ms
+        self._steps: list[tuple[str, Awaitable[Any], Any]] = []
+        self.timings_ms: dict[str, float] = {}
+        self.total_ms: float = 0.0
+
+    def add(self, key: str, awaitable: Awaitable[Any], default: Any = _REQUIRED) -> None:
+        """
+        Queue a query.
+
+        If `default` is given, a failure of this query is logged and replaced
+        by `default`; otherwise the exception propagates from run().
+        """
+        self._steps.append((key, awaitable, default))
+
+    async def _run_step(self, key: str, awaitable: Awaitable[Any], default: Any) -> Any:
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                return await awaitable
+            except Exception as e:
+                if default is _REQUIRED:
+                    raise
+                logger.debug(f"{self.name}.{key} failed, using default: {e}")
+                return default
+            finally:
+                self.timings_ms[key] = (time.perf_counter() - started) * 1000
+
+    async def run(self) -> dict[str, Any]:
+        """Run all queued queries concurrently and return results by key."""
+        steps, self._steps = self._steps, []
+        started = time.perf_counter()
+        try:
+            results = await asyncio.gather(
+                *(self._run_step(key, aw, default) for key, aw, default in steps)
+            )
+        finally:
+            self.total_ms += (time.perf_counter() - started) * 1000
+            self._log()
+        return {key: result for (key, _, _), result in zip(steps, results, strict=True)}
+
+    def _log(self) -> None:
+        if not self.timings_ms:
+            return
+        slowest = max(self.timings_ms, key=self.timings_ms.get)
+        message = (
+            f"{self.name}: {self.total_ms:.1f}ms total, "
+            f"slowest {slowest}={self.timings_ms[slowest]:.1f}ms, "
+            f"sum {sum(self.timings_ms.values()):.1f}ms over {len(self.timings_ms)} queries"
+        )
+        if self.total_ms > self._slow_ms:
+            logger.warning(f"Slow endpoint {message}")
+        else:
+            logger.debug(message)
+
+    def summary(self) -> dict[str, Any]:
+        """Timings for the most recent run, for status endpoints."""
+        return {
+            "total_ms": round(self.total_ms, 2),
+            "queries": {k: round(v, 2) for k, v in self.timings_ms.items()},
+        }
@@ -0,0 +1,300 @@
+"""
+Snapshot cache for expensive dashboard endpoints.
+
+Several endpoints (/health, /api/metrics, /api/activity, /api/performance,
+/api/market/<id>) fan out into multi-query coroutines on the trading event
+loop. With several dashboard tabs polling, every poll used to schedule its
+own batch of queries on the loop and the shared connection pool.
+
+SnapshotService decouples the two:
+
+- A snapshot is the response payload for one key (endpoint + parameters),
+  serialized to JSON once, with a gzip variant and an ETag computed at the
+  same time.
+- Flask threads serve the stored bytes directly. Only a cold key (first
+  request, or one evicted after going idle) dispatches its producer to the
+  event loop, and concurrent cold requests for the same key share one
+  computation.
+- A refresh task on the event loop recomputes, one at a time, keys that
+  have been requested since their snapshot was computed, once their TTL
+  expires or invalidate() reports a change (order/fill/position events).
+  Keys nobody has asked for since (e.g. a /api/market/<id> opened once)
+  wait for their next request instead of costing queries every TTL.
+- Every response carries Age / X-Snapshot-Computed-At headers so clients
+  can see how stale it is.
+- A snapshot older than max_age_factor x its TTL is never served: if the
+  refresh loop has stopped making progress (e.g. the event loop is
+  wedged), the request recomputes inline and fails with the runner's
+  timeout instead of returning an old 200 indefinitely.
+
+Usage:
+    snapshots = SnapshotService()
+    await snapshots.start()          # on the event loop
+    snap = snapshots.get_or_compute("metrics", producer, ttl=10, runner=run_async)
+    snapshots.invalidate("metrics")  # from any thread
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Producer returns (payload, http_status)
+Producer = Callable[[], Awaitable[tuple[Any, int]]]
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+@dataclass
+class Snapshot:
+    """A pre-serialized response payload."""
+
+    body: bytes
+    status: int
+    etag: str  # Unquoted
+    computed_at: datetime
+    computed_monotonic: float
+    gzip_body: bytes | None = None
+
+    @property
+    def age_seconds(self) -> float:
+        return max(0.0, time.monotonic() - self.computed_monotonic)
+
+
+def build_snapshot(payload: Any, status: int = 200, encoder: type | None = None) -> Snapshot:
+    """Serialize `payload` once and precompute its ETag and gzip variant."""
+    body = json.dumps(payload, cls=encoder).encode("utf-8")
+    return Snapshot(
+        body=body,
+        status=status,
+        etag=hashlib.sha1(body).hexdigest(),
+        computed_at=datetime.now(timezone.utc),
+        computed_monotonic=time.monotonic(),
+        gzip_body=gzip.compress(body, compresslevel=5) if len(body) >= GZIP_MIN_BYTES else None,
+    )
+
+
+@dataclass
+class _Entry:
+    producer: Producer
+    ttl: float
+    snapshot: Snapshot | None = None
+    last_requested: float = field(default_factory=time.monotonic)
+    dirty: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class SnapshotService:
+    """
+    Holds snapshots by key and keeps requested ones fresh in the background.
+
+    Thread-safe: Flask threads call get_or_compute()/invalidate(); the
+    refresh loop runs on the event loop passed to start().
+    """
+
+    def __init__(
+        self,
+        encoder: type | None = None,
+        idle_seconds: float = 300.0,
+        max_entries: int = 256,
+        tick_seconds: float = 1.0,
+        min_refresh_seconds: float = 1.0,
+        max_age_factor: float = 3.0,
+    ) -> None:
+        """
+        Args:
+            encoder: json.JSONEncoder subclass used to serialize payloads
+            idle_seconds: Stop refreshing (and drop) keys not requested for this long
+            max_entries: Max keys held; least recently requested are evicted
+            tick_seconds: How often the refresh loop checks for expired keys
+            min_refresh_seconds: Floor on how often an invalidated key is
+                recomputed, so bursts of change events collapse into one refresh
+            max_age_factor: Never serve a snapshot older than this many TTLs,
+                even while the refresh loop is running
+        """
+        self._encoder = encoder
+        self._idle_seconds = idle_seconds
+        self._max_entries = max_entries
+        self._tick_seconds = tick_seconds
+        self._min_refresh_seconds = min_refresh_seconds
+        self._max_age_factor = max_age_factor
+
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background refresh loop on the current event loop."""
+        if self.is_running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._run_loop(), name="dashboard_snapshots")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def get_or_compute(
+        self,
+        key: str,
+        producer: Producer,
+        ttl: float,
+        runner: Callable[[Awaitable[Any]], Any],
+    ) -> Snapshot:
+        """
+        Return the snapshot for `key`, computing it via `runner` if cold.
+
+        While the refresh loop is running, an expired snapshot is served
+        as-is (the loop is already recomputing it) until it is
+        max_age_factor TTLs old. Without the loop, or past that age, it is
+        recomputed inline.
+
+        Raises whatever the producer raises on a cold miss.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(producer=producer, ttl=ttl)
+                self._entries[key] = entry
+                self._evict_locked()
+            else:
+                self._entries.move_to_end(key)
+            entry.producer = producer
+            entry.last_requested = now
+
+        snapshot = entry.snapshot
+        if snapshot is not None and self._servable(snapshot, ttl):
+            self.hits += 1
+            return snapshot
+
+        # Cold, or expired with no refresh loop / past max age: one thread
+        # computes, others wait
+        with entry.lock:
+            snapshot = entry.snapshot
+            if snapshot is not None and self._servable(snapshot, ttl):
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            payload, status = runner(producer())
+            snapshot = build_snapshot(payload, status, self._encoder)
+            entry.snapshot = snapshot
+            entry.dirty = False
+            return snapshot
+
+    def _servable(self, snapshot: Snapshot, ttl: float) -> bool:
+        age = snapshot.age_seconds
+        if age < ttl:
+            return True
+        return self.is_running and age < ttl * self._max_age_factor
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Mark keys starting with any of `prefixes` for immediate refresh."""
+        with self._lock:
+            for key, entry in self._entries.items():
+                if key.startswith(prefixes):
+                    entry.dirty = True
+        if self._loop is not None and self._wake is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._wake.set)
+            except RuntimeError:
+                pass  # Loop shutting down
+
+    async def refresh_due(self) -> int:
+        """Recompute expired or dirty snapshots requested since they were computed."""
+        now = time.monotonic()
+        due: list[tuple[str, _Entry]] = []
+        with self._lock:
+            for key, entry in list(self._entries.items()):
+                if now - entry.last_requested > self._idle_seconds:
+                    del self._entries[key]
+                    continue
+                snapshot = entry.snapshot
+                if snapshot is None:
+                    due.append((key, entry))
+                    continue
+                if entry.last_requested <= snapshot.computed_monotonic:
+                    continue  # Not requested since; the next request marks it due
+                age = snapshot.age_seconds
+                if age >= entry.ttl or (entry.dirty and age >= self._min_refresh_seconds):
+                    due.append((key, entry))
+
+        refreshed = 0
+        for key, entry in due:
+            entry.dirty = False
+            try:
+                payload, status = await entry.producer()
+            except Exception as e:
+                # Keep serving the previous snapshot; its Age header shows the staleness
+                self.refresh_errors += 1
+                logger.warning(f"Snapshot refresh failed for {key}: {e}")
+                continue
+            entry.snapshot = build_snapshot(payload, status, self._encoder)
+            refreshed += 1
+        self.refreshes += refreshed
+        return refreshed
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self._tick_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+                await self.refresh_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Error in snapshot refresh loop: {e}")
+                await asyncio.sleep(self._tick_seconds)
+
+    def _evict_locked(self) -> None:
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = list(self._entries.items())
+        return {
+            "entries": len(entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "running": self.is_running,
+            "max_age_seconds": round(
+                max((e.snapshot.age_seconds for _, e in entries if e.snapshot), default=0.0), 3
+            ),
+        }
@@ -0,0 +1,224 @@
+"""
+SSE fan-out hub for the dashboard event stream.
+
+broadcast_event() runs on the bot's event loop for every price tick, while
+each /api/stream client drains its events from a Flask worker thread. The
+hub keeps that hand-off cheap and bounded:
+
+- Each event is serialized to an SSE frame once and the same string is
+  shared by every subscriber.
+- Clients subscribe to topics (prices, signals, fills, orders); events for
+  topics a client did not ask for are never queued for it. Events outside
+  those topics (bot_state, ...) go to every client.
+- Non-price events go into a fixed-size ring per client. When a slow client
+  overflows, the oldest frames are dropped and the client receives one
+  "resync" frame telling it to refetch.
+- Price events are coalesced to the latest price per token and released
+  at most `price_updates_per_second` times per second, so tick volume does
+  not translate into per-client work.
+
+Usage:
+    hub = SSEHub(price_updates_per_second=4)
+    client = hub.subscribe(topics={"prices", "orders"})
+    hub.publish({"type": "price", "token_id": "tok", "price": "0.95"})
+    frames = hub.next_frames(client, timeout=30)
+    hub.unsubscribe(client)
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable
+from typing import Any
+
+TOPICS = ("prices", "signals", "fills", "orders")
+
+# Event "type" -> topic. Unmapped types are delivered to every client.
+TOPIC_BY_EVENT_TYPE = {
+    "price": "prices",
+    "signal": "signals",
+    "fill": "fills",
+    "position": "fills",
+    "order": "orders",
+}
+
+
+def encode_frame(event: dict[str, Any]) -> str:
+    """Serialize an event as an SSE data frame."""
+    return f"data: {json.dumps(event, default=str)}\n\n"
+
+
+def parse_topics(raw: str | None) -> frozenset[str]:
+    """Parse a comma-separated ?topics= value; empty or missing means all topics."""
+    if not raw:
+        return frozenset(TOPICS)
+    requested = {t.strip() for t in raw.split(",")}
+    return frozenset(t for t in TOPICS if t in requested)
+
+
+class SSEClient:
+    """Per-connection buffers. Only touched through SSEHub."""
+
+    def __init__(self, topics: Iterable[str], buffer_size: int) -> None:
+        self.topics = frozenset(topics)
+        self.wants_prices = "prices" in self.topics
+        self.frames: deque[str] = deque(maxlen=buffer_size)
+        self.prices: OrderedDict[str, str] = OrderedDict()  # token_id -> frame
+        self.max_prices = buffer_size
+        self.dropped = 0  # Frames lost since the last drain
+        self.dropped_total = 0
+        self.cond = threading.Condition(threading.Lock())
+
+
+class SSEHub:
+    """
+    Bounded, coalescing, topic-filtered fan-out of dashboard events.
+
+    publish() may be called from any thread (normally the event loop);
+    next_frames() blocks the calling stream thread until frames are ready.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 256,
+        price_updates_per_second: float = 4.0,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._price_interval = (
+            1.0 / price_updates_per_second if price_updates_per_second > 0 else 0.0
+        )
+
+        # Copy-on-write tuple so publish() can iterate without holding a lock
+        self._clients: tuple[SSEClient, ...] = ()
+        self._clients_lock = threading.Lock()
+
+        # Latest price event per token awaiting the next throttled release
+        self._pending_prices: dict[str, dict[str, Any]] = {}
+        self._price_lock = threading.Lock()
+        self._last_price_release = 0.0
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def subscribe(self, topics: Iterable[str] | None = None) -> SSEClient:
+        """Register a stream client for `topics` (default: all)."""
+        client = SSEClient(TOPICS if topics is None else topics, self._buffer_size)
+        with self._clients_lock:
+            self._clients = self._clients + (client,)
+        return client
+
+    def unsubscribe(self, client: SSEClient) -> None:
+        with self._clients_lock:
+            self._clients = tuple(c for c in self._clients if c is not client)
+
+    def publish(self, event: dict[str, Any]) -> None:
+        """Queue an event for every interested client."""
+        clients = self._clients
+        if not clients:
+            return
+
+        topic = TOPIC_BY_EVENT_TYPE.get(event.get("type"))
+        if topic == "prices":
+            token_id = event.get("token_id")
+            if token_id is not None:
+                if not any(c.wants_prices for c in clients):
+                    return
+                with self._price_lock:
+                    self._pending_prices[token_id] = event
+                self.release_prices()
+                return
+
+        targets = [c for c in clients if topic is None or topic in c.topics]
+        if not targets:
+            return
+
+        frame = encode_frame(event)
+        for client in targets:
+            with client.cond:
+                if len(client.frames) == client.frames.maxlen:
+                    client.dropped += 1
+                    client.dropped_total += 1
+                client.frames.append(frame)
+                client.cond.notify()
+
+    def release_prices(self, force: bool = False) -> int:
+        """
+        Hand pending price updates to subscribers if the throttle allows.
+
+        Returns the number of tokens released.
+        """
+        now = time.monotonic()
+        with self._price_lock:
+            if not self._pending_prices:
+                return 0
+            if not force and now - self._last_price_release < self._price_interval:
+                return 0
+            pending = self._pending_prices
+            self._pending_prices = {}
+            self._last_price_release = now
+
+        targets = [c for c in self._clients if c.wants_prices]
+        if not targets:
+            return len(pending)
+
+        frames = [(token_id, encode_frame(event)) for token_id, event in pending.items()]
+        for client in targets:
+            with client.cond:
+                for token_id, frame in frames:
+                    client.prices.pop(token_id, None)
+                    client.prices[token_id] = frame
+                while len(client.prices) > client.max_prices:
+                    client.prices.popitem(last=False)
+                    client.dropped += 1
+                    client.dropped_total += 1
+                client.cond.notify()
+        return len(pending)
+
+    def next_frames(self, client: SSEClient, timeout: float) -> list[str]:
+        """
+        Wait up to `timeout` seconds and return the client's queued frames.
+
+        Returns an empty list on timeout (caller sends a keepalive). While
+        price updates are held back by the throttle, the wait is shortened
+        so whichever stream thread wakes first releases them.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self.release_prices()
+            with client.cond:
+                if client.frames or client.prices or client.dropped:
+                    return self._drain(client)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                if self._pending_prices and client.wants_prices:
+                    remaining = min(remaining, max(self._price_interval, 0.01))
+                client.cond.wait(remaining)
+
+    def _drain(self, client: SSEClient) -> list[str]:
+        """Take everything queued for `client`. Caller holds client.cond."""
+        frames: list[str] = []
+        if client.dropped:
+            frames.append(encode_frame({"type": "resync", "dropped": client.dropped}))
+            client.dropped = 0
+        frames.extend(client.frames)
+        frames.extend(client.prices.values())
+        client.frames.clear()
+        client.prices.clear()
+        return frames
+
+    def get_stats(self) -> dict[str, Any]:
+        """Subscriber and drop counters for status endpoints."""
+        clients = self._clients
+        return {
+            "clients": len(clients),
+            "pending_prices": len(self._pending_prices),
+            "dropped_total": sum(c.dropped_total for c in clients),
+            "price_updates_per_second": (
+                round(1.0 / self._price_interval, 2) if self._price_interval else None
+            ),
+        }
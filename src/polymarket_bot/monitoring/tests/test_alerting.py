@@ -3,12 +3,13 @@ Tests for alerting and notifications.
 
 Alerts notify operators of important events.
 """
+import asyncio
 import pytest
 import time
 from decimal import Decimal
 from unittest.mock import MagicMock
 
-from polymarket_bot.monitoring.alerting import AlertManager
+from polymarket_bot.monitoring.alerting import TELEGRAM_MAX_TEXT, AlertManager
 
 
 class TestTelegramAlerts:
@@ -303,3 +304,195 @@ class TestAlertStats:
 
         assert stats["unique_alerts"] == 2
         assert stats["total_sent"] == 2  # One was deduplicated
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: dict):
+        self.status = status
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, content_type=None):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+class FakeSession:
+    """aiohttp.ClientSession stand-in serving canned responses in order."""
+
+    def __init__(self, *responses: FakeResponse):
+        self.responses = list(responses)
+        self.posts: list[dict] = []
+
+    def post(self, url, json):
+        self.posts.append(json)
+        return self.responses.pop(0)
+
+
+class TestAsyncDelivery:
+    """Tests for the background alert dispatcher."""
+
+    @pytest.fixture
+    async def manager(self, mock_telegram_api):
+        manager = AlertManager(
+            telegram_bot_token="test_token",
+            telegram_chat_id="test_chat",
+            _telegram_api=mock_telegram_api,
+            min_send_interval=0.05,
+            retry_delay=0.01,
+        )
+        await manager.start()
+        yield manager
+        await manager.stop()
+
+    @pytest.mark.asyncio
+    async def test_send_alert_only_enqueues(self, manager, mock_telegram_api):
+        assert manager.send_alert(title="Queued", message="m", dedup_key="k") is True
+
+        # Nothing is sent until the dispatcher runs; dedup applies at once
+        mock_telegram_api.send_message.assert_not_called()
+        assert manager.send_alert(title="Queued", message="m", dedup_key="k") is False
+
+        await manager.stop()
+        mock_telegram_api.send_message.assert_called_once()
+        assert manager.get_alert_stats()["last_latency_seconds"] is not None
+
+    @pytest.mark.asyncio
+    async def test_bursts_are_coalesced_into_a_digest(self, manager, mock_telegram_api):
+        manager.send_alert(title="First", message="m")
+        await asyncio.sleep(0.01)  # First goes out alone
+        for i in range(4):
+            manager.send_alert(title=f"Burst {i}", message="m")
+
+        await manager.stop()
+
+        assert mock_telegram_api.send_message.call_count == 2
+        digest = mock_telegram_api.send_message.call_args.kwargs["text"]
+        assert digest.startswith("*4 alerts*")
+        assert "Burst 0" in digest and "Burst 3" in digest
+        assert manager.get_alert_stats()["digests"] == 1
+
+    @pytest.mark.asyncio
+    async def test_digest_is_cut_between_alerts(self, manager, mock_telegram_api):
+        """Alerts past the length limit lead the next digest instead of being cut."""
+        manager.send_alert(title="First", message="m")
+        await asyncio.sleep(0.01)
+        for i in range(3):
+            manager.send_alert(title=f"Long {i}", message="_x_ " * 500)
+
+        await manager.stop()
+
+        texts = [c.kwargs["text"] for c in mock_telegram_api.send_message.call_args_list]
+        assert len(texts) == 3
+        assert all(len(text) <= TELEGRAM_MAX_TEXT for text in texts)
+        assert texts[1].startswith("*2 alerts*")
+        assert texts[1].endswith("_x_") and texts[2].endswith("_x_")
+        assert [sum(f"Long {i}" in t for t in texts) for i in range(3)] == [1, 1, 1]
+        assert manager.get_alert_stats()["failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_alerts(self, mock_telegram_api):
+        manager = AlertManager(_telegram_api=mock_telegram_api, queue_size=2)
+        await manager.start()
+
+        results = [manager.send_alert(title=f"A{i}", message="m") for i in range(3)]
+        await manager.stop()
+
+        assert results == [True, True, False]
+        assert manager.get_alert_stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self, manager, mock_telegram_api):
+        mock_telegram_api.send_message.side_effect = [Exception("timeout"), {"ok": True}]
+
+        manager.send_alert(title="Retry", message="m")
+        await manager.stop()
+
+        stats = manager.get_alert_stats()
+        assert mock_telegram_api.send_message.call_count == 2
+        assert (stats["retries"], stats["failed"]) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, mock_telegram_api):
+        mock_telegram_api.send_message.side_effect = Exception("down")
+        manager = AlertManager(
+            _telegram_api=mock_telegram_api,
+            max_retries=2,
+            retry_delay=0.01,
+            min_send_interval=0,
+        )
+        await manager.start()
+
+        manager.send_alert(title="Lost", message="m")
+        await manager.stop()
+
+        assert mock_telegram_api.send_message.call_count == 3
+        assert manager.get_alert_stats()["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sends_are_spaced(self, mock_telegram_api):
+        manager = AlertManager(
+            _telegram_api=mock_telegram_api, min_send_interval=0.2, max_digest=1
+        )
+        await manager.start()
+        started = time.monotonic()
+
+        manager.send_alert(title="One", message="m")
+        manager.send_alert(title="Two", message="m")
+        await manager.stop()
+
+        assert mock_telegram_api.send_message.call_count == 2
+        assert time.monotonic() - started >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_honours_telegram_retry_after(self):
+        session = FakeSession(
+            FakeResponse(429, {"ok": False, "parameters": {"retry_after": 0.05}}),
+            FakeResponse(200, {"ok": True}),
+        )
+        manager = AlertManager(
+            telegram_bot_token="test_token",
+            telegram_chat_id="test_chat",
+            session=session,
+            retry_delay=0.01,
+            min_send_interval=0,
+        )
+        await manager.start()
+
+        manager.send_alert(title="Limited", message="m")
+        await manager.stop()
+
+        assert len(session.posts) == 2
+        assert session.posts[1]["chat_id"] == "test_chat"
+        assert manager.get_alert_stats()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_unparseable_markdown_is_resent_as_plain_text(self):
+        session = FakeSession(
+            FakeResponse(400, {"ok": False, "description": "can't parse entities"}),
+            FakeResponse(200, {"ok": True}),
+        )
+        manager = AlertManager(
+            telegram_bot_token="test_token",
+            telegram_chat_id="test_chat",
+            session=session,
+            retry_delay=0.01,
+            min_send_interval=0,
+        )
+        await manager.start()
+
+        manager.send_alert(title="Broken", message="unclosed *bold")
+        await manager.stop()
+
+        assert [post.get("parse_mode") for post in session.posts] == ["Markdown", None]
+        assert session.posts[1]["text"] == session.posts[0]["text"]
+        stats = manager.get_alert_stats()
+        assert (stats["retries"], stats["failed"]) == (0, 0)
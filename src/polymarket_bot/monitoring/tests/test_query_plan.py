@@ -0,0 +1,78 @@
+"""
+Tests for concurrent dashboard query groups.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+
+from polymarket_bot.monitoring.dashboard import Dashboard
+from polymarket_bot.monitoring.query_plan import QueryPlan
+
+
+async def _query(result, delay=0.05, tracker=None):
+    if tracker is not None:
+        tracker["active"] += 1
+        tracker["peak"] = max(tracker["peak"], tracker["active"])
+    try:
+        await asyncio.sleep(delay)
+        return result
+    finally:
+        if tracker is not None:
+            tracker["active"] -= 1
+
+
+class TestQueryPlan:
+    """Concurrency, budget and error handling."""
+
+    async def test_latency_is_slowest_query_not_sum(self):
+        plan = QueryPlan("test", max_concurrency=4)
+        for i in range(4):
+            plan.add(f"q{i}", _query(i, delay=0.05))
+
+        started = time.perf_counter()
+        results = await plan.run()
+        elapsed = time.perf_counter() - started
+
+        assert results == {"q0": 0, "q1": 1, "q2": 2, "q3": 3}
+        assert elapsed < 0.15
+        assert set(plan.summary()["queries"]) == {"q0", "q1", "q2", "q3"}
+
+    async def test_connection_budget_is_respected(self):
+        tracker = {"active": 0, "peak": 0}
+        plan = QueryPlan("test", max_concurrency=2)
+        for i in range(6):
+            plan.add(f"q{i}", _query(i, delay=0.01, tracker=tracker))
+
+        await plan.run()
+
+        assert tracker["peak"] == 2
+
+    async def test_optional_query_failure_uses_default(self):
+        plan = QueryPlan("test")
+        plan.add("ok", _query("row", delay=0))
+        plan.add("orders", AsyncMock(side_effect=RuntimeError("no table"))(), default=[])
+
+        assert await plan.run() == {"ok": "row", "orders": []}
+
+    async def test_required_query_failure_propagates(self):
+        plan = QueryPlan("test")
+        plan.add("ok", _query("row", delay=0))
+        plan.add("market", AsyncMock(side_effect=RuntimeError("db down"))())
+
+        with pytest.raises(RuntimeError):
+            await plan.run()
+
+
+class TestDashboardQueryPlans:
+    """Dashboard endpoints record per-endpoint timings."""
+
+    async def test_activity_records_timings(self, mock_db):
+        dashboard = Dashboard(db=mock_db)
+
+        assert await dashboard._get_activity(limit=10) == []
+
+        timings = dashboard._endpoint_timings["activity"]
+        assert set(timings["queries"]) == {"triggers", "orders", "exits", "positions", "actions"}
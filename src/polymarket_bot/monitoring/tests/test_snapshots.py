@@ -0,0 +1,196 @@
+"""
+Tests for the dashboard snapshot cache.
+"""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("flask")
+
+from polymarket_bot.monitoring import dashboard as dashboard_module
+from polymarket_bot.monitoring.dashboard import create_app
+from polymarket_bot.monitoring.snapshots import SnapshotService, _Entry, build_snapshot
+
+
+def _run(coro):
+    return asyncio.new_event_loop().run_until_complete(coro)
+
+
+def _seed(service: SnapshotService, key: str, producer, ttl: float = 60):
+    snapshot = build_snapshot({}, 200)
+    service._entries[key] = _Entry(producer=producer, ttl=ttl, snapshot=snapshot)
+    return snapshot
+
+
+class TestSnapshotService:
+    """Caching, invalidation and background refresh."""
+
+    def test_cold_miss_computes_once_then_hits(self):
+        service = SnapshotService()
+        producer = AsyncMock(return_value=({"n": 1}, 200))
+
+        first = service.get_or_compute("k", producer, ttl=60, runner=_run)
+        second = service.get_or_compute("k", producer, ttl=60, runner=_run)
+
+        assert producer.await_count == 1
+        assert first is second
+        assert json.loads(first.body) == {"n": 1}
+        assert service.get_stats()["hits"] == 1
+
+    def test_expired_snapshot_recomputed_without_refresh_loop(self):
+        service = SnapshotService()
+        producer = AsyncMock(return_value=({"n": 1}, 200))
+
+        service.get_or_compute("k", producer, ttl=0, runner=_run)
+        service.get_or_compute("k", producer, ttl=0, runner=_run)
+
+        assert producer.await_count == 2
+
+    def test_snapshot_past_max_age_not_served_while_running(self):
+        """A running but stuck refresh loop does not keep an old snapshot alive."""
+        service = SnapshotService(max_age_factor=3.0)
+        service._task = MagicMock(done=MagicMock(return_value=False))
+        producer = AsyncMock(return_value=({"n": 2}, 200))
+
+        snap = _seed(service, "k", producer, ttl=1)
+        snap.computed_monotonic -= 2  # Expired, within 3 TTLs
+        assert service.get_or_compute("k", producer, ttl=1, runner=_run) is snap
+
+        snap.computed_monotonic -= 2  # Past 3 TTLs
+        fresh = service.get_or_compute("k", producer, ttl=1, runner=_run)
+
+        assert json.loads(fresh.body) == {"n": 2}
+        producer.assert_awaited_once()
+
+    async def test_refresh_due_recomputes_dirty_keys_only(self):
+        service = SnapshotService(min_refresh_seconds=0)
+        activity = AsyncMock(return_value=({"events": []}, 200))
+        market = AsyncMock(return_value=({"market": "x"}, 200))
+        _seed(service, "activity:200", activity)
+        _seed(service, "market:0x1", market)
+
+        service.invalidate("activity")
+        refreshed = await service.refresh_due()
+
+        assert refreshed == 1
+        activity.assert_awaited_once()
+        market.assert_not_awaited()
+
+    def test_refresh_due_skips_keys_not_requested_since_computed(self):
+        service = SnapshotService()
+        metrics = AsyncMock(return_value=({"n": 1}, 200))
+        market = AsyncMock(return_value=({"market": "x"}, 200))
+        service.get_or_compute("metrics", metrics, ttl=0, runner=_run)
+        service.get_or_compute("market:0x1", market, ttl=0, runner=_run)
+
+        assert _run(service.refresh_due()) == 0
+
+        # A poll served from the expired snapshot marks the key due again
+        service._task = MagicMock(done=MagicMock(return_value=False))
+        service._entries["metrics"].ttl = 1
+        service._entries["metrics"].snapshot.computed_monotonic -= 1
+        service.get_or_compute("metrics", metrics, ttl=1, runner=_run)
+
+        assert _run(service.refresh_due()) == 1
+        assert metrics.await_count == 2
+        market.assert_awaited_once()
+
+    async def test_failed_refresh_keeps_previous_snapshot(self):
+        service = SnapshotService(min_refresh_seconds=0)
+        producer = AsyncMock(side_effect=RuntimeError("db down"))
+        snap = _seed(service, "k", producer)
+
+        service.invalidate("k")
+        await service.refresh_due()
+
+        assert service._entries["k"].snapshot is snap
+        assert service.get_stats()["refresh_errors"] == 1
+
+
+class TestSnapshotEndpoints:
+    """HTTP behavior of snapshot-backed routes."""
+
+    @pytest.fixture
+    def collector(self):
+        collector = MagicMock()
+        metrics = MagicMock(
+            total_trades=3,
+            winning_trades=2,
+            losing_trades=1,
+            win_rate=0.66,
+            total_pnl=1,
+            realized_pnl=1,
+            unrealized_pnl=0,
+            position_count=1,
+            capital_deployed=10,
+            available_balance=90,
+        )
+        metrics.calculated_at.isoformat.return_value = "2024-01-01T00:00:00+00:00"
+        collector.get_all_metrics = AsyncMock(return_value=metrics)
+        return collector
+
+    def test_reports_staleness_and_etag(self, collector):
+        client = create_app(metrics_collector=collector, testing=True).test_client()
+
+        response = client.get("/api/metrics")
+
+        assert response.status_code == 200
+        assert response.get_json()["total_trades"] == 3
+        assert "Age" in response.headers
+        assert "X-Snapshot-Computed-At" in response.headers
+        assert response.headers["ETag"]
+
+    def test_if_none_match_returns_304_without_recompute(self, collector):
+        client = create_app(metrics_collector=collector, testing=True).test_client()
+
+        etag = client.get("/api/metrics").headers["ETag"]
+        response = client.get("/api/metrics", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert collector.get_all_metrics.await_count == 1
+
+    def test_gzip_when_accepted(self, mock_db):
+        app = create_app(db=mock_db, testing=True)
+        app.dashboard._get_activity = AsyncMock(
+            return_value=[{"type": "order", "detail": "x" * 50} for _ in range(100)]
+        )
+
+        response = app.test_client().get("/api/activity", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert len(json.loads(gzip.decompress(response.data))["events"]) == 100
+
+    def test_health_fails_when_event_loop_blocked(self, monkeypatch):
+        """A wedged trading loop turns /health into a 503 once the snapshot is too old."""
+        monkeypatch.setattr(dashboard_module, "HEALTH_TIMEOUT_SECONDS", 0.2)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            app = create_app(testing=True)
+            dashboard = app.dashboard
+            dashboard._event_loop = loop
+            asyncio.run_coroutine_threadsafe(dashboard.start_snapshots(), loop).result(5)
+            client = app.test_client()
+            assert client.get("/health").status_code == 200
+
+            # Wedge the loop, then age the cached snapshot past 3 TTLs
+            loop.call_soon_threadsafe(time.sleep, 1.0)
+            time.sleep(0.1)
+            entry = dashboard._snapshots._entries["health"]
+            entry.snapshot.computed_monotonic -= 3 * dashboard_module.SNAPSHOT_TTLS["health"] + 1
+            assert dashboard._snapshots.is_running
+
+            assert client.get("/health").status_code == 503
+        finally:
+            time.sleep(1.0)
+            asyncio.run_coroutine_threadsafe(app.dashboard.stop_snapshots(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
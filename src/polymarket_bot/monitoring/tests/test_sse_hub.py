@@ -0,0 +1,95 @@
+"""
+Tests for the SSE fan-out hub.
+"""
+
+import json
+from unittest.mock import patch
+
+from polymarket_bot.monitoring.sse_hub import SSEHub, parse_topics
+
+
+def _events(frames):
+    return [json.loads(f[len("data: ") :].strip()) for f in frames]
+
+
+class TestFanOut:
+    """Serialization, topics and bounded buffers."""
+
+    def test_serializes_once_for_all_clients(self):
+        hub = SSEHub()
+        a = hub.subscribe()
+        b = hub.subscribe()
+
+        with patch(
+            "polymarket_bot.monitoring.sse_hub.encode_frame",
+            wraps=lambda e: f"data: {json.dumps(e)}\n\n",
+        ) as encode:
+            hub.publish({"type": "order", "order_id": "o1"})
+
+        assert encode.call_count == 1
+        assert hub.next_frames(a, timeout=0) == hub.next_frames(b, timeout=0)
+
+    def test_topic_filtering(self):
+        hub = SSEHub()
+        orders_only = hub.subscribe(parse_topics("orders"))
+
+        hub.publish({"type": "signal", "token_id": "tok"})
+        hub.publish({"type": "order", "order_id": "o1"})
+        hub.publish({"type": "bot_state", "state": "paused"})
+
+        types = [e["type"] for e in _events(hub.next_frames(orders_only, timeout=0))]
+        assert types == ["order", "bot_state"]
+
+    def test_slow_client_is_bounded_and_told_to_resync(self):
+        hub = SSEHub(buffer_size=3)
+        client = hub.subscribe()
+
+        for i in range(10):
+            hub.publish({"type": "order", "order_id": f"o{i}"})
+
+        events = _events(hub.next_frames(client, timeout=0))
+        assert events[0] == {"type": "resync", "dropped": 7}
+        assert [e["order_id"] for e in events[1:]] == ["o7", "o8", "o9"]
+
+    def test_unsubscribed_client_receives_nothing(self):
+        hub = SSEHub()
+        client = hub.subscribe()
+        hub.unsubscribe(client)
+
+        hub.publish({"type": "order", "order_id": "o1"})
+
+        assert hub.client_count == 0
+        assert hub.next_frames(client, timeout=0) == []
+
+
+class TestPriceCoalescing:
+    """Latest price per token, released at the throttle rate."""
+
+    def test_coalesces_to_latest_price_per_token(self):
+        hub = SSEHub(price_updates_per_second=1)
+        client = hub.subscribe()
+
+        with patch("polymarket_bot.monitoring.sse_hub.time.monotonic", return_value=1000.0):
+            hub.publish({"type": "price", "token_id": "a", "price": "0.90"})
+            hub.publish({"type": "price", "token_id": "a", "price": "0.91"})
+            hub.publish({"type": "price", "token_id": "b", "price": "0.50"})
+            # Throttled: only the first tick was released
+            first = _events(hub.next_frames(client, timeout=0))
+
+        with patch("polymarket_bot.monitoring.sse_hub.time.monotonic", return_value=1001.0):
+            second = _events(hub.next_frames(client, timeout=0))
+
+        assert [(e["token_id"], e["price"]) for e in first] == [("a", "0.90")]
+        assert [(e["token_id"], e["price"]) for e in second] == [("a", "0.91"), ("b", "0.50")]
+
+    def test_prices_skipped_without_price_subscribers(self):
+        hub = SSEHub()
+        hub.subscribe(parse_topics("orders"))
+
+        hub.publish({"type": "price", "token_id": "a", "price": "0.90"})
+
+        assert hub.get_stats()["pending_prices"] == 0
+
+    def test_parse_topics_defaults_to_all(self):
+        assert parse_topics(None) == frozenset({"prices", "signals", "fills", "orders"})
+        assert parse_topics("prices, bogus") == frozenset({"prices"})
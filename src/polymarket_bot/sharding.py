@@ -0,0 +1,303 @@
+"""
+Engine sharding across worker processes.
+
+With ENGINE_WORKERS=K the bot runs as one coordinator and K workers. Each
+worker owns a consistent-hash shard of condition_ids: its ingestion
+subscribes to those markets only (read from the market_catalog table the
+coordinator's catalog writes, see StoredMarketCatalog) and its engine
+evaluates them (threshold, read-only dedup, context, filters, strategies).
+Entry and exit signals go to the coordinator over a Unix socket; the
+coordinator owns execution, balance, background tasks and the dashboard,
+and runs every forwarded signal through TradingEngine.submit_entry or
+submit_exit. G2 (try_record_trigger_atomic, a Postgres advisory lock) and
+max positions are therefore enforced in one place, as in a single-process
+bot.
+
+    ring = ShardRing(4)
+    ring.shard_for("0xabc...")        # 0..3, stable across processes
+
+Frames on the socket are a 4-byte big-endian length followed by a pickled
+EntryMessage or ExitMessage. The socket lives in a private directory (mode 0700), so only
+processes of the same user can connect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import hashlib
+import logging
+import multiprocessing
+import os
+import pickle
+import struct
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from polymarket_bot.strategies import EntrySignal, ExitSignal, StrategyContext
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+
+
+def _hash(key: str) -> int:
+    """64-bit hash, identical in every process (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ShardRing:
+    """
+    Consistent-hash ring mapping condition_ids to shards.
+
+    Each shard has `replicas` points on the ring; a key belongs to the shard
+    of the first point at or after its hash. Growing from K to K+1 shards
+    moves about 1/(K+1) of the markets.
+    """
+
+    def __init__(self, shard_count: int, replicas: int = 64):
+        if shard_count < 1:
+            raise ValueError(f"shard_count must be >= 1, got {shard_count}")
+        self.shard_count = shard_count
+        points = sorted(
+            (_hash(f"shard-{shard}-{replica}"), shard)
+            for shard in range(shard_count)
+            for replica in range(replicas)
+        )
+        self._points = [point for point, _ in points]
+        self._shards = [shard for _, shard in points]
+
+    def shard_for(self, condition_id: str) -> int:
+        """Shard that owns a condition_id."""
+        index = bisect.bisect_left(self._points, _hash(condition_id))
+        return self._shards[index % len(self._points)]
+
+    def owns(self, shard: int, condition_id: str) -> bool:
+        """Whether `shard` owns condition_id."""
+        return self.shard_for(condition_id) == shard
+
+
+@dataclass(frozen=True)
+class EntryMessage:
+    """An entry signal forwarded from a worker to the coordinator."""
+
+    shard: int
+    strategy: str
+    threshold: Decimal
+    signal: EntrySignal
+    context: StrategyContext
+    event: dict = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return f"entry for {self.signal.token_id} ({self.strategy})"
+
+
+@dataclass(frozen=True)
+class ExitMessage:
+    """An exit signal forwarded from a worker to the coordinator."""
+
+    shard: int
+    strategy: str
+    signal: ExitSignal
+    context: StrategyContext
+
+    def __str__(self) -> str:
+        return f"exit for position {self.signal.position_id} ({self.strategy})"
+
+
+ShardMessage = EntryMessage | ExitMessage
+MessageHandler = Callable[[ShardMessage], Awaitable[None]]
+
+
+async def _read_message(reader: asyncio.StreamReader) -> ShardMessage:
+    (length,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    return pickle.loads(await reader.readexactly(length))
+
+
+class SignalServer:
+    """
+    Coordinator end of the worker channel.
+
+    Messages from one worker are handled in order; workers are served
+    concurrently. A handler error is logged and does not close the
+    connection.
+    """
+
+    def __init__(self, path: str, handler: MessageHandler):
+        self.path = path
+        self._handler = handler
+        self._server: asyncio.AbstractServer | None = None
+        self.received = 0
+        self.errors = 0
+
+    async def start(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._serve, path=self.path)
+        os.chmod(self.path, 0o600)
+        logger.info(f"Shard channel: listening on {self.path}")
+
+    async def stop(self) -> None:
+        if self._server is None:
+            return
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    message = await _read_message(reader)
+                except asyncio.IncompleteReadError:
+                    return  # Worker closed the connection
+                self.received += 1
+                try:
+                    await self._handler(message)
+                except Exception as e:
+                    self.errors += 1
+                    logger.error(f"Shard {message.shard}: {message} failed: {e}")
+        finally:
+            writer.close()
+
+
+class SignalClient:
+    """
+    Worker end of the channel.
+
+    Connects lazily and reconnects once per send after a broken connection;
+    a send that still fails raises ConnectionError.
+    """
+
+    def __init__(self, path: str, shard: int):
+        self.path = path
+        self.shard = shard
+        self._writer: asyncio.StreamWriter | None = None
+        self.sent = 0
+
+    async def send_entry(
+        self,
+        signal: EntrySignal,
+        context: StrategyContext,
+        event: dict,
+        strategy: str,
+        threshold: Decimal,
+    ) -> None:
+        """Forward an entry; signature matches TradingEngine's entry_sink."""
+        await self.send(
+            EntryMessage(
+                shard=self.shard,
+                strategy=strategy,
+                threshold=threshold,
+                signal=signal,
+                context=context,
+                event=event,
+            )
+        )
+
+    async def send_exit(
+        self,
+        signal: ExitSignal,
+        context: StrategyContext,
+        strategy: str,
+    ) -> None:
+        """Forward an exit; signature matches TradingEngine's exit_sink."""
+        await self.send(
+            ExitMessage(
+                shard=self.shard,
+                strategy=strategy,
+                signal=signal,
+                context=context,
+            )
+        )
+
+    async def send(self, message: ShardMessage) -> None:
+        payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        frame = _HEADER.pack(len(payload)) + payload
+        for attempt in range(2):
+            try:
+                if self._writer is None or self._writer.is_closing():
+                    _, self._writer = await asyncio.open_unix_connection(self.path)
+                self._writer.write(frame)
+                await self._writer.drain()
+                self.sent += 1
+                return
+            except OSError as e:
+                self._writer = None
+                if attempt:
+                    raise ConnectionError(f"Shard channel {self.path}: {e}") from e
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+
+
+class WorkerPool:
+    """
+    The K worker processes.
+
+    Workers are spawned (not forked: the coordinator holds an event loop,
+    pool connections and threads) and run target(*args, shard, count).
+    check() restarts workers that exited.
+    """
+
+    def __init__(self, target: Callable[..., Any], args: tuple, count: int):
+        self._target = target
+        self._args = args
+        self.count = count
+        self._context = multiprocessing.get_context("spawn")
+        self._processes: list[multiprocessing.process.BaseProcess | None] = [None] * count
+        self.restarts = 0
+
+    def start(self) -> None:
+        for shard in range(self.count):
+            self._spawn(shard)
+        logger.info(f"Shards: started {self.count} worker processes")
+
+    def _spawn(self, shard: int) -> None:
+        process = self._context.Process(
+            target=self._target,
+            args=(*self._args, shard, self.count),
+            name=f"engine-shard-{shard}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[shard] = process
+
+    def check(self) -> list[int]:
+        """Restart exited workers; returns their shard numbers."""
+        restarted = []
+        for shard, process in enumerate(self._processes):
+            if process is not None and not process.is_alive():
+                logger.warning(
+                    f"Shard {shard}: worker exited (code {process.exitcode}), restarting"
+                )
+                self._spawn(shard)
+                self.restarts += 1
+                restarted.append(shard)
+        return restarted
+
+    def alive(self) -> int:
+        return sum(1 for p in self._processes if p is not None and p.is_alive())
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """SIGTERM every worker, then kill those still running after timeout."""
+        processes = [p for p in self._processes if p is not None]
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+        for process in processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.kill()
+                process.join()
+        self._processes = [None] * self.count
@@ -6,15 +6,19 @@ Built on asyncpg for high-performance async database access.
 
 Public API:
     Database, DatabaseConfig - Connection pool management
+    DatabaseWorkload - Database API on the background/reporting pool (db.workload())
+    Statement, StatementRegistry, statements - Named statements for hot queries
+    TradePartitionManager - Daily partition creation/retention for trades
 
     Models (matching production schema seed/01_schema.sql and seed/02_tiered_data.sql):
         PolymarketTrade, TradeWatermark
         PolymarketFirstTrigger, TriggerWatermark
         PolymarketCandidate, CandidateWatermark
         LiveOrder, PaperTrade
-        Position, ExitEvent, DailyPnl
+        Position, ExitEvent, DailyPnl, PerformanceRollup
         TradeApproval, ApprovalAlert
         StreamWatchlistItem, PolymarketResolution, PolymarketTokenMeta
+        MarketCatalogEntry
         TradeWatchlistItem, MarketScoresCache, ScoreHistory
 
     Tiered Data Architecture Models:
@@ -30,20 +34,26 @@ Public API:
         CandidateRepository, CandidateWatermarkRepository
         LiveOrderRepository, PaperTradeRepository
         PositionRepository, ExitEventRepository, DailyPnlRepository
+        PerformanceRollupRepository
         TradeApprovalRepository, ApprovalAlertRepository
         StreamWatchlistRepository, ResolutionRepository, TokenMetaRepository
+        MarketCatalogRepository
         TradeWatchlistRepository, MarketScoresCacheRepository, ScoreHistoryRepository
         MarketUniverseRepository, CandleRepository, OrderbookRepository
 """
-from polymarket_bot.storage.database import Database, DatabaseConfig
+from polymarket_bot.storage.database import Database, DatabaseConfig, DatabaseWorkload
+from polymarket_bot.storage.partitions import TradePartitionManager
+from polymarket_bot.storage.statements import Statement, StatementRegistry, statements
 from polymarket_bot.storage.models import (
     ApprovalAlert,
     CandidateWatermark,
     DailyPnl,
     ExitEvent,
     LiveOrder,
+    MarketCatalogEntry,
     MarketScoresCache,
     PaperTrade,
+    PerformanceRollup,
     PolymarketCandidate,
     PolymarketFirstTrigger,
     PolymarketResolution,
@@ -71,8 +81,10 @@ from polymarket_bot.storage.repositories import (
     DailyPnlRepository,
     ExitEventRepository,
     LiveOrderRepository,
+    MarketCatalogRepository,
     MarketScoresCacheRepository,
     PaperTradeRepository,
+    PerformanceRollupRepository,
     PositionRepository,
     ResolutionRepository,
     ScoreHistoryRepository,
@@ -95,6 +107,11 @@ __all__ = [
     # Database
     "Database",
     "DatabaseConfig",
+    "DatabaseWorkload",
+    "TradePartitionManager",
+    "Statement",
+    "StatementRegistry",
+    "statements",
     # Trade models & repos
     "PolymarketTrade",
     "TradeWatermark",
@@ -119,9 +136,11 @@ __all__ = [
     "Position",
     "ExitEvent",
     "DailyPnl",
+    "PerformanceRollup",
     "PositionRepository",
     "ExitEventRepository",
     "DailyPnlRepository",
+    "PerformanceRollupRepository",
     # Approval models & repos
     "TradeApproval",
     "ApprovalAlert",
@@ -134,6 +153,8 @@ __all__ = [
     "StreamWatchlistRepository",
     "ResolutionRepository",
     "TokenMetaRepository",
+    "MarketCatalogEntry",
+    "MarketCatalogRepository",
     # Watchlist & scoring models & repos
     "TradeWatchlistItem",
     "MarketScoresCache",
@@ -9,9 +9,9 @@ Non-monetary fields (thresholds, scores, hours) use float.
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -50,7 +50,9 @@ class PolymarketTrade(BaseModel):
     price: Optional[Decimal] = None
     size: Optional[Decimal] = None
     side: Optional[str] = None
-    timestamp: Optional[int] = None
+    timestamp: int  # Epoch seconds; partition key, NOT NULL
+    # Not a polymarket_trades column: kept in polymarket_trade_payloads when
+    # TradeRepository(store_raw_payloads=True)
     raw_json: Optional[str] = None
     outcome: Optional[str] = None
     outcome_index: Optional[int] = None
@@ -77,6 +79,17 @@ class PolymarketTokenMeta(BaseModel):
     fetched_at: Optional[str] = None
 
 
+class MarketCatalogEntry(BaseModel):
+    """Latest MarketCatalog state for one market (compacted change feed)."""
+
+    condition_id: str
+    seq: int  # Bumped on every content change; consumers read seq > cursor
+    content_hash: str
+    resolved: bool = False
+    payload: dict[str, Any] = Field(default_factory=dict)  # Raw Gamma /markets item
+    changed_at: datetime | None = None
+
+
 # =============================================================================
 # WATERMARKS (for idempotent processing)
 # =============================================================================
@@ -127,6 +140,7 @@ class PolymarketFirstTrigger(BaseModel):
     model_version: Optional[str] = None
     outcome: Optional[str] = None
     outcome_index: Optional[int] = None
+    strategy: str = ""  # Dedup key of the strategy that triggered
 
 
 class PolymarketCandidate(BaseModel):
@@ -272,6 +286,22 @@ class DailyPnl(BaseModel):
     updated_at: Optional[str] = None
 
 
+class PerformanceRollup(BaseModel):
+    """Aggregated exit-event performance for one period bucket."""
+
+    period: str  # 'day', 'week', 'month', 'all'
+    period_start: date
+    trades: int = 0
+    wins: int = 0
+    losses: int = 0
+    gross_profit: float = 0.0
+    gross_loss: float = 0.0  # Magnitude of losing trades
+    net_pnl: float = 0.0
+    best_trade: float | None = None
+    worst_trade: float | None = None
+    updated_at: datetime | None = None
+
+
 # =============================================================================
 # APPROVAL WORKFLOW
 # =============================================================================
@@ -0,0 +1,178 @@
+"""
+Partition maintenance for time-partitioned tables.
+
+polymarket_trades and polymarket_trade_payloads are RANGE partitioned on
+`timestamp` (epoch seconds), one partition per UTC day, with a DEFAULT
+partition catching anything outside the daily ranges.
+
+TradePartitionManager keeps a window of future partitions in place and
+enforces retention by dropping whole partitions, so both aggregation
+scans and retention cost stay constant as history grows.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from polymarket_bot.storage.database import Database
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+# Parent tables partitioned by day on `timestamp`
+TRADE_PARTITIONED_TABLES = ("polymarket_trades", "polymarket_trade_payloads")
+
+_PARTITION_SUFFIX = re.compile(r"_p(\d{8})$")
+
+
+@dataclass
+class PartitionMaintenanceResult:
+    """Outcome of one maintenance run."""
+
+    created: list[str] = field(default_factory=list)
+    dropped: list[str] = field(default_factory=list)
+    default_rows_deleted: int = 0
+
+
+def _as_utc(day: datetime) -> datetime:
+    """Treat naive datetimes as UTC (the repo's utcnow() convention)."""
+    if day.tzinfo is None:
+        return day.replace(tzinfo=timezone.utc)
+    return day.astimezone(timezone.utc)
+
+
+def partition_name(parent: str, day: datetime) -> str:
+    """Name of the daily partition of `parent` covering `day` (UTC)."""
+    return f"{parent}_p{_as_utc(day).strftime('%Y%m%d')}"
+
+
+def day_bounds(day: datetime) -> tuple[int, int]:
+    """Epoch-second [start, end) bounds of the UTC day containing `day`."""
+    start = int(_as_utc(day).timestamp()) // SECONDS_PER_DAY * SECONDS_PER_DAY
+    return start, start + SECONDS_PER_DAY
+
+
+class TradePartitionManager:
+    """
+    Creates future daily partitions and drops expired ones.
+
+    Usage:
+        manager = TradePartitionManager(db, retention_days=30)
+        result = await manager.run_maintenance()
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        retention_days: int = 30,
+        days_ahead: int = 7,
+        tables: tuple[str, ...] = TRADE_PARTITIONED_TABLES,
+    ) -> None:
+        self.db = db
+        self.retention_days = retention_days
+        self.days_ahead = days_ahead
+        self.tables = tables
+
+    async def list_partitions(self, parent: str) -> list[str]:
+        """List the daily partitions attached to `parent` (excludes DEFAULT)."""
+        records = await self.db.fetch(
+            """
+            SELECT c.relname
+            FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            JOIN pg_class p ON p.oid = i.inhparent
+            WHERE p.relname = $1
+            ORDER BY c.relname
+            """,
+            parent,
+        )
+        return [r["relname"] for r in records if _PARTITION_SUFFIX.search(r["relname"])]
+
+    async def ensure_partition(self, parent: str, day: datetime) -> str | None:
+        """
+        Create the partition of `parent` for `day` if it doesn't exist.
+
+        Rows already sitting in the DEFAULT partition for that day are moved
+        into the new partition before it is attached (Postgres refuses to
+        attach a range the DEFAULT partition still holds rows for).
+
+        Returns the partition name if created, None if it already existed.
+        """
+        name = partition_name(parent, day)
+        start, end = day_bounds(day)
+
+        async with self.db.transaction() as conn:
+            exists = await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", name)
+            if exists:
+                return None
+
+            await conn.execute(
+                f"CREATE TABLE {name} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+            await conn.execute(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {parent}_default
+                    WHERE timestamp >= $1 AND timestamp < $2
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """,
+                start,
+                end,
+            )
+            await conn.execute(
+                f"ALTER TABLE {parent} ATTACH PARTITION {name} FOR VALUES FROM ({start}) TO ({end})"
+            )
+
+        logger.debug(f"Created partition {name} [{start}, {end})")
+        return name
+
+    async def drop_expired(self, parent: str, now: datetime | None = None) -> list[str]:
+        """Drop daily partitions of `parent` entirely older than the retention window."""
+        now = now or datetime.now(timezone.utc)
+        cutoff_day = _as_utc(now - timedelta(days=self.retention_days)).strftime("%Y%m%d")
+
+        dropped = []
+        for name in await self.list_partitions(parent):
+            match = _PARTITION_SUFFIX.search(name)
+            if match and match.group(1) < cutoff_day:
+                await self.db.execute(f"DROP TABLE IF EXISTS {name}")
+                dropped.append(name)
+        return dropped
+
+    async def purge_default(self, parent: str, now: datetime | None = None) -> int:
+        """Delete expired stragglers from the DEFAULT partition (small by design)."""
+        now = now or datetime.now(timezone.utc)
+        cutoff, _ = day_bounds(now - timedelta(days=self.retention_days))
+        result = await self.db.execute(
+            f"DELETE FROM {parent}_default WHERE timestamp < $1",
+            cutoff,
+        )
+        try:
+            return int(result.split()[-1]) if result else 0
+        except (ValueError, IndexError):
+            return 0
+
+    async def run_maintenance(self, now: datetime | None = None) -> PartitionMaintenanceResult:
+        """Create partitions for today + days_ahead and enforce retention."""
+        now = now or datetime.now(timezone.utc)
+        result = PartitionMaintenanceResult()
+
+        for parent in self.tables:
+            for offset in range(self.days_ahead + 1):
+                created = await self.ensure_partition(parent, now + timedelta(days=offset))
+                if created:
+                    result.created.append(created)
+            result.dropped.extend(await self.drop_expired(parent, now))
+            result.default_rows_deleted += await self.purge_default(parent, now)
+
+        if result.created or result.dropped:
+            logger.info(
+                f"Trade partitions: created {len(result.created)}, dropped {len(result.dropped)}"
+            )
+        return result
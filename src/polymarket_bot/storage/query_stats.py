@@ -0,0 +1,263 @@
+"""
+Per-statement query statistics and slow-query log for Database.
+
+Every Database.execute/fetch/fetchrow/fetchval call is recorded against
+the statement's fingerprint: the SQL with literals replaced, parameter
+numbers dropped and repeated parameter lists collapsed, so
+
+    SELECT * FROM trades WHERE token_id IN ($1, $2, $3) AND size > 100
+
+and the same query with ten parameters share one entry. Queries issued
+directly on a connection from Database.connection()/transaction() are
+not seen here; only their pool-acquire wait is.
+
+Calls slower than DatabaseConfig.slow_query_ms are logged with their
+parameters and the calling site (first frame outside the storage
+plumbing), and kept in a short in-memory list for the dashboard
+(/api/db/queries).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sys
+from collections import deque
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from polymarket_bot.tracing import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Entries past this many distinct fingerprints are pooled under OTHER
+MAX_STATEMENTS = 1000
+OTHER = "<other statements>"
+
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_PARAM = re.compile(r"\$\d+")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r"\s+")
+_PARAM_LIST = re.compile(r"\(\s*(?:\$n|\?)(?:\s*,\s*(?:\$n|\?))+\s*\)")
+_REPEATED_TUPLES = re.compile(r"(\([^()]*\))(?:\s*,\s*\([^()]*\))+")
+
+# Frames in these files are plumbing, not the caller of interest
+_INTERNAL_FILES = (
+    str(Path(__file__).with_name("database.py")),
+    __file__,
+    "contextlib.py",
+)
+
+
+@lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> str:
+    """Normalized statement text used to group calls."""
+    text = _COMMENT.sub(" ", sql)
+    text = _STRING.sub("?", text)
+    text = _PARAM.sub("$n", text)
+    text = _NUMBER.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _PARAM_LIST.sub("(...)", text)
+    return _REPEATED_TUPLES.sub(r"\1, ...", text)
+
+
+def row_count(method: str, result: Any) -> int:
+    """
+    Rows returned or affected by an asyncpg `method` call.
+
+    Only execute() returns a command status ("INSERT 0 5", "UPDATE 3");
+    a fetchval() string is a value, never a count.
+    """
+    if result is None:
+        return 0
+    if method == "execute":
+        tail = result.rsplit(" ", 1)[-1] if isinstance(result, str) else ""
+        return int(tail) if tail.isdigit() else 0
+    if isinstance(result, list):
+        return len(result)
+    return 1
+
+
+def calling_site() -> str:
+    """file:line (function) of the first frame outside the storage plumbing."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if not filename.endswith(_INTERNAL_FILES):
+            return f"{_short_path(filename)}:{frame.f_lineno} ({frame.f_code.co_name})"
+        frame = frame.f_back
+    return "<unknown>"
+
+
+def _short_path(filename: str) -> str:
+    marker = "polymarket_bot/"
+    index = filename.rfind(marker)
+    return filename[index:] if index >= 0 else filename
+
+
+@dataclass
+class StatementStats:
+    """Aggregates for one statement fingerprint."""
+
+    fingerprint: str
+    calls: int = 0
+    errors: int = 0
+    retries: int = 0
+    rows: int = 0
+    total_seconds: float = 0.0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def to_dict(self) -> dict:
+        latency = self.latency
+        return {
+            "statement": self.fingerprint,
+            "calls": self.calls,
+            "errors": self.errors,
+            "retries": self.retries,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "p50_ms": round(latency.percentile(50) / 1e6, 3),
+            "p99_ms": round(latency.percentile(99) / 1e6, 3),
+            "max_ms": round(latency.max_ns / 1e6, 3),
+        }
+
+
+@dataclass
+class SlowQuery:
+    """One call over the slow-query threshold."""
+
+    statement: str
+    duration_ms: float
+    params: list[str]
+    site: str
+    at: datetime
+
+    def to_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "duration_ms": round(self.duration_ms, 3),
+            "params": self.params,
+            "site": self.site,
+            "at": self.at.isoformat(),
+        }
+
+
+class QueryStats:
+    """
+    Statement and pool-acquire statistics for one Database.
+
+    Recording runs on the event loop; top() and summary() may be called
+    from the dashboard thread and work on snapshots.
+    """
+
+    SORT_KEYS = ("total_ms", "calls", "mean_ms", "p99_ms", "max_ms", "rows", "errors", "retries")
+
+    def __init__(self, slow_query_ms: float = 0.0, max_slow_queries: int = 100):
+        self.slow_query_ms = slow_query_ms
+        self._statements: dict[str, StatementStats] = {}
+        self._slow: deque[SlowQuery] = deque(maxlen=max_slow_queries)
+        self.acquire_wait = LatencyHistogram()
+        self.retries = 0
+
+    def _entry(self, sql: str) -> StatementStats:
+        key = fingerprint(sql)
+        entry = self._statements.get(key)
+        if entry is None:
+            if len(self._statements) >= MAX_STATEMENTS:
+                key = OTHER
+                entry = self._statements.get(key)
+            if entry is None:
+                entry = self._statements[key] = StatementStats(key)
+        return entry
+
+    def record(
+        self,
+        sql: str,
+        seconds: float,
+        rows: int = 0,
+        retries: int = 0,
+        error: bool = False,
+        params: Sequence[Any] = (),
+    ) -> None:
+        entry = self._entry(sql)
+        entry.calls += 1
+        entry.rows += rows
+        entry.retries += retries
+        entry.total_seconds += seconds
+        entry.latency.record(int(seconds * 1e9))
+        if error:
+            entry.errors += 1
+        self.retries += retries
+
+        if self.slow_query_ms and seconds * 1000 >= self.slow_query_ms:
+            self._record_slow(entry.fingerprint, seconds * 1000, params)
+
+    def _record_slow(self, statement: str, duration_ms: float, params: Sequence[Any]) -> None:
+        slow = SlowQuery(
+            statement=statement,
+            duration_ms=duration_ms,
+            params=[_param_repr(p) for p in params[:20]],
+            site=calling_site(),
+            at=datetime.now(timezone.utc),
+        )
+        self._slow.append(slow)
+        logger.warning(
+            f"Slow query ({duration_ms:.1f}ms) at {slow.site}: {statement[:300]} "
+            f"params={slow.params}"
+        )
+
+    def record_acquire(self, seconds: float) -> None:
+        self.acquire_wait.record(int(seconds * 1e9))
+
+    def top(self, limit: int = 20, sort: str = "total_ms") -> list[dict]:
+        """Statements ordered by a to_dict() field, largest first."""
+        if sort not in self.SORT_KEYS:
+            raise ValueError(f"sort must be one of {', '.join(self.SORT_KEYS)}")
+        rows = [entry.to_dict() for entry in list(self._statements.values())]
+        rows.sort(key=lambda row: row[sort], reverse=True)
+        return rows[:limit]
+
+    def slow_queries(self, limit: int | None = None) -> list[dict]:
+        """Most recent slow queries, newest first."""
+        slow = list(self._slow)[::-1]
+        return [s.to_dict() for s in slow[:limit]]
+
+    def summary(self) -> dict:
+        entries = list(self._statements.values())
+        return {
+            "statements": len(entries),
+            "calls": sum(e.calls for e in entries),
+            "errors": sum(e.errors for e in entries),
+            "retries": self.retries,
+            "total_ms": round(sum(e.total_seconds for e in entries) * 1000, 3),
+            "slow_query_ms": self.slow_query_ms,
+            "acquire_wait": self.acquire_wait.to_dict(),
+        }
+
+    def reset(self) -> None:
+        self._statements.clear()
+        self._slow.clear()
+        self.acquire_wait = LatencyHistogram()
+        self.retries = 0
+
+
+def _param_repr(value: Any, limit: int = 200) -> str:
+    text = repr(value)
+    return text if len(text) <= limit else f"{text[:limit]}...({len(text)} chars)"
+
+
+def format_table(rows: list[dict]) -> str:
+    """Plain-text table of top() rows for logs and scripts."""
+    lines = [f"{'calls':>8} {'total ms':>11} {'mean ms':>9} {'p99 ms':>9} {'rows':>9}  statement"]
+    for row in rows:
+        lines.append(
+            f"{row['calls']:8d} {row['total_ms']:11.1f} {row['mean_ms']:9.2f} "
+            f"{row['p99_ms']:9.2f} {row['rows']:9d}  {row['statement'][:120]}"
+        )
+    return "\n".join(lines)
@@ -12,6 +12,7 @@ from polymarket_bot.storage.repositories.candidate_repo import (
     CandidateWatermarkRepository,
 )
 from polymarket_bot.storage.repositories.market_repo import (
+    MarketCatalogRepository,
     ResolutionRepository,
     StreamWatchlistRepository,
     TokenMetaRepository,
@@ -23,6 +24,7 @@ from polymarket_bot.storage.repositories.order_repo import (
 from polymarket_bot.storage.repositories.position_repo import (
     DailyPnlRepository,
     ExitEventRepository,
+    PerformanceRollupRepository,
     PositionRepository,
 )
 from polymarket_bot.storage.repositories.trade_repo import (
@@ -65,6 +67,7 @@ __all__ = [
     "PositionRepository",
     "ExitEventRepository",
     "DailyPnlRepository",
+    "PerformanceRollupRepository",
     # Approvals
     "TradeApprovalRepository",
     "ApprovalAlertRepository",
@@ -72,6 +75,7 @@ __all__ = [
     "StreamWatchlistRepository",
     "ResolutionRepository",
     "TokenMetaRepository",
+    "MarketCatalogRepository",
     # Watchlist & Scoring
     "TradeWatchlistRepository",
     "MarketScoresCacheRepository",
@@ -134,6 +134,9 @@ class CandleRepository(BaseRepository[PriceCandle]):
         This is a pure SQL implementation without TimescaleDB.
         Uses delete-then-insert for idempotency - running multiple times
         gives the same result without double-counting.
+
+        Trade timestamps are epoch seconds (the polymarket_trades partition
+        key), so the time filter prunes to the partitions in range.
         """
         interval = RESOLUTION_INTERVALS.get(resolution)
         if not interval:
@@ -174,7 +177,7 @@ class CandleRepository(BaseRepository[PriceCandle]):
                 $2 as token_id,
                 $3 as resolution,
                 to_timestamp(
-                    floor(extract(epoch from to_timestamp(timestamp / 1000)) / $4) * $4
+                    floor(timestamp / $4) * $4
                 ) as bucket_start,
                 -- Open price: first price in bucket (min timestamp)
                 (array_agg(price ORDER BY timestamp ASC))[1] as open_price,
@@ -188,7 +191,7 @@ class CandleRepository(BaseRepository[PriceCandle]):
             FROM polymarket_trades
             WHERE condition_id = $1
               AND token_id = $2
-              AND timestamp >= extract(epoch from $5::timestamp) * 1000
+              AND timestamp >= extract(epoch from $5::timestamp)::bigint
               AND price IS NOT NULL
               AND size IS NOT NULL
             GROUP BY bucket_start
@@ -5,14 +5,17 @@ Handles:
 - stream_watchlist: Markets from streaming watchlist
 - polymarket_resolutions: Market resolution data
 - polymarket_token_meta: Token metadata cache
+- market_catalog: MarketCatalog change feed for out-of-process consumers
 """
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Optional
+import json
+from datetime import datetime, timedelta
+from typing import Any, Optional
 
 from polymarket_bot.storage.database import Database
 from polymarket_bot.storage.models import (
+    MarketCatalogEntry,
     PolymarketResolution,
     PolymarketTokenMeta,
     StreamWatchlistItem,
@@ -188,3 +191,99 @@ class TokenMetaRepository(BaseRepository[PolymarketTokenMeta]):
         """Get condition_id for a token (common lookup)."""
         query = "SELECT condition_id FROM polymarket_token_meta WHERE token_id = $1"
         return await self.db.fetchval(query, token_id)
+
+
+# Notified (payload = rows written) after each catalog write
+MARKET_CATALOG_CHANNEL = "market_catalog_changed"
+
+
+class MarketCatalogRepository(BaseRepository[MarketCatalogEntry]):
+    """
+    Compacted change feed of MarketCatalog state.
+
+    One row per market holding its latest raw payload. A write that changes
+    the content hash or the resolved flag takes a new seq, so a consumer in
+    another process (the explorer sync) reads changes_since(cursor) and
+    advances its cursor to the last seq it applied.
+    """
+
+    table_name = "market_catalog"
+    model_class = MarketCatalogEntry
+
+    def _record_to_model(self, record) -> MarketCatalogEntry:
+        if record is None:
+            return None
+        data = dict(record)
+        if isinstance(data.get("payload"), str):
+            data["payload"] = json.loads(data["payload"])
+        return MarketCatalogEntry(**data)
+
+    async def apply_changes(self, changes: list[Any]) -> int:
+        """
+        MarketCatalog subscriber: persist a batch of CatalogChange.
+
+        Returns:
+            Rows whose content actually changed
+        """
+        latest = {change.condition_id: change for change in changes}
+        if not latest:
+            return 0
+
+        query = """
+            WITH written AS (
+                INSERT INTO market_catalog AS c
+                (condition_id, seq, content_hash, resolved, payload, changed_at)
+                SELECT u.condition_id, nextval('market_catalog_seq'), u.content_hash,
+                       u.resolved, u.payload::jsonb, NOW()
+                FROM unnest($1::text[], $2::text[], $3::boolean[], $4::text[])
+                    AS u(condition_id, content_hash, resolved, payload)
+                ON CONFLICT (condition_id) DO UPDATE SET
+                    seq = EXCLUDED.seq,
+                    content_hash = EXCLUDED.content_hash,
+                    resolved = EXCLUDED.resolved,
+                    payload = EXCLUDED.payload,
+                    changed_at = EXCLUDED.changed_at
+                WHERE c.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+                   OR c.resolved IS DISTINCT FROM EXCLUDED.resolved
+                RETURNING 1
+            )
+            SELECT COUNT(*) FROM written
+        """
+        async with self.db.transaction() as conn:
+            written = await conn.fetchval(
+                query,
+                list(latest),
+                [change.market.content_hash for change in latest.values()],
+                [change.kind == "resolved" for change in latest.values()],
+                [json.dumps(change.market.raw, default=str) for change in latest.values()],
+            )
+            if written:
+                await conn.execute(
+                    "SELECT pg_notify($1, $2)", MARKET_CATALOG_CHANNEL, str(written)
+                )
+        return written
+
+    async def changes_since(self, seq: int, limit: int = 1000) -> list[MarketCatalogEntry]:
+        """Entries changed after `seq`, oldest first."""
+        query = """
+            SELECT * FROM market_catalog
+            WHERE seq > $1
+            ORDER BY seq
+            LIMIT $2
+        """
+        records = await self.db.fetch(query, seq, limit)
+        return self._records_to_models(records)
+
+    async def latest_seq(self) -> int:
+        return await self.db.fetchval("SELECT COALESCE(MAX(seq), 0) FROM market_catalog")
+
+    async def prune_resolved(self, older_than: timedelta = timedelta(days=7)) -> int:
+        """Delete markets resolved more than `older_than` ago. Returns rows deleted."""
+        result = await self.db.execute(
+            """
+            DELETE FROM market_catalog
+            WHERE resolved AND changed_at < NOW() - $1::interval
+            """,
+            older_than,
+        )
+        return int(result.split()[-1]) if result else 0
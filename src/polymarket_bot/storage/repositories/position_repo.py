@@ -5,15 +5,23 @@ Handles:
 - positions: Open and closed positions
 - exit_events: Exit event records
 - daily_pnl: Daily P&L summaries
+- performance_rollups: Per-period exit-event aggregates
 """
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional
 
 from polymarket_bot.storage.database import Database
-from polymarket_bot.storage.models import DailyPnl, ExitEvent, Position
+from polymarket_bot.storage.models import DailyPnl, ExitEvent, PerformanceRollup, Position
 from polymarket_bot.storage.repositories.base import BaseRepository
+from polymarket_bot.storage.statements import statements
+
+OPEN_POSITIONS = statements.register("positions.open", """
+    SELECT * FROM positions
+    WHERE status = 'open'
+    ORDER BY created_at DESC
+""")
 
 
 class PositionRepository(BaseRepository[Position]):
@@ -58,12 +66,7 @@ class PositionRepository(BaseRepository[Position]):
 
     async def get_open(self) -> list[Position]:
         """Get all open positions."""
-        query = """
-            SELECT * FROM positions
-            WHERE status = 'open'
-            ORDER BY created_at DESC
-        """
-        records = await self.db.fetch(query)
+        records = await self.db.fetch(OPEN_POSITIONS)
         return self._records_to_models(records)
 
     async def get_by_status(self, status: str, limit: int = 100) -> list[Position]:
@@ -315,3 +318,195 @@ class DailyPnlRepository(BaseRepository[DailyPnl]):
         """Get all-time realized P&L."""
         query = "SELECT COALESCE(SUM(realized_pnl), 0) FROM daily_pnl"
         return await self.db.fetchval(query)
+
+
+# period_start of the single all-history row
+ALL_TIME_START = date(1970, 1, 1)
+
+ROLLUP_PERIODS = ("day", "week", "month")
+
+
+def period_starts(closed_at: datetime) -> dict[str, date]:
+    """UTC bucket starts for a close time (week = ISO week, Monday start)."""
+    if closed_at.tzinfo is not None:
+        closed_at = closed_at.astimezone(timezone.utc)
+    day = closed_at.date()
+    return {
+        "day": day,
+        "week": day - timedelta(days=day.weekday()),
+        "month": day.replace(day=1),
+        "all": ALL_TIME_START,
+    }
+
+
+# Fold one exit into its day, week, month and all-time rows. {pnl} is the
+# exit's net P&L and {periods} the four period starts, as SQL expressions.
+_ROLLUP_UPSERT = """
+    INSERT INTO performance_rollups AS r
+    (period, period_start, trades, wins, losses, gross_profit,
+     gross_loss, net_pnl, best_trade, worst_trade, updated_at)
+    SELECT p.period, p.period_start, 1,
+           ({pnl} > 0)::int, ({pnl} < 0)::int,
+           GREATEST({pnl}, 0), GREATEST(-{pnl}, 0),
+           {pnl}, {pnl}, {pnl}, NOW()
+    FROM (VALUES ('day', {day}::date), ('week', {week}::date),
+                 ('month', {month}::date), ('all', {all}::date)) AS p(period, period_start)
+    ON CONFLICT (period, period_start) DO UPDATE SET
+        trades = r.trades + 1,
+        wins = r.wins + EXCLUDED.wins,
+        losses = r.losses + EXCLUDED.losses,
+        gross_profit = r.gross_profit + EXCLUDED.gross_profit,
+        gross_loss = r.gross_loss + EXCLUDED.gross_loss,
+        net_pnl = r.net_pnl + EXCLUDED.net_pnl,
+        best_trade = GREATEST(r.best_trade, EXCLUDED.best_trade),
+        worst_trade = LEAST(r.worst_trade, EXCLUDED.worst_trade),
+        updated_at = NOW()
+"""
+
+RECORD_EXIT_ROLLUP = statements.register("rollups.record_exit", _ROLLUP_UPSERT.format(
+    pnl="$5::float8", day="$1", week="$2", month="$3", all="$4",
+))
+
+# The exit_events row and its rollup in one statement, so they commit or
+# fail together (the rollup is an incremental, non-idempotent upsert).
+# Arguments: the 14 exit_events columns, then the four period starts.
+INSERT_EXIT_EVENT = statements.register("exit_events.insert", """
+    WITH event AS (
+        INSERT INTO exit_events
+        (position_id, token_id, condition_id, exit_type, entry_price,
+         exit_price, size, gross_pnl, net_pnl, hours_held,
+         exit_order_id, status, reason, created_at)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14)
+    )""" + _ROLLUP_UPSERT.format(
+    pnl="$9::float8", day="$15", week="$16", month="$17", all="$18",
+))
+
+
+class PerformanceRollupRepository(BaseRepository[PerformanceRollup]):
+    """
+    Repository for incrementally maintained performance rollups.
+
+    Exits recorded by PositionTracker update their rollups in the same
+    statement as the exit_events insert (INSERT_EXIT_EVENT); record_exit()
+    folds in a single exit, and rebuild() recomputes all rows from
+    exit_events (backfill / repair).
+    """
+
+    table_name = "performance_rollups"
+    model_class = PerformanceRollup
+
+    @staticmethod
+    def period_args(closed_at: datetime) -> tuple:
+        """Day, week, month and all-time period starts for an exit."""
+        starts = period_starts(closed_at)
+        return (starts["day"], starts["week"], starts["month"], starts["all"])
+
+    @staticmethod
+    def record_exit_args(closed_at: datetime, net_pnl: float) -> tuple:
+        """RECORD_EXIT_ROLLUP arguments for one exit."""
+        return (*PerformanceRollupRepository.period_args(closed_at), float(net_pnl))
+
+    async def record_exit(self, closed_at: datetime, net_pnl: float) -> None:
+        """Fold one exit into its day, week, month and all-time rows."""
+        await self.db.execute(RECORD_EXIT_ROLLUP, *self.record_exit_args(closed_at, net_pnl))
+
+    async def rebuild(self) -> int:
+        """
+        Recompute every rollup row from exit_events.
+
+        Returns:
+            Number of exit events folded in
+        """
+        async with self.db.transaction() as conn:
+            await conn.execute("DELETE FROM performance_rollups")
+            await conn.execute(
+                """
+                INSERT INTO performance_rollups (
+                    period, period_start, trades, wins, losses,
+                    gross_profit, gross_loss, net_pnl, best_trade, worst_trade
+                )
+                SELECT period, period_start,
+                       COUNT(*),
+                       COUNT(*) FILTER (WHERE pnl > 0),
+                       COUNT(*) FILTER (WHERE pnl < 0),
+                       COALESCE(SUM(pnl) FILTER (WHERE pnl > 0), 0),
+                       COALESCE(-SUM(pnl) FILTER (WHERE pnl < 0), 0),
+                       SUM(pnl), MAX(pnl), MIN(pnl)
+                FROM (
+                    SELECT p.period,
+                           CASE p.period
+                               WHEN 'all' THEN $1::date
+                               ELSE date_trunc(p.period, e.ts)::date
+                           END AS period_start,
+                           e.pnl
+                    FROM (
+                        SELECT created_at::timestamptz AT TIME ZONE 'UTC' AS ts,
+                               net_pnl::double precision AS pnl
+                        FROM exit_events
+                    ) e
+                    CROSS JOIN (VALUES ('day'), ('week'), ('month'), ('all')) AS p(period)
+                ) buckets
+                GROUP BY period, period_start
+                """,
+                ALL_TIME_START,
+            )
+            total = await conn.fetchval(
+                "SELECT trades FROM performance_rollups WHERE period = 'all'"
+            )
+        return int(total or 0)
+
+    async def get_summary(self, since: date | None = None) -> PerformanceRollup:
+        """
+        Totals across all history, or across day rows from `since` onwards.
+        """
+        if since is None:
+            record = await self.db.fetchrow(
+                "SELECT * FROM performance_rollups WHERE period = 'all' AND period_start = $1",
+                ALL_TIME_START,
+            )
+            if record is None:
+                return PerformanceRollup(period="all", period_start=ALL_TIME_START)
+            return self._record_to_model(record)
+
+        record = await self.db.fetchrow(
+            """
+            SELECT COALESCE(SUM(trades), 0)::int AS trades,
+                   COALESCE(SUM(wins), 0)::int AS wins,
+                   COALESCE(SUM(losses), 0)::int AS losses,
+                   COALESCE(SUM(gross_profit), 0) AS gross_profit,
+                   COALESCE(SUM(gross_loss), 0) AS gross_loss,
+                   COALESCE(SUM(net_pnl), 0) AS net_pnl,
+                   MAX(best_trade) AS best_trade,
+                   MIN(worst_trade) AS worst_trade
+            FROM performance_rollups
+            WHERE period = 'day' AND period_start >= $1
+            """,
+            since,
+        )
+        return PerformanceRollup(period="range", period_start=since, **dict(record or {}))
+
+    async def get_series(
+        self,
+        period: str,
+        since: date | None = None,
+        limit: int | None = None,
+    ) -> list[PerformanceRollup]:
+        """
+        Rollup rows for `period`, oldest first.
+
+        Args:
+            period: 'day', 'week' or 'month'
+            since: Only buckets starting on/after this date
+            limit: Only the most recent N buckets
+        """
+        query = """
+            SELECT * FROM (
+                SELECT * FROM performance_rollups
+                WHERE period = $1 AND ($2::date IS NULL OR period_start >= $2)
+                ORDER BY period_start DESC
+                LIMIT $3
+            ) recent
+            ORDER BY period_start ASC
+        """
+        records = await self.db.fetch(query, period, since, limit)
+        return self._records_to_models(records)
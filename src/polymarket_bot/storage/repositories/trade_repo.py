@@ -2,11 +2,13 @@
 Trade repository with watermark pattern for idempotent processing.
 
 Handles:
-- polymarket_trades: Raw trade data from Polymarket
+- polymarket_trades: Raw trade data from Polymarket (partitioned by day)
+- polymarket_trade_payloads: Optional compressed raw trade JSON
 - trade_watermarks: Tracks last processed trade per condition
 """
 from __future__ import annotations
 
+import zlib
 from datetime import datetime
 from typing import Optional
 
@@ -15,19 +17,43 @@ from polymarket_bot.storage.models import PolymarketTrade, TradeWatermark
 from polymarket_bot.storage.repositories.base import BaseRepository
 
 
+def _encode_payload(raw_json: str) -> bytes:
+    """Compress a raw trade payload for polymarket_trade_payloads."""
+    return zlib.compress(raw_json.encode("utf-8"))
+
+
+def _decode_payload(payload: bytes) -> str:
+    """Decompress a stored payload (rows copied by migration 09 are uncompressed)."""
+    try:
+        return zlib.decompress(payload).decode("utf-8")
+    except zlib.error:
+        return bytes(payload).decode("utf-8")
+
+
 class TradeRepository(BaseRepository[PolymarketTrade]):
-    """Repository for Polymarket trades."""
+    """
+    Repository for Polymarket trades.
+
+    polymarket_trades is range-partitioned on timestamp (see
+    storage.partitions). Raw JSON is not stored on the trade row; pass
+    store_raw_payloads=True to keep it, compressed, in
+    polymarket_trade_payloads.
+    """
 
     table_name = "polymarket_trades"
     model_class = PolymarketTrade
 
+    def __init__(self, db: Database, store_raw_payloads: bool = False) -> None:
+        super().__init__(db)
+        self.store_raw_payloads = store_raw_payloads
+
     async def create(self, trade: PolymarketTrade) -> PolymarketTrade:
         """Insert a new trade."""
         query = """
             INSERT INTO polymarket_trades
-            (condition_id, trade_id, token_id, price, size, side, timestamp, raw_json, outcome, outcome_index)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            ON CONFLICT (condition_id, trade_id) DO NOTHING
+            (condition_id, trade_id, token_id, price, size, side, timestamp, outcome, outcome_index)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            ON CONFLICT (condition_id, trade_id, timestamp) DO NOTHING
             RETURNING *
         """
         record = await self.db.fetchrow(
@@ -39,10 +65,21 @@ class TradeRepository(BaseRepository[PolymarketTrade]):
             trade.size,
             trade.side,
             trade.timestamp,
-            trade.raw_json,
             trade.outcome,
             trade.outcome_index,
         )
+        if record and self.store_raw_payloads and trade.raw_json:
+            await self.db.execute(
+                """
+                INSERT INTO polymarket_trade_payloads (condition_id, trade_id, timestamp, payload)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (condition_id, trade_id, timestamp) DO NOTHING
+                """,
+                trade.condition_id,
+                trade.trade_id,
+                trade.timestamp,
+                _encode_payload(trade.raw_json),
+            )
         return self._record_to_model(record) if record else trade
 
     async def create_many(self, trades: list[PolymarketTrade]) -> int:
@@ -52,12 +89,12 @@ class TradeRepository(BaseRepository[PolymarketTrade]):
 
         query = """
             INSERT INTO polymarket_trades
-            (condition_id, trade_id, token_id, price, size, side, timestamp, raw_json, outcome, outcome_index)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-            ON CONFLICT (condition_id, trade_id) DO NOTHING
+            (condition_id, trade_id, token_id, price, size, side, timestamp, outcome, outcome_index)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+            ON CONFLICT (condition_id, trade_id, timestamp) DO NOTHING
         """
         async with self.db.transaction() as conn:
-            result = await conn.executemany(
+            await conn.executemany(
                 query,
                 [
                     (
@@ -68,15 +105,43 @@ class TradeRepository(BaseRepository[PolymarketTrade]):
                         t.size,
                         t.side,
                         t.timestamp,
-                        t.raw_json,
                         t.outcome,
                         t.outcome_index,
                     )
                     for t in trades
                 ],
             )
+            if self.store_raw_payloads:
+                payloads = [
+                    (t.condition_id, t.trade_id, t.timestamp, _encode_payload(t.raw_json))
+                    for t in trades
+                    if t.raw_json
+                ]
+                if payloads:
+                    await conn.executemany(
+                        """
+                        INSERT INTO polymarket_trade_payloads
+                        (condition_id, trade_id, timestamp, payload)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (condition_id, trade_id, timestamp) DO NOTHING
+                        """,
+                        payloads,
+                    )
         return len(trades)
 
+    async def get_raw_payload(self, condition_id: str, trade_id: str) -> str | None:
+        """Get the stored raw JSON for a trade, if payloads were kept."""
+        payload = await self.db.fetchval(
+            """
+            SELECT payload FROM polymarket_trade_payloads
+            WHERE condition_id = $1 AND trade_id = $2
+            LIMIT 1
+            """,
+            condition_id,
+            trade_id,
+        )
+        return _decode_payload(payload) if payload is not None else None
+
     async def get_by_condition(
         self, condition_id: str, limit: int = 100
     ) -> list[PolymarketTrade]:
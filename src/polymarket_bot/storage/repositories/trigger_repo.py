@@ -23,8 +23,10 @@ class TriggerRepository(BaseRepository[PolymarketFirstTrigger]):
     """
     Repository for first-hit triggers.
 
-    Ensures each (token_id, threshold) combination only triggers once.
-    Also tracks condition_id to prevent duplicate token_id spam (G2).
+    Ensures each (token_id, condition_id, threshold, strategy) combination
+    only triggers once, and each (condition_id, threshold, strategy) too, so
+    several token_ids of one market do not trigger it twice (G2). Callers
+    that do not pass a strategy write ''.
     """
 
     table_name = "polymarket_first_triggers"
@@ -34,16 +36,17 @@ class TriggerRepository(BaseRepository[PolymarketFirstTrigger]):
         """
         Record a new trigger event.
 
-        Uses ON CONFLICT to ensure (token_id, condition_id, threshold) uniqueness.
+        Uses ON CONFLICT to ensure (token_id, condition_id, threshold, strategy)
+        uniqueness.
         This is the G2 gotcha fix - prevents duplicate trades when multiple
         token_ids map to the same condition.
         """
         query = """
             INSERT INTO polymarket_first_triggers
             (token_id, condition_id, threshold, trigger_timestamp, price, size,
-             created_at, model_score, model_version, outcome, outcome_index)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
-            ON CONFLICT (token_id, condition_id, threshold) DO NOTHING
+             created_at, model_score, model_version, outcome, outcome_index, strategy)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+            ON CONFLICT (token_id, condition_id, threshold, strategy) DO NOTHING
             RETURNING *
         """
         record = await self.db.fetchrow(
@@ -59,6 +62,7 @@ class TriggerRepository(BaseRepository[PolymarketFirstTrigger]):
             trigger.model_version,
             trigger.outcome,
             trigger.outcome_index,
+            trigger.strategy,
         )
         return self._record_to_model(record) if record else trigger
 
@@ -0,0 +1,91 @@
+"""
+Named statements for hot queries.
+
+Repositories declare their hot statements once, at import time:
+
+    from polymarket_bot.storage.statements import statements
+
+    OPEN_POSITIONS = statements.register(
+        "positions.open",
+        "SELECT * FROM positions WHERE status = 'open' ORDER BY created_at DESC",
+    )
+
+    records = await db.fetch(OPEN_POSITIONS)
+
+Statements run through asyncpg's per-connection statement cache, which
+prepares each query once per connection. Database sizes that cache
+(DatabaseConfig.statement_cache_size) to hold every registered statement
+alongside ad-hoc queries, and turns off its time-based expiry, so hot
+statements are not re-parsed after an eviction or every few minutes.
+
+A Statement compares and hashes as its SQL text (a str subclass), so
+query stats and test doubles that look at the query keep working. asyncpg
+itself only accepts exact str, and drops the connection otherwise: pass a
+Statement to Database methods or run(), or statement.sql to a connection.
+Inside Database.transaction():
+
+    async with db.transaction() as conn:
+        await statements.run(conn, "fetchval", CLAIM_TRIGGER, token_id, ...)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+
+class Statement(str):
+    """SQL text with a registry name. Create with StatementRegistry.register."""
+
+    name: str
+
+    def __new__(cls, name: str, sql: str) -> Statement:
+        statement = super().__new__(cls, sql)
+        statement.name = name
+        return statement
+
+    @property
+    def sql(self) -> str:
+        return str(self)
+
+
+class StatementRegistry:
+    """Registered statements by name."""
+
+    def __init__(self):
+        self._statements: dict[str, Statement] = {}
+
+    def register(self, name: str, sql: str) -> Statement:
+        """
+        Declare a statement. Registering the same name again returns the
+        existing statement; with different SQL it raises ValueError.
+        """
+        existing = self._statements.get(name)
+        if existing is not None:
+            if existing.sql != sql:
+                raise ValueError(f"Statement {name} already registered with different SQL")
+            return existing
+        statement = self._statements[name] = Statement(name, sql)
+        return statement
+
+    def get(self, name: str) -> Statement | None:
+        return self._statements.get(name)
+
+    def __iter__(self) -> Iterator[Statement]:
+        return iter(list(self._statements.values()))
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    async def run(self, conn: Any, method: str, query: str, *args) -> Any:
+        """
+        conn.<method>(query, *args), passing a Statement as its plain SQL.
+        method is one of execute, fetch, fetchrow, fetchval.
+        """
+        if isinstance(query, Statement):
+            query = query.sql
+        return await getattr(conn, method)(query, *args)
+
+
+# Process-wide registry
+statements = StatementRegistry()
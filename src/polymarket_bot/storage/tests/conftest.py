@@ -98,6 +98,7 @@ async def clean_db(db: Database) -> AsyncGenerator[Database, None]:
         "live_orders",
         "positions",
         "exit_events",
+        "performance_rollups",
     ]
     async with db.transaction() as conn:
         for table in tables_to_clear:
@@ -3,10 +3,21 @@ Database connection tests.
 
 Tests for async PostgreSQL connection management.
 """
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock
 
-from polymarket_bot.storage.database import Database, DatabaseConfig
+from polymarket_bot.storage.database import (
+    BACKGROUND,
+    HOT,
+    REPLICA,
+    REPORTING,
+    Database,
+    DatabaseConfig,
+    DatabaseWorkload,
+)
+from polymarket_bot.telemetry import registry
 
 
 class TestDatabaseConfig:
@@ -30,6 +41,20 @@ class TestDatabaseConfig:
         assert config.min_connections == 5
         assert config.max_connections == 20
 
+    def test_workload_pools(self):
+        """Background and reporting pools by default; replica only when set."""
+        config = DatabaseConfig(url="postgresql://primary/db")
+        assert config.isolated_pools() == [BACKGROUND, REPORTING]
+        assert config.pool_settings(REPORTING).statement_timeout_ms == 30_000
+
+        with_replica = DatabaseConfig(url="postgresql://primary/db", replica_url="postgresql://replica/db")
+        replica = with_replica.pool_settings(REPLICA)
+        assert with_replica.isolated_pools() == [BACKGROUND, REPORTING, REPLICA]
+        assert (replica.url, replica.read_only) == ("postgresql://replica/db", True)
+
+        shared = DatabaseConfig(background_max_connections=0, reporting_max_connections=0)
+        assert shared.isolated_pools() == []
+
 
 @pytest.mark.asyncio
 class TestDatabaseConnection:
@@ -153,3 +178,73 @@ class TestDatabaseRecovery:
 
         assert result == "ok"
         db._ensure_connected.assert_awaited()
+
+
+@pytest.mark.asyncio
+class TestWorkloadPools:
+    """Tests for per-workload pools and replica routing."""
+
+    @pytest.fixture
+    def pools_config(self, db_config: DatabaseConfig) -> DatabaseConfig:
+        return db_config.model_copy(update={
+            "max_connections": 3,
+            "background_max_connections": 1,
+            "reporting_max_connections": 1,
+            "reporting_statement_timeout_ms": 1500,
+            # Same server, but exercises the read-only replica pool
+            "replica_url": db_config.url,
+        })
+
+    async def test_workloads_use_their_own_pools(self, pools_config: DatabaseConfig):
+        db = Database(pools_config)
+        await db.initialize()
+        try:
+            background = db.workload("background")
+            reporting = db.workload("reporting")
+
+            assert db.workload(HOT) is db
+            assert isinstance(background, DatabaseWorkload)
+            assert db.workload("background") is background
+            assert await db.fetchval("SHOW application_name") == "polymarket_bot:hot"
+            assert await background.fetchval("SHOW application_name") == "polymarket_bot:background"
+            assert await reporting.fetchval("SHOW statement_timeout") == "1500ms"
+            # Reads on the replica pool, writes on the primary
+            assert await reporting.fetchval("SHOW transaction_read_only") == "on"
+            async with reporting.connection() as conn:
+                assert await conn.fetchval("SHOW transaction_read_only") == "off"
+            with pytest.raises(ValueError):
+                db.workload("adhoc")
+        finally:
+            await db.close()
+
+    async def test_hot_path_does_not_wait_behind_background(self, pools_config: DatabaseConfig):
+        db = Database(pools_config)
+        await db.initialize()
+        background = db.workload("background")
+        try:
+            async with background.connection():
+                # Background pool is exhausted: the next background call waits
+                waiting = asyncio.create_task(background.fetchval("SELECT 1"))
+                await asyncio.sleep(0.05)
+                assert not waiting.done()
+
+                # The hot path is unaffected
+                assert await asyncio.wait_for(db.fetchval("SELECT 2"), timeout=1) == 2
+
+                text = registry.render()
+                assert 'polymarket_db_pool_waiting{pool="background"} 1' in text
+                assert 'polymarket_db_pool_in_use{pool="background"} 1' in text
+                assert 'polymarket_db_pool_saturated_total{pool="background"}' in text
+            assert await waiting == 1
+        finally:
+            await db.close()
+
+    async def test_shared_pool_when_size_is_zero(self, db_config: DatabaseConfig):
+        config = db_config.model_copy(update={"background_max_connections": 0})
+        db = Database(config)
+        await db.initialize()
+        try:
+            background = db.workload("background")
+            assert await background.fetchval("SHOW application_name") == "polymarket_bot:hot"
+        finally:
+            await db.close()
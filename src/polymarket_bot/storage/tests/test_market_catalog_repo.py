@@ -0,0 +1,69 @@
+"""
+MarketCatalogRepository tests.
+
+Checks that the market_catalog feed only takes a new seq when a market's
+content or resolved flag changes.
+"""
+
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest_asyncio
+
+from polymarket_bot.storage.database import Database
+from polymarket_bot.storage.repositories import MarketCatalogRepository
+
+
+def change(condition_id: str, content_hash: str, kind: str = "added") -> SimpleNamespace:
+    """Duck-typed ingestion.catalog.CatalogChange."""
+    return SimpleNamespace(
+        condition_id=condition_id,
+        kind=kind,
+        market=SimpleNamespace(
+            content_hash=content_hash,
+            raw={"conditionId": condition_id, "question": f"{condition_id}?"},
+        ),
+    )
+
+
+@pytest_asyncio.fixture
+async def repo(db: Database) -> MarketCatalogRepository:
+    await db.execute("DELETE FROM market_catalog")
+    yield MarketCatalogRepository(db)
+    await db.execute("DELETE FROM market_catalog")
+
+
+async def test_apply_changes_skips_unchanged(repo: MarketCatalogRepository):
+    assert await repo.apply_changes([change("0xa", "h1"), change("0xb", "h1")]) == 2
+    start = await repo.latest_seq()
+
+    written = await repo.apply_changes(
+        [
+            change("0xa", "h1", kind="updated"),
+            change("0xb", "h2", kind="updated"),
+        ]
+    )
+
+    assert written == 1
+    entries = await repo.changes_since(start)
+    assert [(e.condition_id, e.content_hash) for e in entries] == [("0xb", "h2")]
+    assert entries[0].payload["question"] == "0xb?"
+
+
+async def test_resolution_takes_new_seq(repo: MarketCatalogRepository):
+    await repo.apply_changes([change("0xa", "h1")])
+    start = await repo.latest_seq()
+
+    # Dropped out of the open listing: same payload, now resolved
+    assert await repo.apply_changes([change("0xa", "h1", kind="resolved")]) == 1
+
+    [entry] = await repo.changes_since(start)
+    assert entry.resolved
+
+
+async def test_prune_resolved(repo: MarketCatalogRepository):
+    await repo.apply_changes([change("0xa", "h1"), change("0xb", "h1", kind="resolved")])
+
+    assert await repo.prune_resolved(older_than=timedelta(days=7)) == 0
+    assert await repo.prune_resolved(older_than=timedelta(seconds=-1)) == 1
+    assert [e.condition_id for e in await repo.changes_since(0)] == ["0xa"]
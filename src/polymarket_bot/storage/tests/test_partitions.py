@@ -0,0 +1,73 @@
+"""
+Trade partition maintenance tests.
+
+Pure helper tests run without a database; the maintenance test needs the
+partitioned schema from seed/01_schema.sql.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from polymarket_bot.storage.database import Database
+from polymarket_bot.storage.models import PolymarketTrade
+from polymarket_bot.storage.partitions import (
+    TradePartitionManager,
+    day_bounds,
+    partition_name,
+)
+from polymarket_bot.storage.repositories import TradeRepository
+from polymarket_bot.storage.repositories.trade_repo import _decode_payload, _encode_payload
+
+
+class TestPartitionHelpers:
+    """Tests for partition naming and bounds."""
+
+    def test_partition_name_uses_utc_day(self):
+        day = datetime(2025, 3, 9, 23, 30, tzinfo=timezone(timedelta(hours=-5)))
+        assert partition_name("polymarket_trades", day) == "polymarket_trades_p20250310"
+
+    def test_day_bounds_are_whole_utc_days(self):
+        start, end = day_bounds(datetime(2025, 3, 10, 12, 0))
+        assert start == int(datetime(2025, 3, 10, tzinfo=timezone.utc).timestamp())
+        assert end - start == 86400
+
+    def test_payload_roundtrip(self):
+        raw = '{"id": "t1", "price": "0.95"}'
+        assert _decode_payload(_encode_payload(raw)) == raw
+
+    def test_decode_uncompressed_legacy_payload(self):
+        """Rows copied by migration 09 are stored as plain UTF-8."""
+        assert _decode_payload(b'{"id": "t1"}') == '{"id": "t1"}'
+
+
+@pytest.mark.asyncio
+class TestTradePartitionManager:
+    """Tests for TradePartitionManager against the partitioned schema."""
+
+    async def test_maintenance_moves_default_rows_and_drops_expired(self, clean_db: Database):
+        manager = TradePartitionManager(clean_db, retention_days=30, days_ahead=1)
+        now = datetime.now(timezone.utc)
+        old_day = now - timedelta(days=40)
+
+        # An expired partition and a fresh trade that lands in DEFAULT
+        await manager.ensure_partition("polymarket_trades", old_day)
+        await clean_db.execute(f"DROP TABLE IF EXISTS {partition_name('polymarket_trades', now)}")
+        repo = TradeRepository(clean_db, store_raw_payloads=True)
+        await repo.create(
+            PolymarketTrade(
+                condition_id="0xpart",
+                trade_id="t1",
+                price=0.5,
+                size=10.0,
+                timestamp=int(now.timestamp()),
+                raw_json='{"id": "t1"}',
+            )
+        )
+
+        result = await manager.run_maintenance(now)
+
+        assert partition_name("polymarket_trades", now) in result.created
+        assert partition_name("polymarket_trades", old_day) in result.dropped
+        assert await repo.get_latest_timestamp("0xpart") == int(now.timestamp())
+        assert await repo.get_raw_payload("0xpart", "t1") == '{"id": "t1"}'
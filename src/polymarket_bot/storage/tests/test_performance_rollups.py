@@ -0,0 +1,152 @@
+"""
+Performance rollup tests.
+
+Checks that incremental record_exit() and a full rebuild() from
+exit_events produce the same rows.
+"""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import asyncpg
+import pytest
+
+from polymarket_bot.storage.database import Database
+from polymarket_bot.storage.models import ExitEvent
+from polymarket_bot.storage.repositories import (
+    ExitEventRepository,
+    PerformanceRollupRepository,
+)
+from polymarket_bot.storage.repositories.position_repo import (
+    ALL_TIME_START,
+    INSERT_EXIT_EVENT,
+    period_starts,
+)
+
+EXITS = [
+    (datetime(2025, 3, 3, 10, 0, tzinfo=timezone.utc), Decimal("5.0")),  # Monday
+    (datetime(2025, 3, 5, 12, 0, tzinfo=timezone.utc), Decimal("-2.0")),
+    (datetime(2025, 3, 5, 18, 0, tzinfo=timezone.utc), Decimal("3.0")),
+    (datetime(2025, 4, 1, 9, 0, tzinfo=timezone.utc), Decimal("-4.0")),
+]
+
+
+async def _all_rows(repo: PerformanceRollupRepository) -> dict:
+    rows = [await repo.get_summary()]
+    for period in ("day", "week", "month"):
+        rows.extend(await repo.get_series(period))
+    return {(r.period, r.period_start): r for r in rows}
+
+
+def test_period_starts():
+    starts = period_starts(datetime(2025, 3, 5, 23, 0, tzinfo=timezone.utc))
+    assert starts == {
+        "day": date(2025, 3, 5),
+        "week": date(2025, 3, 3),
+        "month": date(2025, 3, 1),
+        "all": ALL_TIME_START,
+    }
+
+
+@pytest.mark.asyncio
+class TestPerformanceRollupRepository:
+    """Tests for PerformanceRollupRepository."""
+
+    async def test_record_exit_accumulates(self, clean_db: Database):
+        repo = PerformanceRollupRepository(clean_db)
+        for closed_at, pnl in EXITS:
+            await repo.record_exit(closed_at, float(pnl))
+
+        summary = await repo.get_summary()
+        assert summary.trades == 4
+        assert summary.wins == 2
+        assert summary.losses == 2
+        assert summary.net_pnl == pytest.approx(2.0)
+        assert summary.gross_profit == pytest.approx(8.0)
+        assert summary.gross_loss == pytest.approx(6.0)
+        assert summary.best_trade == pytest.approx(5.0)
+        assert summary.worst_trade == pytest.approx(-4.0)
+
+        days = await repo.get_series("day")
+        assert [d.period_start for d in days] == [
+            date(2025, 3, 3),
+            date(2025, 3, 5),
+            date(2025, 4, 1),
+        ]
+        assert days[1].trades == 2 and days[1].net_pnl == pytest.approx(1.0)
+
+        months = await repo.get_series("month", limit=1)
+        assert len(months) == 1 and months[0].period_start == date(2025, 4, 1)
+
+        ranged = await repo.get_summary(since=date(2025, 3, 5))
+        assert ranged.trades == 3
+        assert ranged.net_pnl == pytest.approx(-3.0)
+
+    async def test_rebuild_matches_incremental(self, clean_db: Database):
+        repo = PerformanceRollupRepository(clean_db)
+        exits = ExitEventRepository(clean_db)
+        for i, (closed_at, pnl) in enumerate(EXITS):
+            await exits.create(
+                ExitEvent(
+                    position_id=f"pos_{i}",
+                    token_id=f"tok_{i}",
+                    condition_id="0xroll",
+                    exit_type="take_profit",
+                    entry_price=Decimal("0.95"),
+                    exit_price=Decimal("0.99"),
+                    size=Decimal("10"),
+                    gross_pnl=pnl,
+                    net_pnl=pnl,
+                    hours_held=1.0,
+                    created_at=closed_at.isoformat(),
+                )
+            )
+            await repo.record_exit(closed_at, float(pnl))
+
+        incremental = await _all_rows(repo)
+        assert await repo.rebuild() == 4
+        rebuilt = await _all_rows(repo)
+
+        assert rebuilt.keys() == incremental.keys()
+        for key, row in rebuilt.items():
+            assert row.trades == incremental[key].trades
+            assert row.net_pnl == pytest.approx(incremental[key].net_pnl)
+            assert row.worst_trade == pytest.approx(incremental[key].worst_trade)
+
+    async def test_exit_event_and_rollup_written_together(self, clean_db: Database):
+        """INSERT_EXIT_EVENT writes the event and its rollups, or neither."""
+        repo = PerformanceRollupRepository(clean_db)
+        closed_at, pnl = EXITS[0]
+        args = (
+            "pos_0",
+            "tok_0",
+            "0xroll",
+            "take_profit",
+            0.95,
+            0.99,
+            10.0,
+            float(pnl),
+            float(pnl),
+            1.0,
+            None,
+            "executed",
+            "profit_target",
+            closed_at.isoformat(),
+            *repo.period_args(closed_at),
+        )
+        await clean_db.execute(INSERT_EXIT_EVENT, *args)
+
+        summary = await repo.get_summary()
+        assert summary.trades == 1
+        assert summary.net_pnl == pytest.approx(5.0)
+        assert await clean_db.fetchval("SELECT COUNT(*) FROM exit_events") == 1
+
+        # A failing event insert leaves the rollups untouched
+        with pytest.raises(asyncpg.NotNullViolationError):
+            await clean_db.execute(INSERT_EXIT_EVENT, None, *args[1:])
+        assert (await repo.get_summary()).trades == 1
+
+    async def test_empty_summary(self, clean_db: Database):
+        summary = await PerformanceRollupRepository(clean_db).get_summary()
+        assert summary.trades == 0
+        assert summary.net_pnl == 0
@@ -0,0 +1,156 @@
+"""
+Tests for per-statement query statistics and the slow-query log.
+"""
+
+import logging
+
+import asyncpg
+import pytest
+
+from polymarket_bot.storage import query_stats as qs
+from polymarket_bot.storage.database import Database
+from polymarket_bot.storage.query_stats import (
+    OTHER,
+    QueryStats,
+    fingerprint,
+    format_table,
+    row_count,
+)
+
+
+class TestFingerprint:
+    """Statements differing only in literals share a fingerprint."""
+
+    def test_literals_and_whitespace_are_normalized(self):
+        a = fingerprint("SELECT *  FROM trades\n WHERE price > 0.95 AND side = 'BUY' -- hot")
+        b = fingerprint("SELECT * FROM trades WHERE price > 0.5 AND side = 'SELL'")
+        assert a == b == "SELECT * FROM trades WHERE price > ? AND side = ?"
+
+    def test_parameter_lists_collapse(self):
+        three = fingerprint("SELECT 1 FROM trades WHERE token_id IN ($1, $2, $3)")
+        ten = fingerprint(
+            f"SELECT 1 FROM trades WHERE token_id IN ({', '.join(f'${i}' for i in range(1, 11))})"
+        )
+        assert three == ten == "SELECT ? FROM trades WHERE token_id IN (...)"
+
+    def test_multi_row_values_collapse(self):
+        sql = "INSERT INTO t (a, b) VALUES ($1, $2), ($3, $4), ($5, $6)"
+        assert fingerprint(sql) == "INSERT INTO t (a, b) VALUES (...), ..."
+
+    def test_identifiers_with_digits_are_kept(self):
+        assert fingerprint("SELECT * FROM trades_2026_10") == "SELECT * FROM trades_2026_10"
+
+
+class TestRowCount:
+    @pytest.mark.parametrize(
+        "method,result,expected",
+        [
+            ("fetch", None, 0),
+            ("fetch", [{"a": 1}, {"a": 2}], 2),
+            ("execute", "INSERT 0 5", 5),
+            ("execute", "UPDATE 3", 3),
+            ("execute", "CREATE TABLE", 0),
+            ("fetchrow", {"id": 1}, 1),
+            ("fetchrow", None, 0),
+            ("fetchval", "12345", 1),
+            ("fetchval", "SELECT 10", 1),
+        ],
+    )
+    def test_row_count(self, method, result, expected):
+        assert row_count(method, result) == expected
+
+
+class TestQueryStats:
+    """Tests for aggregation, ordering and the slow-query log."""
+
+    def test_top_orders_by_requested_key(self):
+        stats = QueryStats()
+        for _ in range(5):
+            stats.record("SELECT * FROM positions WHERE id = $1", 0.001, rows=1)
+        stats.record("SELECT * FROM trades", 0.5, rows=1000, retries=1)
+        stats.record("SELECT * FROM trades", 0.1, error=True)
+
+        by_total = stats.top()
+        by_calls = stats.top(sort="calls")
+
+        assert by_total[0]["statement"] == "SELECT * FROM trades"
+        assert by_total[0]["calls"] == 2
+        assert by_total[0]["errors"] == 1
+        assert by_total[0]["rows"] == 1000
+        assert by_total[0]["total_ms"] == pytest.approx(600.0)
+        assert by_calls[0]["statement"] == "SELECT * FROM positions WHERE id = $n"
+        assert stats.summary()["retries"] == 1
+        assert len(stats.top(limit=1)) == 1
+        with pytest.raises(ValueError):
+            stats.top(sort="statement")
+
+    def test_slow_queries_capture_params_and_site(self, caplog):
+        stats = QueryStats(slow_query_ms=50)
+
+        with caplog.at_level(logging.WARNING, logger=qs.__name__):
+            stats.record("SELECT 1 WHERE x = $1", 0.01, params=("fast",))
+            stats.record("SELECT 1 WHERE x = $1", 0.2, params=("slow", "x" * 500))
+
+        [slow] = stats.slow_queries()
+        assert slow["duration_ms"] == pytest.approx(200.0)
+        assert slow["params"][0] == "'slow'"
+        assert slow["params"][1].endswith("(502 chars)")
+        assert "test_query_stats.py" in slow["site"]
+        assert "test_slow_queries_capture_params_and_site" in slow["site"]
+        assert "Slow query (200.0ms)" in caplog.text
+
+    def test_distinct_statements_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(qs, "MAX_STATEMENTS", 2)
+        stats = QueryStats()
+        for table in ("a", "b", "c", "d"):
+            stats.record(f"SELECT * FROM {table}", 0.001)
+
+        statements = {row["statement"]: row["calls"] for row in stats.top()}
+        assert statements == {"SELECT * FROM a": 1, "SELECT * FROM b": 1, OTHER: 2}
+
+    def test_format_table(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.002, rows=1)
+
+        lines = format_table(stats.top()).splitlines()
+
+        assert lines[0].split()[:2] == ["calls", "total"]
+        assert lines[1].endswith("SELECT ?")
+
+
+@pytest.mark.asyncio
+class TestDatabaseRecording:
+    """Database helper methods feed query_stats."""
+
+    async def test_helpers_record_statements(self, db: Database):
+        db.query_stats.reset()
+        await db.fetchval("SELECT $1::int", 1)
+        await db.fetchval("SELECT $1::int", 2)
+        await db.fetch("SELECT generate_series(1, 3)")
+        with pytest.raises(asyncpg.UndefinedTableError):
+            await db.execute("SELECT * FROM no_such_table_for_stats")
+
+        rows = {row["statement"]: row for row in db.query_stats.top()}
+
+        assert rows["SELECT $n::int"]["calls"] == 2
+        assert rows["SELECT generate_series(...)"]["rows"] == 3
+        assert rows["SELECT * FROM no_such_table_for_stats"]["errors"] == 1
+        assert db.query_stats.summary()["acquire_wait"]["count"] >= 4
+
+    async def test_fetchval_string_is_not_a_row_count(self, db: Database):
+        db.query_stats.reset()
+        await db.fetchval("SELECT $1::text", "1000000")
+
+        [row] = db.query_stats.top()
+        assert row["rows"] == 1
+
+    async def test_slow_query_site_is_caller(self, db: Database):
+        db.query_stats.reset()
+        db.query_stats.slow_query_ms = 0.001
+        try:
+            await db.fetchval("SELECT pg_sleep(0.01)")
+        finally:
+            db.query_stats.slow_query_ms = db.config.slow_query_ms
+
+        [slow] = db.query_stats.slow_queries()
+        assert "test_slow_query_site_is_caller" in slow["site"]
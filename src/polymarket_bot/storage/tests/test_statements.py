@@ -0,0 +1,107 @@
+"""
+Tests for the named statement registry.
+"""
+
+import pytest
+
+from polymarket_bot.core.trigger_tracker import CONDITION_TRIGGERED
+from polymarket_bot.storage.database import Database
+from polymarket_bot.storage.repositories.position_repo import OPEN_POSITIONS
+from polymarket_bot.storage.statements import Statement, StatementRegistry, statements
+
+PREPARED = "SELECT count(*) FROM pg_prepared_statements WHERE statement = $1"
+
+
+class TestStatementRegistry:
+    """Tests for declaring statements."""
+
+    def test_statement_is_its_sql(self):
+        registry = StatementRegistry()
+        statement = registry.register("t.one", "SELECT 1")
+
+        assert isinstance(statement, Statement)
+        assert statement == "SELECT 1"
+        assert statement.name == "t.one"
+        assert type(statement.sql) is str
+        assert registry.get("t.one") is statement
+
+    def test_register_is_idempotent_per_name(self):
+        registry = StatementRegistry()
+        first = registry.register("t.one", "SELECT 1")
+
+        assert registry.register("t.one", "SELECT 1") is first
+        with pytest.raises(ValueError):
+            registry.register("t.one", "SELECT 2")
+        assert len(registry) == 1
+
+    def test_hot_statements_are_registered(self):
+        assert statements.get("trigger.condition_triggered") is CONDITION_TRIGGERED
+        assert statements.get("positions.open") is OPEN_POSITIONS
+        assert {"context.token_meta", "orders.upsert", "positions.upsert"} <= {
+            s.name for s in statements
+        }
+
+    @pytest.mark.asyncio
+    async def test_run_passes_plain_sql(self):
+        registry = StatementRegistry()
+        statement = registry.register("t.one", "SELECT 1")
+        calls = []
+
+        class FakeConn:
+            async def fetchval(self, query, *args):
+                calls.append((query, args))
+                return 1
+
+        assert await registry.run(FakeConn(), "fetchval", statement, "x") == 1
+        assert calls == [("SELECT 1", ("x",))]
+        assert type(calls[0][0]) is str
+
+
+@pytest.mark.asyncio
+class TestCachedExecution:
+    """Tests against a live pool."""
+
+    async def test_hot_statement_survives_ad_hoc_queries(self, db: Database):
+        """Past asyncpg's default 100-entry cache, hot statements stay prepared."""
+        async with db.connection() as conn:
+            await statements.run(conn, "fetchval", CONDITION_TRIGGERED, "0xnone", 0.95, "")
+            for i in range(150):
+                await conn.fetchval(f"SELECT $1::int + {i}", 1)
+            await statements.run(conn, "fetchval", CONDITION_TRIGGERED, "0xnone", 0.95, "")
+
+            assert await conn.fetchval(PREPARED, CONDITION_TRIGGERED.sql) == 1
+
+    async def test_pool_disables_statement_expiry(self, db: Database):
+        assert db.config.statement_cache_size > len(statements)
+        assert db.config.max_cached_statement_lifetime == 0
+
+    async def test_execute_returns_status_in_transactions(self, db: Database):
+        registry = StatementRegistry()
+        insert = registry.register("t.insert", "INSERT INTO stmt_test VALUES ($1), ($2)")
+        count = registry.register("t.count", "SELECT count(*) FROM stmt_test")
+
+        async with db.transaction() as conn:
+            await conn.execute("CREATE TEMP TABLE stmt_test (id int)")
+            assert await registry.run(conn, "execute", insert, 1, 2) == "INSERT 0 2"
+            assert await registry.run(conn, "fetchval", count) == 2
+            assert conn.is_in_transaction()
+            await conn.execute("DROP TABLE stmt_test")
+
+    async def test_statement_reprepared_after_schema_change(self, db: Database):
+        registry = StatementRegistry()
+        select = registry.register("t.select", "SELECT * FROM stmt_schema_test")
+
+        async with db.connection() as conn:
+            await conn.execute("CREATE TEMP TABLE stmt_schema_test (id int)")
+            await conn.execute("INSERT INTO stmt_schema_test VALUES (1)")
+            assert await registry.run(conn, "fetchrow", select) == (1,)
+
+            await conn.execute("ALTER TABLE stmt_schema_test ADD COLUMN note text DEFAULT 'x'")
+            row = await registry.run(conn, "fetchrow", select)
+            await conn.execute("DROP TABLE stmt_schema_test")
+
+        assert dict(row) == {"id": 1, "note": "x"}
+
+    async def test_database_methods_accept_statements(self, db: Database):
+        assert await db.fetchval(CONDITION_TRIGGERED, "0xnone", 0.95, "") is None
+        assert isinstance(await db.fetch(OPEN_POSITIONS), list)
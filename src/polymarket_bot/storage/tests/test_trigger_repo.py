@@ -224,3 +224,25 @@ class TestTriggerWatermarkRepository:
         result = await trigger_watermark_repo.get_timestamp(0.95)
 
         assert result == 2000, "Watermark should not go backwards"
+
+
+@pytest.mark.asyncio
+class TestStrategyTriggerKeys:
+    """Per-strategy first-trigger keys against the real schema."""
+
+    async def test_strategies_trigger_the_same_market_independently(self, clean_db):
+        from decimal import Decimal
+
+        from polymarket_bot.core import TriggerTracker
+
+        tracker = TriggerTracker(clean_db)
+        keys = [("a", Decimal("0.95")), ("b", Decimal("0.97"))]
+
+        assert await tracker.try_record_trigger_atomic("tok_1", "0xcond", Decimal("0.95"), strategy="a")
+        assert not await tracker.try_record_trigger_atomic("tok_2", "0xcond", Decimal("0.95"), strategy="a")
+        assert await tracker.untriggered_strategies("tok_2", "0xcond", keys) == ["b"]
+
+        assert await tracker.try_record_trigger_atomic("tok_2", "0xcond", Decimal("0.97"), strategy="b")
+        assert await tracker.untriggered_strategies("tok_1", "0xcond", keys) == []
+        assert await tracker.untriggered_strategies("tok_1", "0xother", keys) == ["a", "b"]
+        assert {t.strategy for t in await tracker.get_triggers_for_condition("0xcond")} == {"a", "b"}
@@ -0,0 +1,319 @@
+"""
+Process-wide metrics registry with Prometheus text exposition.
+
+Counters, gauges and histograms are created once at import time by the
+module that records them and then updated in place:
+
+    from polymarket_bot.telemetry import registry
+
+    FRAMES = registry.counter("polymarket_ws_frames_total", "WebSocket frames received")
+    FRAMES.inc()
+
+Recording is O(1): an attribute increment, or for histograms a bisect over
+a fixed bucket list. Labeled metrics resolve their child with a dict
+lookup; bind the child once (metric.labels(...)) when the label values are
+known up front.
+
+Counts that components already keep (EngineStats, ProcessorStats,
+PipelineTracker totals, ...) are not double-counted on the hot path.
+Instead a collector registered with add_collector() copies them into
+metrics when /metrics is scraped.
+
+registry.render() produces the Prometheus text format (version 0.0.4),
+served at /metrics by the monitoring dashboard and the ingestion app.
+Updates happen on the event loop; render() may run on another thread
+and only reads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, 0.5ms .. 10s: covers in-process stages through REST round trips
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class _CounterValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def set(self, value: float) -> None:
+        """Mirror a count kept elsewhere (collectors only)."""
+        self.value = value
+
+
+class _GaugeValue:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramValue:
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # last bucket is +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+
+class Metric:
+    """A named metric family, optionally split by labels."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        if not self.labelnames:
+            # Unlabeled: expose the single child's methods directly
+            default = self.labels()
+            for attr in ("inc", "dec", "set", "observe"):
+                if hasattr(default, attr):
+                    setattr(self, attr, getattr(default, attr))
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """Child for one combination of label values."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            child = self._children[values] = self._new_child()
+        return child
+
+    def clear(self) -> None:
+        """Drop labeled children (e.g. before a collector refills them)."""
+        if self.labelnames:
+            self._children.clear()
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for values, child in list(self._children.items()):
+            yield self.name, dict(zip(self.labelnames, values, strict=True)), child.value
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        return _CounterValue()
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        return _GaugeValue()
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for values, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, values, strict=True))
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, n in zip(self.buckets + (math.inf,), counts, strict=True):
+                cumulative += n
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """Holds metric families and scrape-time collectors."""
+
+    def __init__(self):
+        self._metrics: dict[str, Metric] = {}
+        self._collectors: dict[str, Callable[[], None]] = {}
+
+    def _get_or_create(
+        self, cls: type, name: str, documentation: str, labelnames, **kwargs
+    ) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+        elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+            raise ValueError(f"Metric {name} already registered as a different metric")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> Metric | None:
+        return self._metrics.get(name)
+
+    def add_collector(self, key: str, collect: Callable[[], None]) -> None:
+        """
+        Run collect() before every render. Registering the same key again
+        replaces the previous collector.
+        """
+        self._collectors[key] = collect
+
+    def remove_collector(self, key: str) -> None:
+        self._collectors.pop(key, None)
+
+    def collect(self) -> None:
+        for key, collect in list(self._collectors.items()):
+            try:
+                collect()
+            except Exception as e:
+                logger.warning(f"Metrics collector {key} failed: {e}")
+
+    def render(self) -> str:
+        """Prometheus text exposition of every metric."""
+        self.collect()
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {_escape_help(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.type}")
+            for sample_name, labels, value in metric.samples():
+                if labels:
+                    rendered = ",".join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+                    lines.append(f"{sample_name}{{{rendered}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{sample_name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    value = float(value)
+    if value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value)
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Process-wide registry
+registry = MetricsRegistry()
+
+
+class EventLoopLagMonitor:
+    """
+    Measures how late the event loop wakes a sleeping task.
+
+    Lag is the time past the requested interval; sustained lag means
+    something is blocking the loop.
+    """
+
+    def __init__(self, interval: float = 0.5, metrics: MetricsRegistry = registry):
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self._histogram = metrics.histogram(
+            "polymarket_event_loop_lag_seconds",
+            "Event loop wake-up delay past the scheduled time",
+        )
+        self._gauge = metrics.gauge(
+            "polymarket_event_loop_lag_last_seconds",
+            "Most recent event loop wake-up delay",
+        )
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - scheduled)
+            self._histogram.observe(lag)
+            self._gauge.set(lag)
@@ -60,6 +60,13 @@ class TestBotConfigFromEnv:
         assert config.position_size == Decimal("50")
         assert config.max_positions == 100
 
+    def test_loads_engine_workers(self):
+        """ENGINE_WORKERS enables sharded mode; single process by default."""
+        with patch.dict("os.environ", {}, clear=True):
+            assert BotConfig.from_env().engine_workers == 0
+        with patch.dict("os.environ", {"ENGINE_WORKERS": "4"}, clear=True):
+            assert BotConfig.from_env().engine_workers == 4
+
 
 # =============================================================================
 # Live Mode Validation Tests
@@ -273,6 +280,123 @@ class TestEngineModeSelection:
                                 mock_monitoring.assert_called_once()
                                 mock_bg.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_sharded_all_mode_leaves_ingestion_to_workers(self, basic_config):
+        """With engine_workers, the coordinator starts shards instead of ingestion."""
+        basic_config.engine_workers = 2
+        bot = TradingBot(basic_config)
+        bot._db = MagicMock()
+
+        with patch.multiple(
+            bot,
+            _init_database=AsyncMock(),
+            _init_engine=AsyncMock(),
+            _init_market_catalog=AsyncMock(),
+            _init_ingestion=AsyncMock(),
+            _init_universe_updater=AsyncMock(),
+            _init_monitoring=AsyncMock(),
+            _init_background_tasks=AsyncMock(),
+            _init_shards=AsyncMock(),
+            _run_loop=AsyncMock(),
+        ):
+            await bot.start(mode="all")
+
+            bot._init_ingestion.assert_not_called()
+            bot._init_shards.assert_called_once()
+            bot._init_engine.assert_called_once()
+            bot._init_background_tasks.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_worker_mode_runs_ingestion_and_engine_only(self, basic_config):
+        """A shard worker has no monitoring or background tasks."""
+        basic_config.engine_workers = 2
+        bot = TradingBot(basic_config, shard=1, channel_path="/tmp/unused.sock")
+        bot._db = MagicMock()
+
+        with patch.multiple(
+            bot,
+            _init_database=AsyncMock(),
+            _init_engine=AsyncMock(),
+            _init_market_catalog=AsyncMock(),
+            _init_ingestion=AsyncMock(),
+            _init_universe_updater=AsyncMock(),
+            _init_monitoring=AsyncMock(),
+            _init_background_tasks=AsyncMock(),
+            _init_shards=AsyncMock(),
+            _run_loop=AsyncMock(),
+        ):
+            await bot.start(mode="worker")
+
+            bot._init_engine.assert_called_once()
+            bot._init_ingestion.assert_called_once()
+            bot._init_universe_updater.assert_not_called()
+            bot._init_monitoring.assert_not_called()
+            bot._init_background_tasks.assert_not_called()
+            bot._init_shards.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shard_entry_alerts_only_when_executed(self, basic_config):
+        """A forwarded entry the coordinator drops sends no alert or event."""
+        from polymarket_bot.sharding import EntryMessage
+        from polymarket_bot.strategies import EntrySignal
+
+        bot = TradingBot(basic_config)
+        bot._running = True
+        bot._engine = MagicMock(submit_entry=AsyncMock(return_value=False))
+        bot._dashboard = MagicMock()
+        bot._alert_manager = MagicMock()
+        message = EntryMessage(
+            shard=0,
+            strategy="s",
+            threshold=Decimal("0.95"),
+            signal=EntrySignal(reason="r", token_id="tok", price=Decimal("0.96")),
+            context=MagicMock(),
+        )
+
+        await bot._handle_shard_message(message)
+        bot._alert_manager.alert_trade_executed.assert_not_called()
+        bot._dashboard.broadcast_event.assert_not_called()
+
+        bot._engine.submit_entry.return_value = True
+        await bot._handle_shard_message(message)
+        bot._alert_manager.alert_trade_executed.assert_called_once()
+        bot._dashboard.broadcast_event.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_worker_uses_small_database_pools(self, basic_config):
+        from polymarket_bot.main import WORKER_DB_CONNECTIONS
+
+        basic_config.database_url = "postgresql://localhost/test"
+        bot = TradingBot(basic_config, shard=0, channel_path="/tmp/unused.sock")
+
+        with patch("polymarket_bot.storage.Database") as database:
+            database.return_value.initialize = AsyncMock()
+            database.return_value.health_check = AsyncMock(return_value=True)
+            await bot._init_database()
+
+        config = database.call_args.args[0]
+        assert config.max_connections == WORKER_DB_CONNECTIONS
+        assert config.background_max_connections == 1
+        assert config.reporting_max_connections == 0
+
+    @pytest.mark.asyncio
+    async def test_shard_exit_is_submitted(self, basic_config):
+        from polymarket_bot.sharding import ExitMessage
+        from polymarket_bot.strategies import ExitSignal
+
+        bot = TradingBot(basic_config)
+        bot._running = True
+        bot._engine = MagicMock(submit_exit=AsyncMock(), submit_entry=AsyncMock())
+        context = MagicMock()
+        signal = ExitSignal(reason="r", position_id="pos_1")
+
+        await bot._handle_shard_message(
+            ExitMessage(shard=1, strategy="s", signal=signal, context=context)
+        )
+
+        bot._engine.submit_exit.assert_awaited_once_with(signal, context, "s")
+        bot._engine.submit_entry.assert_not_called()
+
 
 # =============================================================================
 # Background Tasks Configuration Tests
@@ -0,0 +1,213 @@
+"""
+Tests for engine sharding: hash ring, signal channel and worker pool.
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+import pytest
+
+from polymarket_bot.sharding import (
+    EntryMessage,
+    ExitMessage,
+    ShardRing,
+    SignalClient,
+    SignalServer,
+    WorkerPool,
+)
+from polymarket_bot.strategies import EntrySignal, ExitSignal, StrategyContext
+
+
+def exit_immediately(shard: int, count: int) -> None:
+    """Worker target for the pool tests (module level: spawn imports it)."""
+
+
+def sleep_forever(shard: int, count: int) -> None:
+    time.sleep(60)
+
+
+def make_context(condition_id: str = "0xcond") -> StrategyContext:
+    return StrategyContext(
+        condition_id=condition_id,
+        token_id="tok",
+        question="Will it?",
+        category=None,
+        trigger_price=Decimal("0.96"),
+        trade_size=Decimal("75"),
+        time_to_end_hours=48.0,
+        trade_age_seconds=2.0,
+        model_score=0.9,
+    )
+
+
+def make_signal() -> EntrySignal:
+    return EntrySignal(
+        reason="high prob",
+        token_id="tok",
+        price=Decimal("0.96"),
+        size=Decimal("20"),
+    )
+
+
+class TestShardRing:
+    """Tests for the consistent-hash ring."""
+
+    def test_every_condition_has_one_owner(self):
+        ring = ShardRing(4)
+        ids = [f"0x{i:064x}" for i in range(2000)]
+
+        owners = [ring.shard_for(cid) for cid in ids]
+
+        assert set(owners) == {0, 1, 2, 3}
+        assert all(ring.owns(owner, cid) for owner, cid in zip(owners, ids, strict=True))
+        # Each shard gets a reasonable share
+        assert min(owners.count(shard) for shard in range(4)) > 2000 / 4 * 0.6
+
+    def test_assignment_is_stable_across_instances(self):
+        assert [ShardRing(3).shard_for(f"c{i}") for i in range(100)] == [
+            ShardRing(3).shard_for(f"c{i}") for i in range(100)
+        ]
+
+    def test_adding_a_shard_moves_few_markets(self):
+        ids = [f"c{i}" for i in range(2000)]
+        before, after = ShardRing(4), ShardRing(5)
+
+        moved = sum(before.shard_for(cid) != after.shard_for(cid) for cid in ids)
+
+        assert moved < len(ids) * 0.35
+        # Markets only move to the new shard
+        assert all(
+            after.shard_for(cid) == 4
+            for cid in ids
+            if before.shard_for(cid) != after.shard_for(cid)
+        )
+
+    def test_rejects_empty_ring(self):
+        with pytest.raises(ValueError):
+            ShardRing(0)
+
+
+class TestSignalChannel:
+    """Tests for the Unix socket between workers and the coordinator."""
+
+    @pytest.mark.asyncio
+    async def test_entries_round_trip(self, tmp_path):
+        received: list[EntryMessage] = []
+
+        async def handler(message):
+            received.append(message)
+
+        server = SignalServer(str(tmp_path / "entries.sock"), handler)
+        await server.start()
+        client = SignalClient(server.path, shard=2)
+        try:
+            await client.send_entry(
+                make_signal(), make_context(), {"price": "0.96"}, "high_prob_yes", Decimal("0.95")
+            )
+            await client.send_entry(
+                make_signal(), make_context("0xother"), {}, "fast", Decimal("0.90")
+            )
+            for _ in range(100):
+                if len(received) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+            await server.stop()
+
+        first, second = received
+        assert isinstance(first, EntryMessage)
+        assert first.shard == 2
+        assert (first.strategy, first.threshold) == ("high_prob_yes", Decimal("0.95"))
+        assert first.signal == make_signal()
+        assert first.context == make_context()
+        assert first.event == {"price": "0.96"}
+        assert second.context.condition_id == "0xother"
+        assert server.received == 2
+
+    @pytest.mark.asyncio
+    async def test_exits_round_trip(self, tmp_path):
+        received = []
+
+        async def handler(message):
+            received.append(message)
+
+        server = SignalServer(str(tmp_path / "entries.sock"), handler)
+        await server.start()
+        client = SignalClient(server.path, shard=1)
+        try:
+            await client.send_exit(
+                ExitSignal(reason="take profit", position_id="pos_1"), make_context(), "fast"
+            )
+            for _ in range(100):
+                if received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+            await server.stop()
+
+        (message,) = received
+        assert isinstance(message, ExitMessage)
+        assert (message.shard, message.strategy) == (1, "fast")
+        assert message.signal.position_id == "pos_1"
+        assert message.context == make_context()
+
+    @pytest.mark.asyncio
+    async def test_handler_error_keeps_connection(self, tmp_path):
+        calls = []
+
+        async def handler(message):
+            calls.append(message.strategy)
+            if message.strategy == "bad":
+                raise RuntimeError("boom")
+
+        server = SignalServer(str(tmp_path / "entries.sock"), handler)
+        await server.start()
+        client = SignalClient(server.path, shard=0)
+        try:
+            for name in ("bad", "good"):
+                await client.send_entry(make_signal(), make_context(), {}, name, Decimal("0.95"))
+            for _ in range(100):
+                if len(calls) == 2:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await client.close()
+            await server.stop()
+
+        assert calls == ["bad", "good"]
+        assert server.errors == 1
+
+    @pytest.mark.asyncio
+    async def test_send_without_server_raises(self, tmp_path):
+        client = SignalClient(str(tmp_path / "missing.sock"), shard=0)
+
+        with pytest.raises(ConnectionError):
+            await client.send_entry(make_signal(), make_context(), {}, "s", Decimal("0.95"))
+
+
+class TestWorkerPool:
+    """Tests for worker process supervision."""
+
+    def test_exited_workers_are_restarted(self):
+        pool = WorkerPool(exit_immediately, (), count=2)
+        pool.start()
+        try:
+            deadline = time.monotonic() + 30
+            while pool.alive() and time.monotonic() < deadline:
+                time.sleep(0.05)
+
+            assert sorted(pool.check()) == [0, 1]
+            assert pool.restarts == 2
+        finally:
+            pool.stop()
+
+    def test_stop_terminates_workers(self):
+        pool = WorkerPool(sleep_forever, (), count=1)
+        pool.start()
+
+        pool.stop(timeout=10)
+
+        assert pool.alive() == 0
@@ -0,0 +1,127 @@
+"""
+Tests for the metrics registry and /metrics exposition.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from polymarket_bot.ingestion.client import endpoint_label
+from polymarket_bot.telemetry import (
+    CONTENT_TYPE,
+    EventLoopLagMonitor,
+    MetricsRegistry,
+    registry,
+)
+
+
+class TestMetricsRegistry:
+    """Tests for metric families and rendering."""
+
+    def test_counter_and_gauge_render(self):
+        reg = MetricsRegistry()
+        frames = reg.counter("frames_total", "Frames received")
+        depth = reg.gauge("buffer_depth", "Queued frames", ("queue",))
+
+        frames.inc()
+        frames.inc(2)
+        depth.labels("ws").set(7)
+        depth.labels('we"ird').dec()
+
+        text = reg.render()
+
+        assert "# TYPE frames_total counter\nframes_total 3\n" in text
+        assert 'buffer_depth{queue="ws"} 7\n' in text
+        assert 'buffer_depth{queue="we\\"ird"} -1\n' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        reg = MetricsRegistry()
+        latency = reg.histogram("request_seconds", "Latency", ("endpoint",), buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.labels("markets").observe(value)
+
+        lines = reg.render().splitlines()
+
+        assert 'request_seconds_bucket{endpoint="markets",le="0.1"} 2' in lines
+        assert 'request_seconds_bucket{endpoint="markets",le="1"} 3' in lines
+        assert 'request_seconds_bucket{endpoint="markets",le="+Inf"} 4' in lines
+        assert 'request_seconds_count{endpoint="markets"} 4' in lines
+        assert 'request_seconds_sum{endpoint="markets"} 3.65' in lines
+
+    def test_get_or_create_and_conflicts(self):
+        reg = MetricsRegistry()
+        counter = reg.counter("cache_total", "Lookups", ("cache", "result"))
+
+        assert reg.counter("cache_total", "Lookups", ("cache", "result")) is counter
+        with pytest.raises(ValueError):
+            reg.gauge("cache_total", "Lookups", ("cache", "result"))
+        with pytest.raises(ValueError):
+            counter.labels("only-one")
+
+    def test_collectors_run_on_render_and_failures_are_contained(self):
+        reg = MetricsRegistry()
+        stats = SimpleNamespace(events=0)
+        events = reg.counter("events_total", "Events")
+        reg.add_collector("stats", lambda: events.set(stats.events))
+        reg.add_collector("broken", lambda: 1 / 0)
+
+        stats.events = 42
+
+        assert "events_total 42\n" in reg.render()
+        reg.remove_collector("stats")
+        stats.events = 50
+        assert "events_total 42\n" in reg.render()
+
+
+class TestEndpointLabel:
+    """REST endpoint labels must stay low-cardinality."""
+
+    def test_ids_are_collapsed(self):
+        assert endpoint_label("https://clob.polymarket.com/markets/0xabc123") == (
+            "clob.polymarket.com/markets/{id}"
+        )
+        assert endpoint_label("https://gamma-api.polymarket.com/markets?limit=10") == (
+            "gamma-api.polymarket.com/markets"
+        )
+
+
+class TestEventLoopLagMonitor:
+    """Tests for event loop lag measurement."""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_shows_up_as_lag(self):
+        import time
+
+        reg = MetricsRegistry()
+        monitor = EventLoopLagMonitor(interval=0.01, metrics=reg)
+        monitor.start()
+        await asyncio.sleep(0.005)
+        time.sleep(0.05)  # Block the loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        lag = reg.get("polymarket_event_loop_lag_seconds").labels()
+        assert sum(lag.counts) >= 2
+        assert lag.sum >= 0.03
+        assert not monitor.running
+
+
+class TestMetricsEndpoints:
+    """Both HTTP apps serve the process registry."""
+
+    def test_ingestion_app_serves_metrics(self):
+        from fastapi.testclient import TestClient
+
+        from polymarket_bot.ingestion.dashboard import create_dashboard_app
+
+        registry.counter("polymarket_test_scrapes_total", "Test counter").inc()
+        client = TestClient(create_dashboard_app(SimpleNamespace()))
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == CONTENT_TYPE
+        assert "polymarket_test_scrapes_total" in response.text
+        assert "# TYPE polymarket_ws_frames_total counter" in response.text
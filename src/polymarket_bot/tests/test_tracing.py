@@ -0,0 +1,179 @@
+"""
+Tests for end-to-end latency tracing.
+"""
+
+import asyncio
+import json
+import timeit
+
+import pytest
+
+from polymarket_bot.ingestion.websocket import PolymarketWebSocket
+from polymarket_bot.tracing import (
+    LatencyHistogram,
+    Stage,
+    Trace,
+    Tracer,
+    activate,
+    chrome_trace,
+    current_trace,
+    deactivate,
+    decode_traces,
+    encode_traces,
+    stamp,
+    tracer,
+)
+
+
+@pytest.fixture
+def sampling():
+    """Trace every frame on the process-wide tracer, restored afterwards."""
+    tracer.reset()
+    tracer.configure(sample_rate=1, capacity=100)
+    yield tracer
+    tracer.configure(sample_rate=0)
+    tracer.reset()
+
+
+def make_trace(trace_id: int, gaps_ns: list[int]) -> Trace:
+    trace = Trace(trace_id, started_at=1_700_000_000.0)
+    now = 1_000_000
+    trace.stamps.append((Stage.RECEIVE, now))
+    for stage, gap in zip(list(Stage)[1:], gaps_ns, strict=False):
+        now += gap
+        trace.stamps.append((stage, now))
+    return trace
+
+
+class TestLatencyHistogram:
+    """Tests for the log-linear histogram."""
+
+    def test_percentiles_within_bucket_precision(self):
+        hist = LatencyHistogram()
+        for value in range(1, 100_001):
+            hist.record(value * 100)  # 100ns .. 10ms
+
+        assert hist.count == 100_000
+        assert hist.percentile(50) == pytest.approx(5_000_000, rel=0.07)
+        assert hist.percentile(99) == pytest.approx(9_900_000, rel=0.07)
+        assert hist.percentile(100) == hist.max_ns == 10_000_000
+
+    def test_bucket_index_is_monotonic(self):
+        indexes = [LatencyHistogram._index(v) for v in range(0, 5000)]
+        assert indexes == sorted(indexes)
+        assert LatencyHistogram._index(1 << 60) == LatencyHistogram._index((1 << 40) - 1)
+
+
+class TestTracer:
+    """Tests for sampling and aggregation."""
+
+    def test_samples_one_in_n(self):
+        t = Tracer(sample_rate=4)
+        started = [t.start() for _ in range(12)]
+        assert [s is not None for s in started] == [False, False, False, True] * 3
+        assert [s.trace_id for s in started if s] == [1, 2, 3]
+
+    def test_disabled_by_default(self):
+        assert Tracer().start() is None
+
+    def test_finish_feeds_ring_and_histograms(self):
+        t = Tracer(capacity=2)
+        for i in range(3):
+            t.finish(make_trace(i, [1_000, 2_000, 3_000]))
+
+        assert [tr.trace_id for tr in t.traces()] == [1, 2]
+        stats = t.stats()
+        assert stats["stages"]["enqueue"]["count"] == 3
+        assert stats["stages"]["parse"]["p50_us"] == pytest.approx(2.0, rel=0.07)
+        assert "threshold" not in stats["stages"]
+        assert stats["total"]["max_us"] == 6.0
+
+    def test_stamp_without_trace_is_cheap(self):
+        per_call = (
+            min(timeit.repeat(lambda: stamp(Stage.FILTERS), number=100_000, repeat=3)) / 100_000
+        )
+        assert per_call < 1e-6
+
+    def test_stamp_targets_active_trace(self):
+        trace = Trace(1)
+        token = activate(trace)
+        try:
+            stamp(Stage.PARSE)
+            assert current_trace() is trace
+        finally:
+            deactivate(token)
+        stamp(Stage.THRESHOLD)
+
+        assert [s for s, _ in trace.stamps] == [Stage.PARSE]
+        assert current_trace() is None
+
+
+class TestExport:
+    """Tests for Chrome trace-event and binary export."""
+
+    def test_chrome_trace_has_one_span_per_stage(self):
+        doc = chrome_trace([make_trace(7, [1_500, 2_500])])
+        spans = [e for e in doc["traceEvents"] if e["ph"] == "X"]
+
+        assert [e["name"] for e in spans] == ["enqueue", "parse"]
+        assert [e["dur"] for e in spans] == [1.5, 2.5]
+        assert spans[1]["ts"] == spans[0]["ts"] + spans[0]["dur"]
+        assert {e["tid"] for e in doc["traceEvents"]} == {7}
+        json.dumps(doc)
+
+    def test_binary_round_trip(self):
+        traces = [make_trace(1, [10, 20, 30]), make_trace(2, [5_000_000_000])]
+
+        decoded = decode_traces(encode_traces(traces))
+
+        assert [(t.trace_id, t.started_at, t.stamps) for t in decoded] == [
+            (t.trace_id, t.started_at, t.stamps) for t in traces
+        ]
+
+    def test_binary_rejects_foreign_data(self):
+        with pytest.raises(ValueError):
+            decode_traces(b"{}")
+
+
+class TestWebSocketTracing:
+    """Traces started on receive reach the price callback."""
+
+    @pytest.mark.asyncio
+    async def test_trace_crosses_buffer_to_callback(self, sampling):
+        seen = []
+
+        async def on_price(update):
+            seen.append(current_trace())
+            stamp(Stage.PRICE_UPDATE)
+
+        ws = PolymarketWebSocket(on_price_update=on_price)
+        frame = json.dumps([{"event_type": "price_change", "asset_id": "tok1", "price": "0.97"}])
+        ws._enqueue_message(frame, sampling.start())
+        processor = asyncio.create_task(ws._process_loop())
+        try:
+            await asyncio.wait_for(ws.drain(), timeout=5)
+        finally:
+            processor.cancel()
+            await asyncio.gather(processor, return_exceptions=True)
+
+        [trace] = sampling.traces()
+        assert seen == [trace]
+        assert [s for s, _ in trace.stamps] == [
+            Stage.RECEIVE,
+            Stage.ENQUEUE,
+            Stage.PARSE,
+            Stage.PRICE_UPDATE,
+        ]
+        assert current_trace() is None
+
+    @pytest.mark.asyncio
+    async def test_inject_is_traced(self, sampling):
+        async def on_price(update):
+            pass
+
+        ws = PolymarketWebSocket(on_price_update=on_price)
+        await ws.inject(
+            json.dumps([{"event_type": "price_change", "asset_id": "tok1", "price": "0.5"}])
+        )
+
+        assert sampling.stats()["stages"]["parse"]["count"] == 1
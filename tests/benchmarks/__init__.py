@@ -0,0 +1,10 @@
+"""
+Offline hot-path benchmarks.
+
+Run from the repository root:
+    python -m tests.benchmarks                      # all cases, compare to baseline
+    python -m tests.benchmarks --only engine,scoring
+    python -m tests.benchmarks --update-baseline    # after an intended change
+
+See harness.py for what is measured and cases.py for the inputs.
+"""
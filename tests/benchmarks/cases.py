@@ -0,0 +1,411 @@
+"""
+Benchmark cases for the event hot path.
+
+Inputs are generated with a fixed seed so runs are comparable. Nothing
+here touches the network; the storage cases need a local Postgres and
+are skipped without one.
+"""
+from __future__ import annotations
+
+import json
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from polymarket_bot.core import EngineConfig, TradingEngine
+from polymarket_bot.core.pipeline_tracker import PipelineTracker, RejectionStage
+from polymarket_bot.core.scoring import MarketMetrics, compute_interestingness, score_market_batch
+from polymarket_bot.ingestion.replay import read_frames
+from polymarket_bot.ingestion.websocket import PolymarketWebSocket
+from polymarket_bot.strategies import HighProbYesStrategy, StrategyContext
+from polymarket_bot.strategies.filters.hard_filters import apply_hard_filters
+from polymarket_bot.tracing import Stage, stamp
+
+from .harness import BenchContext, bench
+
+SEED = 1234
+CATEGORIES = ["politics", "crypto", "sports", "science", "weather", None]
+BENCH_PREFIX = "0xbench"
+
+
+class MemoryDB:
+    """
+    In-memory stand-in for storage.Database on the engine path.
+
+    Answers token metadata and question lookups from dicts and accepts
+    every write. Plain coroutines rather than mocks, so the stand-in
+    adds little on top of the engine's own work.
+    """
+
+    def __init__(self, questions: dict[str, str], token_meta: dict[str, dict]):
+        self._questions = questions
+        self._token_meta = token_meta
+
+    async def fetchrow(self, query: str, *args):
+        if "polymarket_token_meta" in query:
+            return self._token_meta.get(args[0])
+        if "explorer_markets" in query:
+            question = self._questions.get(args[0])
+            return {"question": question} if question else None
+        return None
+
+    async def fetchval(self, query: str, *args):
+        return None
+
+    async def fetch(self, query: str, *args):
+        return []
+
+    async def execute(self, query: str, *args):
+        return "INSERT 0 1"
+
+    async def executemany(self, query: str, args):
+        return None
+
+    def transaction(self):
+        return _MemoryTransaction(self)
+
+
+class _MemoryTransaction:
+    def __init__(self, db: MemoryDB):
+        self._db = db
+
+    async def __aenter__(self):
+        return self._db
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+def make_metrics(count: int) -> list[MarketMetrics]:
+    rng = random.Random(SEED)
+    return [
+        MarketMetrics(
+            condition_id=f"{BENCH_PREFIX}{i:08d}",
+            price=rng.random(),
+            volume_24h=rng.choice([0.0, rng.uniform(10, 2_000_000)]),
+            liquidity=rng.uniform(0, 250_000),
+            trade_count_24h=rng.randint(0, 5000),
+            price_change_24h=rng.uniform(-0.3, 0.3),
+            price_change_1h=rng.uniform(-0.1, 0.1),
+            spread=rng.uniform(0, 0.2),
+            days_to_end=rng.choice([None, rng.uniform(0, 400)]),
+            market_age_days=rng.uniform(0, 300),
+            category=rng.choice(CATEGORIES),
+        )
+        for i in range(count)
+    ]
+
+
+def make_contexts(count: int) -> list[StrategyContext]:
+    rng = random.Random(SEED)
+    questions = [
+        "Will BTC close above $100k on Dec 31?",
+        "Will the Fed cut rates in November?",
+        "Highest temperature in NYC on Friday?",
+        "Will the Lakers win tonight?",
+    ]
+    return [
+        StrategyContext(
+            condition_id=f"{BENCH_PREFIX}{i:08d}",
+            token_id=f"tok{i}",
+            question=rng.choice(questions),
+            category=rng.choice(CATEGORIES),
+            trigger_price=Decimal("0.96"),
+            trade_size=Decimal("75"),
+            time_to_end_hours=rng.uniform(0, 2000),
+            trade_age_seconds=rng.uniform(0, 600),
+            model_score=rng.random(),
+        )
+        for i in range(count)
+    ]
+
+
+def make_frames(count: int, tokens: int = 500) -> list[str]:
+    """Frames shaped like the production market channel: price_change and book arrays."""
+    rng = random.Random(SEED)
+    frames = []
+    for _ in range(count):
+        events = []
+        for _ in range(rng.randint(1, 4)):
+            token = rng.randrange(tokens)
+            price = f"{rng.uniform(0.5, 0.99):.3f}"
+            if rng.random() < 0.7:
+                events.append({
+                    "event_type": "price_change",
+                    "asset_id": f"tok{token}",
+                    "market": f"{BENCH_PREFIX}{token:08d}",
+                    "price": price,
+                    "side": "BUY",
+                    "timestamp": "1760000000000",
+                })
+            else:
+                events.append({
+                    "event_type": "book",
+                    "asset_id": f"tok{token}",
+                    "market": f"{BENCH_PREFIX}{token:08d}",
+                    "last_trade_price": "",
+                    "bids": [{"price": f"{float(price) - 0.01 * k:.3f}", "size": "100"} for k in range(5)],
+                    "asks": [{"price": f"{float(price) + 0.01 * k:.3f}", "size": "100"} for k in range(1, 6)],
+                })
+        frames.append(json.dumps(events))
+    return frames
+
+
+def make_events(count: int, tokens: int = 500) -> list[dict]:
+    """Engine events: mostly below threshold, as in production."""
+    rng = random.Random(SEED)
+    events = []
+    for _ in range(count):
+        token = rng.randrange(tokens)
+        price = rng.uniform(0.96, 0.99) if rng.random() < 0.1 else rng.uniform(0.05, 0.94)
+        events.append({
+            "type": "price_change",
+            "token_id": f"tok{token}",
+            "condition_id": f"{BENCH_PREFIX}{token:08d}",
+            "price": f"{price:.3f}",
+            "timestamp": time.time(),
+        })
+    return events
+
+
+class NamedHighProbYes(HighProbYesStrategy):
+    """HighProbYesStrategy under another name, to run several in one engine."""
+
+    def __init__(self, name: str):
+        super().__init__()
+        self._name = name
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+async def _engine_case(strategies: int):
+    tokens = 500
+    db = MemoryDB(
+        questions={f"{BENCH_PREFIX}{t:08d}": f"Market {t}?" for t in range(tokens)},
+        token_meta={
+            f"tok{t}": {"question": f"Market {t}?", "outcome": "Yes", "outcome_index": 0, "market_id": None}
+            for t in range(tokens)
+        },
+    )
+    if strategies == 1:
+        engine = TradingEngine(config=EngineConfig(), db=db, strategy=HighProbYesStrategy())
+    else:
+        engine = TradingEngine(
+            config=EngineConfig(),
+            db=db,
+            strategies=[NamedHighProbYes(f"high_prob_yes_{n}") for n in range(strategies)],
+        )
+    await engine.start()
+    events = make_events(10_000, tokens)
+    now = time.time()
+    for event in events:
+        event["timestamp"] = now
+
+    async def process(i: int) -> None:
+        await engine.process_event(events[i % len(events)])
+
+    yield process
+    await engine.stop()
+
+
+# Warm up past the tracker's sampled-rejection buffer (2000 x 1:10) so
+# bounded buffers still filling don't show up as retained memory
+@bench("engine.process_event", calls=20_000, warmup=25_000)
+async def engine_process_event(ctx: BenchContext):
+    async for case in _engine_case(1):
+        yield case
+
+
+# Same events fanned out to four strategies: the difference from
+# engine.process_event is the cost of three more evaluate() calls
+@bench("engine.process_event_4_strategies", calls=20_000, warmup=25_000)
+async def engine_process_event_4_strategies(ctx: BenchContext):
+    async for case in _engine_case(4):
+        yield case
+
+
+@bench("websocket.handle_message", calls=20_000)
+async def websocket_handle_message(ctx: BenchContext):
+    if ctx.frames_path:
+        frames = [f.data for f in read_frames(ctx.frames_path)]
+    else:
+        frames = make_frames(5_000)
+
+    async def on_price_update(update) -> None:
+        pass
+
+    ws = PolymarketWebSocket(on_price_update=on_price_update)
+
+    async def handle(i: int) -> None:
+        await ws._handle_message(frames[i % len(frames)])
+
+    yield handle
+
+
+@bench("scoring.compute_interestingness", calls=100_000)
+async def scoring_compute_interestingness(ctx: BenchContext):
+    markets = make_metrics(5_000)
+    yield lambda i: compute_interestingness(markets[i % 5_000])
+
+
+@bench("scoring.score_market_batch", calls=200, events_per_call=1_000, warmup=5)
+async def scoring_score_market_batch(ctx: BenchContext):
+    markets = make_metrics(1_000)
+    yield lambda i: score_market_batch(markets)
+
+
+@bench("pipeline_tracker.record_rejection", calls=200_000, warmup=25_000)
+async def pipeline_tracker_record_rejection(ctx: BenchContext):
+    tracker = PipelineTracker(sample_rate=10, max_recent_rejections=2000)
+    stages = list(RejectionStage)
+    price = Decimal("0.90")
+
+    def record(i: int) -> None:
+        tracker.record_rejection(
+            token_id="tok_bench",
+            condition_id=BENCH_PREFIX,
+            stage=stages[i % len(stages)],
+            price=price,
+        )
+
+    yield record
+
+
+@bench("pipeline_tracker.get_stats", calls=2_000, warmup=10)
+async def pipeline_tracker_get_stats(ctx: BenchContext):
+    tracker = PipelineTracker(sample_rate=10, max_recent_rejections=2000)
+    stages = list(RejectionStage)
+    for i in range(50_000):
+        tracker.record_rejection(
+            token_id=f"tok{i % 100}",
+            condition_id=BENCH_PREFIX,
+            stage=stages[i % len(stages)],
+            price=Decimal("0.90"),
+        )
+    yield lambda i: tracker.get_stats(minutes=60)
+
+
+@bench("filters.apply_hard_filters", calls=100_000)
+async def filters_apply_hard_filters(ctx: BenchContext):
+    contexts = make_contexts(5_000)
+    yield lambda i: apply_hard_filters(contexts[i % 5_000])
+
+
+# Every stage stamp on the hot path pays this when sampling is off
+@bench("tracing.stamp_unsampled", calls=200_000)
+async def tracing_stamp_unsampled(ctx: BenchContext):
+    yield lambda i: stamp(Stage.FILTERS)
+
+
+async def _bench_db(ctx: BenchContext):
+    from polymarket_bot.storage import Database, DatabaseConfig
+
+    db = Database(DatabaseConfig(url=ctx.database_url))
+    await db.initialize()
+    return db
+
+
+@bench("storage.universe_upsert_batch", calls=20, events_per_call=200, warmup=2, requires_db=True)
+async def storage_universe_upsert_batch(ctx: BenchContext):
+    from polymarket_bot.storage import MarketUniverse, MarketUniverseRepository
+
+    db = await _bench_db(ctx)
+    repo = MarketUniverseRepository(db)
+    rng = random.Random(SEED)
+    end = datetime.utcnow() + timedelta(days=30)  # end_date is TIMESTAMP (naive UTC)
+    batch = [
+        MarketUniverse(
+            condition_id=f"{BENCH_PREFIX}{i:08d}",
+            question=f"Benchmark market {i}?",
+            category=rng.choice(CATEGORIES),
+            end_date=end,
+            price=rng.random(),
+            volume_24h=rng.uniform(0, 100_000),
+            liquidity=rng.uniform(0, 50_000),
+        )
+        for i in range(200)
+    ]
+
+    async def upsert(i: int) -> None:
+        await repo.upsert_batch(batch)
+
+    try:
+        yield upsert
+    finally:
+        await db.execute("DELETE FROM market_universe WHERE condition_id LIKE $1", f"{BENCH_PREFIX}%")
+        await db.close()
+
+
+@bench("storage.trade_create_many", calls=20, events_per_call=500, warmup=2, requires_db=True)
+async def storage_trade_create_many(ctx: BenchContext):
+    from polymarket_bot.storage import PolymarketTrade, TradeRepository
+
+    db = await _bench_db(ctx)
+    repo = TradeRepository(db)
+    base_ts = int(time.time())
+
+    async def create(i: int) -> None:
+        # Fresh trade ids per call: every row is an insert
+        await repo.create_many([
+            PolymarketTrade(
+                condition_id=f"{BENCH_PREFIX}{j % 50:08d}",
+                trade_id=f"bench-{i}-{j}",
+                token_id=f"tok{j % 100}",
+                price=Decimal("0.95"),
+                size=Decimal("10"),
+                side="BUY",
+                timestamp=base_ts + j,
+            )
+            for j in range(500)
+        ])
+
+    try:
+        yield create
+    finally:
+        await db.execute("DELETE FROM polymarket_trades WHERE condition_id LIKE $1", f"{BENCH_PREFIX}%")
+        await db.close()
+
+
+# Per-query cost of the trigger dedup lookup on one connection (no pool
+# acquire/reset): parsed and planned every call, as on a statement cache
+# miss (new connection, eviction, expiry); and from asyncpg's statement
+# cache with the Database pool's settings.
+async def _trigger_lookup_case(ctx: BenchContext, mode: str):
+    import asyncpg
+
+    from polymarket_bot.core.trigger_tracker import TOKEN_TRIGGERED
+    from polymarket_bot.storage import DatabaseConfig
+    from polymarket_bot.storage.statements import statements
+
+    config = DatabaseConfig(url=ctx.database_url)
+    conn = await asyncpg.connect(
+        ctx.database_url,
+        statement_cache_size=0 if mode == "uncached" else config.statement_cache_size,
+        max_cached_statement_lifetime=config.max_cached_statement_lifetime,
+    )
+
+    async def lookup(i: int) -> None:
+        await statements.run(
+            conn, "fetchval", TOKEN_TRIGGERED,
+            f"tok{i % 100}", f"{BENCH_PREFIX}{i % 50:08d}", 0.95, "bench",
+        )
+
+    try:
+        yield lookup
+    finally:
+        await conn.close()
+
+
+@bench("storage.trigger_lookup_uncached", calls=5_000, warmup=200, requires_db=True)
+async def storage_trigger_lookup_uncached(ctx: BenchContext):
+    async for case in _trigger_lookup_case(ctx, "uncached"):
+        yield case
+
+
+@bench("storage.trigger_lookup_cached", calls=5_000, warmup=200, requires_db=True)
+async def storage_trigger_lookup_cached(ctx: BenchContext):
+    async for case in _trigger_lookup_case(ctx, "cached"):
+        yield case
@@ -0,0 +1,284 @@
+"""
+Benchmark runner, result format and baseline comparison.
+
+A case is an async generator function registered with @bench. Code before
+its `yield` is setup, the yielded callable (sync or async, called with the
+iteration number) is timed, and code after the `yield` is teardown:
+
+    @bench("scoring.compute_interestingness", calls=50_000)
+    async def compute_interestingness_case(ctx):
+        markets = make_markets(1000)
+        yield lambda i: compute_interestingness(markets[i % 1000])
+
+Each case is measured in two passes over the same callable:
+    1. Timing: per-call wall time (perf_counter_ns) -> events/sec, p50,
+       p99; plus net memory blocks still allocated afterwards
+       (sys.getallocatedblocks), non-zero when a hot path leaks or grows
+       an unbounded cache
+    2. Allocation: bytes allocated at peak within one call (tracemalloc),
+       median over a sample of calls
+
+Async callables must be coroutine functions (async def) so the timing
+loop can await them directly.
+
+Latencies are per call; events/sec and allocation figures are per event
+(a call may cover several events, e.g. one bulk write of 500 rows).
+"""
+from __future__ import annotations
+
+import gc
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Optional
+
+# Default allowed drift before a metric counts as a regression. Wall-clock
+# numbers move between machines and runs, allocation numbers barely do.
+DEFAULT_TOLERANCE = {
+    "events_per_sec": 0.35,
+    "p50_us": 0.50,
+    "p99_us": 1.00,
+    "alloc_bytes_per_event": 0.25,
+    "retained_blocks_per_event": 0.50,  # absolute, not relative
+}
+
+
+@dataclass
+class BenchContext:
+    """Options shared by all cases in a run."""
+    scale: float = 1.0
+    database_url: Optional[str] = None
+    frames_path: Optional[Path] = None
+
+
+@dataclass
+class BenchCase:
+    name: str
+    factory: Callable[[BenchContext], AsyncIterator[Callable[[int], Any]]]
+    calls: int
+    events_per_call: int = 1
+    warmup: int = 100
+    requires_db: bool = False
+
+
+@dataclass
+class BenchResult:
+    name: str
+    calls: int
+    events_per_call: int
+    events_per_sec: float
+    p50_us: float
+    p99_us: float
+    alloc_bytes_per_event: float
+    retained_blocks_per_event: float
+
+    def to_dict(self) -> dict:
+        return {
+            k: round(v, 3) if isinstance(v, float) else v
+            for k, v in asdict(self).items()
+            if k != "name"
+        }
+
+
+@dataclass
+class Regression:
+    case: str
+    metric: str
+    baseline: float
+    current: float
+    limit: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.case}: {self.metric} {self.current:,.2f} "
+            f"(baseline {self.baseline:,.2f}, limit {self.limit:,.2f})"
+        )
+
+
+CASES: dict[str, BenchCase] = {}
+
+
+def bench(
+    name: str,
+    calls: int,
+    events_per_call: int = 1,
+    warmup: int = 100,
+    requires_db: bool = False,
+):
+    """Register an async generator function as a benchmark case."""
+    def decorator(factory):
+        CASES[name] = BenchCase(name, factory, calls, events_per_call, warmup, requires_db)
+        return factory
+    return decorator
+
+
+async def run_case(case: BenchCase, ctx: BenchContext) -> BenchResult:
+    calls = max(10, int(case.calls * ctx.scale))
+    gen = case.factory(ctx)
+    fn = await gen.__anext__()
+    try:
+        if inspect.iscoroutinefunction(fn):
+            latencies, elapsed_ns, retained = await _time_async(fn, calls, case.warmup)
+        else:
+            latencies, elapsed_ns, retained = _time_sync(fn, calls, case.warmup)
+
+        # Transient allocation, sampled
+        samples = []
+        tracemalloc.start()
+        try:
+            for i in range(calls, calls + min(calls, 200)):
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                result = fn(i)
+                if inspect.isawaitable(result):
+                    await result
+                samples.append(tracemalloc.get_traced_memory()[1] - current)
+        finally:
+            tracemalloc.stop()
+    finally:
+        # Resume past the yield so teardown runs
+        async for _ in gen:
+            pass
+
+    events = calls * case.events_per_call
+    return BenchResult(
+        name=case.name,
+        calls=calls,
+        events_per_call=case.events_per_call,
+        events_per_sec=events / (elapsed_ns / 1e9) if elapsed_ns else 0.0,
+        p50_us=latencies[len(latencies) // 2] / 1000,
+        p99_us=latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] / 1000,
+        alloc_bytes_per_event=statistics.median(samples) / case.events_per_call,
+        retained_blocks_per_event=max(0, retained) / events,
+    )
+
+
+def _time_sync(fn: Callable[[int], Any], calls: int, warmup: int) -> tuple[list[int], int, int]:
+    for i in range(warmup):
+        fn(i)
+    # Unboxed, so recording a latency doesn't count as a retained block
+    latencies = array("q", bytes(8 * calls))
+    clock = time.perf_counter_ns
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    started = clock()
+    for i in range(calls):
+        t0 = clock()
+        fn(i)
+        latencies[i] = clock() - t0
+    elapsed_ns = clock() - started
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks_before
+    return sorted(latencies), elapsed_ns, retained
+
+
+async def _time_async(fn: Callable[[int], Any], calls: int, warmup: int) -> tuple[list[int], int, int]:
+    for i in range(warmup):
+        await fn(i)
+    latencies = array("q", bytes(8 * calls))
+    clock = time.perf_counter_ns
+    gc.collect()
+    blocks_before = sys.getallocatedblocks()
+    started = clock()
+    for i in range(calls):
+        t0 = clock()
+        await fn(i)
+        latencies[i] = clock() - t0
+    elapsed_ns = clock() - started
+    gc.collect()
+    retained = sys.getallocatedblocks() - blocks_before
+    return sorted(latencies), elapsed_ns, retained
+
+
+def compare(
+    results: dict[str, BenchResult],
+    baseline: dict,
+) -> list[Regression]:
+    """
+    Compare results to a baseline document (see write_results).
+
+    Tolerances come from baseline["tolerance"], overridden per case by
+    baseline["results"][name]["tolerance"]. A null tolerance reports the
+    metric without gating on it. Cases missing from either side are not
+    compared.
+    """
+    regressions = []
+    default = {**DEFAULT_TOLERANCE, **baseline.get("tolerance", {})}
+
+    for name, result in results.items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        tol = {**default, **base.get("tolerance", {})}
+        current = result.to_dict()
+
+        if tol["events_per_sec"] is not None:
+            limit = base["events_per_sec"] * (1 - tol["events_per_sec"])
+            if current["events_per_sec"] < limit:
+                regressions.append(Regression(
+                    name, "events_per_sec", base["events_per_sec"], current["events_per_sec"], limit
+                ))
+        for metric in ("p50_us", "p99_us", "alloc_bytes_per_event"):
+            if tol[metric] is None:
+                continue
+            # Small absolute slack so near-zero baselines don't flap
+            limit = base[metric] * (1 + tol[metric]) + (1.0 if metric != "alloc_bytes_per_event" else 64)
+            if current[metric] > limit:
+                regressions.append(Regression(name, metric, base[metric], current[metric], limit))
+        metric = "retained_blocks_per_event"
+        if tol[metric] is not None:
+            limit = base[metric] + tol[metric]
+            if current[metric] > limit:
+                regressions.append(Regression(name, metric, base[metric], current[metric], limit))
+
+    return regressions
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "platform": platform.platform(terse=True),
+    }
+
+
+def write_results(path: Path, results: dict[str, dict], tolerance: Optional[dict] = None) -> None:
+    """Write results (BenchResult.to_dict() per case) in the baseline format."""
+    doc: dict[str, Any] = {"environment": environment()}
+    if tolerance is not None:
+        doc["tolerance"] = tolerance
+    doc["results"] = {name: results[name] for name in sorted(results)}
+    path.write_text(json.dumps(doc, indent=2) + "\n")
+
+
+def load_baseline(path: Path) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def format_table(results: dict[str, BenchResult], baseline: Optional[dict] = None) -> str:
+    base_results = (baseline or {}).get("results", {})
+    lines = [
+        f"{'case':40} {'events/s':>12} {'vs base':>8} {'p50 us':>9} {'p99 us':>9} "
+        f"{'B/event':>9} {'retained':>8}"
+    ]
+    for name, r in results.items():
+        base = base_results.get(name)
+        delta = (
+            f"{(r.events_per_sec / base['events_per_sec'] - 1) * 100:+7.1f}%"
+            if base and base["events_per_sec"] else f"{'-':>8}"
+        )
+        lines.append(
+            f"{name:40} {r.events_per_sec:12,.0f} {delta} {r.p50_us:9.2f} {r.p99_us:9.2f} "
+            f"{r.alloc_bytes_per_event:9.0f} {r.retained_blocks_per_event:8.3f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,88 @@
+"""
+Tests for the benchmark harness (baseline comparison and measurement).
+"""
+import json
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks import cases  # noqa: F401  (registers the cases)
+from tests.benchmarks.harness import CASES, BenchCase, BenchContext, BenchResult, compare, run_case
+
+
+def result(**overrides) -> BenchResult:
+    values = {
+        "name": "case",
+        "calls": 1000,
+        "events_per_call": 1,
+        "events_per_sec": 10_000.0,
+        "p50_us": 10.0,
+        "p99_us": 50.0,
+        "alloc_bytes_per_event": 500.0,
+        "retained_blocks_per_event": 0.0,
+    }
+    values.update(overrides)
+    return BenchResult(**values)
+
+
+BASELINE = {"results": {"case": result().to_dict()}}
+
+
+def test_within_tolerance_is_not_a_regression():
+    assert compare({"case": result(events_per_sec=8_000.0, p99_us=90.0)}, BASELINE) == []
+
+
+def test_throughput_latency_and_allocation_regressions():
+    regressions = compare(
+        {"case": result(events_per_sec=5_000.0, p50_us=30.0, alloc_bytes_per_event=900.0)},
+        BASELINE,
+    )
+
+    assert {r.metric for r in regressions} == {"events_per_sec", "p50_us", "alloc_bytes_per_event"}
+
+
+def test_per_case_tolerance_overrides_default():
+    baseline = {"results": {"case": {**result().to_dict(), "tolerance": {"events_per_sec": 0.6}}}}
+
+    assert compare({"case": result(events_per_sec=5_000.0)}, baseline) == []
+
+
+def test_null_tolerance_reports_without_gating():
+    baseline = {"results": {"case": {**result().to_dict(), "tolerance": {"p99_us": None}}}}
+
+    assert compare({"case": result(p99_us=5_000.0)}, baseline) == []
+
+
+def test_retention_is_compared_in_absolute_terms():
+    [regression] = compare({"case": result(retained_blocks_per_event=1.0)}, BASELINE)
+
+    assert regression.metric == "retained_blocks_per_event"
+
+
+@pytest.mark.asyncio
+async def test_run_case_reports_per_event_figures():
+    teardown = []
+
+    async def factory(ctx):
+        data = list(range(100))
+        yield lambda i: sum(data)
+        teardown.append(True)
+
+    case = BenchCase("sum", factory, calls=500, events_per_call=100, warmup=10)
+    res = await run_case(case, BenchContext())
+
+    assert res.calls == 500
+    assert res.events_per_sec > 0
+    assert res.p50_us <= res.p99_us
+    assert res.retained_blocks_per_event < 0.01
+    assert teardown == [True]
+
+
+def test_committed_storage_cases_carry_their_own_tolerance():
+    """DB round trips vary run to run far more than the in-process default allows."""
+    baseline = json.loads((Path(__file__).parent / "baseline.json").read_text())
+    storage = [name for name, case in CASES.items() if case.requires_db]
+
+    assert storage
+    for name in storage:
+        assert "tolerance" in baseline["results"].get(name, {}), name